@@ -15,6 +15,16 @@ case "${RUN_MODE:-cron}" in
     echo "🔄 单次执行"
     exec /usr/local/bin/python -m trendradar
     ;;
+"serve")
+    # 常驻模式：进程内调度，跨轮次复用连接和缓存，不依赖 supercronic
+    if [ "${ENABLE_WEBSERVER:-false}" = "true" ]; then
+        echo "🌐 启动 Web 服务器..."
+        /usr/local/bin/python manage.py start_webserver
+    fi
+
+    echo "⏰ 常驻模式启动: ${CRON_SCHEDULE:-*/30 * * * *}"
+    exec /usr/local/bin/python -m trendradar --serve
+    ;;
 "cron")
     # 生成 crontab
     echo "${CRON_SCHEDULE:-*/30 * * * *} cd /app && /usr/local/bin/python -m trendradar" > /tmp/crontab
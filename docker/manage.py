@@ -139,6 +139,9 @@ def show_status():
         if "supercronic" in pid1_cmdline.lower():
             print("  ✅ supercronic 正确运行为 PID 1")
             supercronic_is_pid1 = True
+        elif "--serve" in pid1_cmdline:
+            print("  ✅ TrendRadar 常驻模式（--serve）正确运行为 PID 1")
+            supercronic_is_pid1 = True
         else:
             print("  ❌ PID 1 不是 supercronic")
             print(f"  📋 实际的 PID 1: {pid1_cmdline}")
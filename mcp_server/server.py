@@ -6,17 +6,18 @@ TrendRadar MCP Server - FastMCP 2.0 实现
 """
 
 import asyncio
+import importlib
 import json
+import threading
 from typing import List, Optional, Dict, Union
 
+from trendradar.profiling import PROFILE_FLAG, enable_if_requested, startup_profiler
+
+# 需要在导入 fastmcp 等依赖之前开启，才能统计到完整的导入耗时
+enable_if_requested()
+
 from fastmcp import FastMCP
 
-from .tools.data_query import DataQueryTools
-from .tools.analytics import AnalyticsTools
-from .tools.search_tools import SearchTools
-from .tools.config_mgmt import ConfigManagementTools
-from .tools.system import SystemManagementTools
-from .tools.storage_sync import StorageSyncTools
 from .utils.date_parser import DateParser
 from .utils.errors import MCPError
 
@@ -24,19 +25,48 @@ from .utils.errors import MCPError
 # 创建 FastMCP 2.0 应用
 mcp = FastMCP('trendradar-news')
 
+
+# 工具名 -> (模块, 类名)，模块在第一次使用对应工具时才导入
+_TOOL_CLASSES = {
+    'data': ('.tools.data_query', 'DataQueryTools'),
+    'analytics': ('.tools.analytics', 'AnalyticsTools'),
+    'search': ('.tools.search_tools', 'SearchTools'),
+    'config': ('.tools.config_mgmt', 'ConfigManagementTools'),
+    'system': ('.tools.system', 'SystemManagementTools'),
+    'storage': ('.tools.storage_sync', 'StorageSyncTools'),
+}
+
+
+class _ToolRegistry:
+    """工具实例注册表（按需导入模块并创建实例，每个工具只创建一次）"""
+
+    def __init__(self):
+        self.project_root: Optional[str] = None
+        self._instances = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, name: str):
+        instance = self._instances.get(name)
+        if instance is not None:
+            return instance
+        with self._lock:
+            instance = self._instances.get(name)
+            if instance is None:
+                module_name, class_name = _TOOL_CLASSES[name]
+                module = importlib.import_module(module_name, __package__)
+                instance = getattr(module, class_name)(self.project_root)
+                self._instances[name] = instance
+        return instance
+
+
 # 全局工具实例（在第一次请求时初始化）
-_tools_instances = {}
+_tools_instances = _ToolRegistry()
 
 
 def _get_tools(project_root: Optional[str] = None):
-    """获取或创建工具实例（单例模式）"""
-    if not _tools_instances:
-        _tools_instances['data'] = DataQueryTools(project_root)
-        _tools_instances['analytics'] = AnalyticsTools(project_root)
-        _tools_instances['search'] = SearchTools(project_root)
-        _tools_instances['config'] = ConfigManagementTools(project_root)
-        _tools_instances['system'] = SystemManagementTools(project_root)
-        _tools_instances['storage'] = StorageSyncTools(project_root)
+    """获取工具注册表（单例模式，工具实例在第一次访问时创建）"""
+    if project_root is not None and not _tools_instances._instances:
+        _tools_instances.project_root = project_root
     return _tools_instances
 
 
@@ -938,8 +968,9 @@ def run_server(
         host: HTTP模式的监听地址，默认 0.0.0.0
         port: HTTP模式的监听端口，默认 3333
     """
-    # 初始化工具实例
+    # 记录项目目录（工具实例在第一次调用时创建）
     _get_tools(project_root)
+    startup_profiler.report()
 
     # 打印启动信息
     print()
@@ -1046,6 +1077,11 @@ if __name__ == '__main__':
         '--project-root',
         help='项目根目录路径'
     )
+    parser.add_argument(
+        PROFILE_FLAG,
+        action='store_true',
+        help='输出启动耗时分析（各模块导入耗时，输出到 stderr）'
+    )
 
     args = parser.parse_args()
 
@@ -1,13 +1,17 @@
 """
 缓存服务
 
-实现TTL缓存机制，提升数据访问性能。
+实现带容量上限（LRU 淘汰）、分命名空间 TTL 和数据版本失效的缓存机制，提升数据访问性能。
 """
 
 import hashlib
 import json
+import os
+import sys
 import time
-from typing import Any, Optional
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
 from threading import Lock
 
 
@@ -57,48 +61,217 @@ def make_cache_key(namespace: str, **params) -> str:
     return f"{namespace}:{hash_value}"
 
 
+# 默认容量上限：条目数与估算内存占用（字节）
+DEFAULT_MAX_ENTRIES = 1000
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+# 默认存活时间（秒）
+DEFAULT_TTL = 900
+
+
+def file_signature(*paths: Union[str, Path]) -> Tuple:
+    """
+    生成文件版本签名，用于缓存失效判断
+
+    每个文件取 (mtime_ns, size)，不存在时为 None。SQLite 库文件应同时传入
+    对应的 -wal 文件，WAL 模式下新写入在 checkpoint 前只体现在 -wal 文件上。
+
+    Args:
+        *paths: 文件路径
+
+    Returns:
+        签名元组，文件有任何变化时签名随之变化
+    """
+    signature = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            signature.append((stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            signature.append(None)
+    return tuple(signature)
+
+
+def _estimate_size(value: Any, _seen: Optional[set] = None) -> int:
+    """粗略估算对象（含嵌套容器）占用的内存字节数"""
+    if _seen is None:
+        _seen = set()
+    obj_id = id(value)
+    if obj_id in _seen:
+        return 0
+    _seen.add(obj_id)
+
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        for k, v in value.items():
+            size += _estimate_size(k, _seen) + _estimate_size(v, _seen)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:
+            size += _estimate_size(item, _seen)
+    return size
+
+
+def _namespace_of(key: str) -> str:
+    """缓存 key 的命名空间（第一个冒号之前的部分）"""
+    return key.split(":", 1)[0]
+
+
+class _CacheEntry:
+    """缓存条目"""
+
+    __slots__ = ("value", "created_at", "ttl", "validator", "size")
+
+    def __init__(self, value: Any, ttl: int, validator: Any, size: int):
+        self.value = value
+        self.created_at = time.time()
+        self.ttl = ttl
+        self.validator = validator
+        self.size = size
+
+
 class CacheService:
-    """缓存服务类"""
+    """
+    缓存服务类
+
+    - 按条目数和估算内存占用限制容量，超出时按 LRU 淘汰
+    - 每个命名空间（key 中第一个冒号之前的部分）可配置独立 TTL，TTL <= 0 表示不过期
+    - 条目可携带 validator（如数据库文件签名），读取时 validator 不一致即视为失效，
+      使当天数据在新一轮抓取落库后立即刷新，历史日期数据可长期缓存
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        default_ttl: int = DEFAULT_TTL,
+        namespace_ttls: Optional[Dict[str, int]] = None,
+    ):
+        """
+        初始化缓存服务
 
-    def __init__(self):
-        """初始化缓存服务"""
-        self._cache = {}
-        self._timestamps = {}
+        Args:
+            max_entries: 最大条目数（<= 0 表示不限制）
+            max_bytes: 最大估算内存占用（<= 0 表示不限制）
+            default_ttl: 默认存活时间（秒）
+            namespace_ttls: 各命名空间的存活时间 {namespace: ttl}
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self._namespace_ttls: Dict[str, int] = dict(namespace_ttls or {})
+        self._cache: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._total_bytes = 0
         self._lock = Lock()
 
-    def get(self, key: str, ttl: int = 900) -> Optional[Any]:
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+        self._namespace_stats: Dict[str, Dict[str, int]] = {}
+
+    def set_namespace_ttl(self, namespace: str, ttl: int) -> None:
+        """设置命名空间的存活时间（秒），<= 0 表示不过期"""
+        with self._lock:
+            self._namespace_ttls[namespace] = ttl
+
+    def _remove(self, key: str) -> None:
+        entry = self._cache.pop(key)
+        self._total_bytes -= entry.size
+
+    def _record(self, key: str, hit: bool) -> None:
+        stats = self._namespace_stats.setdefault(
+            _namespace_of(key), {"hits": 0, "misses": 0}
+        )
+        if hit:
+            self._hits += 1
+            stats["hits"] += 1
+        else:
+            self._misses += 1
+            stats["misses"] += 1
+
+    def get(
+        self,
+        key: str,
+        ttl: Optional[int] = None,
+        validator: Any = None,
+    ) -> Optional[Any]:
         """
         获取缓存数据
 
         Args:
             key: 缓存键
-            ttl: 存活时间（秒），默认15分钟
+            ttl: 存活时间（秒），None 表示使用写入时确定的 TTL（命名空间 TTL），
+                <= 0 表示不过期
+            validator: 当前数据版本（如 file_signature 的结果），与写入时不一致则失效
 
         Returns:
-            缓存的值，如果不存在或已过期则返回None
+            缓存的值，如果不存在、已过期或已失效则返回None
         """
         with self._lock:
-            if key in self._cache:
-                # 检查是否过期
-                if time.time() - self._timestamps[key] < ttl:
-                    return self._cache[key]
-                else:
-                    # 已过期，删除缓存
-                    del self._cache[key]
-                    del self._timestamps[key]
-        return None
-
-    def set(self, key: str, value: Any) -> None:
+            entry = self._cache.get(key)
+            if entry is None:
+                self._record(key, hit=False)
+                return None
+
+            if validator is not None and entry.validator != validator:
+                # 底层数据已变化
+                self._remove(key)
+                self._invalidations += 1
+                self._record(key, hit=False)
+                return None
+
+            effective_ttl = entry.ttl if ttl is None else ttl
+            if effective_ttl > 0 and time.time() - entry.created_at >= effective_ttl:
+                # 已过期，删除缓存
+                self._remove(key)
+                self._expirations += 1
+                self._record(key, hit=False)
+                return None
+
+            self._cache.move_to_end(key)
+            self._record(key, hit=True)
+            return entry.value
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[int] = None,
+        validator: Any = None,
+    ) -> None:
         """
         设置缓存数据
 
         Args:
             key: 缓存键
             value: 缓存值
+            ttl: 存活时间（秒），None 表示使用命名空间 TTL
+            validator: 数据版本，读取时用于失效判断
         """
+        size = _estimate_size(value)
+
         with self._lock:
-            self._cache[key] = value
-            self._timestamps[key] = time.time()
+            if ttl is None:
+                ttl = self._namespace_ttls.get(_namespace_of(key), self.default_ttl)
+
+            if key in self._cache:
+                self._remove(key)
+
+            # 单个值超过内存上限时不缓存
+            if self.max_bytes > 0 and size > self.max_bytes:
+                return
+
+            self._cache[key] = _CacheEntry(value, ttl, validator, size)
+            self._total_bytes += size
+
+            # LRU 淘汰
+            while self._cache and (
+                (self.max_entries > 0 and len(self._cache) > self.max_entries)
+                or (self.max_bytes > 0 and self._total_bytes > self.max_bytes)
+            ):
+                oldest_key = next(iter(self._cache))
+                self._remove(oldest_key)
+                self._evictions += 1
 
     def delete(self, key: str) -> bool:
         """
@@ -112,37 +285,54 @@ class CacheService:
         """
         with self._lock:
             if key in self._cache:
-                del self._cache[key]
-                del self._timestamps[key]
+                self._remove(key)
                 return True
         return False
 
+    def invalidate_namespace(self, namespace: str) -> int:
+        """
+        删除某个命名空间下的全部缓存
+
+        Args:
+            namespace: 命名空间
+
+        Returns:
+            删除的条目数量
+        """
+        with self._lock:
+            keys = [key for key in self._cache if _namespace_of(key) == namespace]
+            for key in keys:
+                self._remove(key)
+            self._invalidations += len(keys)
+            return len(keys)
+
     def clear(self) -> None:
         """清空所有缓存"""
         with self._lock:
             self._cache.clear()
-            self._timestamps.clear()
+            self._total_bytes = 0
 
-    def cleanup_expired(self, ttl: int = 900) -> int:
+    def cleanup_expired(self, ttl: Optional[int] = None) -> int:
         """
         清理过期缓存
 
         Args:
-            ttl: 存活时间（秒）
+            ttl: 存活时间（秒），None 表示使用各条目自身的 TTL
 
         Returns:
             清理的条目数量
         """
         with self._lock:
             current_time = time.time()
-            expired_keys = [
-                key for key, timestamp in self._timestamps.items()
-                if current_time - timestamp >= ttl
-            ]
+            expired_keys = []
+            for key, entry in self._cache.items():
+                effective_ttl = entry.ttl if ttl is None else ttl
+                if effective_ttl > 0 and current_time - entry.created_at >= effective_ttl:
+                    expired_keys.append(key)
 
             for key in expired_keys:
-                del self._cache[key]
-                del self._timestamps[key]
+                self._remove(key)
+            self._expirations += len(expired_keys)
 
             return len(expired_keys)
 
@@ -154,16 +344,38 @@ class CacheService:
             统计信息字典
         """
         with self._lock:
+            now = time.time()
+            timestamps = [entry.created_at for entry in self._cache.values()]
+            lookups = self._hits + self._misses
+
+            namespaces = {}
+            for key, entry in self._cache.items():
+                ns = namespaces.setdefault(
+                    _namespace_of(key), {"entries": 0, "bytes": 0, "hits": 0, "misses": 0}
+                )
+                ns["entries"] += 1
+                ns["bytes"] += entry.size
+            for name, stats in self._namespace_stats.items():
+                ns = namespaces.setdefault(
+                    name, {"entries": 0, "bytes": 0, "hits": 0, "misses": 0}
+                )
+                ns["hits"] = stats["hits"]
+                ns["misses"] = stats["misses"]
+
             return {
                 "total_entries": len(self._cache),
-                "oldest_entry_age": (
-                    time.time() - min(self._timestamps.values())
-                    if self._timestamps else 0
-                ),
-                "newest_entry_age": (
-                    time.time() - max(self._timestamps.values())
-                    if self._timestamps else 0
-                )
+                "total_bytes": self._total_bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "invalidations": self._invalidations,
+                "oldest_entry_age": now - min(timestamps) if timestamps else 0,
+                "newest_entry_age": now - max(timestamps) if timestamps else 0,
+                "namespaces": namespaces,
             }
 
 
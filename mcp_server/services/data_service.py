@@ -65,7 +65,8 @@ class DataService:
         """
         # 尝试从缓存获取
         cache_key = f"latest_news:{','.join(platforms or [])}:{limit}:{include_url}"
-        cached = self.cache.get(cache_key, ttl=900)  # 15分钟缓存
+        signature = self.parser.get_data_signature()
+        cached = self.cache.get(cache_key, validator=signature)  # 新数据落库后失效
         if cached:
             return cached
 
@@ -113,7 +114,7 @@ class DataService:
         result = news_list[:limit]
 
         # 缓存结果
-        self.cache.set(cache_key, result)
+        self.cache.set(cache_key, result, validator=signature)
 
         return result
 
@@ -150,7 +151,8 @@ class DataService:
         # 尝试从缓存获取
         date_str = target_date.strftime("%Y-%m-%d")
         cache_key = f"news_by_date:{date_str}:{','.join(platforms or [])}:{limit}:{include_url}"
-        cached = self.cache.get(cache_key, ttl=900)  # 15分钟缓存
+        signature = self.parser.get_data_signature(target_date)
+        cached = self.cache.get(cache_key, validator=signature)  # 新数据落库后失效
         if cached:
             return cached
 
@@ -192,8 +194,9 @@ class DataService:
         # 限制返回数量
         result = news_list[:limit]
 
-        # 缓存结果(历史数据缓存更久)
-        self.cache.set(cache_key, result)
+        # 缓存结果(历史数据不再变化，不设过期时间)
+        is_today = target_date.date() == datetime.now().date()
+        self.cache.set(cache_key, result, ttl=None if is_today else 0, validator=signature)
 
         return result
 
@@ -353,7 +356,15 @@ class DataService:
         """
         # 尝试从缓存获取
         cache_key = f"trending_topics:{top_n}:{mode}:{extract_mode}"
-        cached = self.cache.get(cache_key, ttl=900)  # 15分钟缓存
+        # 数据或关注词配置变化时失效
+        frequency_config = None
+        if extract_mode == "keywords":
+            frequency_config = self.parser.get_frequency_config()
+        signature = (
+            self.parser.get_data_signature(),
+            frequency_config.content_hash if frequency_config is not None else None,
+        )
+        cached = self.cache.get(cache_key, validator=signature)
         if cached:
             return cached
 
@@ -378,30 +389,32 @@ class DataService:
         word_frequency = Counter()
         keyword_to_news = {}
 
+        # 基于预设关键词统计时，直接使用进程级缓存的已编译词组
+        if extract_mode == "keywords":
+            if frequency_config is not None:
+                word_groups = frequency_config.word_groups
+                matcher = frequency_config.matcher
+            else:
+                word_groups = []
+                matcher = None
+
         # 遍历要处理的标题
         for platform_id, titles in titles_to_process.items():
             for title in titles.keys():
                 if extract_mode == "keywords":
                     # 基于预设关键词统计（支持正则匹配）
-                    from trendradar.core.frequency import _word_matches
-
-                    word_groups = self.parser.parse_frequency_words()
-                    title_lower = title.lower()
-
-                    for group in word_groups:
-                        all_words = group.get("required", []) + group.get("normal", [])
-                        # 检查是否匹配词组中的任意一个词
-                        matched = any(_word_matches(word_config, title_lower) for word_config in all_words)
+                    # 每个标题只计入第一个有任一词命中的词组
+                    group_index = matcher.first_word_group(title) if matcher else None
 
-                        if matched:
-                            # 使用组的 display_name（组别名或行别名拼接）
-                            display_key = group.get("display_name") or group.get("group_key", "")
+                    if group_index is not None:
+                        group = word_groups[group_index]
+                        # 使用组的 display_name（组别名或行别名拼接）
+                        display_key = group.get("display_name") or group.get("group_key", "")
 
-                            word_frequency[display_key] += 1
-                            if display_key not in keyword_to_news:
-                                keyword_to_news[display_key] = []
-                            keyword_to_news[display_key].append(title)
-                            break  # 每个标题只计入第一个匹配的词组
+                        word_frequency[display_key] += 1
+                        if display_key not in keyword_to_news:
+                            keyword_to_news[display_key] = []
+                        keyword_to_news[display_key].append(title)
 
                 elif extract_mode == "auto_extract":
                     # 自动提取关键词
@@ -439,7 +452,7 @@ class DataService:
         }
 
         # 缓存结果
-        self.cache.set(cache_key, result)
+        self.cache.set(cache_key, result, validator=signature)
 
         return result
 
@@ -666,6 +679,7 @@ class DataService:
                 "latest_record": latest_record.strftime("%Y-%m-%d") if latest_record else None,
             },
             "cache": self.cache.get_stats(),
+            "sqlite_pool": self.parser.pool.get_stats(),
             "health": "healthy"
         }
 
@@ -697,7 +711,9 @@ class DataService:
         """
         days = min(max(days, 1), 30)  # 限制 1-30 天
         cache_key = f"latest_rss:{','.join(feeds or [])}:{days}:{limit}:{include_summary}"
-        cached = self.cache.get(cache_key, ttl=900)
+        # 历史日期不再变化，只需跟踪今天的 RSS 数据库
+        signature = self.parser.get_data_signature(db_type="rss")
+        cached = self.cache.get(cache_key, validator=signature)
         if cached:
             return cached
 
@@ -760,7 +776,7 @@ class DataService:
         result = rss_list[:limit]
 
         # 缓存结果
-        self.cache.set(cache_key, result)
+        self.cache.set(cache_key, result, validator=signature)
 
         return result
 
@@ -786,7 +802,8 @@ class DataService:
             匹配的 RSS 条目列表（按 URL 去重）
         """
         cache_key = f"search_rss:{keyword}:{','.join(feeds or [])}:{days}:{limit}:{include_summary}"
-        cached = self.cache.get(cache_key, ttl=900)
+        signature = self.parser.get_data_signature(db_type="rss")
+        cached = self.cache.get(cache_key, validator=signature)
         if cached:
             return cached
 
@@ -843,7 +860,7 @@ class DataService:
         result = results[:limit]
 
         # 缓存结果
-        self.cache.set(cache_key, result)
+        self.cache.set(cache_key, result, validator=signature)
 
         return result
 
@@ -855,7 +872,8 @@ class DataService:
             RSS 源状态信息
         """
         cache_key = "rss_feeds_status"
-        cached = self.cache.get(cache_key, ttl=900)
+        signature = self.parser.get_data_signature(db_type="rss")
+        cached = self.cache.get(cache_key, validator=signature)
         if cached:
             return cached
 
@@ -887,6 +905,6 @@ class DataService:
             "generated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         }
 
-        self.cache.set(cache_key, result)
+        self.cache.set(cache_key, result, validator=signature)
 
         return result
@@ -6,7 +6,6 @@ v2.0.0: 仅支持 SQLite 数据库，移除 TXT 文件支持
 """
 
 import re
-import sqlite3
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 from datetime import datetime
@@ -14,7 +13,10 @@ from datetime import datetime
 import yaml
 
 from ..utils.errors import FileParseError, DataNotFoundError
-from .cache_service import get_cache
+from trendradar.storage.rollup import load_daily_rollup
+
+from .cache_service import get_cache, file_signature
+from .sqlite_pool import get_connection_pool
 
 
 class ParserService:
@@ -34,6 +36,7 @@ class ParserService:
             self.project_root = Path(project_root)
 
         self.cache = get_cache()
+        self.pool = get_connection_pool()
 
     @staticmethod
     def clean_title(title: str) -> str:
@@ -75,6 +78,23 @@ class ParserService:
             return db_path
         return None
 
+    def get_data_signature(self, date: datetime = None, db_type: str = "news") -> Tuple:
+        """
+        获取指定日期数据库的版本签名（库文件及 -wal 文件的 mtime/size）
+
+        新一轮抓取写入后签名随之变化，用作缓存 validator。
+
+        Args:
+            date: 日期对象，默认为今天
+            db_type: 数据库类型 ("news" 或 "rss")
+
+        Returns:
+            签名元组（包含日期本身，跨天后自然失效）
+        """
+        date_str = self.get_date_folder_name(date)
+        db_path = self.project_root / "output" / db_type / f"{date_str}.db"
+        return (date_str,) + file_signature(db_path, f"{db_path}-wal")
+
     def _read_from_sqlite(
         self,
         date: datetime = None,
@@ -100,22 +120,24 @@ class ParserService:
         id_to_name = {}
         all_timestamps = {}
 
-        try:
-            conn = sqlite3.connect(str(db_path))
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
+        # 历史日期的数据库不会再写入，可以 immutable 模式打开
+        date_str = self.get_date_folder_name(date)
+        immutable = date_str < self.get_date_folder_name()
 
-            if db_type == "news":
-                return self._read_news_from_sqlite(cursor, platform_ids, all_titles, id_to_name, all_timestamps)
-            elif db_type == "rss":
-                return self._read_rss_from_sqlite(cursor, platform_ids, all_titles, id_to_name, all_timestamps)
+        try:
+            with self.pool.connection(db_type, date_str, db_path, immutable=immutable) as conn:
+                cursor = conn.cursor()
+                try:
+                    if db_type == "news":
+                        return self._read_news_from_sqlite(cursor, platform_ids, all_titles, id_to_name, all_timestamps)
+                    elif db_type == "rss":
+                        return self._read_rss_from_sqlite(cursor, platform_ids, all_titles, id_to_name, all_timestamps)
+                finally:
+                    cursor.close()
 
         except Exception as e:
             print(f"Warning: 从 SQLite 读取数据失败: {e}")
             return None
-        finally:
-            if 'conn' in locals():
-                conn.close()
 
     def _read_news_from_sqlite(
         self,
@@ -324,16 +346,19 @@ class ParserService:
         platform_key = ','.join(sorted(platform_ids)) if platform_ids else 'all'
         cache_key = f"read_all:{db_type}:{date_str}:{platform_key}"
 
+        # 以数据库文件签名作为 validator：新数据落库后立即失效
+        # 历史日期的数据不再变化，不设过期时间
         is_today = (date is None) or (date.date() == datetime.now().date())
-        ttl = 900 if is_today else 900
+        ttl = 900 if is_today else 0
+        signature = self.get_data_signature(date, db_type)
 
-        cached = self.cache.get(cache_key, ttl=ttl)
+        cached = self.cache.get(cache_key, validator=signature)
         if cached:
             return cached
 
         result = self._read_from_sqlite(date, platform_ids, db_type)
         if result:
-            self.cache.set(cache_key, result)
+            self.cache.set(cache_key, result, ttl=ttl, validator=signature)
             return result
 
         raise DataNotFoundError(
@@ -341,6 +366,36 @@ class ParserService:
             suggestion="请先运行爬虫或检查日期是否正确"
         )
 
+    def read_daily_rollup(self, date: datetime = None):
+        """
+        读取指定日期的列式汇总数据（output/news/{date}.rollup）
+
+        用于多日统计类分析：只映射紧凑数组，不构建标题字典。汇总文件缺失或
+        与新闻库不一致时自动重新生成。
+
+        Args:
+            date: 日期对象，默认为今天
+
+        Returns:
+            trendradar.storage.rollup.DailyRollup
+
+        Raises:
+            DataNotFoundError: 数据不存在
+        """
+        date_str = self.get_date_folder_name(date)
+        rollup = None
+        try:
+            rollup = load_daily_rollup(self.project_root / "output" / "news", date_str)
+        except Exception as e:
+            print(f"Warning: 读取 {date_str} 汇总数据失败: {e}")
+
+        if rollup is None or rollup.item_count == 0:
+            raise DataNotFoundError(
+                f"未找到 {date_str} 的 news 数据",
+                suggestion="请先运行爬虫或检查日期是否正确"
+            )
+        return rollup
+
     def parse_yaml_config(self, config_path: str = None) -> dict:
         """
         解析YAML配置文件
@@ -393,7 +448,25 @@ class ParserService:
         Raises:
             FileParseError: 文件解析错误
         """
-        from trendradar.core.frequency import load_frequency_words
+        config = self.get_frequency_config(words_file)
+        return config.word_groups if config is not None else []
+
+    def get_frequency_config(self, words_file: str = None):
+        """
+        获取已解析并预编译的关键词配置
+
+        与 trendradar 共用进程级缓存，文件未变化时不会重复解析和编译。
+
+        Args:
+            words_file: 关键词文件路径，默认为 config/frequency_words.txt
+
+        Returns:
+            trendradar.core.frequency.FrequencyConfig，文件不存在时返回 None
+
+        Raises:
+            FileParseError: 文件解析错误
+        """
+        from trendradar.core.frequency import get_frequency_config
 
         if words_file is None:
             words_file = str(self.project_root / "config" / "frequency_words.txt")
@@ -401,10 +474,9 @@ class ParserService:
             words_file = str(words_file)
 
         try:
-            word_groups, filter_words, global_filters = load_frequency_words(words_file)
-            return word_groups
+            return get_frequency_config(words_file)
         except FileNotFoundError:
-            return []
+            return None
         except Exception as e:
             raise FileParseError(words_file, str(e))
 
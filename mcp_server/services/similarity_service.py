@@ -0,0 +1,242 @@
+"""
+标题相似度服务
+
+基于字符 shingle 的 MinHash 签名 + LSH 分桶生成候选对，
+只对候选对用 SequenceMatcher 做精确校验，避免 O(n²) 的两两比较。
+
+- 签名按标题缓存（LRU），重复调用直接复用
+- LSH 参数按 0.6 以上的阈值调校；更低的阈值下召回率不足，回退为全量比较
+- ratio() 先用 real_quick_ratio / quick_ratio 上界剪枝，再计算精确相似度
+"""
+
+import random
+import zlib
+from collections import OrderedDict, defaultdict
+from difflib import SequenceMatcher
+from threading import Lock
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+
+# MinHash 参数：96 个哈希函数分为 48 个 band（每 band 2 行）
+# 字符 2-gram Jaccard 为 0.3 的标题对成为候选的概率约 0.99，
+# 实测 SequenceMatcher 相似度 ≥ 0.7 的标题对约 99% 进入候选
+DEFAULT_NUM_PERM = 96
+DEFAULT_BANDS = 48
+DEFAULT_SHINGLE_SIZE = 2
+DEFAULT_MAX_CACHED = 200_000
+
+# 低于该相似度阈值时 LSH 会漏掉大量相似对（阈值 0.3 时召回不足 5%），调用方应全量比较
+LSH_MIN_THRESHOLD = 0.6
+
+_MASK_64 = (1 << 64) - 1
+
+
+class SimilarityEngine:
+    """MinHash/LSH 标题相似度引擎"""
+
+    def __init__(
+        self,
+        num_perm: int = DEFAULT_NUM_PERM,
+        bands: int = DEFAULT_BANDS,
+        shingle_size: int = DEFAULT_SHINGLE_SIZE,
+        max_cached: int = DEFAULT_MAX_CACHED,
+        seed: int = 1,
+    ):
+        """
+        初始化相似度引擎
+
+        Args:
+            num_perm: MinHash 哈希函数个数
+            bands: LSH band 数（num_perm 必须能被整除）
+            shingle_size: 字符 shingle 长度
+            max_cached: 最多缓存的签名数
+            seed: 哈希函数随机种子（固定种子保证签名可复用）
+        """
+        if num_perm % bands != 0:
+            raise ValueError("num_perm 必须能被 bands 整除")
+
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.max_cached = max_cached
+
+        rng = random.Random(seed)
+        # multiply-shift 哈希族：h(x) = ((a * x + b) mod 2^64) >> 32，a 为奇数
+        self._perms = [
+            (rng.getrandbits(64) | 1, rng.getrandbits(64)) for _ in range(num_perm)
+        ]
+
+        self._signatures: "OrderedDict[str, Tuple[int, ...]]" = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def _shingles(self, text: str) -> Set[int]:
+        text = text.lower()
+        k = self.shingle_size
+        if len(text) <= k:
+            grams = {text} if text else set()
+        else:
+            grams = {text[i:i + k] for i in range(len(text) - k + 1)}
+        return {zlib.crc32(gram.encode("utf-8")) for gram in grams}
+
+    def signature(self, text: str) -> Tuple[int, ...]:
+        """
+        获取文本的 MinHash 签名（带缓存）
+
+        Args:
+            text: 文本
+
+        Returns:
+            长度为 num_perm 的签名元组，空文本返回空元组
+        """
+        with self._lock:
+            sig = self._signatures.get(text)
+            if sig is not None:
+                self._signatures.move_to_end(text)
+                self._hits += 1
+                return sig
+            self._misses += 1
+
+        hashes = self._shingles(text)
+        if hashes:
+            perms = self._perms
+            # 按 shingle 计算全部哈希后按列取最小值，比逐个哈希函数循环更快
+            sig = tuple(map(min, zip(*[
+                [((a * x + b) & _MASK_64) >> 32 for a, b in perms]
+                for x in hashes
+            ])))
+        else:
+            sig = ()
+
+        with self._lock:
+            self._signatures[text] = sig
+            while len(self._signatures) > self.max_cached:
+                self._signatures.popitem(last=False)
+        return sig
+
+    @staticmethod
+    def uses_lsh(threshold: float) -> bool:
+        """
+        该阈值下能否只比较 LSH 候选
+
+        Args:
+            threshold: 相似度阈值
+
+        Returns:
+            True 表示 LSH 召回率足够；False 表示应全量比较
+        """
+        return threshold >= LSH_MIN_THRESHOLD
+
+    def _band_keys(self, sig: Tuple[int, ...]) -> List[Tuple[int, Tuple[int, ...]]]:
+        rows = self.rows
+        return [(band, sig[band * rows:(band + 1) * rows]) for band in range(self.bands)]
+
+    def candidate_neighbors(self, texts: Sequence[str]) -> List[Set[int]]:
+        """
+        LSH 候选近邻
+
+        Args:
+            texts: 文本列表
+
+        Returns:
+            与 texts 等长的列表，第 i 项为可能与 texts[i] 相似的其他下标集合
+        """
+        buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = defaultdict(list)
+        for idx, text in enumerate(texts):
+            sig = self.signature(text)
+            if not sig:
+                continue
+            for key in self._band_keys(sig):
+                buckets[key].append(idx)
+
+        neighbors: List[Set[int]] = [set() for _ in texts]
+        for members in buckets.values():
+            if len(members) < 2:
+                continue
+            for idx in members:
+                neighbors[idx].update(members)
+        for idx, found in enumerate(neighbors):
+            found.discard(idx)
+        return neighbors
+
+    def candidates_for(
+        self, reference: str, texts: Sequence[str], threshold: Optional[float] = None
+    ) -> List[int]:
+        """
+        与参考文本可能相似的文本下标
+
+        Args:
+            reference: 参考文本
+            texts: 待比较的文本
+            threshold: 相似度阈值；低于 LSH_MIN_THRESHOLD 时返回全部下标
+
+        Returns:
+            候选下标列表（升序）
+        """
+        if threshold is not None and not self.uses_lsh(threshold):
+            return list(range(len(texts)))
+        ref_sig = self.signature(reference)
+        if not ref_sig:
+            return []
+        ref_keys = set(self._band_keys(ref_sig))
+        result = []
+        for idx, text in enumerate(texts):
+            sig = self.signature(text)
+            if sig and not ref_keys.isdisjoint(self._band_keys(sig)):
+                result.append(idx)
+        return result
+
+    @staticmethod
+    def ratio(text1: str, text2: str, threshold: Optional[float] = None) -> float:
+        """
+        SequenceMatcher 相似度
+
+        Args:
+            text1: 文本1
+            text2: 文本2
+            threshold: 若给出，上界低于阈值时直接返回上界（此时不保证是精确值，只保证 < threshold）
+
+        Returns:
+            相似度分数（0-1之间）
+        """
+        matcher = SequenceMatcher(None, text1, text2)
+        if threshold is not None:
+            upper = matcher.real_quick_ratio()
+            if upper < threshold:
+                return upper
+            upper = matcher.quick_ratio()
+            if upper < threshold:
+                return upper
+        return matcher.ratio()
+
+    def get_stats(self) -> Dict:
+        """签名缓存统计"""
+        with self._lock:
+            return {
+                "cached_signatures": len(self._signatures),
+                "max_cached": self.max_cached,
+                "hits": self._hits,
+                "misses": self._misses,
+            }
+
+
+# 全局相似度引擎实例
+_global_engine = None
+_global_engine_lock = Lock()
+
+
+def get_similarity_engine() -> SimilarityEngine:
+    """
+    获取全局相似度引擎实例
+
+    Returns:
+        全局 SimilarityEngine
+    """
+    global _global_engine
+    if _global_engine is None:
+        with _global_engine_lock:
+            if _global_engine is None:
+                _global_engine = SimilarityEngine()
+    return _global_engine
@@ -0,0 +1,227 @@
+"""
+SQLite 只读连接池
+
+按 (db_type, date) 复用只读连接，避免多日期查询时反复建立连接、解析 schema
+和冷启动页缓存：
+- 连接以 URI mode=ro 打开；历史日期（且没有未合并的 -wal 文件）额外使用
+  immutable=1，跳过文件锁和变更检测
+- 空闲连接总数有上限，超出时关闭最久未使用的连接（LRU）
+- 每个连接同一时间只借给一个线程，可在 asyncio.to_thread 的并发下安全使用
+- 借出前检查文件是否被替换（inode 变化），immutable 连接还会检查 mtime/size，
+  变化后重新打开
+"""
+
+import os
+import sqlite3
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from threading import Lock
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+
+# 默认最多保留的空闲连接数
+DEFAULT_MAX_IDLE = 32
+
+
+class _PooledConnection:
+    """连接池中的连接及其打开时的文件标识"""
+
+    __slots__ = ("conn", "identity", "immutable")
+
+    def __init__(self, conn: sqlite3.Connection, identity: Tuple, immutable: bool):
+        self.conn = conn
+        self.identity = identity
+        self.immutable = immutable
+
+
+def _file_identity(db_path: Path, immutable: bool) -> Optional[Tuple]:
+    """文件标识：普通连接只关心文件是否被替换，immutable 连接还要求内容未变"""
+    try:
+        stat = os.stat(db_path)
+    except OSError:
+        return None
+    if immutable:
+        return (stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    return (stat.st_dev, stat.st_ino)
+
+
+class SQLiteConnectionPool:
+    """SQLite 只读连接池"""
+
+    def __init__(self, max_idle: int = DEFAULT_MAX_IDLE):
+        """
+        初始化连接池
+
+        Args:
+            max_idle: 最多保留的空闲连接数
+        """
+        self.max_idle = max_idle
+        self._idle: "OrderedDict[Tuple[str, str], List[_PooledConnection]]" = OrderedDict()
+        self._idle_count = 0
+        self._lock = Lock()
+
+        self._opened = 0
+        self._reused = 0
+        self._closed = 0
+
+    def _open(self, db_path: Path, immutable: bool) -> _PooledConnection:
+        """
+        打开只读连接
+
+        immutable 打开失败时以不带 immutable 的只读模式重试；只读模式也失败时抛出异常，
+        不回退为读写连接（避免写入或创建数据库文件）。
+        """
+        identity = _file_identity(db_path, immutable)
+        uri = f"{db_path.resolve().as_uri()}?mode=ro"
+        conn = None
+        if immutable:
+            try:
+                conn = sqlite3.connect(uri + "&immutable=1", uri=True, check_same_thread=False)
+            except sqlite3.Error:
+                immutable = False
+                identity = _file_identity(db_path, immutable)
+        if conn is None:
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        with self._lock:
+            self._opened += 1
+        return _PooledConnection(conn, identity, immutable)
+
+    def _close(self, pooled: _PooledConnection) -> None:
+        try:
+            pooled.conn.close()
+        except sqlite3.Error:
+            pass
+        with self._lock:
+            self._closed += 1
+
+    def _acquire(
+        self, key: Tuple[str, str], db_path: Path, immutable: bool
+    ) -> _PooledConnection:
+        stale = []
+        pooled = None
+        with self._lock:
+            idle = self._idle.get(key)
+            while idle:
+                candidate = idle.pop()
+                self._idle_count -= 1
+                if (
+                    candidate.immutable == immutable
+                    and candidate.identity is not None
+                    and candidate.identity == _file_identity(db_path, candidate.immutable)
+                ):
+                    pooled = candidate
+                    self._reused += 1
+                    break
+                stale.append(candidate)
+            if idle is not None and not idle:
+                del self._idle[key]
+
+        for candidate in stale:
+            self._close(candidate)
+
+        return pooled if pooled is not None else self._open(db_path, immutable)
+
+    def _release(self, key: Tuple[str, str], pooled: _PooledConnection) -> None:
+        evicted = []
+        with self._lock:
+            self._idle.setdefault(key, []).append(pooled)
+            self._idle.move_to_end(key)
+            self._idle_count += 1
+
+            # LRU：关闭最久未使用日期的空闲连接
+            while self._idle_count > self.max_idle:
+                oldest_key = next(iter(self._idle))
+                idle = self._idle[oldest_key]
+                evicted.append(idle.pop(0))
+                self._idle_count -= 1
+                if not idle:
+                    del self._idle[oldest_key]
+
+        for candidate in evicted:
+            self._close(candidate)
+
+    @contextmanager
+    def connection(
+        self,
+        db_type: str,
+        date_str: str,
+        db_path: Union[str, Path],
+        immutable: bool = False,
+    ) -> Iterator[sqlite3.Connection]:
+        """
+        借用一个只读连接
+
+        Args:
+            db_type: 数据库类型 ("news" 或 "rss")
+            date_str: 日期字符串（YYYY-MM-DD）
+            db_path: 数据库文件路径
+            immutable: 是否以 immutable=1 打开（仅用于不会再写入的历史日期）
+
+        Yields:
+            sqlite3.Connection（row_factory 为 sqlite3.Row）
+        """
+        db_path = Path(db_path)
+        # 存在 -wal 文件说明还有未合并的写入，immutable 模式会忽略它
+        if immutable and Path(f"{db_path}-wal").exists():
+            immutable = False
+
+        key = (db_type, date_str)
+        pooled = self._acquire(key, db_path, immutable)
+        try:
+            yield pooled.conn
+        except sqlite3.Error:
+            # 连接可能已不可用，不再放回连接池
+            self._close(pooled)
+            raise
+        except BaseException:
+            self._release(key, pooled)
+            raise
+        else:
+            self._release(key, pooled)
+
+    def close_all(self) -> None:
+        """关闭所有空闲连接"""
+        with self._lock:
+            idle = [pooled for conns in self._idle.values() for pooled in conns]
+            self._idle.clear()
+            self._idle_count = 0
+        for pooled in idle:
+            self._close(pooled)
+
+    def get_stats(self) -> Dict:
+        """
+        获取连接池统计信息
+
+        Returns:
+            统计信息字典
+        """
+        with self._lock:
+            return {
+                "idle_connections": self._idle_count,
+                "max_idle": self.max_idle,
+                "opened": self._opened,
+                "reused": self._reused,
+                "closed": self._closed,
+            }
+
+
+# 全局连接池实例
+_global_pool = None
+_global_pool_lock = Lock()
+
+
+def get_connection_pool() -> SQLiteConnectionPool:
+    """
+    获取全局连接池实例
+
+    Returns:
+        全局 SQLite 连接池
+    """
+    global _global_pool
+    if _global_pool is None:
+        with _global_pool_lock:
+            if _global_pool is None:
+                _global_pool = SQLiteConnectionPool()
+    return _global_pool
@@ -4,18 +4,24 @@
 提供热度趋势分析、平台对比、关键词共现、情感分析等高级分析功能。
 """
 
+import heapq
 import os
 import re
 from collections import Counter, defaultdict
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Union
-from difflib import SequenceMatcher
 
 import yaml
 
 from trendradar.core.analyzer import calculate_news_weight as _calculate_news_weight
+from trendradar.storage.rollup import HAS_NUMPY
 
+if HAS_NUMPY:
+    import numpy as np
+
+from ..services.cache_service import file_signature
 from ..services.data_service import DataService
+from ..services.similarity_service import get_similarity_engine
 from ..utils.validators import (
     validate_platforms,
     validate_limit,
@@ -27,13 +33,21 @@ from ..utils.validators import (
 from ..utils.errors import MCPError, InvalidParameterError, DataNotFoundError
 
 
+# 权重配置缓存：(config.yaml 文件签名, 权重配置)
+_weight_config_cache = None
+
+
 def _get_weight_config() -> Dict:
     """
     从 config.yaml 读取权重配置
 
+    按文件 mtime/size 缓存，每条新闻计算权重时不再重复解析 YAML。
+
     Returns:
         权重配置字典，包含 RANK_WEIGHT, FREQUENCY_WEIGHT, HOTNESS_WEIGHT
     """
+    global _weight_config_cache
+
     # 默认值
     default_config = {
         "RANK_WEIGHT": 0.6,
@@ -41,21 +55,29 @@ def _get_weight_config() -> Dict:
         "HOTNESS_WEIGHT": 0.1,
     }
 
-    try:
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        config_path = os.path.join(current_dir, "..", "..", "config", "config.yaml")
-        config_path = os.path.normpath(config_path)
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    config_path = os.path.join(current_dir, "..", "..", "config", "config.yaml")
+    config_path = os.path.normpath(config_path)
 
+    signature = file_signature(config_path)
+    cached = _weight_config_cache
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    try:
         with open(config_path, 'r', encoding='utf-8') as f:
             config = yaml.safe_load(f)
             weight = config.get('advanced', {}).get('weight', {})
-            return {
+            result = {
                 "RANK_WEIGHT": weight.get('rank', 0.6),
                 "FREQUENCY_WEIGHT": weight.get('frequency', 0.3),
                 "HOTNESS_WEIGHT": weight.get('hotness', 0.1),
             }
     except Exception:
-        return default_config
+        result = default_config
+
+    _weight_config_cache = (signature, result)
+    return result
 
 
 def calculate_news_weight(news_data: Dict, rank_threshold: int = 5) -> float:
@@ -75,6 +97,55 @@ def calculate_news_weight(news_data: Dict, rank_threshold: int = 5) -> float:
     return _calculate_news_weight(news_data, rank_threshold, _get_weight_config())
 
 
+def _rollup_item_weights(rollup, items: List[int]) -> List[float]:
+    """
+    按汇总数据中的排名统计计算新闻权重
+
+    与 calculate_news_weight（rank_threshold=5）逐条计算的结果一致，
+    安装了 NumPy 时按数组批量计算。
+
+    Args:
+        rollup: DailyRollup
+        items: 新闻行下标列表
+
+    Returns:
+        与 items 等长的权重列表
+    """
+    config = _get_weight_config()
+    rank_factor = config["RANK_WEIGHT"]
+    frequency_factor = config["FREQUENCY_WEIGHT"]
+    hotness_factor = config["HOTNESS_WEIGHT"]
+
+    if HAS_NUMPY and items:
+        index = np.asarray(items, dtype=np.intp)
+        counts = rollup.as_numpy("item_rank_count")[index].astype(np.float64)
+        scores = rollup.as_numpy("item_rank_score")[index]
+        highs = rollup.as_numpy("item_rank_high")[index]
+        safe_counts = np.where(counts > 0, counts, 1.0)
+        weights = (
+            (scores / safe_counts) * rank_factor
+            + np.minimum(counts, 10) * 10 * frequency_factor
+            + (highs / safe_counts) * 100 * hotness_factor
+        )
+        return np.where(counts > 0, weights, 0.0).tolist()
+
+    rank_counts = rollup.item_rank_count
+    rank_scores = rollup.item_rank_score
+    rank_highs = rollup.item_rank_high
+    weights = []
+    for item in items:
+        count = rank_counts[item]
+        if not count:
+            weights.append(0.0)
+            continue
+        weights.append(
+            (rank_scores[item] / count) * rank_factor
+            + min(count, 10) * 10 * frequency_factor
+            + (rank_highs[item] / count) * 100 * hotness_factor
+        )
+    return weights
+
+
 class AnalyticsTools:
     """高级数据分析工具类"""
 
@@ -313,24 +384,19 @@ class AnalyticsTools:
 
             while current_date <= end_date:
                 try:
-                    all_titles, _, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date
-                    )
-
-                    # 统计该时间点的话题出现次数
-                    count = 0
-                    matched_titles = []
+                    rollup = self.data_service.parser.read_daily_rollup(date=current_date)
 
-                    for _, titles in all_titles.items():
-                        for title in titles.keys():
-                            if topic.lower() in title.lower():
-                                count += 1
-                                matched_titles.append(title)
+                    # 统计该时间点的话题出现次数（各平台分别计数）
+                    title_ids = rollup.match_titles(topic)
+                    count = rollup.item_count_for_titles(title_ids)
+                    sample_items = rollup.items_for_titles(title_ids)[:3]  # 只保留前3个样本
 
                     trend_data.append({
                         "date": current_date.strftime("%Y-%m-%d"),
                         "count": count,
-                        "sample_titles": matched_titles[:3]  # 只保留前3个样本
+                        "sample_titles": [
+                            rollup.title(rollup.item_title[item]) for item in sample_items
+                        ]
                     })
 
                 except DataNotFoundError:
@@ -956,33 +1022,44 @@ class AnalyticsTools:
             # 读取数据
             all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date()
 
+            # MinHash/LSH 生成候选，只对候选做精确相似度计算（低阈值时全量比较）
+            engine = get_similarity_engine()
+            entries = [
+                (platform_id, title, info)
+                for platform_id, titles in all_titles.items()
+                for title, info in titles.items()
+            ]
+            candidate_indices = engine.candidates_for(
+                reference_title, [title for _, title, _ in entries], threshold
+            )
+
             # 计算相似度
             similar_items = []
 
-            for platform_id, titles in all_titles.items():
+            for idx in candidate_indices:
+                platform_id, title, info = entries[idx]
                 platform_name = id_to_name.get(platform_id, platform_id)
 
-                for title, info in titles.items():
-                    if title == reference_title:
-                        continue
+                if title == reference_title:
+                    continue
 
-                    # 计算相似度
-                    similarity = self._calculate_similarity(reference_title, title)
+                # 计算相似度
+                similarity = engine.ratio(reference_title, title, threshold)
 
-                    if similarity >= threshold:
-                        news_item = {
-                            "title": title,
-                            "platform": platform_id,
-                            "platform_name": platform_name,
-                            "similarity": round(similarity, 3),
-                            "rank": info["ranks"][0] if info["ranks"] else 0
-                        }
+                if similarity >= threshold:
+                    news_item = {
+                        "title": title,
+                        "platform": platform_id,
+                        "platform_name": platform_name,
+                        "similarity": round(similarity, 3),
+                        "rank": info["ranks"][0] if info["ranks"] else 0
+                    }
 
-                        # 条件性添加 URL 字段
-                        if include_url:
-                            news_item["url"] = info.get("url", "")
+                    # 条件性添加 URL 字段
+                    if include_url:
+                        news_item["url"] = info.get("url", "")
 
-                        similar_items.append(news_item)
+                    similar_items.append(news_item)
 
             # 按相似度排序
             similar_items.sort(key=lambda x: x["similarity"], reverse=True)
@@ -1387,14 +1464,11 @@ class AnalyticsTools:
             current_date = start_date
             while current_date <= end_date:
                 try:
-                    all_titles, id_to_name, timestamps = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date
-                    )
-
-                    for platform_id, titles in all_titles.items():
-                        platform_name = id_to_name.get(platform_id, platform_id)
+                    rollup = self.data_service.parser.read_daily_rollup(date=current_date)
+                    timestamps = dict.fromkeys(f"{crawl_time}.db" for crawl_time in rollup.crawl_times)
 
-                        platform_activity[platform_name]["news_count"] += len(titles)
+                    for platform_name, news_count in zip(rollup.platform_names, rollup.platform_counts):
+                        platform_activity[platform_name]["news_count"] += news_count
                         platform_activity[platform_name]["days_active"].add(current_date.strftime("%Y-%m-%d"))
 
                         # 统计更新次数（基于文件数量）
@@ -1516,16 +1590,10 @@ class AnalyticsTools:
             current_date = start_date
             while current_date <= end_date:
                 try:
-                    all_titles, _, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date
-                    )
+                    rollup = self.data_service.parser.read_daily_rollup(date=current_date)
 
                     # 统计该日的话题出现次数
-                    count = 0
-                    for _, titles in all_titles.items():
-                        for title in titles.keys():
-                            if topic.lower() in title.lower():
-                                count += 1
+                    count = rollup.item_count_for_titles(rollup.match_titles(topic))
 
                     lifecycle_data.append({
                         "date": current_date.strftime("%Y-%m-%d"),
@@ -1960,20 +2028,6 @@ class AnalyticsTools:
 
         return keywords
 
-    def _calculate_similarity(self, text1: str, text2: str) -> float:
-        """
-        计算两个文本的相似度
-
-        Args:
-            text1: 文本1
-            text2: 文本2
-
-        Returns:
-            相似度分数（0-1之间）
-        """
-        # 使用 SequenceMatcher 计算相似度
-        return SequenceMatcher(None, text1, text2).ratio()
-
     def _find_unique_topics(self, platform_stats: Dict) -> Dict[str, List[str]]:
         """
         找出各平台独有的热点话题
@@ -2159,7 +2213,8 @@ class AnalyticsTools:
         """
         对新闻列表进行相似度聚合
 
-        使用双层过滤策略：先用 Jaccard 快速粗筛，再用 SequenceMatcher 精确计算
+        使用三层过滤策略：先用 MinHash/LSH 生成候选对，再用 Jaccard 快速粗筛，
+        最后用 SequenceMatcher 精确计算（阈值低于 LSH_MIN_THRESHOLD 时跳过 LSH，全量比较）
 
         Args:
             news_list: 新闻列表
@@ -2185,6 +2240,12 @@ class AnalyticsTools:
         # 按权重排序
         sorted_items = sorted(prepared_news, key=lambda x: x["data"].get("weight", 0), reverse=True)
 
+        # LSH 候选近邻（签名按标题缓存，跨调用复用）；低阈值下 LSH 召回不足，全量比较
+        engine = get_similarity_engine()
+        neighbors = None
+        if engine.uses_lsh(threshold):
+            neighbors = engine.candidate_neighbors([item["data"]["title"] for item in sorted_items])
+
         aggregated = []
         used_indices = set()
         PRE_FILTER_RATIO = 0.5  # 粗筛阈值系数
@@ -2221,9 +2282,10 @@ class AnalyticsTools:
 
             used_indices.add(i)
 
-            # 查找相似新闻
-            for j in range(i + 1, len(sorted_items)):
-                if j in used_indices:
+            # 查找相似新闻（只检查 LSH 候选）
+            candidates = range(i + 1, len(sorted_items)) if neighbors is None else sorted(neighbors[i])
+            for j in candidates:
+                if j <= i or j in used_indices:
                     continue
 
                 compare_item = sorted_items[j]
@@ -2248,7 +2310,7 @@ class AnalyticsTools:
 
                 # 精确计算：SequenceMatcher
                 other_news = compare_item["data"]
-                real_similarity = self._calculate_similarity(news["title"], other_news["title"])
+                real_similarity = engine.ratio(news["title"], other_news["title"], threshold)
 
                 if real_similarity >= threshold:
                     # 合并到当前组
@@ -2342,8 +2404,8 @@ class AnalyticsTools:
                 )
 
             # 收集两个时期的数据
-            data1 = self._collect_period_data(date_range1, platforms, topic)
-            data2 = self._collect_period_data(date_range2, platforms, topic)
+            data1 = self._collect_period_data(date_range1, platforms, topic, top_n)
+            data2 = self._collect_period_data(date_range2, platforms, topic, top_n)
 
             # 根据对比类型执行不同的分析
             if compare_type == "overview":
@@ -2419,56 +2481,99 @@ class AnalyticsTools:
         self,
         date_range: tuple,
         platforms: Optional[List[str]],
-        topic: Optional[str]
+        topic: Optional[str],
+        top_n: int = 10
     ) -> Dict:
-        """收集指定时期的新闻数据"""
+        """
+        收集指定时期的新闻数据
+
+        基于按日汇总数据（rollup）统计，只为权重最高的 top_n 条新闻构建字典。
+        """
         start_date, end_date = date_range
-        all_news = []
+        news_count = 0
         all_keywords = Counter()
         platform_stats = Counter()
+        keyword_cache: Dict[str, List[str]] = {}
+        weighted_news = []  # (权重, 日期, 汇总数据, 新闻行)
 
         current_date = start_date
         while current_date <= end_date:
             try:
-                all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date(
-                    date=current_date,
-                    platform_ids=platforms
-                )
+                rollup = self.data_service.parser.read_daily_rollup(date=current_date)
+            except DataNotFoundError:
+                current_date += timedelta(days=1)
+                continue
 
-                for platform_id, titles in all_titles.items():
-                    platform_name = id_to_name.get(platform_id, platform_id)
+            date_str = current_date.strftime("%Y-%m-%d")
+            current_date += timedelta(days=1)
 
-                    for title, info in titles.items():
-                        # 如果指定了话题，过滤不相关的新闻
-                        if topic and topic.lower() not in title.lower():
-                            continue
+            # 如果指定了话题，只保留标题包含话题的新闻
+            if topic:
+                items = rollup.items_for_titles(rollup.match_titles(topic))
+            else:
+                items = range(rollup.item_count)
 
-                        news_item = {
-                            "title": title,
-                            "platform": platform_id,
-                            "platform_name": platform_name,
-                            "date": current_date.strftime("%Y-%m-%d"),
-                            "ranks": info.get("ranks", []),
-                            "rank": info["ranks"][0] if info["ranks"] else 999
-                        }
-                        news_item["weight"] = calculate_news_weight(news_item)
-                        all_news.append(news_item)
+            item_platform = rollup.item_platform
+            if platforms:
+                allowed = {
+                    index for index, platform_id in enumerate(rollup.platform_ids)
+                    if platform_id in platforms
+                }
+                if not allowed:
+                    continue
+                # 带平台过滤读取新闻库时按 platform_id 索引返回（平台按 ID 排序），
+                # 保持相同顺序，使权重/词频并列时的先后与逐条读取一致
+                platform_ids = rollup.platform_ids
+                items = sorted(
+                    (item for item in items if item_platform[item] in allowed),
+                    key=lambda item: (platform_ids[item_platform[item]], item)
+                )
+            else:
+                items = list(items)
 
-                        # 统计平台
-                        platform_stats[platform_name] += 1
+            if not items:
+                continue
 
-                        # 提取关键词
-                        keywords = self._extract_keywords(title)
-                        all_keywords.update(keywords)
+            news_count += len(items)
 
-            except DataNotFoundError:
-                pass
+            # 统计平台
+            for platform_index, count in Counter(item_platform[item] for item in items).items():
+                platform_stats[rollup.platform_names[platform_index]] += count
 
-            current_date += timedelta(days=1)
+            # 提取关键词：同一标题只分词一次，按出现次数累加（保持首次出现顺序）
+            item_title = rollup.item_title
+            for title_id, count in Counter(item_title[item] for item in items).items():
+                title = rollup.title(title_id)
+                keywords = keyword_cache.get(title)
+                if keywords is None:
+                    keywords = self._extract_keywords(title)
+                    keyword_cache[title] = keywords
+                for keyword in keywords:
+                    all_keywords[keyword] += count
+
+            weights = _rollup_item_weights(rollup, items)
+            weighted_news.extend(
+                (weight, date_str, rollup, item) for weight, item in zip(weights, items)
+            )
+
+        # 与 sorted(..., reverse=True)[:top_n] 等价（权重相同时保持原有顺序）
+        top_news = []
+        for weight, date_str, rollup, item in heapq.nlargest(
+            top_n, weighted_news, key=lambda entry: entry[0]
+        ):
+            platform_index = rollup.item_platform[item]
+            top_news.append({
+                "title": rollup.title(rollup.item_title[item]),
+                "platform": rollup.platform_ids[platform_index],
+                "platform_name": rollup.platform_names[platform_index],
+                "date": date_str,
+                "rank": rollup.item_rank[item],
+                "weight": weight
+            })
 
         return {
-            "news": all_news,
-            "news_count": len(all_news),
+            "top_news": top_news,
+            "news_count": news_count,
             "keywords": all_keywords,
             "platform_stats": platform_stats,
             "date_range": date_range
@@ -2496,8 +2601,8 @@ class AnalyticsTools:
         persistent_keywords = [kw for kw in top_kw1 if kw in top_kw2]
 
         # TOP 新闻对比
-        top_news1 = sorted(data1["news"], key=lambda x: x.get("weight", 0), reverse=True)[:top_n]
-        top_news2 = sorted(data2["news"], key=lambda x: x.get("weight", 0), reverse=True)[:top_n]
+        top_news1 = data1["top_news"][:top_n]
+        top_news2 = data2["top_news"][:top_n]
 
         return {
             "overview": {
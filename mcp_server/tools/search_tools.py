@@ -4,13 +4,16 @@
 提供模糊搜索、链接查询、历史相关新闻检索等高级搜索功能。
 """
 
-import re
+import math
 from collections import Counter
 from datetime import datetime, timedelta
 from difflib import SequenceMatcher
 from typing import Dict, List, Optional, Tuple, Union
 
+from trendradar.storage.search_index import extract_keywords, get_search_index
+
 from ..services.data_service import DataService
+from ..services.similarity_service import get_similarity_engine
 from ..utils.validators import validate_keyword, validate_limit, validate_threshold, normalize_date_range
 from ..utils.errors import MCPError, InvalidParameterError, DataNotFoundError
 
@@ -26,6 +29,56 @@ class SearchTools:
             project_root: 项目根目录
         """
         self.data_service = DataService(project_root)
+        self.search_index = get_search_index(
+            str(self.data_service.parser.project_root / "output")
+        )
+
+    def _find_candidates(self, finder: str, query: str, dates: List[datetime], **kwargs) -> Optional[Dict]:
+        """
+        通过跨日期搜索索引获取候选标题
+
+        Args:
+            finder: "substring" 或 "similar"
+            query: 查询文本
+            dates: 日期列表
+            **kwargs: 传给 NewsSearchIndex.find_similar 的参数
+
+        Returns:
+            {date: {(platform_id, title), ...}}，索引不可用时返回 None（调用方回退为全量扫描）
+        """
+        date_strs = sorted({d.strftime("%Y-%m-%d") for d in dates})
+        try:
+            if finder == "substring":
+                return self.search_index.find_substring(query, date_strs)
+            return self.search_index.find_similar(query, date_strs, **kwargs)
+        except Exception as e:
+            print(f"Warning: 搜索索引不可用，回退为全量扫描: {e}")
+            return None
+
+    @staticmethod
+    def _narrow_titles(all_titles: Dict, candidates: set) -> Dict:
+        """只保留候选标题（保持原有顺序）"""
+        by_platform: Dict[str, set] = {}
+        for platform_id, title in candidates:
+            by_platform.setdefault(platform_id, set()).add(title)
+
+        narrowed = {}
+        for platform_id, titles in all_titles.items():
+            selected = by_platform.get(platform_id)
+            if selected:
+                narrowed[platform_id] = {
+                    title: info for title, info in titles.items() if title in selected
+                }
+        return narrowed
+
+    @staticmethod
+    def _date_list(start_date: datetime, end_date: datetime) -> List[datetime]:
+        dates = []
+        current = start_date
+        while current <= end_date:
+            dates.append(current)
+            current += timedelta(days=1)
+        return dates
 
     def search_news_unified(
         self,
@@ -117,16 +170,37 @@ class SearchTools:
                 # 使用最新可用日期
                 start_date = end_date = latest
 
+            # 通过搜索索引缩小候选范围（精确匹配 / 打分仍按原逻辑执行）
+            search_dates = self._date_list(start_date, end_date)
+            if search_mode == "fuzzy":
+                query_words = set(self._extract_keywords(query))
+                candidates = self._find_candidates(
+                    "similar", query, search_dates,
+                    min_ratio=threshold,
+                    tokens=query_words,
+                    min_shared_tokens=math.ceil(len(query_words) * 0.5),
+                    include_substring=True,
+                )
+            else:
+                candidates = self._find_candidates("substring", query, search_dates)
+
             # 收集所有匹配的新闻
             all_matches = []
-            current_date = start_date
 
-            while current_date <= end_date:
+            for current_date in search_dates:
+                date_candidates = None
+                if candidates is not None:
+                    date_candidates = candidates.get(current_date.strftime("%Y-%m-%d"))
+                    if not date_candidates:
+                        continue
+
                 try:
                     all_titles, id_to_name, timestamps = self.data_service.parser.read_all_titles_for_date(
                         date=current_date,
                         platform_ids=platforms
                     )
+                    if date_candidates is not None:
+                        all_titles = self._narrow_titles(all_titles, date_candidates)
 
                     # 根据搜索模式执行不同的搜索逻辑
                     if search_mode == "keyword":
@@ -148,8 +222,6 @@ class SearchTools:
                     # 该日期没有数据，继续下一天
                     pass
 
-                current_date += timedelta(days=1)
-
             if not all_matches:
                 # 获取可用日期范围用于错误提示
                 earliest, latest = self.data_service.get_available_date_range()
@@ -431,8 +503,8 @@ class SearchTools:
         if query.lower() in text.lower():
             return True, 1.0
 
-        # 计算整体相似度
-        similarity = self._calculate_similarity(query, text)
+        # 计算整体相似度（上界低于阈值时提前返回，不影响匹配结果）
+        similarity = get_similarity_engine().ratio(query.lower(), text.lower(), threshold)
         if similarity >= threshold:
             return True, similarity
 
@@ -463,17 +535,8 @@ class SearchTools:
         Returns:
             关键词列表
         """
-        # 移除URL和特殊字符
-        text = re.sub(r'http[s]?://\S+', '', text)
-        text = re.sub(r'\[.*?\]', '', text)  # 移除方括号内容
-
-        # 使用正则表达式分词（中文和英文）
-        words = re.findall(r'[\w]+', text)
-
-        # 过滤短词
-        keywords = [word for word in words if word and len(word) >= min_length]
-
-        return keywords
+        # 与搜索索引使用同一分词规则
+        return extract_keywords(text, min_length)
 
     def _calculate_keyword_overlap(self, keywords1: List[str], keywords2: List[str]) -> float:
         """
@@ -607,14 +670,31 @@ class SearchTools:
                     suggestion="请提供更详细的文本内容"
                 )
 
+            # 通过搜索索引缩小候选范围：
+            # 综合分 = 0.7 * 关键词重合 + 0.3 * 文本相似度，没有共享关键词时需要文本相似度 >= threshold / 0.3
+            search_dates = self._date_list(search_start, search_end)
+            candidates = self._find_candidates(
+                "similar", reference_title, search_dates,
+                min_ratio=threshold / 0.3 if threshold <= 0.3 else None,
+                tokens=reference_keywords,
+                min_shared_tokens=1,
+            )
+
             # 收集所有相关新闻
             all_related_news = []
-            current_date = search_start
 
-            while current_date <= search_end:
+            for current_date in search_dates:
+                date_candidates = None
+                if candidates is not None:
+                    date_candidates = candidates.get(current_date.strftime("%Y-%m-%d"))
+                    if not date_candidates:
+                        continue
+
                 try:
                     # 读取该日期的数据
                     all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date(current_date)
+                    if date_candidates is not None:
+                        all_titles = self._narrow_titles(all_titles, date_candidates)
 
                     # 搜索相关新闻
                     for platform_id, titles in all_titles.items():
@@ -663,9 +743,6 @@ class SearchTools:
                     # 记录错误但继续处理其他日期
                     print(f"Warning: 处理日期 {current_date.strftime('%Y-%m-%d')} 时出错: {e}")
 
-                # 移动到下一天
-                current_date += timedelta(days=1)
-
             if not all_related_news:
                 return {
                     "success": True,
@@ -813,12 +890,34 @@ class SearchTools:
             # 提取参考标题的关键词
             reference_keywords = self._extract_keywords(reference_title)
 
+            # 通过搜索索引缩小候选范围：
+            # 相似度 = 0.7 * 文本相似度 + 0.3 * 关键词重合，没有共享关键词时需要文本相似度 >= threshold / 0.7
+            if reference_keywords:
+                candidates = self._find_candidates(
+                    "similar", reference_title, search_dates,
+                    min_ratio=threshold / 0.7 if threshold <= 0.7 else None,
+                    tokens=reference_keywords,
+                    min_shared_tokens=1,
+                )
+            else:
+                candidates = self._find_candidates(
+                    "similar", reference_title, search_dates, min_ratio=threshold
+                )
+
             # 收集所有相关新闻
             all_related_news = []
             
             for search_date in search_dates:
+                date_candidates = None
+                if candidates is not None:
+                    date_candidates = candidates.get(search_date.strftime("%Y-%m-%d"))
+                    if not date_candidates:
+                        continue
+
                 try:
                     all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date(search_date)
+                    if date_candidates is not None:
+                        all_titles = self._narrow_titles(all_titles, date_candidates)
                     
                     for platform_id, titles in all_titles.items():
                         platform_name = id_to_name.get(platform_id, platform_id)
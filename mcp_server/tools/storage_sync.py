@@ -8,7 +8,7 @@
 import os
 import re
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Dict, List, Optional
 
 import yaml
@@ -244,57 +244,23 @@ class StorageSyncTools:
                     }
                 }
 
-            # 获取本地数据目录
-            local_dir = self._get_local_data_dir()
-            local_dir.mkdir(parents=True, exist_ok=True)
-
-            # 获取远程可用日期
-            remote_dates = remote_backend.list_remote_dates()
-
-            # 获取本地已有日期
-            local_dates = set(self._get_local_dates())
-
             # 计算需要拉取的日期（最近 N 天）
             from trendradar.utils.time import get_configured_time
+            from trendradar.storage.remote_pull import DEFAULT_MAX_WORKERS, RemotePuller
             config = self._load_config()
             timezone = config.get("app", {}).get("timezone", "Asia/Shanghai")
             now = get_configured_time(timezone)
+            max_workers = self._get_storage_config().get("pull", {}).get("max_workers", DEFAULT_MAX_WORKERS)
+
+            # 并行拉取到 output/news/{date}.db：远程未变化的日期跳过，本地写入过的文件不覆盖
+            puller = RemotePuller(
+                remote_backend, str(self._get_local_data_dir()), db_type="news", max_workers=max_workers
+            )
+            result = puller.pull_recent_days(days, now)
 
-            target_dates = []
-            for i in range(days):
-                date = now - timedelta(days=i)
-                date_str = date.strftime("%Y-%m-%d")
-                if date_str in remote_dates:
-                    target_dates.append(date_str)
-
-            # 执行拉取
-            synced_dates = []
-            skipped_dates = []
-            failed_dates = []
-
-            for date_str in target_dates:
-                # 检查本地是否已存在
-                if date_str in local_dates:
-                    skipped_dates.append(date_str)
-                    continue
-
-                # 拉取单个日期
-                try:
-                    local_date_dir = local_dir / date_str
-                    local_db_path = local_date_dir / "news.db"
-                    remote_key = f"news/{date_str}.db"
-
-                    local_date_dir.mkdir(parents=True, exist_ok=True)
-                    remote_backend.s3_client.download_file(
-                        remote_backend.bucket_name,
-                        remote_key,
-                        str(local_db_path)
-                    )
-                    synced_dates.append(date_str)
-                    print(f"[存储同步] 已拉取: {date_str}")
-                except Exception as e:
-                    failed_dates.append({"date": date_str, "error": str(e)})
-                    print(f"[存储同步] 拉取失败 ({date_str}): {e}")
+            synced_dates = result.pulled
+            skipped_dates = sorted(result.unchanged + result.skipped, reverse=True)
+            failed_dates = result.failed
 
             return {
                 "success": True,
@@ -307,10 +273,13 @@ class StorageSyncTools:
                 "data": {
                     "synced_dates": synced_dates,
                     "skipped_dates": skipped_dates,
-                    "failed_dates": failed_dates
+                    "failed_dates": failed_dates,
+                    "downloaded_mb": round(result.bytes_downloaded / 1024 / 1024, 2),
+                    "elapsed_seconds": round(result.seconds, 2),
+                    "throughput_mb_s": round(result.throughput, 2)
                 },
                 "message": f"成功同步 {len(synced_dates)} 天数据" + (
-                    f"，跳过 {len(skipped_dates)} 天（本地已存在）" if skipped_dates else ""
+                    f"，跳过 {len(skipped_dates)} 天（远程未变化或本地已存在）" if skipped_dates else ""
                 ) + (
                     f"，失败 {len(failed_dates)} 天" if failed_dates else ""
                 )
@@ -7,7 +7,15 @@ TrendRadar - 热点新闻聚合与分析工具
   trendradar                  # 安装后执行
 """
 
-from trendradar.context import AppContext
-
 __version__ = "5.4.0"
 __all__ = ["AppContext", "__version__"]
+
+
+def __getattr__(name):
+    # AppContext 依赖报告、通知、AI 等模块，延迟到首次访问时导入，
+    # 使只用到 trendradar.storage / trendradar.core 的调用方（如 MCP 服务）不必加载它们
+    if name == "AppContext":
+        from trendradar.context import AppContext
+
+        return AppContext
+    raise AttributeError(f"module 'trendradar' has no attribute {name!r}")
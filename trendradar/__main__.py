@@ -6,12 +6,18 @@ TrendRadar 主程序
 支持: python -m trendradar
 """
 
+import argparse
 import os
 import re
 import webbrowser
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 
+from trendradar.profiling import PROFILE_FLAG, enable_if_requested, startup_profiler
+
+# 需要在导入其余依赖之前开启，才能统计到完整的导入耗时
+enable_if_requested()
+
 import requests
 
 from trendradar.context import AppContext
@@ -226,7 +232,15 @@ class NewsAnalyzer:
         self.update_info = None
         self.proxy_url = None
         self._setup_proxy()
-        self.data_fetcher = DataFetcher(self.proxy_url)
+        self.data_fetcher = DataFetcher(
+            self.proxy_url,
+            max_workers=self.ctx.config.get("CRAWLER_MAX_WORKERS", 1),
+            per_host_concurrency=self.ctx.config.get("CRAWLER_PER_HOST_CONCURRENCY", 4),
+            crawl_timeout=self.ctx.config.get("CRAWLER_TIMEOUT", 0),
+            per_host_interval=self.ctx.config.get("CRAWLER_PER_HOST_INTERVAL"),
+        )
+        # RSS 抓取器延迟创建，常驻模式下跨轮次复用（Session 连接池）
+        self._rss_fetcher = None
 
         # 初始化存储管理器（使用 AppContext）
         self._init_storage_manager()
@@ -1032,6 +1046,21 @@ class NewsAnalyzer:
         if self.storage_manager.save_news_data(news_data):
             print(f"数据已保存到存储后端: {self.storage_manager.backend_name}")
 
+            # 增量更新跨日期搜索索引（仅本地存储）
+            local_config = self.ctx.config["STORAGE"].get("LOCAL", {})
+            if self.storage_manager.backend_name == "local" and local_config.get("SEARCH_INDEX", True):
+                from trendradar.storage.search_index import update_search_index
+
+                added = update_search_index(local_config.get("DATA_DIR", "output"), crawl_date)
+                if added:
+                    print(f"[搜索索引] 新增 {added} 条标题")
+
+            # 更新当天的列式汇总文件，并封存之前的汇总文件（仅本地存储）
+            if self.storage_manager.backend_name == "local" and local_config.get("ROLLUP", True):
+                from trendradar.storage.rollup import update_daily_rollups
+
+                update_daily_rollups(local_config.get("DATA_DIR", "output"), crawl_date)
+
         # 保存 TXT 快照（如果启用）
         txt_file = self.storage_manager.save_txt_snapshot(news_data)
         if txt_file:
@@ -1064,63 +1093,10 @@ class NewsAnalyzer:
             return None, None, None
 
         try:
-            from trendradar.crawler.rss import RSSFetcher, RSSFeedConfig
-
-            # 构建 RSS 源配置
-            feeds = []
-            for feed_config in rss_feeds:
-                # 读取并验证单个 feed 的 max_age_days（可选）
-                max_age_days_raw = feed_config.get("max_age_days")
-                max_age_days = None
-                if max_age_days_raw is not None:
-                    try:
-                        max_age_days = int(max_age_days_raw)
-                        if max_age_days < 0:
-                            feed_id = feed_config.get("id", "unknown")
-                            print(f"[警告] RSS feed '{feed_id}' 的 max_age_days 为负数，将使用全局默认值")
-                            max_age_days = None
-                    except (ValueError, TypeError):
-                        feed_id = feed_config.get("id", "unknown")
-                        print(f"[警告] RSS feed '{feed_id}' 的 max_age_days 格式错误：{max_age_days_raw}")
-                        max_age_days = None
-
-                feed = RSSFeedConfig(
-                    id=feed_config.get("id", ""),
-                    name=feed_config.get("name", ""),
-                    url=feed_config.get("url", ""),
-                    max_items=feed_config.get("max_items", 50),
-                    enabled=feed_config.get("enabled", True),
-                    max_age_days=max_age_days,  # None=使用全局，0=禁用，>0=覆盖
-                )
-                if feed.id and feed.url and feed.enabled:
-                    feeds.append(feed)
-
-            if not feeds:
-                print("[RSS] 没有启用的 RSS 源")
+            fetcher = self._get_rss_fetcher(rss_feeds)
+            if fetcher is None:
                 return None, None, None
 
-            # 创建抓取器
-            rss_config = self.ctx.rss_config
-            # RSS 代理：优先使用 RSS 专属代理，否则使用爬虫默认代理
-            rss_proxy_url = rss_config.get("PROXY_URL", "") or self.proxy_url or ""
-            # 获取配置的时区
-            timezone = self.ctx.config.get("TIMEZONE", "Asia/Shanghai")
-            # 获取新鲜度过滤配置
-            freshness_config = rss_config.get("FRESHNESS_FILTER", {})
-            freshness_enabled = freshness_config.get("ENABLED", True)
-            default_max_age_days = freshness_config.get("MAX_AGE_DAYS", 3)
-
-            fetcher = RSSFetcher(
-                feeds=feeds,
-                request_interval=rss_config.get("REQUEST_INTERVAL", 2000),
-                timeout=rss_config.get("TIMEOUT", 15),
-                use_proxy=rss_config.get("USE_PROXY", False),
-                proxy_url=rss_proxy_url,
-                timezone=timezone,
-                freshness_enabled=freshness_enabled,
-                default_max_age_days=default_max_age_days,
-            )
-
             # 抓取数据
             rss_data = fetcher.fetch_all()
 
@@ -1142,6 +1118,78 @@ class NewsAnalyzer:
             print(f"[RSS] 抓取失败: {e}")
             return None, None, None
 
+    def _get_rss_fetcher(self, rss_feeds: List[Dict]):
+        """创建 RSS 抓取器（已创建时直接复用），没有启用的源时返回 None"""
+        if self._rss_fetcher is not None:
+            return self._rss_fetcher
+
+        from trendradar.crawler.rss import RSSFetcher, RSSFeedConfig
+
+        # 构建 RSS 源配置
+        feeds = []
+        for feed_config in rss_feeds:
+            # 读取并验证单个 feed 的 max_age_days（可选）
+            max_age_days_raw = feed_config.get("max_age_days")
+            max_age_days = None
+            if max_age_days_raw is not None:
+                try:
+                    max_age_days = int(max_age_days_raw)
+                    if max_age_days < 0:
+                        feed_id = feed_config.get("id", "unknown")
+                        print(f"[警告] RSS feed '{feed_id}' 的 max_age_days 为负数，将使用全局默认值")
+                        max_age_days = None
+                except (ValueError, TypeError):
+                    feed_id = feed_config.get("id", "unknown")
+                    print(f"[警告] RSS feed '{feed_id}' 的 max_age_days 格式错误：{max_age_days_raw}")
+                    max_age_days = None
+
+            feed = RSSFeedConfig(
+                id=feed_config.get("id", ""),
+                name=feed_config.get("name", ""),
+                url=feed_config.get("url", ""),
+                max_items=feed_config.get("max_items", 50),
+                enabled=feed_config.get("enabled", True),
+                max_age_days=max_age_days,  # None=使用全局，0=禁用，>0=覆盖
+            )
+            if feed.id and feed.url and feed.enabled:
+                feeds.append(feed)
+
+        if not feeds:
+            print("[RSS] 没有启用的 RSS 源")
+            return None
+
+        # 创建抓取器
+        rss_config = self.ctx.rss_config
+        # RSS 代理：优先使用 RSS 专属代理，否则使用爬虫默认代理
+        rss_proxy_url = rss_config.get("PROXY_URL", "") or self.proxy_url or ""
+        # 获取配置的时区
+        timezone = self.ctx.config.get("TIMEZONE", "Asia/Shanghai")
+        # 获取新鲜度过滤配置
+        freshness_config = rss_config.get("FRESHNESS_FILTER", {})
+        freshness_enabled = freshness_config.get("ENABLED", True)
+        default_max_age_days = freshness_config.get("MAX_AGE_DAYS", 3)
+
+        # 条件请求校验信息存储（ETag / Last-Modified / 内容哈希）
+        validator_store_path = None
+        if rss_config.get("CONDITIONAL_GET", True):
+            data_dir = self.ctx.config.get("STORAGE", {}).get("LOCAL", {}).get("DATA_DIR", "output")
+            validator_store_path = str(Path(data_dir) / "cache" / "rss_validators.db")
+
+        self._rss_fetcher = RSSFetcher(
+            feeds=feeds,
+            request_interval=rss_config.get("REQUEST_INTERVAL", 2000),
+            timeout=rss_config.get("TIMEOUT", 15),
+            use_proxy=rss_config.get("USE_PROXY", False),
+            proxy_url=rss_proxy_url,
+            timezone=timezone,
+            freshness_enabled=freshness_enabled,
+            default_max_age_days=default_max_age_days,
+            max_workers=rss_config.get("MAX_WORKERS", 1),
+            per_domain_concurrency=rss_config.get("PER_DOMAIN_CONCURRENCY", 2),
+            validator_store_path=validator_store_path,
+        )
+        return self._rss_fetcher
+
     def _process_rss_data_by_mode(self, rss_data) -> Tuple[Optional[List[Dict]], Optional[List[Dict]], Optional[List[Dict]]]:
         """
         按报告模式处理 RSS 数据，返回与热榜相同格式的统计结构
@@ -1367,12 +1415,11 @@ class NewsAnalyzer:
         try:
             word_groups, filter_words, global_filters = self.ctx.load_frequency_words()
             if word_groups or filter_words or global_filters:
-                from trendradar.core.frequency import matches_word_groups
-                filtered_items = []
-                for item in rss_items:
-                    title = item.get("title", "")
-                    if matches_word_groups(title, word_groups, filter_words, global_filters):
-                        filtered_items.append(item)
+                from trendradar.core.frequency import get_compiled_word_groups
+                matcher = get_compiled_word_groups(word_groups, filter_words, global_filters)
+                filtered_items = [
+                    item for item in rss_items if matcher.matches(item.get("title", ""))
+                ]
 
                 original_count = len(rss_items)
                 rss_items = filtered_items
@@ -1602,8 +1649,13 @@ class NewsAnalyzer:
 
         return html_file
 
-    def run(self) -> None:
-        """执行分析流程"""
+    def run(self, keep_alive: bool = False) -> None:
+        """
+        执行分析流程
+
+        Args:
+            keep_alive: 常驻模式下为 True，结束时只清理过期数据，保留连接供下一轮复用
+        """
         try:
             self._initialize_and_check_config()
 
@@ -1627,16 +1679,83 @@ class NewsAnalyzer:
             if self.ctx.config.get("DEBUG", False):
                 raise
         finally:
-            # 清理资源（包括过期数据清理和数据库连接关闭）
-            self.ctx.cleanup()
+            if keep_alive:
+                self.ctx.end_cycle()
+            else:
+                # 清理资源（包括过期数据清理和数据库连接关闭）
+                self.ctx.cleanup()
+
+    def close(self) -> None:
+        """释放所有资源（HTTP Session、RSS 校验信息存储、数据库连接）"""
+        self.data_fetcher.close()
+        if self._rss_fetcher is not None:
+            self._rss_fetcher.close()
+            self._rss_fetcher = None
+        self.ctx.cleanup()
+
+
+def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """解析命令行参数"""
+    parser = argparse.ArgumentParser(
+        prog="trendradar",
+        description="TrendRadar 热点新闻聚合与分析工具",
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="常驻模式：进程内按 cron 表达式定时运行，跨轮次复用连接和缓存",
+    )
+    parser.add_argument(
+        "--schedule",
+        default=None,
+        help="常驻模式的 cron 表达式（默认读取环境变量 CRON_SCHEDULE，未设置时为 \"*/30 * * * *\"）",
+    )
+    parser.add_argument(
+        "--immediate",
+        action="store_true",
+        default=None,
+        help="常驻模式启动后立即执行一次（默认读取环境变量 IMMEDIATE_RUN）",
+    )
+    parser.add_argument(
+        PROFILE_FLAG,
+        action="store_true",
+        help="输出启动耗时分析（各模块导入耗时和初始化阶段耗时）",
+    )
+    return parser.parse_args(argv)
+
+
+def _serve(config: Dict, args: argparse.Namespace) -> None:
+    """以常驻模式运行"""
+    from trendradar.daemon import CronSchedule, Daemon, DEFAULT_SCHEDULE
+
+    expression = args.schedule or os.environ.get("CRON_SCHEDULE", "").strip() or DEFAULT_SCHEDULE
+    schedule = CronSchedule(expression)
+
+    immediate = args.immediate
+    if immediate is None:
+        immediate = os.environ.get("IMMEDIATE_RUN", "").strip().lower() in ("true", "1", "yes")
+
+    with startup_profiler.phase("初始化常驻调度"):
+        daemon = Daemon(
+            config=config,
+            analyzer_factory=lambda cfg: NewsAnalyzer(config=cfg),
+            config_loader=load_config,
+            schedule=schedule,
+            immediate=immediate,
+            config_path=os.environ.get("CONFIG_PATH", "config/config.yaml"),
+        )
+    startup_profiler.report()
+    daemon.run()
 
 
-def main():
+def main(argv: Optional[List[str]] = None):
     """主程序入口"""
+    args = _parse_args(argv)
     debug_mode = False
     try:
         # 先加载配置以获取 version_check_url
-        config = load_config()
+        with startup_profiler.phase("加载配置"):
+            config = load_config()
         version_url = config.get("VERSION_CHECK_URL", "")
         configs_version_url = config.get("CONFIGS_VERSION_CHECK_URL", "")
 
@@ -1644,10 +1763,18 @@ def main():
         need_update = False
         remote_version = None
         if version_url:
-            need_update, remote_version = check_all_versions(version_url, configs_version_url)
+            with startup_profiler.phase("版本检查"):
+                need_update, remote_version = check_all_versions(version_url, configs_version_url)
+
+        if args.serve:
+            debug_mode = config.get("DEBUG", False)
+            _serve(config, args)
+            return
 
         # 复用已加载的配置，避免重复加载
-        analyzer = NewsAnalyzer(config=config)
+        with startup_profiler.phase("初始化分析器"):
+            analyzer = NewsAnalyzer(config=config)
+        startup_profiler.report()
 
         # 设置更新信息（复用已获取的远程版本，不再重复请求）
         if analyzer.is_github_actions and need_update and remote_version:
@@ -1658,7 +1785,16 @@ def main():
 
         # 获取 debug 配置
         debug_mode = analyzer.ctx.config.get("DEBUG", False)
-        analyzer.run()
+
+        # 与常驻模式共用运行锁，避免手动执行和定时执行同时写数据
+        from trendradar.daemon import get_run_lock
+
+        with get_run_lock(analyzer.ctx.config) as acquired:
+            if not acquired:
+                print("另一个 TrendRadar 实例正在运行，本次跳过")
+                analyzer.close()
+                return
+            analyzer.run()
     except FileNotFoundError as e:
         print(f"❌ 配置文件错误: {e}")
         print("\n请确保以下文件存在:")
@@ -7,6 +7,7 @@ TrendRadar AI 模块
 
 from .analyzer import AIAnalyzer, AIAnalysisResult
 from .translator import AITranslator, TranslationResult, BatchTranslationResult
+from .translation_memory import TranslationMemory
 from .formatter import (
     get_ai_analysis_renderer,
     render_ai_analysis_markdown,
@@ -25,6 +26,7 @@ __all__ = [
     "AITranslator",
     "TranslationResult",
     "BatchTranslationResult",
+    "TranslationMemory",
     # 格式化
     "get_ai_analysis_renderer",
     "render_ai_analysis_markdown",
@@ -390,17 +390,19 @@ class AIAnalyzer:
             return first
         return f"{first}~{last}"
 
-    def _format_rank_timeline(self, rank_timeline: List[Dict]) -> str:
-        """格式化排名时间线"""
+    def _format_rank_timeline(self, rank_timeline: List) -> str:
+        """格式化排名时间线（元素为 (时间, 排名) 元组或 {"time", "rank"} 字典）"""
         if not rank_timeline:
             return "-"
 
         parts = []
         for item in rank_timeline:
-            time_str = item.get("time", "")
+            if isinstance(item, dict):
+                time_str, rank = item.get("time", ""), item.get("rank")
+            else:
+                time_str, rank = item
             if len(time_str) == 5 and time_str[2] == '-':
                 time_str = time_str.replace('-', ':')
-            rank = item.get("rank")
             if rank is None:
                 parts.append(f"0({time_str})")
             else:
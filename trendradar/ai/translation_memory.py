@@ -0,0 +1,174 @@
+# coding=utf-8
+"""
+AI 翻译记忆存储
+
+持久化保存已翻译的文本，键为 (规范化原文, 目标语言, 提示词版本)：
+同一标题在多次运行中只翻译一次，提示词或目标语言变化后自动失效。
+超过保留天数未被使用的条目在打开时清理（每个进程对同一文件只清理一次）。
+"""
+
+import hashlib
+import re
+import sqlite3
+import threading
+import unicodedata
+from pathlib import Path
+from typing import Dict, Iterable
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS translations (
+    source_hash TEXT NOT NULL,
+    language TEXT NOT NULL,
+    prompt_version TEXT NOT NULL,
+    source_text TEXT NOT NULL,
+    translated_text TEXT NOT NULL,
+    updated_at TEXT DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (source_hash, language, prompt_version)
+);
+"""
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# SQLite 单条语句的参数数量上限（保守取值）
+_QUERY_CHUNK = 500
+
+# 本进程已清理过过期条目的数据库文件（常驻模式下重新加载配置时不再重复清理）
+_pruned_paths: set = set()
+_pruned_lock = threading.Lock()
+
+
+def normalize_text(text: str) -> str:
+    """规范化原文（NFKC + 折叠空白），作为翻译记忆的键"""
+    return _WHITESPACE_RE.sub(" ", unicodedata.normalize("NFKC", text)).strip()
+
+
+def _hash_text(normalized: str) -> str:
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class TranslationMemory:
+    """
+    翻译记忆（SQLite）
+
+    只应在单个线程中访问（AITranslator 在调用线程中查询和写回，并发的只是模型请求）。
+    """
+
+    def __init__(self, db_path: str, language: str, prompt_version: str, retention_days: int = 30):
+        """
+        初始化翻译记忆
+
+        Args:
+            db_path: SQLite 文件路径（目录不存在时自动创建）
+            language: 目标语言
+            prompt_version: 提示词版本（提示词内容的哈希）
+            retention_days: 条目保留天数（按最近使用时间，0=永久保留）
+        """
+        self.db_path = Path(db_path)
+        self.language = language
+        self.prompt_version = prompt_version
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path))
+        self._conn.executescript(_SCHEMA)
+        if retention_days and retention_days > 0 and self._claim_prune():
+            self._conn.execute(
+                "DELETE FROM translations WHERE updated_at < datetime('now', ?)",
+                (f"-{int(retention_days)} days",),
+            )
+        self._conn.commit()
+
+    def _claim_prune(self) -> bool:
+        """本进程是否尚未清理过该文件（首次调用时登记）"""
+        key = str(self.db_path.resolve())
+        with _pruned_lock:
+            if key in _pruned_paths:
+                return False
+            _pruned_paths.add(key)
+            return True
+
+    def lookup(self, texts: Iterable[str]) -> Dict[str, str]:
+        """
+        查询已有译文
+
+        Args:
+            texts: 原文列表
+
+        Returns:
+            {原文: 译文}，只包含命中的条目
+        """
+        by_hash: Dict[str, list] = {}
+        for text in texts:
+            by_hash.setdefault(_hash_text(normalize_text(text)), []).append(text)
+        if not by_hash:
+            return {}
+
+        found: Dict[str, str] = {}
+        hashes = list(by_hash)
+        for start in range(0, len(hashes), _QUERY_CHUNK):
+            chunk = hashes[start:start + _QUERY_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._conn.execute(
+                f"""
+                SELECT source_hash, translated_text FROM translations
+                WHERE language = ? AND prompt_version = ? AND source_hash IN ({placeholders})
+                """,
+                (self.language, self.prompt_version, *chunk),
+            ).fetchall()
+            for source_hash, translated in rows:
+                for text in by_hash[source_hash]:
+                    found[text] = translated
+
+        if found:
+            # 刷新最近使用时间，常用条目不会被清理
+            self._conn.executemany(
+                """
+                UPDATE translations SET updated_at = CURRENT_TIMESTAMP
+                WHERE source_hash = ? AND language = ? AND prompt_version = ?
+                """,
+                [
+                    (_hash_text(normalize_text(text)), self.language, self.prompt_version)
+                    for text in found
+                ],
+            )
+            self._conn.commit()
+        return found
+
+    def save(self, translations: Dict[str, str]) -> None:
+        """
+        写回译文
+
+        Args:
+            translations: {原文: 译文}
+        """
+        rows = [
+            (
+                _hash_text(normalize_text(text)),
+                self.language,
+                self.prompt_version,
+                normalize_text(text),
+                translated,
+            )
+            for text, translated in translations.items()
+            if translated
+        ]
+        if not rows:
+            return
+        self._conn.executemany(
+            """
+            INSERT INTO translations
+                (source_hash, language, prompt_version, source_text, translated_text, updated_at)
+            VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+            ON CONFLICT(source_hash, language, prompt_version) DO UPDATE SET
+                translated_text = excluded.translated_text,
+                updated_at = CURRENT_TIMESTAMP
+            """,
+            rows,
+        )
+        self._conn.commit()
+
+    def close(self) -> None:
+        """关闭数据库连接"""
+        try:
+            self._conn.close()
+        except sqlite3.Error:
+            pass
@@ -4,14 +4,23 @@ AI 翻译器模块
 
 对推送内容进行多语言翻译
 基于 LiteLLM 统一接口，支持 100+ AI 提供商
+
+批量翻译先查询翻译记忆，只把未命中的文本按大小分块、并发发送给模型，结果写回记忆。
 """
 
-import json
+import hashlib
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from trendradar.ai.client import AIClient
+from trendradar.ai.translation_memory import TranslationMemory
+
+
+# 单次请求的原文字符数上限（避免提示词和输出超出模型上下文 / max_tokens）
+MAX_CHUNK_CHARS = 4000
 
 
 @dataclass
@@ -35,13 +44,19 @@ class BatchTranslationResult:
 class AITranslator:
     """AI 翻译器"""
 
-    def __init__(self, translation_config: Dict[str, Any], ai_config: Dict[str, Any]):
+    def __init__(
+        self,
+        translation_config: Dict[str, Any],
+        ai_config: Dict[str, Any],
+        memory_path: Optional[str] = None,
+    ):
         """
         初始化 AI 翻译器
 
         Args:
             translation_config: AI 翻译配置 (AI_TRANSLATION)
             ai_config: AI 模型配置（LiteLLM 格式）
+            memory_path: 翻译记忆 SQLite 文件路径（None=不使用翻译记忆）
         """
         self.translation_config = translation_config
         self.ai_config = ai_config
@@ -49,6 +64,8 @@ class AITranslator:
         # 翻译配置
         self.enabled = translation_config.get("ENABLED", False)
         self.target_language = translation_config.get("LANGUAGE", "English")
+        self.batch_size = max(1, int(translation_config.get("BATCH_SIZE", 50) or 1))
+        self.max_workers = max(1, int(translation_config.get("MAX_WORKERS", 3) or 1))
 
         # 创建 AI 客户端（基于 LiteLLM）
         self.client = AIClient(ai_config)
@@ -58,6 +75,25 @@ class AITranslator:
             translation_config.get("PROMPT_FILE", "ai_translation_prompt.txt")
         )
 
+        # 提示词版本：提示词内容变化后，旧译文自动失效
+        self.prompt_version = hashlib.blake2b(
+            f"{self.system_prompt}\n[user]\n{self.user_prompt_template}".encode("utf-8"),
+            digest_size=8,
+        ).hexdigest()
+
+        # 翻译记忆
+        self.memory: Optional[TranslationMemory] = None
+        if memory_path and self.enabled:
+            try:
+                self.memory = TranslationMemory(
+                    memory_path,
+                    language=self.target_language,
+                    prompt_version=self.prompt_version,
+                    retention_days=translation_config.get("MEMORY_RETENTION_DAYS", 30),
+                )
+            except (sqlite3.Error, OSError) as e:
+                print(f"[翻译] 翻译记忆不可用，将直接调用模型: {e}")
+
     def _load_prompt_template(self, prompt_file: str) -> tuple:
         """加载提示词模板"""
         config_dir = Path(__file__).parent.parent.parent / "config"
@@ -112,6 +148,15 @@ class AITranslator:
             result.success = True
             return result
 
+        try:
+            cached = self.memory.lookup([text]).get(text) if self.memory else None
+        except sqlite3.Error:
+            cached = None
+        if cached:
+            result.translated_text = cached
+            result.success = True
+            return result
+
         try:
             # 构建提示词
             user_prompt = self.user_prompt_template
@@ -122,6 +167,11 @@ class AITranslator:
             response = self._call_ai(user_prompt)
             result.translated_text = response.strip()
             result.success = True
+            if self.memory:
+                try:
+                    self.memory.save({text: result.translated_text})
+                except sqlite3.Error as e:
+                    print(f"[翻译] 翻译记忆写入失败: {e}")
 
         except Exception as e:
             error_type = type(e).__name__
@@ -134,7 +184,9 @@ class AITranslator:
 
     def translate_batch(self, texts: List[str]) -> BatchTranslationResult:
         """
-        批量翻译文本（单次 API 调用）
+        批量翻译文本
+
+        先查询翻译记忆，未命中的文本去重后按 batch_size 和字符数分块，并发调用模型。
 
         Args:
             texts: 要翻译的文本列表
@@ -187,34 +239,115 @@ class AITranslator:
         if not non_empty_texts:
             return batch_result
 
-        try:
-            # 构建批量翻译内容（使用编号格式）
-            batch_content = self._format_batch_content(non_empty_texts)
+        unique_texts = list(dict.fromkeys(non_empty_texts))
+        translations: Dict[str, str] = {}
+        if self.memory:
+            try:
+                translations = self.memory.lookup(unique_texts)
+            except sqlite3.Error as e:
+                print(f"[翻译] 翻译记忆查询失败: {e}")
+            if translations:
+                print(f"[翻译] 翻译记忆命中 {len(translations)}/{len(unique_texts)} 条")
+
+        errors: Dict[str, str] = {}
+        misses = [text for text in unique_texts if text not in translations]
+        if misses:
+            translated, errors, verified = self._translate_misses(misses)
+            translations.update(translated)
+            if self.memory and verified:
+                try:
+                    self.memory.save(verified)
+                except sqlite3.Error as e:
+                    print(f"[翻译] 翻译记忆写入失败: {e}")
+
+        # 填充结果
+        for idx in non_empty_indices:
+            text = texts[idx]
+            translated = translations.get(text)
+            if translated:
+                batch_result.results[idx].translated_text = translated
+                batch_result.results[idx].success = True
+                batch_result.success_count += 1
+            else:
+                batch_result.results[idx].error = errors.get(text, "翻译结果为空")
+                batch_result.fail_count += 1
 
-            # 构建提示词
-            user_prompt = self.user_prompt_template
-            user_prompt = user_prompt.replace("{target_language}", self.target_language)
-            user_prompt = user_prompt.replace("{content}", batch_content)
+        return batch_result
 
-            # 调用 AI API
-            response = self._call_ai(user_prompt)
+    def _chunk_texts(self, texts: List[str]) -> List[List[str]]:
+        """按条数（batch_size）和原文字符数（MAX_CHUNK_CHARS）分块"""
+        chunks: List[List[str]] = []
+        current: List[str] = []
+        current_chars = 0
+        for text in texts:
+            if current and (
+                len(current) >= self.batch_size or current_chars + len(text) > MAX_CHUNK_CHARS
+            ):
+                chunks.append(current)
+                current, current_chars = [], 0
+            current.append(text)
+            current_chars += len(text)
+        if current:
+            chunks.append(current)
+        return chunks
+
+    def _translate_chunk(self, texts: List[str]) -> Tuple[List[str], bool]:
+        """
+        单次 API 调用翻译一块文本
 
-            # 解析批量翻译结果
-            translated_texts = self._parse_batch_response(response, len(non_empty_texts))
+        Returns:
+            (译文列表, 编号是否与原文一一对应)
+        """
+        # 构建批量翻译内容（使用编号格式）
+        batch_content = self._format_batch_content(texts)
 
-            # 填充结果
-            for idx, translated in zip(non_empty_indices, translated_texts):
-                batch_result.results[idx].translated_text = translated
-                batch_result.results[idx].success = True
-                batch_result.success_count += 1
+        # 构建提示词
+        user_prompt = self.user_prompt_template
+        user_prompt = user_prompt.replace("{target_language}", self.target_language)
+        user_prompt = user_prompt.replace("{content}", batch_content)
 
-        except Exception as e:
-            error_msg = f"批量翻译失败: {type(e).__name__}: {str(e)[:100]}"
-            for idx in non_empty_indices:
-                batch_result.results[idx].error = error_msg
-            batch_result.fail_count = len(non_empty_indices)
+        # 调用 AI API
+        response = self._call_ai(user_prompt)
 
-        return batch_result
+        # 解析批量翻译结果
+        return self._parse_batch_response_checked(response, len(texts))
+
+    def _translate_misses(
+        self, texts: List[str]
+    ) -> Tuple[Dict[str, str], Dict[str, str], Dict[str, str]]:
+        """
+        分块并发翻译未命中记忆的文本
+
+        Returns:
+            (全部译文, 失败原因, 可写回记忆的译文)
+            编号未能一一对应的块仍按顺序使用译文，但不写回记忆，避免错位结果被长期复用
+        """
+        chunks = self._chunk_texts(texts)
+        if len(chunks) > 1:
+            print(f"[翻译] {len(texts)} 条新文本分 {len(chunks)} 块翻译（并发 {min(self.max_workers, len(chunks))}）")
+
+        translated: Dict[str, str] = {}
+        errors: Dict[str, str] = {}
+        verified: Dict[str, str] = {}
+
+        workers = min(self.max_workers, len(chunks))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="translate") as executor:
+            futures = [(chunk, executor.submit(self._translate_chunk, chunk)) for chunk in chunks]
+            for chunk, future in futures:
+                try:
+                    results, exact = future.result()
+                except Exception as e:
+                    error_msg = f"批量翻译失败: {type(e).__name__}: {str(e)[:100]}"
+                    for text in chunk:
+                        errors[text] = error_msg
+                    continue
+                for text, result in zip(chunk, results):
+                    if result:
+                        translated[text] = result
+                        if exact:
+                            verified[text] = result
+
+        return translated, errors, verified
 
     def _format_batch_content(self, texts: List[str]) -> str:
         """格式化批量翻译内容"""
@@ -234,6 +367,15 @@ class AITranslator:
         Returns:
             List[str]: 翻译结果列表
         """
+        return self._parse_batch_response_checked(response, expected_count)[0]
+
+    def _parse_batch_response_checked(self, response: str, expected_count: int) -> Tuple[List[str], bool]:
+        """
+        解析批量翻译响应，并判断编号是否与原文一一对应
+
+        Returns:
+            (翻译结果列表, 编号是否恰好为 1..expected_count)
+        """
         results = []
         lines = response.strip().split("\n")
 
@@ -266,6 +408,7 @@ class AITranslator:
         # 按索引排序并提取文本
         results.sort(key=lambda x: x[0])
         translated = [text for _, text in results]
+        exact = [idx for idx, _ in results] == list(range(1, expected_count + 1))
 
         # 如果解析结果数量不匹配，尝试简单按行分割
         if len(translated) != expected_count:
@@ -283,7 +426,7 @@ class AITranslator:
         while len(translated) < expected_count:
             translated.append("")
 
-        return translated[:expected_count]
+        return translated[:expected_count], exact
 
     def _call_ai(self, user_prompt: str) -> str:
         """调用 AI API（使用 LiteLLM）"""
@@ -293,3 +436,9 @@ class AITranslator:
         messages.append({"role": "user", "content": user_prompt})
 
         return self.client.chat(messages)
+
+    def close(self) -> None:
+        """关闭翻译记忆"""
+        if self.memory:
+            self.memory.close()
+            self.memory = None
@@ -17,12 +17,10 @@ from trendradar.utils.time import (
     convert_time_for_display,
 )
 from trendradar.core import (
-    load_frequency_words,
-    matches_word_groups,
+    get_compiled_word_groups,
     save_titles_to_file,
-    read_all_today_titles,
-    detect_latest_new_titles,
     count_word_frequency,
+    RunDataSnapshot,
 )
 from trendradar.report import (
     clean_title,
@@ -37,6 +35,7 @@ from trendradar.notification import (
     NotificationDispatcher,
     PushRecordManager,
 )
+from trendradar.notification import transport as push_transport
 from trendradar.ai import AITranslator
 from trendradar.storage import get_storage_manager
 
@@ -72,6 +71,9 @@ class AppContext:
         """
         self.config = config
         self._storage_manager = None
+        self._translator: Optional[AITranslator] = None
+        self._cycle_date: Optional[str] = None
+        self._snapshot: Optional[RunDataSnapshot] = None
 
     # === 配置访问 ===
 
@@ -175,12 +177,16 @@ class AppContext:
                     "secret_access_key": remote_config.get("SECRET_ACCESS_KEY", ""),
                     "endpoint_url": remote_config.get("ENDPOINT_URL", ""),
                     "region": remote_config.get("REGION", ""),
+                    "delta_sync": remote_config.get("DELTA_SYNC", True),
+                    "compact_segments": remote_config.get("COMPACT_SEGMENTS", 12),
                 },
                 local_retention_days=local_config.get("RETENTION_DAYS", 0),
                 remote_retention_days=remote_config.get("RETENTION_DAYS", 0),
                 pull_enabled=pull_config.get("ENABLED", False),
                 pull_days=pull_config.get("DAYS", 7),
+                pull_workers=pull_config.get("MAX_WORKERS", 8),
                 timezone=self.timezone,
+                sqlite_profile=storage_config.get("SQLITE"),
             )
         return self._storage_manager
 
@@ -197,17 +203,24 @@ class AppContext:
         output_path = self.get_output_path("txt", f"{self.format_time()}.txt")
         return save_titles_to_file(results, id_to_name, failed_ids, output_path, clean_title)
 
+    def get_snapshot(self) -> RunDataSnapshot:
+        """获取本轮运行的数据快照（存储写入后自动失效，每轮结束时丢弃）"""
+        storage_manager = self.get_storage_manager()
+        if self._snapshot is None or self._snapshot.storage_manager is not storage_manager:
+            self._snapshot = RunDataSnapshot(storage_manager)
+        return self._snapshot
+
     def read_today_titles(
         self, platform_ids: Optional[List[str]] = None, quiet: bool = False
     ) -> Tuple[Dict, Dict, Dict]:
-        """读取当天所有标题"""
-        return read_all_today_titles(self.get_storage_manager(), platform_ids, quiet=quiet)
+        """读取当天所有标题（本轮内共享）"""
+        return self.get_snapshot().today_titles(platform_ids, quiet=quiet)
 
     def detect_new_titles(
         self, platform_ids: Optional[List[str]] = None, quiet: bool = False
     ) -> Dict:
-        """检测最新批次的新增标题"""
-        return detect_latest_new_titles(self.get_storage_manager(), platform_ids, quiet=quiet)
+        """检测最新批次的新增标题（本轮内共享）"""
+        return self.get_snapshot().new_titles(platform_ids, quiet=quiet)
 
     def is_first_crawl(self) -> bool:
         """检测是否是当天第一次爬取"""
@@ -218,8 +231,8 @@ class AppContext:
     def load_frequency_words(
         self, frequency_file: Optional[str] = None
     ) -> Tuple[List[Dict], List[str], List[str]]:
-        """加载频率词配置"""
-        return load_frequency_words(frequency_file)
+        """加载频率词配置（本轮内共享）"""
+        return self.get_snapshot().frequency_words(frequency_file)
 
     def matches_word_groups(
         self,
@@ -228,8 +241,10 @@ class AppContext:
         filter_words: List[str],
         global_filters: Optional[List[str]] = None,
     ) -> bool:
-        """检查标题是否匹配词组规则"""
-        return matches_word_groups(title, word_groups, filter_words, global_filters)
+        """检查标题是否匹配词组规则（使用预编译匹配器）"""
+        return get_compiled_word_groups(
+            word_groups, filter_words, global_filters
+        ).matches(title)
 
     # === 统计分析 ===
 
@@ -329,6 +344,7 @@ class AppContext:
         rss_new_items: Optional[List[Dict]] = None,
         ai_analysis: Optional[Any] = None,
         standalone_data: Optional[Dict] = None,
+        asset_prefix: Optional[str] = None,
     ) -> str:
         """渲染HTML内容"""
         return render_html_content(
@@ -344,6 +360,7 @@ class AppContext:
             ai_analysis=ai_analysis,
             show_new_section=self.show_new_section,
             standalone_data=standalone_data,
+            asset_prefix=asset_prefix,
         )
 
     # === 通知内容渲染 ===
@@ -441,20 +458,31 @@ class AppContext:
 
     # === 通知发送 ===
 
-    def create_notification_dispatcher(self) -> NotificationDispatcher:
-        """创建通知调度器"""
-        # 创建翻译器（如果启用）
-        translator = None
+    def get_translator(self) -> Optional[AITranslator]:
+        """
+        获取翻译器（未启用时返回 None）
+
+        翻译器及其翻译记忆连接在上下文内复用（常驻模式下跨轮复用），在 cleanup() 中关闭。
+        """
         trans_config = self.config.get("AI_TRANSLATION", {})
-        if trans_config.get("ENABLED", False):
+        if not trans_config.get("ENABLED", False):
+            return None
+        if self._translator is None:
             ai_config = self.config.get("AI", {})
-            translator = AITranslator(trans_config, ai_config)
+            memory_path = None
+            if trans_config.get("MEMORY", True):
+                data_dir = self.config.get("STORAGE", {}).get("LOCAL", {}).get("DATA_DIR", "output")
+                memory_path = str(Path(data_dir) / "cache" / "translation_memory.db")
+            self._translator = AITranslator(trans_config, ai_config, memory_path=memory_path)
+        return self._translator
 
+    def create_notification_dispatcher(self) -> NotificationDispatcher:
+        """创建通知调度器"""
         return NotificationDispatcher(
             config=self.config,
             get_time_func=self.get_time,
             split_content_func=self.split_content,
-            translator=translator,
+            translator=self.get_translator(),
         )
 
     def create_push_manager(self) -> PushRecordManager:
@@ -468,7 +496,36 @@ class AppContext:
 
     def cleanup(self):
         """清理资源"""
+        self._snapshot = None
+        push_transport.close_all()
+        if self._translator:
+            self._translator.close()
+            self._translator = None
         if self._storage_manager:
             self._storage_manager.cleanup_old_data()
             self._storage_manager.cleanup()
             self._storage_manager = None
+
+    def end_cycle(self):
+        """
+        常驻模式下结束一轮运行
+
+        只清理过期数据，保留本地数据库连接供下一轮复用；
+        远程存储的临时数据库是远端的快照，每轮都释放以便下一轮重新拉取。
+        跨日后同样全部释放，避免前一天的连接一直占用。
+        推送的 HTTP 连接池和翻译器跨轮复用，SMTP 连接在两轮之间会被服务端超时断开，每轮释放。
+        """
+        self._snapshot = None
+        push_transport.close_smtp_connections()
+        if not self._storage_manager:
+            return
+
+        self._storage_manager.cleanup_old_data()
+
+        today = self.format_date()
+        if (
+            self._storage_manager.backend_name != "local"
+            or (self._cycle_date is not None and self._cycle_date != today)
+        ):
+            self._storage_manager.cleanup()
+        self._cycle_date = today
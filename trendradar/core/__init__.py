@@ -10,13 +10,21 @@ from trendradar.core.config import (
     get_account_at_index,
 )
 from trendradar.core.loader import load_config
-from trendradar.core.frequency import load_frequency_words, matches_word_groups
+from trendradar.core.frequency import (
+    load_frequency_words,
+    matches_word_groups,
+    CompiledWordGroups,
+    get_compiled_word_groups,
+    FrequencyConfig,
+    get_frequency_config,
+)
 from trendradar.core.data import (
     save_titles_to_file,
     read_all_today_titles_from_storage,
     read_all_today_titles,
     detect_latest_new_titles_from_storage,
     detect_latest_new_titles,
+    RunDataSnapshot,
 )
 from trendradar.core.analyzer import (
     calculate_news_weight,
@@ -33,12 +41,17 @@ __all__ = [
     "load_config",
     "load_frequency_words",
     "matches_word_groups",
+    "CompiledWordGroups",
+    "get_compiled_word_groups",
+    "FrequencyConfig",
+    "get_frequency_config",
     # 数据处理
     "save_titles_to_file",
     "read_all_today_titles_from_storage",
     "read_all_today_titles",
     "detect_latest_new_titles_from_storage",
     "detect_latest_new_titles",
+    "RunDataSnapshot",
     # 统计分析
     "calculate_news_weight",
     "format_time_display",
@@ -10,7 +10,7 @@
 
 from typing import Dict, List, Tuple, Optional, Callable
 
-from trendradar.core.frequency import matches_word_groups, _word_matches
+from trendradar.core.frequency import get_compiled_word_groups
 
 
 def calculate_news_weight(
@@ -221,6 +221,8 @@ def count_word_frequency(
         group_key = group["group_key"]
         word_stats[group_key] = {"count": 0, "titles": {}}
 
+    matcher = get_compiled_word_groups(word_groups, filter_words, global_filters)
+
     for source_id, titles_data in results_to_process.items():
         total_titles += len(titles_data)
 
@@ -231,12 +233,10 @@ def count_word_frequency(
             if title in processed_titles.get(source_id, {}):
                 continue
 
-            # 使用统一的匹配逻辑
-            matches_frequency_words = matches_word_groups(
-                title, word_groups, filter_words, global_filters
-            )
+            # 使用统一的匹配逻辑（预编译匹配器，一次扫描得出命中的词组）
+            group_index = matcher.first_group(title)
 
-            if not matches_frequency_words:
+            if group_index is None:
                 continue
 
             # 如果是增量模式或 current 模式第一次，统计匹配的新增新闻数量
@@ -249,119 +249,88 @@ def count_word_frequency(
             source_url = title_data.get("url", "")
             source_mobile_url = title_data.get("mobileUrl", "")
 
-            # 找到匹配的词组（防御性转换确保类型安全）
-            title_lower = str(title).lower() if not isinstance(title, str) else title.lower()
-            for group in word_groups:
-                required_words = group["required"]
-                normal_words = group["normal"]
-
-                # 如果是"全部新闻"模式，所有标题都匹配第一个（唯一的）词组
-                if len(word_groups) == 1 and word_groups[0]["group_key"] == "全部新闻":
-                    group_key = group["group_key"]
-                    word_stats[group_key]["count"] += 1
-                    if source_id not in word_stats[group_key]["titles"]:
-                        word_stats[group_key]["titles"][source_id] = []
-                else:
-                    # 原有的匹配逻辑（支持正则语法）
-                    if required_words:
-                        all_required_present = all(
-                            _word_matches(req_item, title_lower)
-                            for req_item in required_words
-                        )
-                        if not all_required_present:
-                            continue
-
-                    if normal_words:
-                        any_normal_present = any(
-                            _word_matches(normal_item, title_lower)
-                            for normal_item in normal_words
-                        )
-                        if not any_normal_present:
-                            continue
-
-                    group_key = group["group_key"]
-                    word_stats[group_key]["count"] += 1
-                    if source_id not in word_stats[group_key]["titles"]:
-                        word_stats[group_key]["titles"][source_id] = []
-
-                first_time = ""
-                last_time = ""
-                count_info = 1
-                ranks = source_ranks if source_ranks else []
-                url = source_url
-                mobile_url = source_mobile_url
-                rank_timeline = []
-
-                # 对于 current 模式，从历史统计信息中获取完整数据
-                if (
-                    mode == "current"
-                    and title_info
-                    and source_id in title_info
-                    and title in title_info[source_id]
-                ):
-                    info = title_info[source_id][title]
-                    first_time = info.get("first_time", "")
-                    last_time = info.get("last_time", "")
-                    count_info = info.get("count", 1)
-                    if "ranks" in info and info["ranks"]:
-                        ranks = info["ranks"]
-                    url = info.get("url", source_url)
-                    mobile_url = info.get("mobileUrl", source_mobile_url)
-                    rank_timeline = info.get("rank_timeline", [])
-                elif (
-                    title_info
-                    and source_id in title_info
-                    and title in title_info[source_id]
-                ):
-                    info = title_info[source_id][title]
-                    first_time = info.get("first_time", "")
-                    last_time = info.get("last_time", "")
-                    count_info = info.get("count", 1)
-                    if "ranks" in info and info["ranks"]:
-                        ranks = info["ranks"]
-                    url = info.get("url", source_url)
-                    mobile_url = info.get("mobileUrl", source_mobile_url)
-                    rank_timeline = info.get("rank_timeline", [])
-
-                if not ranks:
-                    ranks = [99]
-
-                time_display = format_time_display(first_time, last_time, convert_time_func)
-
-                source_name = id_to_name.get(source_id, source_id)
-
-                # 判断是否为新增
-                is_new = False
-                if all_news_are_new:
-                    # 增量模式下所有处理的新闻都是新增，或者当天第一次的所有新闻都是新增
-                    is_new = True
-                elif new_titles and source_id in new_titles:
-                    # 检查是否在新增列表中
-                    new_titles_for_source = new_titles[source_id]
-                    is_new = title in new_titles_for_source
-
-                word_stats[group_key]["titles"][source_id].append(
-                    {
-                        "title": title,
-                        "source_name": source_name,
-                        "first_time": first_time,
-                        "last_time": last_time,
-                        "time_display": time_display,
-                        "count": count_info,
-                        "ranks": ranks,
-                        "rank_threshold": rank_threshold,
-                        "url": url,
-                        "mobileUrl": mobile_url,
-                        "is_new": is_new,
-                        "rank_timeline": rank_timeline,
-                    }
-                )
-
-                if source_id not in processed_titles:
-                    processed_titles[source_id] = {}
-                processed_titles[source_id][title] = True
+            # 命中的词组（"全部新闻"模式下为唯一的虚拟词组）
+            group_key = word_groups[group_index]["group_key"]
+            word_stats[group_key]["count"] += 1
+            if source_id not in word_stats[group_key]["titles"]:
+                word_stats[group_key]["titles"][source_id] = []
+
+            first_time = ""
+            last_time = ""
+            count_info = 1
+            ranks = source_ranks if source_ranks else []
+            url = source_url
+            mobile_url = source_mobile_url
+            rank_timeline = []
+
+            # 对于 current 模式，从历史统计信息中获取完整数据
+            if (
+                mode == "current"
+                and title_info
+                and source_id in title_info
+                and title in title_info[source_id]
+            ):
+                info = title_info[source_id][title]
+                first_time = info.get("first_time", "")
+                last_time = info.get("last_time", "")
+                count_info = info.get("count", 1)
+                if "ranks" in info and info["ranks"]:
+                    ranks = info["ranks"]
+                url = info.get("url", source_url)
+                mobile_url = info.get("mobileUrl", source_mobile_url)
+                rank_timeline = info.get("rank_timeline", [])
+            elif (
+                title_info
+                and source_id in title_info
+                and title in title_info[source_id]
+            ):
+                info = title_info[source_id][title]
+                first_time = info.get("first_time", "")
+                last_time = info.get("last_time", "")
+                count_info = info.get("count", 1)
+                if "ranks" in info and info["ranks"]:
+                    ranks = info["ranks"]
+                url = info.get("url", source_url)
+                mobile_url = info.get("mobileUrl", source_mobile_url)
+                rank_timeline = info.get("rank_timeline", [])
+
+            if not ranks:
+                ranks = [99]
+
+            time_display = format_time_display(first_time, last_time, convert_time_func)
+
+            source_name = id_to_name.get(source_id, source_id)
+
+            # 判断是否为新增
+            is_new = False
+            if all_news_are_new:
+                # 增量模式下所有处理的新闻都是新增，或者当天第一次的所有新闻都是新增
+                is_new = True
+            elif new_titles and source_id in new_titles:
+                # 检查是否在新增列表中
+                new_titles_for_source = new_titles[source_id]
+                is_new = title in new_titles_for_source
+
+            word_stats[group_key]["titles"][source_id].append(
+                {
+                    "title": title,
+                    "source_name": source_name,
+                    "first_time": first_time,
+                    "last_time": last_time,
+                    "time_display": time_display,
+                    "count": count_info,
+                    "ranks": ranks,
+                    "rank_threshold": rank_threshold,
+                    "url": url,
+                    "mobileUrl": mobile_url,
+                    "is_new": is_new,
+                    "rank_timeline": rank_timeline,
+                }
+            )
 
-                break
+            if source_id not in processed_titles:
+                processed_titles[source_id] = {}
+            processed_titles[source_id][title] = True
 
     # 最后统一打印汇总信息
     if mode == "incremental":
@@ -571,6 +540,7 @@ def count_rss_frequency(
 
     total_items = len(rss_items)
     processed_urls = set()  # 用于去重
+    matcher = get_compiled_word_groups(word_groups, filter_words, global_filters)
 
     # 为每个条目分配一个基于发布时间的"排名"
     # 按发布时间排序，最新的排在前面
@@ -591,67 +561,36 @@ def count_rss_frequency(
         if url:
             processed_urls.add(url)
 
-        # 使用统一的匹配逻辑
-        if not matches_word_groups(title, word_groups, filter_words, global_filters):
+        # 使用统一的匹配逻辑（一个条目只匹配第一个词组）
+        group_index = matcher.first_group(title)
+        if group_index is None:
             continue
 
-        # 找到匹配的词组
-        title_lower = title.lower()
-        for group in word_groups:
-            required_words = group["required"]
-            normal_words = group["normal"]
-            group_key = group["group_key"]
-
-            # "全部 RSS" 模式：所有条目都匹配
-            if len(word_groups) == 1 and word_groups[0]["group_key"] == "全部 RSS":
-                matched = True
-            else:
-                # 检查必须词（支持正则语法）
-                if required_words:
-                    all_required_present = all(
-                        _word_matches(req_item, title_lower)
-                        for req_item in required_words
-                    )
-                    if not all_required_present:
-                        continue
-
-                # 检查普通词（支持正则语法）
-                if normal_words:
-                    any_normal_present = any(
-                        _word_matches(normal_item, title_lower)
-                        for normal_item in normal_words
-                    )
-                    if not any_normal_present:
-                        continue
-
-                matched = True
-
-            if matched:
-                word_stats[group_key]["count"] += 1
-
-                # 格式化时间显示
-                published_at = item.get("published_at", "")
-                time_display = format_iso_time_friendly(published_at, timezone, include_date=True) if published_at else ""
-
-                # 判断是否为新增
-                is_new = url in new_urls if url else False
-
-                # 获取排名（基于发布时间顺序）
-                rank = url_to_rank.get(url, 99) if url else 99
-
-                title_data = {
-                    "title": title,
-                    "source_name": item.get("feed_name", item.get("feed_id", "RSS")),
-                    "time_display": time_display,
-                    "count": 1,  # RSS 条目通常只出现一次
-                    "ranks": [rank],
-                    "rank_threshold": rank_threshold,
-                    "url": url,
-                    "mobile_url": "",
-                    "is_new": is_new,
-                }
-                word_stats[group_key]["titles"].append(title_data)
-                break  # 一个条目只匹配第一个词组
+        group_key = word_groups[group_index]["group_key"]
+        word_stats[group_key]["count"] += 1
+
+        # 格式化时间显示
+        published_at = item.get("published_at", "")
+        time_display = format_iso_time_friendly(published_at, timezone, include_date=True) if published_at else ""
+
+        # 判断是否为新增
+        is_new = url in new_urls if url else False
+
+        # 获取排名（基于发布时间顺序）
+        rank = url_to_rank.get(url, 99) if url else 99
+
+        title_data = {
+            "title": title,
+            "source_name": item.get("feed_name", item.get("feed_id", "RSS")),
+            "time_display": time_display,
+            "count": 1,  # RSS 条目通常只出现一次
+            "ranks": [rank],
+            "rank_threshold": rank_threshold,
+            "url": url,
+            "mobile_url": "",
+            "is_new": is_new,
+        }
+        word_stats[group_key]["titles"].append(title_data)
 
     # 构建统计结果
     stats = []
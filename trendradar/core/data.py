@@ -6,6 +6,7 @@
 - save_titles_to_file: 保存标题到 TXT 文件
 - read_all_today_titles: 从存储后端读取当天所有标题
 - detect_latest_new_titles: 检测最新批次的新增标题
+- RunDataSnapshot: 单次运行内共享的数据快照
 
 Author: TrendRadar Team
 """
@@ -13,6 +14,8 @@ Author: TrendRadar Team
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Callable
 
+from trendradar.core.frequency import load_frequency_words
+
 
 def save_titles_to_file(
     results: Dict,
@@ -98,51 +101,42 @@ def read_all_today_titles_from_storage(
         Tuple[Dict, Dict, Dict]: (all_results, id_to_name, title_info)
     """
     try:
-        news_data = storage_manager.get_today_all_data()
-
-        if not news_data or not news_data.items:
-            return {}, {}, {}
-
         all_results = {}
         final_id_to_name = {}
         title_info = {}
+        platform_filter = set(current_platform_ids) if current_platform_ids is not None else None
 
-        for source_id, news_list in news_data.items.items():
+        # 流式读取：直接从存储游标构建结果，不经过 NewsData 中间对象
+        for (source_id, source_name, title, _rank, url, mobile_url,
+             first_time, last_time, count, ranks, rank_timeline) in storage_manager.iter_today_news():
             # 按平台过滤
-            if current_platform_ids is not None and source_id not in current_platform_ids:
+            if platform_filter is not None and source_id not in platform_filter:
                 continue
 
-            # 获取来源名称
-            source_name = news_data.id_to_name.get(source_id, source_id)
-            final_id_to_name[source_id] = source_name
-
-            if source_id not in all_results:
-                all_results[source_id] = {}
+            source_results = all_results.get(source_id)
+            if source_results is None:
+                final_id_to_name[source_id] = source_name
+                source_results = all_results[source_id] = {}
                 title_info[source_id] = {}
 
-            for item in news_list:
-                title = item.title
-                ranks = getattr(item, 'ranks', [item.rank])
-                first_time = getattr(item, 'first_time', item.crawl_time)
-                last_time = getattr(item, 'last_time', item.crawl_time)
-                count = getattr(item, 'count', 1)
-                rank_timeline = getattr(item, 'rank_timeline', [])
-
-                all_results[source_id][title] = {
-                    "ranks": ranks,
-                    "url": item.url or "",
-                    "mobileUrl": item.mobile_url or "",
-                }
-
-                title_info[source_id][title] = {
-                    "first_time": first_time,
-                    "last_time": last_time,
-                    "count": count,
-                    "ranks": ranks,
-                    "url": item.url or "",
-                    "mobileUrl": item.mobile_url or "",
-                    "rank_timeline": rank_timeline,
-                }
+            url = url or ""
+            mobile_url = mobile_url or ""
+            source_results[title] = {
+                "ranks": ranks,
+                "url": url,
+                "mobileUrl": mobile_url,
+            }
+
+            # rank_timeline 为 (时间, 排名) 元组列表
+            title_info[source_id][title] = {
+                "first_time": first_time,
+                "last_time": last_time,
+                "count": count,
+                "ranks": ranks,
+                "url": url,
+                "mobileUrl": mobile_url,
+                "rank_timeline": rank_timeline,
+            }
 
         return all_results, final_id_to_name, title_info
 
@@ -184,6 +178,7 @@ def read_all_today_titles(
 def detect_latest_new_titles_from_storage(
     storage_manager,
     current_platform_ids: Optional[List[str]] = None,
+    latest_data=None,
 ) -> Dict:
     """
     从存储后端检测最新批次的新增标题
@@ -191,26 +186,19 @@ def detect_latest_new_titles_from_storage(
     Args:
         storage_manager: 存储管理器实例
         current_platform_ids: 当前监控的平台 ID 列表（用于过滤）
+        latest_data: 已读取的最新抓取数据（可选，不传则从存储读取）
 
     Returns:
         Dict: 新增标题 {source_id: {title: title_data}}
     """
     try:
         # 获取最新抓取数据
-        latest_data = storage_manager.get_latest_crawl_data()
+        if latest_data is None:
+            latest_data = storage_manager.get_latest_crawl_data()
         if not latest_data or not latest_data.items:
             return {}
 
-        # 获取所有历史数据
-        all_data = storage_manager.get_today_all_data()
-        if not all_data or not all_data.items:
-            # 没有历史数据（第一次抓取），不应该有"新增"标题
-            return {}
-
-        # 获取最新批次时间
-        latest_time = latest_data.crawl_time
-
-        # 步骤1：收集最新批次的标题（last_crawl_time = latest_time 的标题）
+        # 步骤1：收集最新批次的标题（last_crawl_time = 最新批次时间的标题）
         latest_titles = {}
         for source_id, news_list in latest_data.items.items():
             if current_platform_ids is not None and source_id not in current_platform_ids:
@@ -223,25 +211,17 @@ def detect_latest_new_titles_from_storage(
                     "mobileUrl": item.mobile_url or "",
                 }
 
-        # 步骤2：收集历史标题
+        # 步骤2：查询历史标题（只探测最新批次的标题，不读取当天全部数据）
         # 关键逻辑：一个标题只要其 first_crawl_time < latest_time，就是历史标题
         # 这样即使同一标题有多条记录（URL 不同），只要任何一条是历史的，该标题就算历史
-        historical_titles = {}
-        for source_id, news_list in all_data.items.items():
-            if current_platform_ids is not None and source_id not in current_platform_ids:
-                continue
-
-            historical_titles[source_id] = set()
-            for item in news_list:
-                first_time = getattr(item, 'first_time', item.crawl_time)
-                # 如果该记录的首次出现时间早于最新批次，则该标题是历史标题
-                if first_time < latest_time:
-                    historical_titles[source_id].add(item.title)
+        history = storage_manager.get_historical_titles(latest_data, current_platform_ids)
+        if history is None:
+            return {}
+        has_historical_data, historical_titles = history
 
         # 检查是否是当天第一次抓取（没有任何历史标题）
-        # 如果所有平台的历史标题集合都为空，说明只有一个抓取批次
+        # 如果所有平台都没有历史标题，说明只有一个抓取批次
         # 在这种情况下，将所有最新批次的标题视为"新增"（用于增量模式的第一次推送）
-        has_historical_data = any(len(titles) > 0 for titles in historical_titles.values())
         if not has_historical_data:
             # 第一次爬取：返回所有最新标题作为"新增"
             return latest_titles
@@ -249,11 +229,10 @@ def detect_latest_new_titles_from_storage(
         # 步骤3：找出新增标题 = 最新批次标题 - 历史标题
         new_titles = {}
         for source_id, source_latest_titles in latest_titles.items():
-            historical_set = historical_titles.get(source_id, set())
             source_new_titles = {}
 
             for title, title_data in source_latest_titles.items():
-                if title not in historical_set:
+                if (source_id, title) not in historical_titles:
                     source_new_titles[title] = title_data
 
             if source_new_titles:
@@ -270,6 +249,7 @@ def detect_latest_new_titles(
     storage_manager,
     current_platform_ids: Optional[List[str]] = None,
     quiet: bool = False,
+    latest_data=None,
 ) -> Dict:
     """
     检测当日最新批次的新增标题（从存储后端）
@@ -278,12 +258,103 @@ def detect_latest_new_titles(
         storage_manager: 存储管理器实例
         current_platform_ids: 当前监控的平台 ID 列表（用于过滤）
         quiet: 是否静默模式（不打印日志）
+        latest_data: 已读取的最新抓取数据（可选，不传则从存储读取）
 
     Returns:
         Dict: 新增标题 {source_id: {title: title_data}}
     """
-    new_titles = detect_latest_new_titles_from_storage(storage_manager, current_platform_ids)
+    new_titles = detect_latest_new_titles_from_storage(
+        storage_manager, current_platform_ids, latest_data=latest_data
+    )
     if new_titles and not quiet:
         total_new = sum(len(titles) for titles in new_titles.values())
         print(f"[存储] 从存储后端检测到 {total_new} 条新增标题")
     return new_titles
+
+
+def _platform_key(platform_ids: Optional[List[str]]) -> Optional[Tuple[str, ...]]:
+    return None if platform_ids is None else tuple(platform_ids)
+
+
+class RunDataSnapshot:
+    """
+    单次运行内共享的数据快照
+
+    一轮运行中，模式策略、分析数据加载、AI 分析数据准备等多处都需要当天全部标题、
+    最新抓取批次、新增标题和频率词配置。快照在首次使用时读取并缓存，之后直接复用。
+
+    存储管理器每次写入新闻数据（save_news_data）后，存储相关的缓存自动失效；
+    频率词配置在快照生命周期内保持不变，由 AppContext 在每轮结束时丢弃快照。
+    返回的结构由各调用方共享，调用方不应修改。
+    """
+
+    def __init__(self, storage_manager):
+        """
+        Args:
+            storage_manager: 存储管理器实例
+        """
+        self.storage_manager = storage_manager
+        self._version = getattr(storage_manager, "news_data_version", None)
+        self._today_titles: Dict[Optional[Tuple[str, ...]], Tuple[Dict, Dict, Dict]] = {}
+        self._new_titles: Dict[Optional[Tuple[str, ...]], Dict] = {}
+        self._latest_data = None
+        self._latest_loaded = False
+        self._frequency_words: Dict[Optional[str], Tuple[List[Dict], List[str], List[str]]] = {}
+
+    def _check_version(self) -> None:
+        """存储写入后丢弃存储相关缓存"""
+        version = getattr(self.storage_manager, "news_data_version", None)
+        if version != self._version:
+            self.invalidate()
+            self._version = version
+
+    def invalidate(self) -> None:
+        """丢弃存储相关缓存（频率词配置保留）"""
+        self._today_titles.clear()
+        self._new_titles.clear()
+        self._latest_data = None
+        self._latest_loaded = False
+
+    def today_titles(
+        self, platform_ids: Optional[List[str]] = None, quiet: bool = False
+    ) -> Tuple[Dict, Dict, Dict]:
+        """当天所有标题 (all_results, id_to_name, title_info)"""
+        self._check_version()
+        key = _platform_key(platform_ids)
+        cached = self._today_titles.get(key)
+        if cached is None:
+            cached = read_all_today_titles(self.storage_manager, platform_ids, quiet=quiet)
+            self._today_titles[key] = cached
+        return cached
+
+    def latest_crawl_data(self):
+        """最新一次抓取的数据"""
+        self._check_version()
+        if not self._latest_loaded:
+            self._latest_data = self.storage_manager.get_latest_crawl_data()
+            self._latest_loaded = True
+        return self._latest_data
+
+    def new_titles(self, platform_ids: Optional[List[str]] = None, quiet: bool = False) -> Dict:
+        """最新批次的新增标题"""
+        self._check_version()
+        key = _platform_key(platform_ids)
+        cached = self._new_titles.get(key)
+        if cached is None:
+            latest_data = self.latest_crawl_data()
+            if latest_data is None:
+                cached = {}
+            else:
+                cached = detect_latest_new_titles(
+                    self.storage_manager, platform_ids, quiet=quiet, latest_data=latest_data
+                )
+            self._new_titles[key] = cached
+        return cached
+
+    def frequency_words(self, frequency_file: Optional[str] = None) -> Tuple[List[Dict], List[str], List[str]]:
+        """频率词配置 (word_groups, filter_words, global_filters)"""
+        cached = self._frequency_words.get(frequency_file)
+        if cached is None:
+            cached = load_frequency_words(frequency_file)
+            self._frequency_words[frequency_file] = cached
+        return cached
@@ -11,10 +11,23 @@
 - 正则表达式（/pattern/ 语法）
 - 显示名称（=> 别名 语法）
 - 组别名（[组别名] 语法，作为词组第一行）
+
+匹配：
+- matches_word_groups: 逐词检查的参考实现
+- CompiledWordGroups: 预编译匹配器（Aho-Corasick 字面词自动机 + 合并正则），
+  单次扫描标题即可得出过滤结果和全部命中的词组
+
+缓存：
+- get_frequency_config: 进程级配置缓存，文件只解析、编译一次，
+  mtime/大小变化且内容哈希变化时才重新加载
 """
 
+import hashlib
 import os
 import re
+import threading
+from collections import OrderedDict, deque
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Union
 
@@ -114,23 +127,26 @@ def load_frequency_words(
         frequency_file: 频率词配置文件路径，默认从环境变量 FREQUENCY_WORDS_PATH 获取或使用 config/frequency_words.txt
 
     Returns:
-        (词组列表, 词组内过滤词, 全局过滤词)
+        (词组列表, 词组内过滤词, 全局过滤词)，同一份配置多次加载返回同一组列表对象，
+        调用方不应修改
 
     Raises:
         FileNotFoundError: 频率词文件不存在
     """
-    if frequency_file is None:
-        frequency_file = os.environ.get(
-            "FREQUENCY_WORDS_PATH", "config/frequency_words.txt"
-        )
+    config = get_frequency_config(frequency_file)
+    return config.word_groups, config.filter_words, config.global_filters
 
-    frequency_path = Path(frequency_file)
-    if not frequency_path.exists():
-        raise FileNotFoundError(f"频率词文件 {frequency_file} 不存在")
 
-    with open(frequency_path, "r", encoding="utf-8") as f:
-        content = f.read()
+def _parse_frequency_content(content: str) -> Tuple[List[Dict], List, List[str]]:
+    """
+    解析频率词配置文件内容
 
+    Args:
+        content: 配置文件文本
+
+    Returns:
+        (词组列表, 词组内过滤词, 全局过滤词)
+    """
     word_groups = [group.strip() for group in content.split("\n\n") if group.strip()]
 
     processed_groups = []
@@ -304,3 +320,404 @@ def matches_word_groups(
         return True
 
     return False
+
+
+# _parse_word 编译正则使用的 flags，只有 flags 一致的正则才能合并
+_MERGEABLE_REGEX_FLAGS = re.compile("", re.IGNORECASE).flags
+
+
+class _AhoCorasick:
+    """
+    Aho-Corasick 多模式字符串匹配自动机
+
+    一次扫描文本即可找出所有命中的关键词（按字符构建，适用于中英文混合）。
+    """
+
+    __slots__ = ("_goto", "_fail", "_out")
+
+    def __init__(self, keywords: Dict[str, int]):
+        """
+        Args:
+            keywords: {关键词: 关键词 ID}，关键词不能为空字符串
+        """
+        goto: List[Dict[str, int]] = [{}]
+        out: List[List[int]] = [[]]
+
+        for keyword, keyword_id in keywords.items():
+            state = 0
+            for ch in keyword:
+                next_state = goto[state].get(ch)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][ch] = next_state
+                    goto.append({})
+                    out.append([])
+                state = next_state
+            out[state].append(keyword_id)
+
+        # 广度优先构建失败指针，并把失败链上的输出合并到当前状态
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in goto[state].items():
+                queue.append(next_state)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[next_state] = goto[f].get(ch, 0)
+                out[next_state].extend(out[fail[next_state]])
+
+        self._goto = goto
+        self._fail = fail
+        self._out = [tuple(ids) for ids in out]
+
+    def search(self, text: str) -> set:
+        """返回文本中命中的全部关键词 ID"""
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+        hits = set()
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                hits.update(out[state])
+        return hits
+
+
+class CompiledWordGroups:
+    """
+    预编译的频率词匹配器
+
+    与 matches_word_groups + 逐组检查的语义完全一致，但：
+    - 所有字面词（普通词、必须词、过滤词、全局过滤词）放进同一个 Aho-Corasick 自动机，
+      标题只需扫描一次
+    - 所有正则合并为一个预筛选正则，未命中时跳过逐个正则检查
+    - 通过"词 -> 词组"倒排索引只检查有命中词的候选词组
+
+    配置列表在编译后不应再被修改。
+    """
+
+    def __init__(
+        self,
+        word_groups: List[Dict],
+        filter_words: List,
+        global_filters: Optional[List[str]] = None,
+    ):
+        self.word_groups = word_groups
+        self.filter_words = filter_words
+        self.global_filters = global_filters or []
+
+        self._literal_ids: Dict[str, int] = {}  # 小写字面词 -> ID
+        self._regex_ids: Dict[Tuple[str, int], int] = {}  # (正则, flags) -> ID
+        self._regexes: List[Tuple[int, "re.Pattern"]] = []
+        self._always_ids: set = set()  # 空字面词（总是命中）
+        self._next_id = 0
+
+        self._global_ids = {self._literal_id(w.lower()) for w in self.global_filters}
+        self._filter_ids = {self._word_id(w) for w in filter_words}
+
+        # 每个词组的必须词 / 普通词 ID
+        self._groups: List[Tuple[Tuple[int, ...], frozenset]] = []
+        # 候选索引：命中某个词时需要检查的词组
+        self._candidates: Dict[int, List[int]] = {}
+        # 任一词（必须词或普通词）命中即视为相关的词组索引
+        self._any_word_groups: Dict[int, List[int]] = {}
+        self._always_groups: List[int] = []  # 没有任何词的词组（如"全部新闻"）
+
+        for idx, group in enumerate(word_groups):
+            required = tuple(dict.fromkeys(self._word_id(w) for w in group.get("required", [])))
+            normal = frozenset(self._word_id(w) for w in group.get("normal", []))
+            self._groups.append((required, normal))
+
+            # 有普通词时，至少要命中一个普通词；否则要命中第一个必须词
+            if normal:
+                trigger_ids = normal
+            elif required:
+                trigger_ids = (required[0],)
+            else:
+                trigger_ids = ()
+                self._always_groups.append(idx)
+            for word_id in trigger_ids:
+                self._candidates.setdefault(word_id, []).append(idx)
+            for word_id in set(required) | normal:
+                self._any_word_groups.setdefault(word_id, []).append(idx)
+
+        literals = {k: v for k, v in self._literal_ids.items() if k}
+        self._automaton = _AhoCorasick(literals) if literals else None
+
+        # 合并无捕获组、flags 一致的正则作为预筛选；其余正则每次单独检查
+        self._merged_regex = None
+        self._merged_patterns: List[Tuple[int, "re.Pattern"]] = [
+            (rid, p) for rid, p in self._regexes
+            if p.groups == 0 and p.flags == _MERGEABLE_REGEX_FLAGS
+        ]
+        if self._merged_patterns:
+            try:
+                self._merged_regex = re.compile(
+                    "|".join(f"(?:{p.pattern})" for _, p in self._merged_patterns),
+                    re.IGNORECASE,
+                )
+            except re.error:
+                self._merged_patterns = []
+        merged_ids = {rid for rid, _ in self._merged_patterns}
+        self._unmerged_regexes = [(rid, p) for rid, p in self._regexes if rid not in merged_ids]
+
+    def _literal_id(self, word_lower: str) -> int:
+        word_id = self._literal_ids.get(word_lower)
+        if word_id is None:
+            word_id = self._next_id
+            self._next_id += 1
+            self._literal_ids[word_lower] = word_id
+            if not word_lower:
+                self._always_ids.add(word_id)
+        return word_id
+
+    def _word_id(self, word_config: Union[str, Dict]) -> int:
+        """为词配置分配 ID（规则与 _word_matches 一致）"""
+        if isinstance(word_config, str):
+            return self._literal_id(word_config.lower())
+
+        pattern = word_config.get("pattern")
+        if word_config.get("is_regex") and pattern:
+            key = (pattern.pattern, pattern.flags)
+            word_id = self._regex_ids.get(key)
+            if word_id is None:
+                word_id = self._next_id
+                self._next_id += 1
+                self._regex_ids[key] = word_id
+                self._regexes.append((word_id, pattern))
+            return word_id
+
+        return self._literal_id(word_config["word"].lower())
+
+    def _scan(self, title_lower: str) -> set:
+        """扫描标题，返回命中的全部词 ID"""
+        hits = set(self._always_ids)
+        if self._automaton is not None:
+            hits |= self._automaton.search(title_lower)
+        if self._merged_regex is not None and self._merged_regex.search(title_lower):
+            for word_id, pattern in self._merged_patterns:
+                if pattern.search(title_lower):
+                    hits.add(word_id)
+        for word_id, pattern in self._unmerged_regexes:
+            if pattern.search(title_lower):
+                hits.add(word_id)
+        return hits
+
+    @staticmethod
+    def _normalize_title(title) -> str:
+        # 防御性类型检查：确保 title 是有效字符串
+        if not isinstance(title, str):
+            title = str(title) if title is not None else ""
+        return title
+
+    def _passes_filters(self, hits: set) -> bool:
+        if self._global_ids and not self._global_ids.isdisjoint(hits):
+            return False
+        if self._filter_ids and not self._filter_ids.isdisjoint(hits):
+            return False
+        return True
+
+    def _groups_from_hits(self, hits: set) -> List[int]:
+        candidates = set(self._always_groups)
+        for word_id in hits:
+            group_ids = self._candidates.get(word_id)
+            if group_ids:
+                candidates.update(group_ids)
+
+        matched = []
+        for idx in sorted(candidates):
+            required, normal = self._groups[idx]
+            if required and not all(word_id in hits for word_id in required):
+                continue
+            if normal and normal.isdisjoint(hits):
+                continue
+            matched.append(idx)
+        return matched
+
+    def match_groups(self, title: str) -> List[int]:
+        """
+        返回标题命中的全部词组索引（升序）
+
+        标题为空、命中全局过滤词或过滤词时返回空列表。
+        """
+        title = self._normalize_title(title)
+        if not title.strip():
+            return []
+        hits = self._scan(title.lower())
+        if not self._passes_filters(hits):
+            return []
+        return self._groups_from_hits(hits)
+
+    def first_group(self, title: str) -> Optional[int]:
+        """返回标题命中的第一个词组索引，未命中返回 None"""
+        groups = self.match_groups(title)
+        return groups[0] if groups else None
+
+    def matches(self, title: str) -> bool:
+        """等价于 matches_word_groups(title, word_groups, filter_words, global_filters)"""
+        title = self._normalize_title(title)
+        if not title.strip():
+            return False
+        hits = self._scan(title.lower())
+        if self._global_ids and not self._global_ids.isdisjoint(hits):
+            return False
+        if not self.word_groups:
+            return True
+        if not self._passes_filters(hits):
+            return False
+        return bool(self._groups_from_hits(hits))
+
+    def first_word_group(self, title: str) -> Optional[int]:
+        """
+        返回任一词（必须词或普通词）出现在标题中的第一个词组索引
+
+        不应用过滤词和必须词规则，用于按关注词粗略归类标题。
+        """
+        title = self._normalize_title(title)
+        if not title.strip():
+            return None
+        hits = self._scan(title.lower())
+        first = None
+        for word_id in hits:
+            group_ids = self._any_word_groups.get(word_id)
+            if group_ids and (first is None or group_ids[0] < first):
+                first = group_ids[0]
+        return first
+
+
+# 最近编译的匹配器缓存：键为配置列表的 id，值中保留列表引用以保证 id 不被复用
+_COMPILED_CACHE_SIZE = 8
+_compiled_cache: "OrderedDict[Tuple[int, int, int], Tuple[tuple, CompiledWordGroups]]" = OrderedDict()
+_compiled_cache_lock = threading.Lock()
+
+
+def get_compiled_word_groups(
+    word_groups: List[Dict],
+    filter_words: List,
+    global_filters: Optional[List[str]] = None,
+) -> CompiledWordGroups:
+    """
+    获取词组配置对应的预编译匹配器
+
+    按配置列表对象本身缓存：load_frequency_words 返回的同一组列表只编译一次。
+
+    Args:
+        word_groups: 词组列表
+        filter_words: 过滤词列表
+        global_filters: 全局过滤词列表
+
+    Returns:
+        CompiledWordGroups 实例
+    """
+    key = (id(word_groups), id(filter_words), id(global_filters))
+    with _compiled_cache_lock:
+        entry = _compiled_cache.get(key)
+        if entry is not None:
+            _compiled_cache.move_to_end(key)
+            return entry[1]
+
+    # get_frequency_config 缓存的配置始终持有自己的匹配器
+    compiled = None
+    with _frequency_configs_lock:
+        for config in _frequency_configs.values():
+            if (
+                config.word_groups is word_groups
+                and config.filter_words is filter_words
+                and config.global_filters is global_filters
+            ):
+                compiled = config.matcher
+                break
+    if compiled is None:
+        compiled = CompiledWordGroups(word_groups, filter_words, global_filters)
+
+    with _compiled_cache_lock:
+        _compiled_cache[key] = ((word_groups, filter_words, global_filters), compiled)
+        _compiled_cache.move_to_end(key)
+        while len(_compiled_cache) > _COMPILED_CACHE_SIZE:
+            _compiled_cache.popitem(last=False)
+    return compiled
+
+
+@dataclass
+class FrequencyConfig:
+    """已解析并预编译的频率词配置"""
+    path: str
+    word_groups: List[Dict]
+    filter_words: List
+    global_filters: List[str]
+    matcher: CompiledWordGroups
+    content_hash: str
+    file_stat: Tuple[int, int]
+
+
+# 进程级频率词配置缓存：键为配置文件的绝对路径
+_frequency_configs: Dict[str, FrequencyConfig] = {}
+_frequency_configs_lock = threading.Lock()
+
+
+def get_frequency_config(frequency_file: Optional[str] = None) -> FrequencyConfig:
+    """
+    获取频率词配置（进程级缓存）
+
+    同一文件只解析、编译一次；文件 mtime 或大小变化时重新读取，内容哈希也变化时
+    才重新解析（仅 touch 文件不会触发重新编译）。
+
+    Args:
+        frequency_file: 频率词配置文件路径，默认从环境变量 FREQUENCY_WORDS_PATH 获取或使用 config/frequency_words.txt
+
+    Returns:
+        FrequencyConfig 实例
+
+    Raises:
+        FileNotFoundError: 频率词文件不存在
+    """
+    if frequency_file is None:
+        frequency_file = os.environ.get(
+            "FREQUENCY_WORDS_PATH", "config/frequency_words.txt"
+        )
+
+    frequency_path = Path(frequency_file)
+    key = os.path.abspath(frequency_path)
+    try:
+        stat = os.stat(frequency_path)
+    except OSError:
+        with _frequency_configs_lock:
+            _frequency_configs.pop(key, None)
+        raise FileNotFoundError(f"频率词文件 {frequency_file} 不存在")
+
+    file_stat = (stat.st_mtime_ns, stat.st_size)
+    with _frequency_configs_lock:
+        cached = _frequency_configs.get(key)
+    if cached is not None and cached.file_stat == file_stat:
+        return cached
+
+    with open(frequency_path, "r", encoding="utf-8") as f:
+        content = f.read()
+    content_hash = hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+    if cached is not None and cached.content_hash == content_hash:
+        cached.file_stat = file_stat
+        return cached
+
+    word_groups, filter_words, global_filters = _parse_frequency_content(content)
+    config = FrequencyConfig(
+        path=key,
+        word_groups=word_groups,
+        filter_words=filter_words,
+        global_filters=global_filters,
+        # 经由 get_compiled_word_groups 编译，对同一组列表的后续调用直接命中
+        matcher=get_compiled_word_groups(word_groups, filter_words, global_filters),
+        content_hash=content_hash,
+        file_stat=file_stat,
+    )
+
+    with _frequency_configs_lock:
+        _frequency_configs[key] = config
+    if cached is not None:
+        print(f"[频率词] 检测到 {frequency_file} 变化，已重新加载")
+    return config
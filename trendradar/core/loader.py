@@ -69,6 +69,10 @@ def _load_crawler_config(config_data: Dict) -> Dict:
     platforms_config = config_data.get("platforms", {})
     return {
         "REQUEST_INTERVAL": crawler_config.get("request_interval", 100),
+        "CRAWLER_MAX_WORKERS": crawler_config.get("max_workers", 1),
+        "CRAWLER_PER_HOST_CONCURRENCY": crawler_config.get("per_host_concurrency", 4),
+        "CRAWLER_TIMEOUT": crawler_config.get("crawl_timeout", 0),
+        "CRAWLER_PER_HOST_INTERVAL": crawler_config.get("per_host_interval"),
         "USE_PROXY": crawler_config.get("use_proxy", False),
         "DEFAULT_PROXY": crawler_config.get("default_proxy", ""),
         "ENABLE_CRAWLER": platforms_config.get("enabled", True),
@@ -108,6 +112,9 @@ def _load_notification_config(config_data: Dict) -> Dict:
         "BATCH_SEND_INTERVAL": advanced.get("batch_send_interval", 1.0),
         "FEISHU_MESSAGE_SEPARATOR": advanced.get("feishu_message_separator", "---"),
         "MAX_ACCOUNTS_PER_CHANNEL": _get_env_int("MAX_ACCOUNTS_PER_CHANNEL") or advanced.get("max_accounts_per_channel", 3),
+        "PUSH_CHANNEL_WORKERS": advanced.get("push_channel_workers", 9),
+        "PUSH_ACCOUNT_CONCURRENCY": advanced.get("push_account_concurrency", 3),
+        "PUSH_DEADLINE": advanced.get("push_deadline", 300),
     }
 
 
@@ -169,6 +176,9 @@ def _load_rss_config(config_data: Dict) -> Dict:
         "ENABLED": rss.get("enabled", False),
         "REQUEST_INTERVAL": advanced_rss.get("request_interval", 2000),
         "TIMEOUT": advanced_rss.get("timeout", 15),
+        "MAX_WORKERS": advanced_rss.get("max_workers", 1),
+        "PER_DOMAIN_CONCURRENCY": advanced_rss.get("per_domain_concurrency", 2),
+        "CONDITIONAL_GET": advanced_rss.get("conditional_get", True),
         "USE_PROXY": advanced_rss.get("use_proxy", False),
         "PROXY_URL": rss_proxy_url,
         "FEEDS": rss.get("feeds", []),
@@ -279,6 +289,10 @@ def _load_ai_translation_config(config_data: Dict) -> Dict:
         "ENABLED": enabled_env if enabled_env is not None else trans_config.get("enabled", False),
         "LANGUAGE": _get_env_str("AI_TRANSLATION_LANGUAGE") or trans_config.get("language", "English"),
         "PROMPT_FILE": trans_config.get("prompt_file", "ai_translation_prompt.txt"),
+        "BATCH_SIZE": trans_config.get("batch_size", 50),
+        "MAX_WORKERS": trans_config.get("max_workers", 3),
+        "MEMORY": trans_config.get("memory", True),
+        "MEMORY_RETENTION_DAYS": trans_config.get("memory_retention_days", 30),
     }
 
 
@@ -289,6 +303,7 @@ def _load_storage_config(config_data: Dict) -> Dict:
     local = storage.get("local", {})
     remote = storage.get("remote", {})
     pull = storage.get("pull", {})
+    sqlite_profile = storage.get("sqlite", {}) or {}
 
     txt_enabled_env = _get_env_bool("STORAGE_TXT_ENABLED")
     html_enabled_env = _get_env_bool("STORAGE_HTML_ENABLED")
@@ -304,6 +319,8 @@ def _load_storage_config(config_data: Dict) -> Dict:
         "LOCAL": {
             "DATA_DIR": local.get("data_dir", "output"),
             "RETENTION_DAYS": _get_env_int("LOCAL_RETENTION_DAYS") or local.get("retention_days", 0),
+            "SEARCH_INDEX": local.get("search_index", True),
+            "ROLLUP": local.get("rollup", True),
         },
         "REMOTE": {
             "ENDPOINT_URL": _get_env_str("S3_ENDPOINT_URL") or remote.get("endpoint_url", ""),
@@ -312,10 +329,19 @@ def _load_storage_config(config_data: Dict) -> Dict:
             "SECRET_ACCESS_KEY": _get_env_str("S3_SECRET_ACCESS_KEY") or remote.get("secret_access_key", ""),
             "REGION": _get_env_str("S3_REGION") or remote.get("region", ""),
             "RETENTION_DAYS": _get_env_int("REMOTE_RETENTION_DAYS") or remote.get("retention_days", 0),
+            "DELTA_SYNC": remote.get("delta_sync", True),
+            "COMPACT_SEGMENTS": remote.get("compact_segments", 12),
         },
         "PULL": {
             "ENABLED": pull_enabled_env if pull_enabled_env is not None else pull.get("enabled", False),
             "DAYS": _get_env_int("PULL_DAYS") or pull.get("days", 7),
+            "MAX_WORKERS": pull.get("max_workers", 8),
+        },
+        # SQLite 连接参数（未配置的项由存储层使用默认值）
+        "SQLITE": {
+            key: sqlite_profile[key]
+            for key in ("journal_mode", "synchronous", "mmap_size", "cache_size", "temp_store")
+            if key in sqlite_profile
         },
     }
 
@@ -4,17 +4,95 @@
 
 负责从 NewsNow API 抓取新闻数据，支持：
 - 单个平台数据获取
-- 批量平台数据爬取
+- 批量平台数据爬取（顺序 / 并发两种模式）
 - 自动重试机制
 - 代理支持
+- 连接池复用（keep-alive Session）
+- 按主机限流（并发上限 + 带抖动的请求间隔）
+- 全局截止时间
 """
 
 import json
 import random
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from typing import Dict, List, Tuple, Optional, Union
+from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+
+
+class HostThrottle:
+    """
+    单个主机的限流器
+
+    - 信号量限制同一主机的并发请求数
+    - 错开请求发起时间（带随机抖动）：默认以 request_interval / concurrency 为步长，
+      使同一主机的请求节奏与顺序模式一致；指定 start_interval 时以它为步长，
+      不同主机之间互不影响
+
+    注意：热榜所有平台都请求同一个 newsnow 主机，默认步长下整轮耗时约为
+    平台数 × 步长，与顺序模式接近；调小 start_interval 才能接近"最慢请求耗时"。
+    """
+
+    def __init__(self, concurrency: int, request_interval: int, start_interval: Optional[int] = None):
+        """
+        Args:
+            concurrency: 同一主机的最大并发请求数
+            request_interval: 请求间隔（毫秒，顺序模式语义）
+            start_interval: 同一主机请求发起的最小间隔（毫秒，None=request_interval / concurrency）
+        """
+        self.concurrency = max(1, concurrency)
+        self.request_interval = request_interval
+        self.start_interval = start_interval
+        self._semaphore = threading.Semaphore(self.concurrency)
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def _jittered_gap(self) -> float:
+        """计算下一次请求的错开间隔（秒）"""
+        if self.start_interval is not None:
+            if self.start_interval <= 0:
+                return 0.0
+            return max(0, self.start_interval + random.randint(-10, 20)) / 1000
+        interval = self.request_interval + random.randint(-10, 20)
+        interval = max(50, interval)
+        return interval / 1000 / self.concurrency
+
+    def acquire(self, deadline: Optional[float] = None) -> bool:
+        """
+        获取请求许可
+
+        Args:
+            deadline: 全局截止时间（time.monotonic() 时间戳）
+
+        Returns:
+            是否在截止时间前获得许可
+        """
+        timeout = None
+        if deadline is not None:
+            timeout = max(0.0, deadline - time.monotonic())
+        if not self._semaphore.acquire(timeout=timeout):
+            return False
+
+        with self._lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_slot)
+            self._next_slot = start_at + self._jittered_gap()
+
+        wait_time = start_at - time.monotonic()
+        if deadline is not None and start_at >= deadline:
+            self._semaphore.release()
+            return False
+        if wait_time > 0:
+            time.sleep(wait_time)
+        return True
+
+    def release(self) -> None:
+        """释放请求许可"""
+        self._semaphore.release()
 
 
 class DataFetcher:
@@ -36,6 +114,10 @@ class DataFetcher:
         self,
         proxy_url: Optional[str] = None,
         api_url: Optional[str] = None,
+        max_workers: int = 1,
+        per_host_concurrency: int = 4,
+        crawl_timeout: float = 0,
+        per_host_interval: Optional[int] = None,
     ):
         """
         初始化数据获取器
@@ -43,9 +125,54 @@ class DataFetcher:
         Args:
             proxy_url: 代理服务器 URL（可选）
             api_url: API 基础 URL（可选，默认使用 DEFAULT_API_URL）
+            max_workers: 并发线程数（<=1 时使用顺序模式）
+            per_host_concurrency: 同一主机的最大并发请求数（仅并发模式）
+            crawl_timeout: 整轮爬取的全局截止时间（秒，0=不限制，仅并发模式）
+            per_host_interval: 同一主机请求发起的最小间隔（毫秒，仅并发模式；
+                None=按 request_interval / per_host_concurrency 计算）
         """
         self.proxy_url = proxy_url
         self.api_url = api_url or self.DEFAULT_API_URL
+        self.max_workers = max(1, int(max_workers or 1))
+        self.per_host_concurrency = max(1, int(per_host_concurrency or 1))
+        self.crawl_timeout = max(0.0, float(crawl_timeout or 0))
+        self.per_host_interval = None if per_host_interval is None else max(0, int(per_host_interval))
+
+        self.session = self._create_session()
+        self._throttles: Dict[str, HostThrottle] = {}
+        self._throttles_lock = threading.Lock()
+
+    def _create_session(self) -> requests.Session:
+        """创建带连接池的 keep-alive Session"""
+        session = requests.Session()
+        pool_size = max(10, self.max_workers)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update(self.DEFAULT_HEADERS)
+        if self.proxy_url:
+            session.proxies = {"http": self.proxy_url, "https": self.proxy_url}
+        return session
+
+    def close(self) -> None:
+        """关闭连接池"""
+        self.session.close()
+
+    def _build_url(self, id_value: str) -> str:
+        """构建平台数据请求 URL"""
+        return f"{self.api_url}?id={id_value}&latest"
+
+    def _get_throttle(self, url: str, request_interval: int) -> HostThrottle:
+        """获取（或创建）URL 所属主机的限流器"""
+        host = urlparse(url).netloc
+        with self._throttles_lock:
+            throttle = self._throttles.get(host)
+            if throttle is None or throttle.request_interval != request_interval:
+                throttle = HostThrottle(
+                    self.per_host_concurrency, request_interval, self.per_host_interval
+                )
+                self._throttles[host] = throttle
+            return throttle
 
     def fetch_data(
         self,
@@ -53,6 +180,7 @@ class DataFetcher:
         max_retries: int = 2,
         min_retry_wait: int = 3,
         max_retry_wait: int = 5,
+        deadline: Optional[float] = None,
     ) -> Tuple[Optional[str], str, str]:
         """
         获取指定ID数据，支持重试
@@ -62,6 +190,7 @@ class DataFetcher:
             max_retries: 最大重试次数
             min_retry_wait: 最小重试等待时间（秒）
             max_retry_wait: 最大重试等待时间（秒）
+            deadline: 截止时间（time.monotonic() 时间戳），超过后不再重试
 
         Returns:
             (响应文本, 平台ID, 别名) 元组，失败时响应文本为 None
@@ -72,21 +201,15 @@ class DataFetcher:
             id_value = id_info
             alias = id_value
 
-        url = f"{self.api_url}?id={id_value}&latest"
-
-        proxies = None
-        if self.proxy_url:
-            proxies = {"http": self.proxy_url, "https": self.proxy_url}
+        url = self._build_url(id_value)
 
         retries = 0
         while retries <= max_retries:
             try:
-                response = requests.get(
-                    url,
-                    proxies=proxies,
-                    headers=self.DEFAULT_HEADERS,
-                    timeout=10,
-                )
+                timeout = 10
+                if deadline is not None:
+                    timeout = min(timeout, max(0.1, deadline - time.monotonic()))
+                response = self.session.get(url, timeout=timeout)
                 response.raise_for_status()
 
                 data_text = response.text
@@ -106,6 +229,9 @@ class DataFetcher:
                     base_wait = random.uniform(min_retry_wait, max_retry_wait)
                     additional_wait = (retries - 1) * random.uniform(1, 2)
                     wait_time = base_wait + additional_wait
+                    if deadline is not None and time.monotonic() + wait_time >= deadline:
+                        print(f"请求 {id_value} 失败: {e}（已到达截止时间，不再重试）")
+                        return None, id_value, alias
                     print(f"请求 {id_value} 失败: {e}. {wait_time:.2f}秒后重试...")
                     time.sleep(wait_time)
                 else:
@@ -114,6 +240,41 @@ class DataFetcher:
 
         return None, id_value, alias
 
+    def _parse_response(self, id_value: str, response: str) -> Optional[Dict]:
+        """
+        解析平台响应为 {标题: {ranks, url, mobileUrl}} 字典
+
+        Returns:
+            解析结果，失败时返回 None
+        """
+        try:
+            data = json.loads(response)
+            titles = {}
+
+            for index, item in enumerate(data.get("items", []), 1):
+                title = item.get("title")
+                # 跳过无效标题（None、float、空字符串）
+                if title is None or isinstance(title, float) or not str(title).strip():
+                    continue
+                title = str(title).strip()
+                url = item.get("url", "")
+                mobile_url = item.get("mobileUrl", "")
+
+                if title in titles:
+                    titles[title]["ranks"].append(index)
+                else:
+                    titles[title] = {
+                        "ranks": [index],
+                        "url": url,
+                        "mobileUrl": mobile_url,
+                    }
+            return titles
+        except json.JSONDecodeError:
+            print(f"解析 {id_value} 响应失败")
+        except Exception as e:
+            print(f"处理 {id_value} 数据出错: {e}")
+        return None
+
     def crawl_websites(
         self,
         ids_list: List[Union[str, Tuple[str, str]]],
@@ -122,6 +283,8 @@ class DataFetcher:
         """
         爬取多个网站数据
 
+        max_workers > 1 时使用并发模式，否则按顺序逐个请求。
+
         Args:
             ids_list: 平台ID列表，每个元素可以是字符串或 (平台ID, 别名) 元组
             request_interval: 请求间隔（毫秒）
@@ -129,6 +292,16 @@ class DataFetcher:
         Returns:
             (结果字典, ID到名称的映射, 失败ID列表) 元组
         """
+        if self.max_workers > 1 and len(ids_list) > 1:
+            return self._crawl_concurrent(ids_list, request_interval)
+        return self._crawl_sequential(ids_list, request_interval)
+
+    def _crawl_sequential(
+        self,
+        ids_list: List[Union[str, Tuple[str, str]]],
+        request_interval: int,
+    ) -> Tuple[Dict, Dict, List]:
+        """顺序爬取（逐个平台请求，平台之间按间隔等待）"""
         results = {}
         id_to_name = {}
         failed_ids = []
@@ -143,34 +316,9 @@ class DataFetcher:
             id_to_name[id_value] = name
             response, _, _ = self.fetch_data(id_info)
 
-            if response:
-                try:
-                    data = json.loads(response)
-                    results[id_value] = {}
-
-                    for index, item in enumerate(data.get("items", []), 1):
-                        title = item.get("title")
-                        # 跳过无效标题（None、float、空字符串）
-                        if title is None or isinstance(title, float) or not str(title).strip():
-                            continue
-                        title = str(title).strip()
-                        url = item.get("url", "")
-                        mobile_url = item.get("mobileUrl", "")
-
-                        if title in results[id_value]:
-                            results[id_value][title]["ranks"].append(index)
-                        else:
-                            results[id_value][title] = {
-                                "ranks": [index],
-                                "url": url,
-                                "mobileUrl": mobile_url,
-                            }
-                except json.JSONDecodeError:
-                    print(f"解析 {id_value} 响应失败")
-                    failed_ids.append(id_value)
-                except Exception as e:
-                    print(f"处理 {id_value} 数据出错: {e}")
-                    failed_ids.append(id_value)
+            titles = self._parse_response(id_value, response) if response else None
+            if titles is not None:
+                results[id_value] = titles
             else:
                 failed_ids.append(id_value)
 
@@ -182,3 +330,74 @@ class DataFetcher:
 
         print(f"成功: {list(results.keys())}, 失败: {failed_ids}")
         return results, id_to_name, failed_ids
+
+    def _crawl_concurrent(
+        self,
+        ids_list: List[Union[str, Tuple[str, str]]],
+        request_interval: int,
+    ) -> Tuple[Dict, Dict, List]:
+        """
+        并发爬取
+
+        - 线程池大小由 max_workers 决定
+        - 同一主机的并发数与请求节奏由 HostThrottle 控制
+        - 超过 crawl_timeout 仍未完成的平台记为失败
+        """
+        id_to_name = {}
+        id_values = []
+        for id_info in ids_list:
+            if isinstance(id_info, tuple):
+                id_value, name = id_info
+            else:
+                id_value = id_info
+                name = id_value
+            id_to_name[id_value] = name
+            id_values.append(id_value)
+
+        deadline = None
+        if self.crawl_timeout > 0:
+            deadline = time.monotonic() + self.crawl_timeout
+
+        def task(id_info) -> Optional[Dict]:
+            id_value = id_info[0] if isinstance(id_info, tuple) else id_info
+            throttle = self._get_throttle(self._build_url(id_value), request_interval)
+            if not throttle.acquire(deadline):
+                print(f"请求 {id_value} 超出截止时间，已跳过")
+                return None
+            try:
+                response, _, _ = self.fetch_data(id_info, deadline=deadline)
+            finally:
+                throttle.release()
+            return self._parse_response(id_value, response) if response else None
+
+        workers = min(self.max_workers, len(ids_list))
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="crawler")
+        try:
+            futures = {id_values[i]: executor.submit(task, id_info) for i, id_info in enumerate(ids_list)}
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            wait(list(futures.values()), timeout=timeout)
+        finally:
+            # 到达截止时间时不等待仍在运行的请求，直接取消排队中的任务
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        # 按配置顺序组装结果，保持与顺序模式一致
+        results = {}
+        failed_ids = []
+        for id_value in id_values:
+            future = futures[id_value]
+            titles = None
+            if future.done() and not future.cancelled():
+                try:
+                    titles = future.result()
+                except Exception as e:
+                    print(f"处理 {id_value} 数据出错: {e}")
+            elif deadline is not None:
+                print(f"请求 {id_value} 未在 {self.crawl_timeout:.0f} 秒内完成")
+
+            if titles is not None:
+                results[id_value] = titles
+            elif id_value not in failed_ids:
+                failed_ids.append(id_value)
+
+        print(f"成功: {list(results.keys())}, 失败: {failed_ids}")
+        return results, id_to_name, failed_ids
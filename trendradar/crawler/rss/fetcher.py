@@ -2,18 +2,26 @@
 """
 RSS 抓取器
 
-负责从配置的 RSS 源抓取数据并转换为标准格式
+负责从配置的 RSS 源抓取数据并转换为标准格式，支持：
+- 并发抓取（按域名限流）
+- 条件请求（ETag / Last-Modified），304 或内容哈希未变化时复用上次解析结果
 """
 
+import hashlib
 import time
 import random
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Dict, Optional, Tuple, Callable
+from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from .parser import RSSParser, ParsedRSSItem
+from .validators import FeedValidator, FeedValidatorStore
+from trendradar.crawler.fetcher import HostThrottle
 from trendradar.storage.base import RSSItem, RSSData
 from trendradar.utils.time import get_configured_time, is_within_days, DEFAULT_TIMEZONE
 
@@ -29,6 +37,15 @@ class RSSFeedConfig:
     max_age_days: Optional[int] = None  # 文章最大年龄（天），覆盖全局设置；None=使用全局，0=禁用过滤
 
 
+@dataclass
+class _FeedResult:
+    """单个源的下载/解析结果（工作线程 -> 主线程）"""
+    status: str                                  # "ok" | "not_modified" | "unchanged" | "error"
+    parsed_items: List[ParsedRSSItem] = field(default_factory=list)
+    validator: Optional[FeedValidator] = None    # 新的校验信息（status == "ok" 时）
+    error: Optional[str] = None
+
+
 class RSSFetcher:
     """RSS 抓取器"""
 
@@ -42,19 +59,25 @@ class RSSFetcher:
         timezone: str = DEFAULT_TIMEZONE,
         freshness_enabled: bool = True,
         default_max_age_days: int = 3,
+        max_workers: int = 1,
+        per_domain_concurrency: int = 2,
+        validator_store_path: Optional[str] = None,
     ):
         """
         初始化抓取器
 
         Args:
             feeds: RSS 源配置列表
-            request_interval: 请求间隔（毫秒）
+            request_interval: 请求间隔（毫秒，并发模式下按域名分别计算）
             timeout: 请求超时（秒）
             use_proxy: 是否使用代理
             proxy_url: 代理 URL
             timezone: 时区配置（如 'Asia/Shanghai'）
             freshness_enabled: 是否启用新鲜度过滤
             default_max_age_days: 默认最大文章年龄（天）
+            max_workers: 并发线程数（<=1 时顺序抓取）
+            per_domain_concurrency: 同一域名的最大并发请求数
+            validator_store_path: 条件请求校验信息存储路径（None=不使用条件请求）
         """
         self.feeds = [f for f in feeds if f.enabled]
         self.request_interval = request_interval
@@ -64,13 +87,24 @@ class RSSFetcher:
         self.timezone = timezone
         self.freshness_enabled = freshness_enabled
         self.default_max_age_days = default_max_age_days
+        self.max_workers = max(1, int(max_workers or 1))
+        self.per_domain_concurrency = max(1, int(per_domain_concurrency or 1))
+        self.validator_store_path = validator_store_path
 
         self.parser = RSSParser()
         self.session = self._create_session()
 
+        self._validator_store: Optional[FeedValidatorStore] = None
+        self._validators: Dict[str, FeedValidator] = {}
+        self._throttles: Dict[str, HostThrottle] = {}
+
     def _create_session(self) -> requests.Session:
         """创建请求会话"""
         session = requests.Session()
+        pool_size = max(10, self.max_workers)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
         session.headers.update({
             "User-Agent": "TrendRadar/2.0 RSS Reader (https://github.com/trendradar)",
             "Accept": "application/feed+json, application/json, application/rss+xml, application/atom+xml, application/xml, text/xml, */*",
@@ -127,71 +161,199 @@ class RSSFetcher:
         filtered_count = len(items) - len(filtered)
         return filtered, filtered_count
 
-    def fetch_feed(self, feed: RSSFeedConfig) -> Tuple[List[RSSItem], Optional[str]]:
+    def _open_validator_store(self) -> None:
+        """打开校验信息存储并预加载所有源的校验信息"""
+        if not self.validator_store_path or self._validator_store is not None:
+            return
+        try:
+            self._validator_store = FeedValidatorStore(self.validator_store_path)
+            self._validators = self._validator_store.load_validators()
+        except Exception as e:
+            print(f"[RSS] 校验信息存储不可用，将完整抓取: {e}")
+            self._validator_store = None
+            self._validators = {}
+
+    def _close_validator_store(self) -> None:
+        """关闭校验信息存储"""
+        if self._validator_store is not None:
+            self._validator_store.close()
+            self._validator_store = None
+            self._validators = {}
+
+    def close(self) -> None:
+        """关闭连接池和校验信息存储"""
+        self._close_validator_store()
+        self.session.close()
+
+    def _get_validator(self, feed: RSSFeedConfig) -> Optional[FeedValidator]:
+        """获取源的已知校验信息（URL 变更后视为无效）"""
+        validator = self._validators.get(feed.id)
+        if validator and validator.url == feed.url:
+            return validator
+        return None
+
+    def _download_feed(self, feed: RSSFeedConfig) -> _FeedResult:
         """
-        抓取单个 RSS 源
+        下载并解析单个 RSS 源（可在工作线程中调用，不访问校验信息存储）
 
         Args:
             feed: RSS 源配置
 
         Returns:
-            (条目列表, 错误信息) 元组
+            _FeedResult
         """
+        validator = self._get_validator(feed)
+        headers = {}
+        if validator:
+            if validator.etag:
+                headers["If-None-Match"] = validator.etag
+            if validator.last_modified:
+                headers["If-Modified-Since"] = validator.last_modified
+
         try:
-            response = self.session.get(feed.url, timeout=self.timeout)
+            response = self.session.get(feed.url, timeout=self.timeout, headers=headers)
+
+            if response.status_code == 304 and validator:
+                return _FeedResult(status="not_modified")
+
             response.raise_for_status()
 
-            parsed_items = self.parser.parse(response.text, feed.url)
+            content_hash = hashlib.sha256(response.content).hexdigest()
+            new_validator = FeedValidator(
+                feed_id=feed.id,
+                url=feed.url,
+                etag=response.headers.get("ETag", ""),
+                last_modified=response.headers.get("Last-Modified", ""),
+                content_hash=content_hash,
+            )
+            if validator and validator.content_hash == content_hash:
+                return _FeedResult(status="unchanged", validator=new_validator)
 
-            # 限制条目数量（0=不限制）
-            if feed.max_items > 0:
-                parsed_items = parsed_items[:feed.max_items]
-
-            # 转换为 RSSItem（使用配置的时区）
-            now = get_configured_time(self.timezone)
-            crawl_time = now.strftime("%H:%M")
-            items = []
-
-            for parsed in parsed_items:
-                item = RSSItem(
-                    title=parsed.title,
-                    feed_id=feed.id,
-                    feed_name=feed.name,
-                    url=parsed.url,
-                    published_at=parsed.published_at or "",
-                    summary=parsed.summary or "",
-                    author=parsed.author or "",
-                    crawl_time=crawl_time,
-                    first_time=crawl_time,
-                    last_time=crawl_time,
-                    count=1,
-                )
-                items.append(item)
-
-            # 注意：新鲜度过滤已移至推送阶段（_convert_rss_items_to_list）
-            # 这样所有文章都会存入数据库，但旧文章不会推送
-            print(f"[RSS] {feed.name}: 获取 {len(items)} 条")
-            return items, None
+            parsed_items = self.parser.parse(response.text, feed.url)
+            return _FeedResult(status="ok", parsed_items=parsed_items, validator=new_validator)
 
         except requests.Timeout:
-            error = f"请求超时 ({self.timeout}s)"
-            print(f"[RSS] {feed.name}: {error}")
-            return [], error
+            return _FeedResult(status="error", error=f"请求超时 ({self.timeout}s)")
 
         except requests.RequestException as e:
-            error = f"请求失败: {e}"
-            print(f"[RSS] {feed.name}: {error}")
-            return [], error
+            return _FeedResult(status="error", error=f"请求失败: {e}")
 
         except ValueError as e:
-            error = f"解析失败: {e}"
-            print(f"[RSS] {feed.name}: {error}")
-            return [], error
+            return _FeedResult(status="error", error=f"解析失败: {e}")
 
         except Exception as e:
-            error = f"未知错误: {e}"
-            print(f"[RSS] {feed.name}: {error}")
-            return [], error
+            return _FeedResult(status="error", error=f"未知错误: {e}")
+
+    def _resolve_feed_result(
+        self,
+        feed: RSSFeedConfig,
+        result: _FeedResult,
+    ) -> Tuple[List[RSSItem], Optional[str]]:
+        """
+        处理下载结果（主线程）：复用缓存的解析结果、更新校验信息、转换为 RSSItem
+
+        Returns:
+            (条目列表, 错误信息) 元组
+        """
+        if result.status == "error":
+            print(f"[RSS] {feed.name}: {result.error}")
+            return [], result.error
+
+        parsed_items = result.parsed_items
+        if result.status in ("not_modified", "unchanged"):
+            cached = self._validator_store.load_items(feed.id) if self._validator_store else None
+            if cached is None:
+                # 缓存缺失（理论上不会发生），清除校验信息后完整重抓
+                self._validators.pop(feed.id, None)
+                return self._resolve_feed_result(feed, self._download_feed(feed))
+            parsed_items = cached
+
+        if self._validator_store is not None:
+            if result.status == "ok":
+                self._validator_store.save(result.validator, parsed_items)
+            elif result.status == "unchanged":
+                # 内容未变，但 ETag / Last-Modified 可能变化
+                self._validator_store.save(result.validator, parsed_items)
+
+        items = self._build_items(feed, parsed_items)
+
+        # 注意：新鲜度过滤已移至推送阶段（_convert_rss_items_to_list）
+        # 这样所有文章都会存入数据库，但旧文章不会推送
+        if result.status == "ok":
+            print(f"[RSS] {feed.name}: 获取 {len(items)} 条")
+        else:
+            reason = "304 未修改" if result.status == "not_modified" else "内容未变化"
+            print(f"[RSS] {feed.name}: {reason}，复用 {len(items)} 条")
+        return items, None
+
+    def _build_items(
+        self,
+        feed: RSSFeedConfig,
+        parsed_items: List[ParsedRSSItem],
+    ) -> List[RSSItem]:
+        """将解析结果转换为 RSSItem 列表"""
+        # 限制条目数量（0=不限制）
+        if feed.max_items > 0:
+            parsed_items = parsed_items[:feed.max_items]
+
+        # 转换为 RSSItem（使用配置的时区）
+        now = get_configured_time(self.timezone)
+        crawl_time = now.strftime("%H:%M")
+        items = []
+
+        for parsed in parsed_items:
+            item = RSSItem(
+                title=parsed.title,
+                feed_id=feed.id,
+                feed_name=feed.name,
+                url=parsed.url,
+                published_at=parsed.published_at or "",
+                summary=parsed.summary or "",
+                author=parsed.author or "",
+                crawl_time=crawl_time,
+                first_time=crawl_time,
+                last_time=crawl_time,
+                count=1,
+            )
+            items.append(item)
+
+        return items
+
+    def fetch_feed(self, feed: RSSFeedConfig) -> Tuple[List[RSSItem], Optional[str]]:
+        """
+        抓取单个 RSS 源
+
+        Args:
+            feed: RSS 源配置
+
+        Returns:
+            (条目列表, 错误信息) 元组
+        """
+        return self._resolve_feed_result(feed, self._download_feed(feed))
+
+    def _get_throttle(self, url: str) -> HostThrottle:
+        """获取（或创建）URL 所属域名的限流器（仅在主线程中创建）"""
+        domain = urlparse(url).netloc
+        if domain not in self._throttles:
+            self._throttles[domain] = HostThrottle(self.per_domain_concurrency, self.request_interval)
+        return self._throttles[domain]
+
+    def _fetch_concurrent(self) -> Dict[str, _FeedResult]:
+        """并发下载所有源（按域名限流），返回 {feed_id: _FeedResult}"""
+        throttles = {feed.id: self._get_throttle(feed.url) for feed in self.feeds}
+
+        def task(feed: RSSFeedConfig) -> _FeedResult:
+            throttle = throttles[feed.id]
+            throttle.acquire()
+            try:
+                return self._download_feed(feed)
+            finally:
+                throttle.release()
+
+        workers = min(self.max_workers, len(self.feeds))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="rss") as executor:
+            futures = {feed.id: executor.submit(task, feed) for feed in self.feeds}
+            return {feed_id: future.result() for feed_id, future in futures.items()}
 
     def fetch_all(self) -> RSSData:
         """
@@ -211,24 +373,45 @@ class RSSFetcher:
 
         print(f"[RSS] 开始抓取 {len(self.feeds)} 个 RSS 源...")
 
-        for i, feed in enumerate(self.feeds):
-            # 请求间隔（带随机波动）
-            if i > 0:
-                interval = self.request_interval / 1000
-                jitter = random.uniform(-0.2, 0.2) * interval
-                time.sleep(interval + jitter)
-
-            items, error = self.fetch_feed(feed)
-
-            id_to_name[feed.id] = feed.name
-
-            if error:
-                failed_ids.append(feed.id)
-            else:
-                all_items[feed.id] = items
+        self._open_validator_store()
+        try:
+            concurrent = self.max_workers > 1 and len(self.feeds) > 1
+            prefetched = self._fetch_concurrent() if concurrent else {}
+            reused_count = 0
+
+            for i, feed in enumerate(self.feeds):
+                if concurrent:
+                    result = prefetched[feed.id]
+                else:
+                    # 请求间隔（带随机波动）
+                    if i > 0:
+                        interval = self.request_interval / 1000
+                        jitter = random.uniform(-0.2, 0.2) * interval
+                        time.sleep(interval + jitter)
+                    result = self._download_feed(feed)
+
+                if result.status in ("not_modified", "unchanged"):
+                    reused_count += 1
+
+                items, error = self._resolve_feed_result(feed, result)
+
+                id_to_name[feed.id] = feed.name
+
+                if error:
+                    failed_ids.append(feed.id)
+                else:
+                    all_items[feed.id] = items
+
+            if self._validator_store is not None:
+                self._validator_store.commit()
+        finally:
+            self._close_validator_store()
 
         total_items = sum(len(items) for items in all_items.values())
-        print(f"[RSS] 抓取完成: {len(all_items)} 个源成功, {len(failed_ids)} 个失败, 共 {total_items} 条")
+        print(
+            f"[RSS] 抓取完成: {len(all_items)} 个源成功（{reused_count} 个未变化）, "
+            f"{len(failed_ids)} 个失败, 共 {total_items} 条"
+        )
 
         return RSSData(
             date=crawl_date,
@@ -248,6 +431,9 @@ class RSSFetcher:
                 {
                     "enabled": true,
                     "request_interval": 2000,
+                    "max_workers": 8,
+                    "per_domain_concurrency": 2,
+                    "validator_store_path": "output/cache/rss_validators.db",
                     "freshness_filter": {
                         "enabled": true,
                         "max_age_days": 3
@@ -302,4 +488,7 @@ class RSSFetcher:
             timezone=config.get("timezone", DEFAULT_TIMEZONE),
             freshness_enabled=freshness_enabled,
             default_max_age_days=default_max_age_days,
+            max_workers=config.get("max_workers", 1),
+            per_domain_concurrency=config.get("per_domain_concurrency", 2),
+            validator_store_path=config.get("validator_store_path"),
         )
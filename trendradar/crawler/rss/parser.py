@@ -5,6 +5,7 @@ RSS 解析器
 支持 RSS 2.0、Atom 和 JSON Feed 1.1 格式的解析
 """
 
+import importlib.util
 import re
 import html
 import json
@@ -13,12 +14,8 @@ from datetime import datetime
 from typing import List, Optional, Dict, Any
 from email.utils import parsedate_to_datetime
 
-try:
-    import feedparser
-    HAS_FEEDPARSER = True
-except ImportError:
-    HAS_FEEDPARSER = False
-    feedparser = None
+# feedparser 只在解析 RSS/Atom 时导入，未启用 RSS 时不产生导入开销
+HAS_FEEDPARSER = importlib.util.find_spec("feedparser") is not None
 
 
 @dataclass
@@ -63,6 +60,8 @@ class RSSParser:
             return self._parse_json_feed(content, feed_url)
 
         # 使用 feedparser 解析 RSS/Atom
+        import feedparser
+
         feed = feedparser.parse(content)
 
         if feed.bozo and not feed.entries:
@@ -0,0 +1,140 @@
+# coding=utf-8
+"""
+RSS 条件请求校验信息存储
+
+为每个 RSS 源持久化保存 ETag、Last-Modified、内容哈希以及上次解析结果，
+用于发送 If-None-Match / If-Modified-Since 条件请求，并在 304 或内容未变化时
+直接复用上次的解析结果，跳过下载与解析。
+"""
+
+import json
+import sqlite3
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .parser import ParsedRSSItem
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS feed_validators (
+    feed_id TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    etag TEXT DEFAULT '',
+    last_modified TEXT DEFAULT '',
+    content_hash TEXT DEFAULT '',
+    items_json TEXT NOT NULL DEFAULT '[]',
+    updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+);
+"""
+
+
+@dataclass
+class FeedValidator:
+    """单个 RSS 源的校验信息"""
+    feed_id: str
+    url: str
+    etag: str = ""
+    last_modified: str = ""
+    content_hash: str = ""
+
+
+class FeedValidatorStore:
+    """
+    RSS 源校验信息存储（SQLite）
+
+    只应在单个线程中访问（RSSFetcher 在主线程中读写，工作线程只读取预加载的校验信息）。
+    """
+
+    def __init__(self, db_path: str):
+        """
+        初始化存储
+
+        Args:
+            db_path: SQLite 文件路径（目录不存在时自动创建）
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path))
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    def load_validators(self) -> Dict[str, FeedValidator]:
+        """
+        加载所有源的校验信息（不含解析结果）
+
+        Returns:
+            {feed_id: FeedValidator} 字典
+        """
+        cursor = self._conn.execute(
+            "SELECT feed_id, url, etag, last_modified, content_hash FROM feed_validators"
+        )
+        return {
+            row[0]: FeedValidator(
+                feed_id=row[0],
+                url=row[1],
+                etag=row[2] or "",
+                last_modified=row[3] or "",
+                content_hash=row[4] or "",
+            )
+            for row in cursor.fetchall()
+        }
+
+    def load_items(self, feed_id: str) -> Optional[List[ParsedRSSItem]]:
+        """
+        加载源的上次解析结果
+
+        Returns:
+            解析结果列表，不存在或损坏时返回 None
+        """
+        row = self._conn.execute(
+            "SELECT items_json FROM feed_validators WHERE feed_id = ?",
+            (feed_id,),
+        ).fetchone()
+        if not row:
+            return None
+        try:
+            return [ParsedRSSItem(**item) for item in json.loads(row[0])]
+        except (ValueError, TypeError):
+            return None
+
+    def save(
+        self,
+        validator: FeedValidator,
+        items: List[ParsedRSSItem],
+    ) -> None:
+        """保存源的校验信息和解析结果"""
+        self._conn.execute(
+            """
+            INSERT INTO feed_validators
+                (feed_id, url, etag, last_modified, content_hash, items_json, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+            ON CONFLICT(feed_id) DO UPDATE SET
+                url = excluded.url,
+                etag = excluded.etag,
+                last_modified = excluded.last_modified,
+                content_hash = excluded.content_hash,
+                items_json = excluded.items_json,
+                updated_at = CURRENT_TIMESTAMP
+            """,
+            (
+                validator.feed_id,
+                validator.url,
+                validator.etag,
+                validator.last_modified,
+                validator.content_hash,
+                json.dumps([asdict(item) for item in items], ensure_ascii=False),
+            ),
+        )
+
+    def commit(self) -> None:
+        """提交写入"""
+        self._conn.commit()
+
+    def close(self) -> None:
+        """关闭存储"""
+        try:
+            self._conn.commit()
+            self._conn.close()
+        except sqlite3.Error:
+            pass
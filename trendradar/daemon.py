@@ -0,0 +1,407 @@
+# coding=utf-8
+"""
+常驻运行模式
+
+替代「cron 每次拉起一个新进程」的运行方式：进程常驻，按 cron 表达式在进程内调度，
+跨轮次复用同一个 NewsAnalyzer（AppContext、存储连接、HTTP Session、频率词匹配器等）。
+
+- CronSchedule: 标准 5 字段 cron 表达式解析（与 supercronic/crontab 的常用语法兼容）
+- RunLock: 基于文件锁的运行锁，防止多个实例（常驻进程 / 手动执行）同时运行
+- Daemon: 调度循环，支持配置文件热重载和信号优雅退出
+"""
+
+import os
+import signal
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
+
+DEFAULT_SCHEDULE = "*/30 * * * *"
+
+# 单次等待的最长秒数（系统休眠/时钟调整后能及时重新计算）
+_MAX_SLEEP_SECONDS = 60
+
+_MONTH_NAMES = {
+    name: idx + 1
+    for idx, name in enumerate(
+        ["JAN", "FEB", "MAR", "APR", "MAY", "JUN", "JUL", "AUG", "SEP", "OCT", "NOV", "DEC"]
+    )
+}
+_WEEKDAY_NAMES = {
+    name: idx for idx, name in enumerate(["SUN", "MON", "TUE", "WED", "THU", "FRI", "SAT"])
+}
+
+_ALIASES = {
+    "@yearly": "0 0 1 1 *",
+    "@annually": "0 0 1 1 *",
+    "@monthly": "0 0 1 * *",
+    "@weekly": "0 0 * * 0",
+    "@daily": "0 0 * * *",
+    "@midnight": "0 0 * * *",
+    "@hourly": "0 * * * *",
+}
+
+
+def _parse_field(
+    spec: str, low: int, high: int, names: Optional[Dict[str, int]] = None
+) -> Set[int]:
+    """解析单个 cron 字段（支持 * / , - 以及月份/星期英文缩写）"""
+
+    def to_int(token: str) -> int:
+        token = token.strip().upper()
+        if names and token in names:
+            return names[token]
+        if not token.isdigit():
+            raise ValueError(f"无法识别的取值: {token}")
+        return int(token)
+
+    values: Set[int] = set()
+    for part in spec.split(","):
+        if not part:
+            raise ValueError(f"字段格式错误: {spec}")
+
+        step = 1
+        if "/" in part:
+            part, step_str = part.split("/", 1)
+            if not step_str.isdigit() or int(step_str) == 0:
+                raise ValueError(f"步长错误: {step_str}")
+            step = int(step_str)
+
+        if part == "*":
+            start, end = low, high
+        elif "-" in part:
+            start_str, end_str = part.split("-", 1)
+            start, end = to_int(start_str), to_int(end_str)
+        else:
+            start = to_int(part)
+            # "5/10" 表示从 5 开始每 10 个单位
+            end = high if step > 1 else start
+
+        if start < low or end > high or start > end:
+            raise ValueError(f"取值超出范围 [{low}-{high}]: {spec}")
+        values.update(range(start, end + 1, step))
+    return values
+
+
+class CronSchedule:
+    """
+    5 字段 cron 表达式：分 时 日 月 周
+
+    使用本地系统时间（与 crontab/supercronic 一致，容器内由 TZ 环境变量决定）。
+    日和周同时受限时按 crontab 语义取并集。
+    """
+
+    def __init__(self, expression: str):
+        """
+        解析 cron 表达式
+
+        Args:
+            expression: cron 表达式，如 "*/30 * * * *"，也支持 @hourly/@daily 等别名
+
+        Raises:
+            ValueError: 表达式格式错误
+        """
+        self.expression = expression.strip()
+        normalized = _ALIASES.get(self.expression.lower(), self.expression)
+        fields = normalized.split()
+        if len(fields) != 5:
+            raise ValueError(f"cron 表达式需要 5 个字段: {expression}")
+
+        minute, hour, day, month, weekday = fields
+        self.minutes = _parse_field(minute, 0, 59)
+        self.hours = _parse_field(hour, 0, 23)
+        self.days = _parse_field(day, 1, 31)
+        self.months = _parse_field(month, 1, 12, _MONTH_NAMES)
+        # 周日可以写成 0 或 7
+        self.weekdays = {d % 7 for d in _parse_field(weekday, 0, 7, _WEEKDAY_NAMES)}
+
+        self._day_restricted = not day.startswith("*")
+        self._weekday_restricted = not weekday.startswith("*")
+
+    def _day_matches(self, moment: datetime) -> bool:
+        day_ok = moment.day in self.days
+        # Python: 周一=0；cron: 周日=0
+        weekday_ok = (moment.weekday() + 1) % 7 in self.weekdays
+        if self._day_restricted and self._weekday_restricted:
+            return day_ok or weekday_ok
+        return day_ok and weekday_ok
+
+    def next_after(self, moment: datetime) -> datetime:
+        """
+        计算严格晚于 moment 的下一个触发时间
+
+        Args:
+            moment: 参考时间
+
+        Returns:
+            下一个触发时间（秒和微秒为 0）
+
+        Raises:
+            ValueError: 表达式永远不会触发（如 2 月 31 日）
+        """
+        candidate = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit_year = candidate.year + 5
+
+        while candidate.year <= limit_year:
+            if candidate.month not in self.months:
+                if candidate.month == 12:
+                    candidate = candidate.replace(year=candidate.year + 1, month=1, day=1, hour=0, minute=0)
+                else:
+                    candidate = candidate.replace(month=candidate.month + 1, day=1, hour=0, minute=0)
+                continue
+            if not self._day_matches(candidate):
+                candidate = (candidate + timedelta(days=1)).replace(hour=0, minute=0)
+                continue
+            if candidate.hour not in self.hours:
+                candidate = (candidate + timedelta(hours=1)).replace(minute=0)
+                continue
+            if candidate.minute not in self.minutes:
+                candidate += timedelta(minutes=1)
+                continue
+            return candidate
+
+        raise ValueError(f"cron 表达式不会触发: {self.expression}")
+
+    def __repr__(self) -> str:
+        return f"CronSchedule({self.expression!r})"
+
+
+class RunLock:
+    """
+    运行锁（非阻塞文件锁）
+
+    常驻进程的每一轮和手动单次执行共用同一把锁，避免两次运行同时抓取、写同一个数据库。
+    进程退出时操作系统自动释放锁，不会残留死锁。不支持 fcntl 的平台上退化为不加锁。
+    """
+
+    def __init__(self, lock_path: str):
+        """
+        初始化运行锁
+
+        Args:
+            lock_path: 锁文件路径（目录不存在时自动创建）
+        """
+        self.lock_path = Path(lock_path)
+        self._file = None
+
+    def acquire(self) -> bool:
+        """
+        尝试获取锁
+
+        Returns:
+            是否成功获取（已被其他进程持有时返回 False）
+        """
+        if not HAS_FCNTL:
+            return True
+        if self._file is not None:
+            return True
+
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        lock_file = open(self.lock_path, "a+")
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+
+        lock_file.seek(0)
+        lock_file.truncate()
+        lock_file.write(str(os.getpid()))
+        lock_file.flush()
+        self._file = lock_file
+        return True
+
+    def release(self) -> None:
+        """释放锁"""
+        if self._file is None:
+            return
+        try:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+        finally:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> bool:
+        return self.acquire()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.release()
+
+
+def get_run_lock(config: Dict[str, Any]) -> RunLock:
+    """获取数据目录下的运行锁"""
+    data_dir = config.get("STORAGE", {}).get("LOCAL", {}).get("DATA_DIR", "output")
+    return RunLock(str(Path(data_dir) / ".trendradar.lock"))
+
+
+def _file_signature(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class Daemon:
+    """
+    常驻调度循环
+
+    每一轮结束后只做过期数据清理，不关闭存储连接和 HTTP Session；
+    轮次之间串行执行，运行超时错过的调度点直接跳过，不会重叠执行。
+    收到 SIGTERM/SIGINT 后等待当前轮次结束再退出，再次收到信号则立即中断。
+    """
+
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        analyzer_factory: Callable[[Dict[str, Any]], Any],
+        config_loader: Callable[[], Dict[str, Any]],
+        schedule: CronSchedule,
+        immediate: bool = False,
+        config_path: Optional[str] = None,
+    ):
+        """
+        初始化常驻调度
+
+        Args:
+            config: 已加载的配置
+            analyzer_factory: 根据配置创建 NewsAnalyzer 的函数
+            config_loader: 重新加载配置的函数（配置文件变化时调用）
+            schedule: 调度表达式
+            immediate: 启动后是否立即执行一轮
+            config_path: 配置文件路径（用于检测变化，None 时不热重载）
+        """
+        self.config = config
+        self.analyzer_factory = analyzer_factory
+        self.config_loader = config_loader
+        self.schedule = schedule
+        self.immediate = immediate
+        self.config_path = config_path
+
+        self.analyzer = analyzer_factory(config)
+        self.run_lock = get_run_lock(config)
+        self._config_signature = _file_signature(config_path) if config_path else None
+        self._stop = threading.Event()
+        self._cycles = 0
+
+    # === 信号处理 ===
+
+    def _handle_signal(self, signum, frame) -> None:
+        if self._stop.is_set():
+            # 第二次收到信号：立即中断当前轮次
+            raise KeyboardInterrupt
+        name = signal.Signals(signum).name
+        print(f"[常驻模式] 收到 {name}，当前轮次结束后退出（再次发送可立即中断）")
+        self._stop.set()
+
+    def _install_signal_handlers(self) -> None:
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(sig, self._handle_signal)
+
+    def stop(self) -> None:
+        """请求退出（当前轮次结束后生效）"""
+        self._stop.set()
+
+    # === 调度循环 ===
+
+    def _reload_config_if_changed(self) -> None:
+        """配置文件变化时重新加载并重建分析器"""
+        if not self.config_path:
+            return
+        signature = _file_signature(self.config_path)
+        if signature == self._config_signature:
+            return
+
+        print(f"[常驻模式] 检测到配置文件变化，重新加载: {self.config_path}")
+        try:
+            config = self.config_loader()
+            analyzer = self.analyzer_factory(config)
+        except Exception as e:
+            print(f"[常驻模式] 配置重新加载失败，继续使用原配置: {e}")
+            return
+
+        self.analyzer.close()
+        self.config = config
+        self.analyzer = analyzer
+        self.run_lock.release()
+        self.run_lock = get_run_lock(config)
+        self._config_signature = signature
+
+    def _run_cycle(self) -> None:
+        """执行一轮分析"""
+        self._reload_config_if_changed()
+
+        if not self.run_lock.acquire():
+            print(f"[常驻模式] 另一个 TrendRadar 实例正在运行（{self.run_lock.lock_path}），跳过本轮")
+            return
+
+        self._cycles += 1
+        started = time.monotonic()
+        print(f"[常驻模式] 第 {self._cycles} 轮开始: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        try:
+            self.analyzer.run(keep_alive=True)
+        except Exception as e:
+            # DEBUG 模式下 run() 会抛出异常，常驻进程不因单轮失败退出
+            print(f"[常驻模式] 第 {self._cycles} 轮执行出错: {e}")
+        finally:
+            self.run_lock.release()
+        print(f"[常驻模式] 第 {self._cycles} 轮结束，耗时 {time.monotonic() - started:.1f} 秒")
+
+    def _wait_until(self, moment: datetime) -> bool:
+        """
+        等待到指定时间
+
+        Returns:
+            True 表示到点，False 表示收到退出请求
+        """
+        while not self._stop.is_set():
+            remaining = (moment - datetime.now()).total_seconds()
+            if remaining <= 0:
+                return True
+            self._stop.wait(min(remaining, _MAX_SLEEP_SECONDS))
+        return False
+
+    def run(self) -> None:
+        """启动调度循环（阻塞直到收到退出信号）"""
+        self._install_signal_handlers()
+        print(f"[常驻模式] 已启动，调度: {self.schedule.expression}，PID: {os.getpid()}")
+
+        try:
+            if self.immediate:
+                print("[常驻模式] 立即执行一次")
+                self._run_cycle()
+
+            next_run = self.schedule.next_after(datetime.now())
+            while not self._stop.is_set():
+                print(f"[常驻模式] 下次执行: {next_run.strftime('%Y-%m-%d %H:%M')}")
+                if not self._wait_until(next_run):
+                    break
+
+                self._run_cycle()
+
+                # 本轮耗时超过调度间隔时，跳过已错过的调度点，避免连续补跑
+                following = self.schedule.next_after(next_run)
+                now = datetime.now()
+                if following <= now:
+                    skipped = 0
+                    while following <= now:
+                        skipped += 1
+                        following = self.schedule.next_after(following)
+                    print(f"[常驻模式] 本轮运行超出调度间隔，跳过 {skipped} 个调度点")
+                next_run = following
+        except KeyboardInterrupt:
+            print("[常驻模式] 运行被中断")
+        finally:
+            print("[常驻模式] 正在释放资源...")
+            self.analyzer.close()
+            self.run_lock.release()
+            print(f"[常驻模式] 已退出，共执行 {self._cycles} 轮")
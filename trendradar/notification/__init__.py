@@ -13,6 +13,8 @@
 - batch: 批次处理工具
 - renderer: 通知内容渲染
 - splitter: 消息分批拆分
+- render_cache: 单次分发内的渲染缓存
+- transport: 推送传输层（HTTP 连接池、限流重试、SMTP 连接复用）
 - senders: 消息发送器（各渠道发送函数）
 - dispatcher: 多账号通知调度器
 """
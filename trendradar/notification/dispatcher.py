@@ -5,6 +5,9 @@
 提供统一的通知分发接口。
 支持所有通知渠道的多账号配置，使用 `;` 分隔多个账号。
 
+各渠道并行推送，同一渠道的多个账号在渠道并发上限内并行推送，
+单个账号的多个批次仍按顺序发送；整体推送受截止时间约束。
+
 使用示例:
     dispatcher = NotificationDispatcher(config, get_time_func, split_content_func)
     results = dispatcher.dispatch_all(report_data, report_type, ...)
@@ -12,7 +15,11 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+import contextvars
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
 from trendradar.core.config import (
     get_account_at_index,
@@ -32,6 +39,8 @@ from .senders import (
     send_to_wework,
     send_to_generic_webhook,
 )
+from .render_cache import RenderCache
+from . import transport
 from .renderer import (
     render_rss_feishu_content,
     render_rss_dingtalk_content,
@@ -72,6 +81,148 @@ class NotificationDispatcher:
         self.split_content_func = split_content_func
         self.max_accounts = config.get("MAX_ACCOUNTS_PER_CHANNEL", 3)
         self.translator = translator
+        self.channel_workers = max(1, int(config.get("PUSH_CHANNEL_WORKERS", 9) or 1))
+        self.account_concurrency = max(1, int(config.get("PUSH_ACCOUNT_CONCURRENCY", 3) or 1))
+        self.push_deadline = float(config.get("PUSH_DEADLINE", 0) or 0)
+        self._deadline_at: Optional[float] = None
+        self._render_cache: Optional[RenderCache] = None
+
+    @property
+    def _split_content_func(self) -> Callable:
+        """当前分发使用的分批函数（分发期间带渲染缓存）"""
+        return self._render_cache or self.split_content_func
+
+    # === 并发调度 ===
+
+    def _remaining_time(self) -> Optional[float]:
+        """距离推送截止时间的剩余秒数（None 表示不限制）"""
+        if self._deadline_at is None:
+            return None
+        return max(0.0, self._deadline_at - time.monotonic())
+
+    def _run_parallel(
+        self,
+        tasks: List[Tuple[str, Callable[[], bool]]],
+        max_workers: int,
+        thread_name_prefix: str,
+        log_prefix: str,
+    ) -> Dict[str, bool]:
+        """
+        在截止时间内并行执行发送任务
+
+        截止时间到达时尚未开始的任务被取消，尚未完成的任务记为失败，不再等待。
+        截止时间经 contextvars 传入工作线程，传输层据此收紧每次请求的超时、
+        截止后不再发起新请求，仍在运行的任务会在剩余请求超时后很快结束。
+
+        Args:
+            tasks: [(任务名, 发送函数)] 列表，发送函数返回是否成功
+            max_workers: 最大并发数
+            thread_name_prefix: 线程名前缀
+            log_prefix: 日志前缀
+
+        Returns:
+            Dict[str, bool]: 任务名 -> 是否成功（顺序与 tasks 一致）
+        """
+        if not tasks:
+            return {}
+
+        remaining = self._remaining_time()
+        if remaining is not None and remaining <= 0:
+            print(f"{log_prefix} 已超过推送截止时间，跳过: {', '.join(name for name, _ in tasks)}")
+            return {name: False for name, _ in tasks}
+
+        if len(tasks) == 1 or max_workers <= 1:
+            results = {}
+            for name, func in tasks:
+                remaining = self._remaining_time()
+                if remaining is not None and remaining <= 0:
+                    print(f"{log_prefix} 已超过推送截止时间，跳过: {name}")
+                    results[name] = False
+                    continue
+                results[name] = self._call_safely(name, func, log_prefix)
+            return results
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(max_workers, len(tasks)),
+            thread_name_prefix=thread_name_prefix,
+        )
+        # 每个任务在当前上下文的副本中运行，继承推送截止时间
+        futures = {
+            name: executor.submit(
+                contextvars.copy_context().run, self._call_safely, name, func, log_prefix
+            )
+            for name, func in tasks
+        }
+        try:
+            wait(futures.values(), timeout=self._remaining_time())
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        results = {}
+        timed_out = []
+        for name, future in futures.items():
+            if future.done() and not future.cancelled():
+                results[name] = future.result()
+            else:
+                results[name] = False
+                timed_out.append(name)
+        if timed_out:
+            print(f"{log_prefix} 推送超过截止时间（{self.push_deadline:g}s），未完成: {', '.join(timed_out)}")
+        return results
+
+    @staticmethod
+    def _call_safely(name: str, func: Callable[[], bool], log_prefix: str) -> bool:
+        """执行发送函数，异常视为发送失败（避免一个渠道的异常影响其他渠道）"""
+        try:
+            return bool(func())
+        except Exception as e:
+            print(f"{log_prefix} {name} 推送异常: {e}")
+            return False
+
+    def _dispatch_channels(self, tasks: List[Tuple[str, Callable[[], bool]]]) -> Dict[str, bool]:
+        """并行推送到各渠道，整体受推送截止时间约束"""
+        self._deadline_at = time.monotonic() + self.push_deadline if self.push_deadline > 0 else None
+        deadline_token = transport.set_deadline(self._deadline_at)
+        started = time.perf_counter()
+        try:
+            results = self._run_parallel(tasks, self.channel_workers, "push", "[推送]")
+        finally:
+            transport.reset_deadline(deadline_token)
+            self._deadline_at = None
+        if len(tasks) > 1:
+            print(f"[推送] {len(tasks)} 个渠道推送完成，耗时 {time.perf_counter() - started:.1f}s")
+        return results
+
+    def _run_account_tasks(
+        self,
+        channel_name: str,
+        tasks: List[Tuple[str, Callable[[], bool]]],
+    ) -> bool:
+        """
+        在渠道并发上限内并行推送同一渠道的多个账号
+
+        Args:
+            channel_name: 渠道名称（用于日志）
+            tasks: [(账号标签, 发送函数)] 列表
+
+        Returns:
+            bool: 任一账号发送成功则返回 True
+        """
+        results = self._run_parallel(
+            [(label or channel_name, func) for label, func in tasks],
+            self.account_concurrency,
+            f"push-{channel_name}",
+            f"[推送][{channel_name}]",
+        )
+        return any(results.values()) if results else False
+
+    @staticmethod
+    def _copy_title_group(group: Dict) -> Dict:
+        """复制一个标题分组及其标题条目（条目内的其他字段共享引用）"""
+        group = dict(group)
+        if group.get("titles"):
+            group["titles"] = [dict(title_data) for title_data in group["titles"]]
+        return group
 
     def _translate_content(
         self,
@@ -93,13 +244,15 @@ class NotificationDispatcher:
         if not self.translator or not self.translator.enabled:
             return report_data, rss_items, rss_new_items
 
-        import copy
         print(f"[翻译] 开始翻译内容到 {self.translator.target_language}...")
 
-        # 深拷贝避免修改原始数据
-        report_data = copy.deepcopy(report_data)
-        rss_items = copy.deepcopy(rss_items) if rss_items else None
-        rss_new_items = copy.deepcopy(rss_new_items) if rss_new_items else None
+        # 只复制会被回填标题的层级，避免修改原始数据（无需深拷贝整个报告）
+        report_data = dict(report_data)
+        for key in ("stats", "new_titles"):
+            if report_data.get(key):
+                report_data[key] = [self._copy_title_group(group) for group in report_data[key]]
+        rss_items = [dict(item) for item in rss_items] if rss_items else None
+        rss_new_items = [dict(item) for item in rss_new_items] if rss_new_items else None
 
         # 收集所有需要翻译的标题
         titles_to_translate = []
@@ -190,8 +343,6 @@ class NotificationDispatcher:
         Returns:
             Dict[str, bool]: 每个渠道的发送结果，key 为渠道名，value 为是否成功
         """
-        results = {}
-
         # 获取区域显示配置
         display_regions = self.config.get("DISPLAY", {}).get("REGIONS", {})
 
@@ -200,61 +351,43 @@ class NotificationDispatcher:
             report_data, rss_items, rss_new_items
         )
 
+        channel_args = (
+            report_data, report_type, update_info, proxy_url, mode, rss_items, rss_new_items,
+            ai_analysis, display_regions, standalone_data,
+        )
+        tasks: List[Tuple[str, Callable[[], bool]]] = []
+
         # 飞书
         if self.config.get("FEISHU_WEBHOOK_URL"):
-            results["feishu"] = self._send_feishu(
-                report_data, report_type, update_info, proxy_url, mode, rss_items, rss_new_items,
-                ai_analysis, display_regions, standalone_data
-            )
+            tasks.append(("feishu", partial(self._send_feishu, *channel_args)))
 
         # 钉钉
         if self.config.get("DINGTALK_WEBHOOK_URL"):
-            results["dingtalk"] = self._send_dingtalk(
-                report_data, report_type, update_info, proxy_url, mode, rss_items, rss_new_items,
-                ai_analysis, display_regions, standalone_data
-            )
+            tasks.append(("dingtalk", partial(self._send_dingtalk, *channel_args)))
 
         # 企业微信
         if self.config.get("WEWORK_WEBHOOK_URL"):
-            results["wework"] = self._send_wework(
-                report_data, report_type, update_info, proxy_url, mode, rss_items, rss_new_items,
-                ai_analysis, display_regions, standalone_data
-            )
+            tasks.append(("wework", partial(self._send_wework, *channel_args)))
 
         # Telegram（需要配对验证）
         if self.config.get("TELEGRAM_BOT_TOKEN") and self.config.get("TELEGRAM_CHAT_ID"):
-            results["telegram"] = self._send_telegram(
-                report_data, report_type, update_info, proxy_url, mode, rss_items, rss_new_items,
-                ai_analysis, display_regions, standalone_data
-            )
+            tasks.append(("telegram", partial(self._send_telegram, *channel_args)))
 
         # ntfy（需要配对验证）
         if self.config.get("NTFY_SERVER_URL") and self.config.get("NTFY_TOPIC"):
-            results["ntfy"] = self._send_ntfy(
-                report_data, report_type, update_info, proxy_url, mode, rss_items, rss_new_items,
-                ai_analysis, display_regions, standalone_data
-            )
+            tasks.append(("ntfy", partial(self._send_ntfy, *channel_args)))
 
         # Bark
         if self.config.get("BARK_URL"):
-            results["bark"] = self._send_bark(
-                report_data, report_type, update_info, proxy_url, mode, rss_items, rss_new_items,
-                ai_analysis, display_regions, standalone_data
-            )
+            tasks.append(("bark", partial(self._send_bark, *channel_args)))
 
         # Slack
         if self.config.get("SLACK_WEBHOOK_URL"):
-            results["slack"] = self._send_slack(
-                report_data, report_type, update_info, proxy_url, mode, rss_items, rss_new_items,
-                ai_analysis, display_regions, standalone_data
-            )
+            tasks.append(("slack", partial(self._send_slack, *channel_args)))
 
         # 通用 Webhook
         if self.config.get("GENERIC_WEBHOOK_URL"):
-            results["generic_webhook"] = self._send_generic_webhook(
-                report_data, report_type, update_info, proxy_url, mode, rss_items, rss_new_items,
-                ai_analysis, display_regions, standalone_data
-            )
+            tasks.append(("generic_webhook", partial(self._send_generic_webhook, *channel_args)))
 
         # 邮件（保持原有逻辑，已支持多收件人，AI 分析已嵌入 HTML）
         if (
@@ -262,8 +395,16 @@ class NotificationDispatcher:
             and self.config.get("EMAIL_PASSWORD")
             and self.config.get("EMAIL_TO")
         ):
-            results["email"] = self._send_email(report_type, html_file_path)
+            tasks.append(("email", partial(self._send_email, report_type, html_file_path)))
 
+        # 同一次分发内，相同格式的渠道/账号复用分批结果
+        self._render_cache = RenderCache(self.split_content_func)
+        try:
+            results = self._dispatch_channels(tasks)
+        finally:
+            cache, self._render_cache = self._render_cache, None
+        if cache.hits:
+            print(f"[推送] 渲染缓存：生成 {cache.misses} 份，复用 {cache.hits} 次")
         return results
 
     def _send_to_multi_accounts(
@@ -290,15 +431,17 @@ class NotificationDispatcher:
             return False
 
         accounts = limit_accounts(accounts, self.max_accounts, channel_name)
-        results = []
+        tasks = []
 
         for i, account in enumerate(accounts):
             if account:
                 account_label = f"账号{i+1}" if len(accounts) > 1 else ""
-                result = send_func(account, account_label=account_label, **kwargs)
-                results.append(result)
+                tasks.append((
+                    account_label,
+                    partial(send_func, account, account_label=account_label, **kwargs),
+                ))
 
-        return any(results) if results else False
+        return self._run_account_tasks(channel_name, tasks)
 
     def _send_feishu(
         self,
@@ -332,7 +475,8 @@ class NotificationDispatcher:
                 account_label=account_label,
                 batch_size=self.config.get("FEISHU_BATCH_SIZE", 29000),
                 batch_interval=self.config.get("BATCH_SEND_INTERVAL", 1.0),
-                split_content_func=self.split_content_func,
+                split_content_func=self._split_content_func,
+                render_cache=self._render_cache,
                 get_time_func=self.get_time_func,
                 rss_items=rss_items if display_regions.get("RSS", True) else None,
                 rss_new_items=rss_new_items if display_regions.get("RSS", True) else None,
@@ -373,7 +517,8 @@ class NotificationDispatcher:
                 account_label=account_label,
                 batch_size=self.config.get("DINGTALK_BATCH_SIZE", 20000),
                 batch_interval=self.config.get("BATCH_SEND_INTERVAL", 1.0),
-                split_content_func=self.split_content_func,
+                split_content_func=self._split_content_func,
+                render_cache=self._render_cache,
                 rss_items=rss_items if display_regions.get("RSS", True) else None,
                 rss_new_items=rss_new_items if display_regions.get("RSS", True) else None,
                 ai_analysis=ai_analysis if display_regions.get("AI_ANALYSIS", True) else None,
@@ -414,7 +559,8 @@ class NotificationDispatcher:
                 batch_size=self.config.get("MESSAGE_BATCH_SIZE", 4000),
                 batch_interval=self.config.get("BATCH_SEND_INTERVAL", 1.0),
                 msg_type=self.config.get("WEWORK_MSG_TYPE", "markdown"),
-                split_content_func=self.split_content_func,
+                split_content_func=self._split_content_func,
+                render_cache=self._render_cache,
                 rss_items=rss_items if display_regions.get("RSS", True) else None,
                 rss_new_items=rss_new_items if display_regions.get("RSS", True) else None,
                 ai_analysis=ai_analysis if display_regions.get("AI_ANALYSIS", True) else None,
@@ -460,13 +606,14 @@ class NotificationDispatcher:
         telegram_tokens = limit_accounts(telegram_tokens, self.max_accounts, "Telegram")
         telegram_chat_ids = telegram_chat_ids[: len(telegram_tokens)]
 
-        results = []
+        tasks = []
         for i in range(len(telegram_tokens)):
             token = telegram_tokens[i]
             chat_id = telegram_chat_ids[i]
             if token and chat_id:
                 account_label = f"账号{i+1}" if len(telegram_tokens) > 1 else ""
-                result = send_to_telegram(
+                tasks.append((account_label, partial(
+                    send_to_telegram,
                     bot_token=token,
                     chat_id=chat_id,
                     report_data=report_data,
@@ -477,16 +624,16 @@ class NotificationDispatcher:
                     account_label=account_label,
                     batch_size=self.config.get("MESSAGE_BATCH_SIZE", 4000),
                     batch_interval=self.config.get("BATCH_SEND_INTERVAL", 1.0),
-                    split_content_func=self.split_content_func,
+                    split_content_func=self._split_content_func,
+                    render_cache=self._render_cache,
                     rss_items=rss_items if display_regions.get("RSS", True) else None,
                     rss_new_items=rss_new_items if display_regions.get("RSS", True) else None,
                     ai_analysis=ai_analysis if display_regions.get("AI_ANALYSIS", True) else None,
                     display_regions=display_regions,
                     standalone_data=standalone_data if display_regions.get("STANDALONE", False) else None,
-                )
-                results.append(result)
+                )))
 
-        return any(results) if results else False
+        return self._run_account_tasks("Telegram", tasks)
 
     def _send_ntfy(
         self,
@@ -525,12 +672,13 @@ class NotificationDispatcher:
         if ntfy_tokens:
             ntfy_tokens = ntfy_tokens[: len(ntfy_topics)]
 
-        results = []
+        tasks = []
         for i, topic in enumerate(ntfy_topics):
             if topic:
                 token = get_account_at_index(ntfy_tokens, i, "") if ntfy_tokens else ""
                 account_label = f"账号{i+1}" if len(ntfy_topics) > 1 else ""
-                result = send_to_ntfy(
+                tasks.append((account_label, partial(
+                    send_to_ntfy,
                     server_url=ntfy_server_url,
                     topic=topic,
                     token=token,
@@ -541,16 +689,16 @@ class NotificationDispatcher:
                     mode=mode,
                     account_label=account_label,
                     batch_size=3800,
-                    split_content_func=self.split_content_func,
+                    split_content_func=self._split_content_func,
+                    render_cache=self._render_cache,
                     rss_items=rss_items if display_regions.get("RSS", True) else None,
                     rss_new_items=rss_new_items if display_regions.get("RSS", True) else None,
                     ai_analysis=ai_analysis if display_regions.get("AI_ANALYSIS", True) else None,
                     display_regions=display_regions,
                     standalone_data=standalone_data if display_regions.get("STANDALONE", False) else None,
-                )
-                results.append(result)
+                )))
 
-        return any(results) if results else False
+        return self._run_account_tasks("ntfy", tasks)
 
     def _send_bark(
         self,
@@ -583,7 +731,8 @@ class NotificationDispatcher:
                 account_label=account_label,
                 batch_size=self.config.get("BARK_BATCH_SIZE", 3600),
                 batch_interval=self.config.get("BATCH_SEND_INTERVAL", 1.0),
-                split_content_func=self.split_content_func,
+                split_content_func=self._split_content_func,
+                render_cache=self._render_cache,
                 rss_items=rss_items if display_regions.get("RSS", True) else None,
                 rss_new_items=rss_new_items if display_regions.get("RSS", True) else None,
                 ai_analysis=ai_analysis if display_regions.get("AI_ANALYSIS", True) else None,
@@ -623,7 +772,8 @@ class NotificationDispatcher:
                 account_label=account_label,
                 batch_size=self.config.get("SLACK_BATCH_SIZE", 4000),
                 batch_interval=self.config.get("BATCH_SEND_INTERVAL", 1.0),
-                split_content_func=self.split_content_func,
+                split_content_func=self._split_content_func,
+                render_cache=self._render_cache,
                 rss_items=rss_items if display_regions.get("RSS", True) else None,
                 rss_new_items=rss_new_items if display_regions.get("RSS", True) else None,
                 ai_analysis=ai_analysis if display_regions.get("AI_ANALYSIS", True) else None,
@@ -657,7 +807,7 @@ class NotificationDispatcher:
             return False
 
         urls = limit_accounts(urls, self.max_accounts, "通用Webhook")
-        results = []
+        tasks = []
 
         for i, url in enumerate(urls):
             if not url:
@@ -672,7 +822,8 @@ class NotificationDispatcher:
 
             account_label = f"账号{i+1}" if len(urls) > 1 else ""
 
-            result = send_to_generic_webhook(
+            tasks.append((account_label, partial(
+                send_to_generic_webhook,
                 webhook_url=url,
                 payload_template=template,
                 report_data=report_data,
@@ -683,16 +834,16 @@ class NotificationDispatcher:
                 account_label=account_label,
                 batch_size=self.config.get("MESSAGE_BATCH_SIZE", 4000),
                 batch_interval=self.config.get("BATCH_SEND_INTERVAL", 1.0),
-                split_content_func=self.split_content_func,
+                split_content_func=self._split_content_func,
+                render_cache=self._render_cache,
                 rss_items=rss_items if display_regions.get("RSS", True) else None,
                 rss_new_items=rss_new_items if display_regions.get("RSS", True) else None,
                 ai_analysis=ai_analysis if display_regions.get("AI_ANALYSIS", True) else None,
                 display_regions=display_regions,
                 standalone_data=standalone_data if display_regions.get("STANDALONE", False) else None,
-            )
-            results.append(result)
+            )))
 
-        return any(results) if results else False
+        return self._run_account_tasks("通用Webhook", tasks)
 
     def _send_email(
         self,
@@ -747,50 +898,46 @@ class NotificationDispatcher:
             print("[RSS通知] 没有 RSS 内容，跳过通知")
             return {}
 
-        results = {}
         report_type = "RSS 订阅更新"
+        tasks: List[Tuple[str, Callable[[], bool]]] = []
 
         # 飞书
         if self.config.get("FEISHU_WEBHOOK_URL"):
-            results["feishu"] = self._send_rss_feishu(
-                rss_items, feeds_info, proxy_url
-            )
+            tasks.append(("feishu", partial(self._send_rss_feishu, rss_items, feeds_info, proxy_url)))
 
         # 钉钉
         if self.config.get("DINGTALK_WEBHOOK_URL"):
-            results["dingtalk"] = self._send_rss_dingtalk(
-                rss_items, feeds_info, proxy_url
-            )
+            tasks.append(("dingtalk", partial(self._send_rss_dingtalk, rss_items, feeds_info, proxy_url)))
 
         # 企业微信
         if self.config.get("WEWORK_WEBHOOK_URL"):
-            results["wework"] = self._send_rss_markdown(
-                rss_items, feeds_info, proxy_url, "wework"
-            )
+            tasks.append(("wework", partial(
+                self._send_rss_markdown, rss_items, feeds_info, proxy_url, "wework"
+            )))
 
         # Telegram
         if self.config.get("TELEGRAM_BOT_TOKEN") and self.config.get("TELEGRAM_CHAT_ID"):
-            results["telegram"] = self._send_rss_markdown(
-                rss_items, feeds_info, proxy_url, "telegram"
-            )
+            tasks.append(("telegram", partial(
+                self._send_rss_markdown, rss_items, feeds_info, proxy_url, "telegram"
+            )))
 
         # ntfy
         if self.config.get("NTFY_SERVER_URL") and self.config.get("NTFY_TOPIC"):
-            results["ntfy"] = self._send_rss_markdown(
-                rss_items, feeds_info, proxy_url, "ntfy"
-            )
+            tasks.append(("ntfy", partial(
+                self._send_rss_markdown, rss_items, feeds_info, proxy_url, "ntfy"
+            )))
 
         # Bark
         if self.config.get("BARK_URL"):
-            results["bark"] = self._send_rss_markdown(
-                rss_items, feeds_info, proxy_url, "bark"
-            )
+            tasks.append(("bark", partial(
+                self._send_rss_markdown, rss_items, feeds_info, proxy_url, "bark"
+            )))
 
         # Slack
         if self.config.get("SLACK_WEBHOOK_URL"):
-            results["slack"] = self._send_rss_markdown(
-                rss_items, feeds_info, proxy_url, "slack"
-            )
+            tasks.append(("slack", partial(
+                self._send_rss_markdown, rss_items, feeds_info, proxy_url, "slack"
+            )))
 
         # 邮件
         if (
@@ -798,9 +945,9 @@ class NotificationDispatcher:
             and self.config.get("EMAIL_PASSWORD")
             and self.config.get("EMAIL_TO")
         ):
-            results["email"] = self._send_email(report_type, html_file_path)
+            tasks.append(("email", partial(self._send_email, report_type, html_file_path)))
 
-        return results
+        return self._dispatch_channels(tasks)
 
     def _send_rss_feishu(
         self,
@@ -809,8 +956,6 @@ class NotificationDispatcher:
         proxy_url: Optional[str],
     ) -> bool:
         """发送 RSS 到飞书"""
-        import requests
-
         content = render_rss_feishu_content(
             rss_items=rss_items,
             feeds_info=feeds_info,
@@ -850,7 +995,7 @@ class NotificationDispatcher:
                     }
 
                     proxies = {"http": proxy_url, "https": proxy_url} if proxy_url else None
-                    resp = requests.post(webhook_url, json=payload, proxies=proxies, timeout=30)
+                    resp = transport.post(webhook_url, json=payload, proxies=proxies, timeout=30)
                     resp.raise_for_status()
 
                 print(f"✅ 飞书{account_label} RSS 通知发送成功")
@@ -868,8 +1013,6 @@ class NotificationDispatcher:
         proxy_url: Optional[str],
     ) -> bool:
         """发送 RSS 到钉钉"""
-        import requests
-
         content = render_rss_dingtalk_content(
             rss_items=rss_items,
             feeds_info=feeds_info,
@@ -901,7 +1044,7 @@ class NotificationDispatcher:
                     }
 
                     proxies = {"http": proxy_url, "https": proxy_url} if proxy_url else None
-                    resp = requests.post(webhook_url, json=payload, proxies=proxies, timeout=30)
+                    resp = transport.post(webhook_url, json=payload, proxies=proxies, timeout=30)
                     resp.raise_for_status()
 
                 print(f"✅ 钉钉{account_label} RSS 通知发送成功")
@@ -920,8 +1063,6 @@ class NotificationDispatcher:
         channel: str,
     ) -> bool:
         """发送 RSS 到 Markdown 兼容渠道（企业微信、Telegram、ntfy、Bark、Slack）"""
-        import requests
-
         content = render_rss_markdown_content(
             rss_items=rss_items,
             feeds_info=feeds_info,
@@ -947,8 +1088,6 @@ class NotificationDispatcher:
 
     def _send_rss_wework(self, content: str, proxy_url: Optional[str]) -> bool:
         """发送 RSS 到企业微信"""
-        import requests
-
         webhooks = parse_multi_account_config(self.config["WEWORK_WEBHOOK_URL"])
         webhooks = limit_accounts(webhooks, self.max_accounts, "企业微信")
 
@@ -970,7 +1109,7 @@ class NotificationDispatcher:
                     }
 
                     proxies = {"http": proxy_url, "https": proxy_url} if proxy_url else None
-                    resp = requests.post(webhook_url, json=payload, proxies=proxies, timeout=30)
+                    resp = transport.post(webhook_url, json=payload, proxies=proxies, timeout=30)
                     resp.raise_for_status()
 
                 print(f"✅ 企业微信{account_label} RSS 通知发送成功")
@@ -983,8 +1122,6 @@ class NotificationDispatcher:
 
     def _send_rss_telegram(self, content: str, proxy_url: Optional[str]) -> bool:
         """发送 RSS 到 Telegram"""
-        import requests
-
         tokens = parse_multi_account_config(self.config["TELEGRAM_BOT_TOKEN"])
         chat_ids = parse_multi_account_config(self.config["TELEGRAM_CHAT_ID"])
 
@@ -1014,7 +1151,7 @@ class NotificationDispatcher:
                     }
 
                     proxies = {"http": proxy_url, "https": proxy_url} if proxy_url else None
-                    resp = requests.post(url, json=payload, proxies=proxies, timeout=30)
+                    resp = transport.post(url, json=payload, proxies=proxies, timeout=30)
                     resp.raise_for_status()
 
                 print(f"✅ Telegram{account_label} RSS 通知发送成功")
@@ -1027,8 +1164,6 @@ class NotificationDispatcher:
 
     def _send_rss_ntfy(self, content: str, proxy_url: Optional[str]) -> bool:
         """发送 RSS 到 ntfy"""
-        import requests
-
         server_url = self.config["NTFY_SERVER_URL"]
         topics = parse_multi_account_config(self.config["NTFY_TOPIC"])
         tokens = parse_multi_account_config(self.config.get("NTFY_TOKEN", ""))
@@ -1056,7 +1191,7 @@ class NotificationDispatcher:
                         headers["Authorization"] = f"Bearer {token}"
 
                     proxies = {"http": proxy_url, "https": proxy_url} if proxy_url else None
-                    resp = requests.post(
+                    resp = transport.post(
                         url, data=batch_content.encode("utf-8"),
                         headers=headers, proxies=proxies, timeout=30
                     )
@@ -1072,7 +1207,6 @@ class NotificationDispatcher:
 
     def _send_rss_bark(self, content: str, proxy_url: Optional[str]) -> bool:
         """发送 RSS 到 Bark"""
-        import requests
         import urllib.parse
 
         urls = parse_multi_account_config(self.config["BARK_URL"])
@@ -1095,7 +1229,7 @@ class NotificationDispatcher:
                     url = f"{bark_url.rstrip('/')}/{title}/{body}"
 
                     proxies = {"http": proxy_url, "https": proxy_url} if proxy_url else None
-                    resp = requests.get(url, proxies=proxies, timeout=30)
+                    resp = transport.get(url, proxies=proxies, timeout=30)
                     resp.raise_for_status()
 
                 print(f"✅ Bark{account_label} RSS 通知发送成功")
@@ -1108,8 +1242,6 @@ class NotificationDispatcher:
 
     def _send_rss_slack(self, content: str, proxy_url: Optional[str]) -> bool:
         """发送 RSS 到 Slack"""
-        import requests
-
         webhooks = parse_multi_account_config(self.config["SLACK_WEBHOOK_URL"])
         webhooks = limit_accounts(webhooks, self.max_accounts, "Slack")
 
@@ -1138,7 +1270,7 @@ class NotificationDispatcher:
                     }
 
                     proxies = {"http": proxy_url, "https": proxy_url} if proxy_url else None
-                    resp = requests.post(webhook_url, json=payload, proxies=proxies, timeout=30)
+                    resp = transport.post(webhook_url, json=payload, proxies=proxies, timeout=30)
                     resp.raise_for_status()
 
                 print(f"✅ Slack{account_label} RSS 通知发送成功")
@@ -0,0 +1,111 @@
+# coding=utf-8
+"""
+推送渲染缓存
+
+一次推送分发内，各渠道、各账号对同一份报告数据的分批结果完全相同，
+只取决于格式类型、批次大小和各区块内容。RenderCache 包装内容分批函数，
+以 (format_type, max_bytes, 各区块内容哈希) 为键缓存分批结果：
+
+- 同一格式的多个账号/渠道（如企业微信与通用 Webhook）复用同一份批次
+- AI 分析按渠道格式只渲染一次
+- 并发推送时同一键只计算一次，其他线程等待结果
+
+缓存只在单次分发内有效，由 NotificationDispatcher 创建和丢弃。
+"""
+
+import hashlib
+import pickle
+import threading
+from typing import Any, Callable, Dict, List, Tuple
+
+
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+class RenderCache:
+    """单次分发内的渲染缓存（线程安全）"""
+
+    def __init__(self, split_content_func: Callable[..., List[str]]):
+        """
+        Args:
+            split_content_func: 原始内容分批函数
+        """
+        self.split_content_func = split_content_func
+        self._lock = threading.Lock()
+        self._key_locks: Dict[Tuple, threading.Lock] = {}
+        self._results: Dict[Tuple, Any] = {}
+        # id -> (对象, 内容哈希)；持有对象引用，保证缓存期内 id 不被复用
+        self._fingerprints: Dict[int, Tuple[Any, str]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _fingerprint(self, value: Any) -> Any:
+        """区块内容哈希（同一对象只计算一次）"""
+        if isinstance(value, _SCALAR_TYPES):
+            return value
+        with self._lock:
+            cached = self._fingerprints.get(id(value))
+            if cached is not None and cached[0] is value:
+                return cached[1]
+        try:
+            digest = hashlib.blake2b(
+                pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), digest_size=16
+            ).hexdigest()
+        except Exception:
+            # 无法序列化的对象按身份区分
+            digest = f"id:{id(value)}"
+        with self._lock:
+            self._fingerprints[id(value)] = (value, digest)
+        return digest
+
+    def _get_or_compute(self, key: Tuple, compute: Callable[[], Any]) -> Any:
+        with self._lock:
+            if key in self._results:
+                self.hits += 1
+                return self._results[key]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                if key in self._results:
+                    self.hits += 1
+                    return self._results[key]
+            result = compute()
+            with self._lock:
+                self._results[key] = result
+                self.misses += 1
+            return result
+
+    def split(self, report_data: Any, format_type: str, *args, **kwargs) -> List[str]:
+        """
+        带缓存的内容分批，参数与原始分批函数一致
+
+        Returns:
+            分批后的消息内容列表（副本，调用方可自由修改）
+        """
+        key = (
+            "split",
+            format_type,
+            kwargs.get("max_bytes"),
+            self._fingerprint(report_data),
+            tuple(self._fingerprint(arg) for arg in args),
+            tuple(sorted((name, self._fingerprint(value)) for name, value in kwargs.items())),
+        )
+        batches = self._get_or_compute(
+            key, lambda: self.split_content_func(report_data, format_type, *args, **kwargs)
+        )
+        return list(batches)
+
+    __call__ = split
+
+    def render_ai_analysis(self, ai_analysis: Any, channel: str, render: Callable[[Any, str], str]) -> str:
+        """
+        带缓存的 AI 分析渲染（同一结果按渠道格式只渲染一次）
+
+        Args:
+            ai_analysis: AI 分析结果
+            channel: 渠道格式
+            render: 实际渲染函数 (ai_analysis, channel) -> str
+        """
+        key = ("ai", channel, self._fingerprint(ai_analysis))
+        return self._get_or_compute(key, lambda: render(ai_analysis, channel))
@@ -29,15 +29,24 @@ from urllib.parse import urlparse
 
 import requests
 
+from trendradar.report.html_assets import inline_assets
+
 from .batch import add_batch_headers, get_max_batch_header_size
 from .formatters import convert_markdown_to_mrkdwn, strip_markdown
+from .render_cache import RenderCache
+from . import transport
 
 
-def _render_ai_analysis(ai_analysis: Any, channel: str) -> str:
-    """渲染 AI 分析内容为指定渠道格式"""
+def _render_ai_analysis(
+    ai_analysis: Any, channel: str, render_cache: Optional[RenderCache] = None
+) -> str:
+    """渲染 AI 分析内容为指定渠道格式（传入 RenderCache 时同一格式只渲染一次）"""
     if not ai_analysis:
         return ""
 
+    if render_cache is not None:
+        return render_cache.render_ai_analysis(ai_analysis, channel, _render_ai_analysis)
+
     try:
         from trendradar.ai.formatter import get_ai_analysis_renderer
         renderer = get_ai_analysis_renderer(channel)
@@ -86,6 +95,7 @@ def send_to_feishu(
     batch_size: int = 29000,
     batch_interval: float = 1.0,
     split_content_func: Callable = None,
+    render_cache: Optional[RenderCache] = None,
     get_time_func: Callable = None,
     rss_items: Optional[list] = None,
     rss_new_items: Optional[list] = None,
@@ -107,6 +117,7 @@ def send_to_feishu(
         batch_size: 批次大小（字节）
         batch_interval: 批次发送间隔（秒）
         split_content_func: 内容分批函数
+        render_cache: 单次分发内的渲染缓存（可选，AI 分析按渠道格式只渲染一次）
         get_time_func: 获取当前时间的函数
         rss_items: RSS 统计条目列表（可选，用于合并推送）
         rss_new_items: RSS 新增条目列表（可选，用于新增区块）
@@ -126,7 +137,7 @@ def send_to_feishu(
     ai_content = None
     ai_stats = None
     if ai_analysis:
-        ai_content = _render_ai_analysis(ai_analysis, "feishu")
+        ai_content = _render_ai_analysis(ai_analysis, "feishu", render_cache)
         # 提取 AI 分析统计数据（只要 AI 分析成功就显示）
         if getattr(ai_analysis, "success", False):
             ai_stats = {
@@ -175,7 +186,7 @@ def send_to_feishu(
         }
 
         try:
-            response = requests.post(
+            response = transport.post(
                 webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
             )
             if response.status_code == 200:
@@ -218,6 +229,7 @@ def send_to_dingtalk(
     batch_size: int = 20000,
     batch_interval: float = 1.0,
     split_content_func: Callable = None,
+    render_cache: Optional[RenderCache] = None,
     rss_items: Optional[list] = None,
     rss_new_items: Optional[list] = None,
     ai_analysis: Any = None,
@@ -238,6 +250,7 @@ def send_to_dingtalk(
         batch_size: 批次大小（字节）
         batch_interval: 批次发送间隔（秒）
         split_content_func: 内容分批函数
+        render_cache: 单次分发内的渲染缓存（可选，AI 分析按渠道格式只渲染一次）
         rss_items: RSS 统计条目列表（可选，用于合并推送）
         rss_new_items: RSS 新增条目列表（可选，用于新增区块）
 
@@ -256,7 +269,7 @@ def send_to_dingtalk(
     ai_content = None
     ai_stats = None
     if ai_analysis:
-        ai_content = _render_ai_analysis(ai_analysis, "dingtalk")
+        ai_content = _render_ai_analysis(ai_analysis, "dingtalk", render_cache)
         # 提取 AI 分析统计数据（只要 AI 分析成功就显示）
         if getattr(ai_analysis, "success", False):
             ai_stats = {
@@ -305,7 +318,7 @@ def send_to_dingtalk(
         }
 
         try:
-            response = requests.post(
+            response = transport.post(
                 webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
             )
             if response.status_code == 200:
@@ -347,6 +360,7 @@ def send_to_wework(
     batch_interval: float = 1.0,
     msg_type: str = "markdown",
     split_content_func: Callable = None,
+    render_cache: Optional[RenderCache] = None,
     rss_items: Optional[list] = None,
     rss_new_items: Optional[list] = None,
     ai_analysis: Any = None,
@@ -368,6 +382,7 @@ def send_to_wework(
         batch_interval: 批次发送间隔（秒）
         msg_type: 消息类型 (markdown/text)
         split_content_func: 内容分批函数
+        render_cache: 单次分发内的渲染缓存（可选，AI 分析按渠道格式只渲染一次）
         rss_items: RSS 统计条目列表（可选，用于合并推送）
         rss_new_items: RSS 新增条目列表（可选，用于新增区块）
 
@@ -397,7 +412,7 @@ def send_to_wework(
     ai_content = None
     ai_stats = None
     if ai_analysis:
-        ai_content = _render_ai_analysis(ai_analysis, "wework")
+        ai_content = _render_ai_analysis(ai_analysis, "wework", render_cache)
         # 提取 AI 分析统计数据（只要 AI 分析成功就显示）
         if getattr(ai_analysis, "success", False):
             ai_stats = {
@@ -444,7 +459,7 @@ def send_to_wework(
         )
 
         try:
-            response = requests.post(
+            response = transport.post(
                 webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
             )
             if response.status_code == 200:
@@ -486,6 +501,7 @@ def send_to_telegram(
     batch_size: int = 4000,
     batch_interval: float = 1.0,
     split_content_func: Callable = None,
+    render_cache: Optional[RenderCache] = None,
     rss_items: Optional[list] = None,
     rss_new_items: Optional[list] = None,
     ai_analysis: Any = None,
@@ -507,6 +523,7 @@ def send_to_telegram(
         batch_size: 批次大小（字节）
         batch_interval: 批次发送间隔（秒）
         split_content_func: 内容分批函数
+        render_cache: 单次分发内的渲染缓存（可选，AI 分析按渠道格式只渲染一次）
         rss_items: RSS 统计条目列表（可选，用于合并推送）
         rss_new_items: RSS 新增条目列表（可选，用于新增区块）
 
@@ -527,7 +544,7 @@ def send_to_telegram(
     ai_content = None
     ai_stats = None
     if ai_analysis:
-        ai_content = _render_ai_analysis(ai_analysis, "telegram")
+        ai_content = _render_ai_analysis(ai_analysis, "telegram", render_cache)
         # 提取 AI 分析统计数据（只要 AI 分析成功就显示）
         if getattr(ai_analysis, "success", False):
             ai_stats = {
@@ -571,7 +588,7 @@ def send_to_telegram(
         }
 
         try:
-            response = requests.post(
+            response = transport.post(
                 url, headers=headers, json=payload, proxies=proxies, timeout=30
             )
             if response.status_code == 200:
@@ -638,6 +655,8 @@ def send_to_email(
         print(f"使用HTML文件: {html_file_path}")
         with open(html_file_path, "r", encoding="utf-8") as f:
             html_content = f.read()
+        # 报告快照引用外部 CSS/JS 文件，邮件中需内联
+        html_content = inline_assets(html_content)
 
         domain = from_email.split("@")[-1].lower()
 
@@ -708,25 +727,8 @@ TrendRadar 热点分析报告
         print(f"发件人: {from_email}")
 
         try:
-            if use_tls:
-                # TLS 模式
-                server = smtplib.SMTP(smtp_server, smtp_port, timeout=30)
-                server.set_debuglevel(0)  # 设为1可以查看详细调试信息
-                server.ehlo()
-                server.starttls()
-                server.ehlo()
-            else:
-                # SSL 模式
-                server = smtplib.SMTP_SSL(smtp_server, smtp_port, timeout=30)
-                server.set_debuglevel(0)
-                server.ehlo()
-
-            # 登录
-            server.login(from_email, password)
-
-            # 发送邮件
-            server.send_message(msg)
-            server.quit()
+            # 复用同一账号的 SMTP 连接（一封邮件投递所有收件人）
+            transport.send_mail(smtp_server, smtp_port, use_tls, from_email, password, msg)
 
             print(f"邮件发送成功 [{report_type}] -> {to_email}")
             return True
@@ -772,6 +774,7 @@ def send_to_ntfy(
     *,
     batch_size: int = 3800,
     split_content_func: Callable = None,
+    render_cache: Optional[RenderCache] = None,
     rss_items: Optional[list] = None,
     rss_new_items: Optional[list] = None,
     ai_analysis: Any = None,
@@ -793,6 +796,7 @@ def send_to_ntfy(
         account_label: 账号标签（多账号时显示）
         batch_size: 批次大小（字节）
         split_content_func: 内容分批函数
+        render_cache: 单次分发内的渲染缓存（可选，AI 分析按渠道格式只渲染一次）
         rss_items: RSS 统计条目列表（可选，用于合并推送）
         rss_new_items: RSS 新增条目列表（可选，用于新增区块）
 
@@ -837,7 +841,7 @@ def send_to_ntfy(
     ai_content = None
     ai_stats = None
     if ai_analysis:
-        ai_content = _render_ai_analysis(ai_analysis, "ntfy")
+        ai_content = _render_ai_analysis(ai_analysis, "ntfy", render_cache)
         # 提取 AI 分析统计数据（只要 AI 分析成功就显示）
         if getattr(ai_analysis, "success", False):
             ai_stats = {
@@ -894,7 +898,7 @@ def send_to_ntfy(
             current_headers["Title"] = f"{report_type_en} ({actual_batch_num}/{total_batches})"
 
         try:
-            response = requests.post(
+            response = transport.post(
                 url,
                 headers=current_headers,
                 data=batch_content.encode("utf-8"),
@@ -910,25 +914,10 @@ def send_to_ntfy(
                     interval = 2 if "ntfy.sh" in server_url else 1
                     time.sleep(interval)
             elif response.status_code == 429:
+                # 传输层已按 Retry-After 退避重试，仍被限流则放弃该批次
                 print(
-                    f"{log_prefix}第 {actual_batch_num}/{total_batches} 批次速率限制 [{report_type}]，等待后重试"
+                    f"{log_prefix}第 {actual_batch_num}/{total_batches} 批次速率限制，重试后仍失败 [{report_type}]"
                 )
-                time.sleep(10)  # 等待10秒后重试
-                # 重试一次
-                retry_response = requests.post(
-                    url,
-                    headers=current_headers,
-                    data=batch_content.encode("utf-8"),
-                    proxies=proxies,
-                    timeout=30,
-                )
-                if retry_response.status_code == 200:
-                    print(f"{log_prefix}第 {actual_batch_num}/{total_batches} 批次重试成功 [{report_type}]")
-                    success_count += 1
-                else:
-                    print(
-                        f"{log_prefix}第 {actual_batch_num}/{total_batches} 批次重试失败，状态码：{retry_response.status_code}"
-                    )
             elif response.status_code == 413:
                 print(
                     f"{log_prefix}第 {actual_batch_num}/{total_batches} 批次消息过大被拒绝 [{report_type}]，消息大小：{content_size} 字节"
@@ -975,6 +964,7 @@ def send_to_bark(
     batch_size: int = 3600,
     batch_interval: float = 1.0,
     split_content_func: Callable = None,
+    render_cache: Optional[RenderCache] = None,
     rss_items: Optional[list] = None,
     rss_new_items: Optional[list] = None,
     ai_analysis: Any = None,
@@ -995,6 +985,7 @@ def send_to_bark(
         batch_size: 批次大小（字节）
         batch_interval: 批次发送间隔（秒）
         split_content_func: 内容分批函数
+        render_cache: 单次分发内的渲染缓存（可选，AI 分析按渠道格式只渲染一次）
         rss_items: RSS 统计条目列表（可选，用于合并推送）
         rss_new_items: RSS 新增条目列表（可选，用于新增区块）
 
@@ -1024,7 +1015,7 @@ def send_to_bark(
     ai_content = None
     ai_stats = None
     if ai_analysis:
-        ai_content = _render_ai_analysis(ai_analysis, "bark")
+        ai_content = _render_ai_analysis(ai_analysis, "bark", render_cache)
         # 提取 AI 分析统计数据（只要 AI 分析成功就显示）
         if getattr(ai_analysis, "success", False):
             ai_stats = {
@@ -1088,7 +1079,7 @@ def send_to_bark(
         }
 
         try:
-            response = requests.post(
+            response = transport.post(
                 api_endpoint,
                 json=payload,
                 proxies=proxies,
@@ -1149,6 +1140,7 @@ def send_to_slack(
     batch_size: int = 4000,
     batch_interval: float = 1.0,
     split_content_func: Callable = None,
+    render_cache: Optional[RenderCache] = None,
     rss_items: Optional[list] = None,
     rss_new_items: Optional[list] = None,
     ai_analysis: Any = None,
@@ -1169,6 +1161,7 @@ def send_to_slack(
         batch_size: 批次大小（字节）
         batch_interval: 批次发送间隔（秒）
         split_content_func: 内容分批函数
+        render_cache: 单次分发内的渲染缓存（可选，AI 分析按渠道格式只渲染一次）
         rss_items: RSS 统计条目列表（可选，用于合并推送）
         rss_new_items: RSS 新增条目列表（可选，用于新增区块）
 
@@ -1187,7 +1180,7 @@ def send_to_slack(
     ai_content = None
     ai_stats = None
     if ai_analysis:
-        ai_content = _render_ai_analysis(ai_analysis, "slack")
+        ai_content = _render_ai_analysis(ai_analysis, "slack", render_cache)
         # 提取 AI 分析统计数据（只要 AI 分析成功就显示）
         if getattr(ai_analysis, "success", False):
             ai_stats = {
@@ -1230,7 +1223,7 @@ def send_to_slack(
         payload = {"text": mrkdwn_content}
 
         try:
-            response = requests.post(
+            response = transport.post(
                 webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
             )
 
@@ -1268,6 +1261,7 @@ def send_to_generic_webhook(
     batch_size: int = 4000,
     batch_interval: float = 1.0,
     split_content_func: Optional[Callable] = None,
+    render_cache: Optional[RenderCache] = None,
     rss_items: Optional[list] = None,
     rss_new_items: Optional[list] = None,
     ai_analysis: Any = None,
@@ -1289,6 +1283,7 @@ def send_to_generic_webhook(
         batch_size: 批次大小（字节）
         batch_interval: 批次发送间隔（秒）
         split_content_func: 内容分批函数
+        render_cache: 单次分发内的渲染缓存（可选，AI 分析按渠道格式只渲染一次）
         rss_items: RSS 统计条目列表（可选，用于合并推送）
         rss_new_items: RSS 新增条目列表（可选，用于新增区块）
 
@@ -1311,7 +1306,7 @@ def send_to_generic_webhook(
     ai_stats = None
     if ai_analysis:
         # 通用 Webhook 使用 markdown 格式渲染 AI 分析
-        ai_content = _render_ai_analysis(ai_analysis, "wework")
+        ai_content = _render_ai_analysis(ai_analysis, "wework", render_cache)
         # 提取 AI 分析统计数据
         if getattr(ai_analysis, "success", False):
             ai_stats = {
@@ -1369,7 +1364,7 @@ def send_to_generic_webhook(
                 # 默认格式
                 payload = {"title": report_type, "content": batch_content}
 
-            response = requests.post(
+            response = transport.post(
                 webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
             )
             
@@ -25,6 +25,44 @@ DEFAULT_BATCH_SIZES = {
 DEFAULT_REGION_ORDER = ["hotlist", "rss", "new_items", "standalone", "ai_analysis"]
 
 
+class _BatchBuilder:
+    """
+    单个批次的增量构建器
+
+    片段追加到列表、累计 UTF-8 字节数，判断是否超限时只计算新片段的字节数，
+    完成时一次性拼接，整体分批耗时与内容长度成线性关系。
+    """
+
+    __slots__ = ("header", "footer", "max_bytes", "parts", "size", "_footer_size")
+
+    def __init__(self, header: str, footer: str, max_bytes: int, *parts: str):
+        self.header = header
+        self.footer = footer
+        self.max_bytes = max_bytes
+        self.parts: List[str] = [header]
+        self.size = len(header.encode("utf-8"))
+        self._footer_size = len(footer.encode("utf-8"))
+        for part in parts:
+            self.append(part)
+
+    def fits(self, text: str) -> bool:
+        """追加 text 后（含尾部）是否仍小于字节上限"""
+        return self.size + len(text.encode("utf-8")) + self._footer_size < self.max_bytes
+
+    def append(self, text: str) -> None:
+        """追加片段"""
+        self.parts.append(text)
+        self.size += len(text.encode("utf-8"))
+
+    def restart(self, *parts: str) -> "_BatchBuilder":
+        """以头部 + parts 开启新批次"""
+        return _BatchBuilder(self.header, self.footer, self.max_bytes, *parts)
+
+    def finish(self) -> str:
+        """拼接为完整批次内容（含尾部）"""
+        return "".join(self.parts) + self.footer
+
+
 def split_content_into_batches(
     report_data: Dict,
     format_type: str,
@@ -213,7 +251,7 @@ def split_content_into_batches(
         elif format_type == "slack":
             stats_header = f"📊 *{stats_title}* (共 {total_hotlist_count} 条)\n\n"
 
-    current_batch = base_header
+    current_batch = _BatchBuilder(base_header, base_footer, max_bytes)
     current_batch_has_content = False
 
     # 当没有热榜数据时的处理
@@ -262,18 +300,14 @@ def split_content_into_batches(
             actual_stats_header = stats_header
 
         # 添加统计标题
-        test_content = current_batch + actual_stats_header
-        if (
-            len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-            < max_bytes
-        ):
-            current_batch = test_content
+        if current_batch.fits(actual_stats_header):
+            current_batch.append(actual_stats_header)
             current_batch_has_content = True
         else:
             if current_batch_has_content:
-                batches.append(current_batch + base_footer)
+                batches.append(current_batch.finish())
             # 新批次开头不需要分割线，使用原始 stats_header
-            current_batch = base_header + stats_header
+            current_batch = current_batch.restart(stats_header)
             current_batch_has_content = True
 
         # 逐个处理词组（确保词组标题+第一条新闻的原子性）
@@ -383,20 +417,16 @@ def split_content_into_batches(
 
             # 原子性检查：词组标题+第一条新闻必须一起处理
             word_with_first_news = word_header + first_news_line
-            test_content = current_batch + word_with_first_news
 
-            if (
-                len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                >= max_bytes
-            ):
+            if not current_batch.fits(word_with_first_news):
                 # 当前批次容纳不下，开启新批次
                 if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + stats_header + word_with_first_news
+                    batches.append(current_batch.finish())
+                current_batch = current_batch.restart(stats_header, word_with_first_news)
                 current_batch_has_content = True
                 start_index = 1
             else:
-                current_batch = test_content
+                current_batch.append(word_with_first_news)
                 current_batch_has_content = True
                 start_index = 1
 
@@ -434,17 +464,13 @@ def split_content_into_batches(
                 if j < len(stat["titles"]) - 1:
                     news_line += "\n"
 
-                test_content = current_batch + news_line
-                if (
-                    len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                    >= max_bytes
-                ):
+                if not current_batch.fits(news_line):
                     if current_batch_has_content:
-                        batches.append(current_batch + base_footer)
-                    current_batch = base_header + stats_header + word_header + news_line
+                        batches.append(current_batch.finish())
+                    current_batch = current_batch.restart(stats_header, word_header, news_line)
                     current_batch_has_content = True
                 else:
-                    current_batch = test_content
+                    current_batch.append(news_line)
                     current_batch_has_content = True
 
             # 词组间分隔符
@@ -463,12 +489,8 @@ def split_content_into_batches(
                 elif format_type == "slack":
                     separator = f"\n\n"
 
-                test_content = current_batch + separator
-                if (
-                    len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                    < max_bytes
-                ):
-                    current_batch = test_content
+                if current_batch.fits(separator):
+                    current_batch.append(separator)
 
         return current_batch, current_batch_has_content, batches
 
@@ -511,17 +533,13 @@ def split_content_into_batches(
             elif format_type == "slack":
                 new_header = f"🆕 *本次新增热点新闻* (共 {report_data['total_new_count']} 条)\n\n"
 
-        test_content = current_batch + new_header
-        if (
-            len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-            >= max_bytes
-        ):
+        if not current_batch.fits(new_header):
             if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + new_header
+                batches.append(current_batch.finish())
+            current_batch = current_batch.restart(new_header)
             current_batch_has_content = True
         else:
-            current_batch = test_content
+            current_batch.append(new_header)
             current_batch_has_content = True
 
         # 逐个处理新增新闻来源
@@ -574,19 +592,15 @@ def split_content_into_batches(
 
             # 原子性检查：来源标题+第一条新闻
             source_with_first_news = source_header + first_news_line
-            test_content = current_batch + source_with_first_news
 
-            if (
-                len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                >= max_bytes
-            ):
+            if not current_batch.fits(source_with_first_news):
                 if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + new_header + source_with_first_news
+                    batches.append(current_batch.finish())
+                current_batch = current_batch.restart(new_header, source_with_first_news)
                 current_batch_has_content = True
                 start_index = 1
             else:
-                current_batch = test_content
+                current_batch.append(source_with_first_news)
                 current_batch_has_content = True
                 start_index = 1
 
@@ -621,20 +635,16 @@ def split_content_into_batches(
 
                 news_line = f"  {j + 1}. {formatted_title}\n"
 
-                test_content = current_batch + news_line
-                if (
-                    len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                    >= max_bytes
-                ):
+                if not current_batch.fits(news_line):
                     if current_batch_has_content:
-                        batches.append(current_batch + base_footer)
-                    current_batch = base_header + new_header + source_header + news_line
+                        batches.append(current_batch.finish())
+                    current_batch = current_batch.restart(new_header, source_header, news_line)
                     current_batch_has_content = True
                 else:
-                    current_batch = test_content
+                    current_batch.append(news_line)
                     current_batch_has_content = True
 
-            current_batch += "\n"
+            current_batch.append("\n")
 
         return current_batch, current_batch_has_content, batches
 
@@ -660,20 +670,15 @@ def split_content_into_batches(
         # 如果不需要分割线，ai_separator 保持为空字符串
 
         # 尝试将 AI 内容添加到当前批次
-        test_content = current_batch + ai_separator + ai_content
-        if (
-            len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-            < max_bytes
-        ):
-            current_batch = test_content
+        if current_batch.fits(ai_separator + ai_content):
+            current_batch.append(ai_separator + ai_content)
             current_batch_has_content = True
         else:
             # 当前批次容纳不下，开启新批次
             if current_batch_has_content:
-                batches.append(current_batch + base_footer)
+                batches.append(current_batch.finish())
             # AI 内容可能很长，需要考虑是否需要进一步分割
-            ai_with_header = base_header + ai_content
-            current_batch = ai_with_header
+            current_batch = current_batch.restart(ai_content)
             current_batch_has_content = True
 
         return current_batch, current_batch_has_content, batches
@@ -717,7 +722,7 @@ def split_content_into_batches(
 
     for region in region_order:
         # 记录处理前的状态，用于判断该区域是否产生了内容
-        batch_before = current_batch
+        batch_before = current_batch.size
         has_content_before = current_batch_has_content
         batches_len_before = len(batches)
 
@@ -742,7 +747,7 @@ def split_content_into_batches(
             # 处理 RSS 新增（跟随 new_items，继承 add_separator 逻辑）
             # 如果热榜新增产生了内容，RSS 新增需要分割线
             new_batch_changed = (
-                current_batch != batch_before or
+                current_batch.size != batch_before or
                 current_batch_has_content != has_content_before or
                 len(batches) != batches_len_before
             )
@@ -763,7 +768,7 @@ def split_content_into_batches(
 
         # 检查该区域是否产生了内容
         region_produced_content = (
-            current_batch != batch_before or
+            current_batch.size != batch_before or
             current_batch_has_content != has_content_before or
             len(batches) != batches_len_before
         )
@@ -783,17 +788,13 @@ def split_content_into_batches(
         elif format_type == "dingtalk":
             failed_header = f"\n---\n\n⚠️ **数据获取失败的平台：**\n\n"
 
-        test_content = current_batch + failed_header
-        if (
-            len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-            >= max_bytes
-        ):
+        if not current_batch.fits(failed_header):
             if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + failed_header
+                batches.append(current_batch.finish())
+            current_batch = current_batch.restart(failed_header)
             current_batch_has_content = True
         else:
-            current_batch = test_content
+            current_batch.append(failed_header)
             current_batch_has_content = True
 
         for i, id_value in enumerate(report_data["failed_ids"], 1):
@@ -804,22 +805,18 @@ def split_content_into_batches(
             else:
                 failed_line = f"  • {id_value}\n"
 
-            test_content = current_batch + failed_line
-            if (
-                len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                >= max_bytes
-            ):
+            if not current_batch.fits(failed_line):
                 if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + failed_header + failed_line
+                    batches.append(current_batch.finish())
+                current_batch = current_batch.restart(failed_header, failed_line)
                 current_batch_has_content = True
             else:
-                current_batch = test_content
+                current_batch.append(failed_line)
                 current_batch_has_content = True
 
     # 完成最后批次
     if current_batch_has_content:
-        batches.append(current_batch + base_footer)
+        batches.append(current_batch.finish())
 
     return batches
 
@@ -831,7 +828,7 @@ def _process_rss_stats_section(
     base_header: str,
     base_footer: str,
     max_bytes: int,
-    current_batch: str,
+    current_batch: "_BatchBuilder",
     current_batch_has_content: bool,
     batches: List[str],
     timezone: str = "Asia/Shanghai",
@@ -847,7 +844,7 @@ def _process_rss_stats_section(
         base_header: 基础头部
         base_footer: 基础尾部
         max_bytes: 最大字节数
-        current_batch: 当前批次内容
+        current_batch: 当前批次构建器
         current_batch_has_content: 当前批次是否有内容
         batches: 已完成的批次列表
         timezone: 时区名称
@@ -893,14 +890,13 @@ def _process_rss_stats_section(
             rss_header = f"📰 **RSS 订阅统计** (共 {total_items} 条)\n\n"
 
     # 添加 RSS 标题
-    test_content = current_batch + rss_header
-    if len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8")) < max_bytes:
-        current_batch = test_content
+    if current_batch.fits(rss_header):
+        current_batch.append(rss_header)
         current_batch_has_content = True
     else:
         if current_batch_has_content:
-            batches.append(current_batch + base_footer)
-        current_batch = base_header + rss_header
+            batches.append(current_batch.finish())
+        current_batch = current_batch.restart(rss_header)
         current_batch_has_content = True
 
     # 逐个处理关键词组（与热榜一致）
@@ -979,16 +975,15 @@ def _process_rss_stats_section(
 
         # 原子性检查：关键词标题 + 第一条新闻必须一起处理
         word_with_first_news = word_header + first_news_line
-        test_content = current_batch + word_with_first_news
 
-        if len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8")) >= max_bytes:
+        if not current_batch.fits(word_with_first_news):
             if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + rss_header + word_with_first_news
+                batches.append(current_batch.finish())
+            current_batch = current_batch.restart(rss_header, word_with_first_news)
             current_batch_has_content = True
             start_index = 1
         else:
-            current_batch = test_content
+            current_batch.append(word_with_first_news)
             current_batch_has_content = True
             start_index = 1
 
@@ -1014,14 +1009,13 @@ def _process_rss_stats_section(
             if j < len(stat["titles"]) - 1:
                 news_line += "\n"
 
-            test_content = current_batch + news_line
-            if len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8")) >= max_bytes:
+            if not current_batch.fits(news_line):
                 if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + rss_header + word_header + news_line
+                    batches.append(current_batch.finish())
+                current_batch = current_batch.restart(rss_header, word_header, news_line)
                 current_batch_has_content = True
             else:
-                current_batch = test_content
+                current_batch.append(news_line)
                 current_batch_has_content = True
 
         # 关键词间分隔符
@@ -1040,9 +1034,8 @@ def _process_rss_stats_section(
             elif format_type == "slack":
                 separator = "\n\n"
 
-            test_content = current_batch + separator
-            if len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8")) < max_bytes:
-                current_batch = test_content
+            if current_batch.fits(separator):
+                current_batch.append(separator)
 
     return current_batch, current_batch_has_content, batches
 
@@ -1054,7 +1047,7 @@ def _process_rss_new_titles_section(
     base_header: str,
     base_footer: str,
     max_bytes: int,
-    current_batch: str,
+    current_batch: "_BatchBuilder",
     current_batch_has_content: bool,
     batches: List[str],
     timezone: str = "Asia/Shanghai",
@@ -1070,7 +1063,7 @@ def _process_rss_new_titles_section(
         base_header: 基础头部
         base_footer: 基础尾部
         max_bytes: 最大字节数
-        current_batch: 当前批次内容
+        current_batch: 当前批次构建器
         current_batch_has_content: 当前批次是否有内容
         batches: 已完成的批次列表
         timezone: 时区名称
@@ -1129,14 +1122,13 @@ def _process_rss_new_titles_section(
             new_header = f"🆕 *RSS 本次新增* (共 {total_items} 条)\n\n"
 
     # 添加 RSS 新增标题
-    test_content = current_batch + new_header
-    if len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8")) >= max_bytes:
+    if not current_batch.fits(new_header):
         if current_batch_has_content:
-            batches.append(current_batch + base_footer)
-        current_batch = base_header + new_header
+            batches.append(current_batch.finish())
+        current_batch = current_batch.restart(new_header)
         current_batch_has_content = True
     else:
-        current_batch = test_content
+        current_batch.append(new_header)
         current_batch_has_content = True
 
     # 按来源分组显示（与热榜新增格式一致）
@@ -1183,16 +1175,15 @@ def _process_rss_new_titles_section(
 
         # 原子性检查：来源标题 + 第一条新闻必须一起处理
         source_with_first_news = source_header + first_news_line
-        test_content = current_batch + source_with_first_news
 
-        if len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8")) >= max_bytes:
+        if not current_batch.fits(source_with_first_news):
             if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + new_header + source_with_first_news
+                batches.append(current_batch.finish())
+            current_batch = current_batch.restart(new_header, source_with_first_news)
             current_batch_has_content = True
             start_index = 1
         else:
-            current_batch = test_content
+            current_batch.append(source_with_first_news)
             current_batch_has_content = True
             start_index = 1
 
@@ -1217,18 +1208,17 @@ def _process_rss_new_titles_section(
 
             news_line = f"  {j + 1}. {formatted_title}\n"
 
-            test_content = current_batch + news_line
-            if len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8")) >= max_bytes:
+            if not current_batch.fits(news_line):
                 if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + new_header + source_header + news_line
+                    batches.append(current_batch.finish())
+                current_batch = current_batch.restart(new_header, source_header, news_line)
                 current_batch_has_content = True
             else:
-                current_batch = test_content
+                current_batch.append(news_line)
                 current_batch_has_content = True
 
         # 来源间添加空行（与热榜新增格式一致）
-        current_batch += "\n"
+        current_batch.append("\n")
 
     return current_batch, current_batch_has_content, batches
 
@@ -1294,7 +1284,7 @@ def _process_standalone_section(
     base_header: str,
     base_footer: str,
     max_bytes: int,
-    current_batch: str,
+    current_batch: "_BatchBuilder",
     current_batch_has_content: bool,
     batches: List[str],
     timezone: str = "Asia/Shanghai",
@@ -1317,7 +1307,7 @@ def _process_standalone_section(
         base_header: 基础头部
         base_footer: 基础尾部
         max_bytes: 最大字节数
-        current_batch: 当前批次内容
+        current_batch: 当前批次构建器
         current_batch_has_content: 当前批次是否有内容
         batches: 已完成的批次列表
         timezone: 时区名称
@@ -1371,14 +1361,13 @@ def _process_standalone_section(
             section_header = f"📋 **独立展示区** (共 {total_items} 条)\n\n"
 
     # 添加区块标题
-    test_content = current_batch + section_header
-    if len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8")) < max_bytes:
-        current_batch = test_content
+    if current_batch.fits(section_header):
+        current_batch.append(section_header)
         current_batch_has_content = True
     else:
         if current_batch_has_content:
-            batches.append(current_batch + base_footer)
-        current_batch = base_header + section_header
+            batches.append(current_batch.finish())
+        current_batch = current_batch.restart(section_header)
         current_batch_has_content = True
 
     # 处理热榜平台
@@ -1410,16 +1399,15 @@ def _process_standalone_section(
 
         # 原子性检查
         platform_with_first = platform_header + first_item_line
-        test_content = current_batch + platform_with_first
 
-        if len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8")) >= max_bytes:
+        if not current_batch.fits(platform_with_first):
             if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + section_header + platform_with_first
+                batches.append(current_batch.finish())
+            current_batch = current_batch.restart(section_header, platform_with_first)
             current_batch_has_content = True
             start_index = 1
         else:
-            current_batch = test_content
+            current_batch.append(platform_with_first)
             current_batch_has_content = True
             start_index = 1
 
@@ -1427,17 +1415,16 @@ def _process_standalone_section(
         for j in range(start_index, len(items)):
             item_line = _format_standalone_platform_item(items[j], j + 1, format_type, rank_threshold)
 
-            test_content = current_batch + item_line
-            if len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8")) >= max_bytes:
+            if not current_batch.fits(item_line):
                 if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + section_header + platform_header + item_line
+                    batches.append(current_batch.finish())
+                current_batch = current_batch.restart(section_header, platform_header, item_line)
                 current_batch_has_content = True
             else:
-                current_batch = test_content
+                current_batch.append(item_line)
                 current_batch_has_content = True
 
-        current_batch += "\n"
+        current_batch.append("\n")
 
     # 处理 RSS 源
     for feed in rss_feeds:
@@ -1468,16 +1455,15 @@ def _process_standalone_section(
 
         # 原子性检查
         feed_with_first = feed_header + first_item_line
-        test_content = current_batch + feed_with_first
 
-        if len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8")) >= max_bytes:
+        if not current_batch.fits(feed_with_first):
             if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + section_header + feed_with_first
+                batches.append(current_batch.finish())
+            current_batch = current_batch.restart(section_header, feed_with_first)
             current_batch_has_content = True
             start_index = 1
         else:
-            current_batch = test_content
+            current_batch.append(feed_with_first)
             current_batch_has_content = True
             start_index = 1
 
@@ -1485,17 +1471,16 @@ def _process_standalone_section(
         for j in range(start_index, len(items)):
             item_line = _format_standalone_rss_item(items[j], j + 1, format_type, timezone)
 
-            test_content = current_batch + item_line
-            if len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8")) >= max_bytes:
+            if not current_batch.fits(item_line):
                 if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + section_header + feed_header + item_line
+                    batches.append(current_batch.finish())
+                current_batch = current_batch.restart(section_header, feed_header, item_line)
                 current_batch_has_content = True
             else:
-                current_batch = test_content
+                current_batch.append(item_line)
                 current_batch_has_content = True
 
-        current_batch += "\n"
+        current_batch.append("\n")
 
     return current_batch, current_batch_has_content, batches
 
@@ -0,0 +1,364 @@
+# coding=utf-8
+"""
+推送传输层
+
+各渠道发送器共用的 HTTP / SMTP 连接：
+
+- 按主机（scheme://host:port）复用 keep-alive Session，连接池大小覆盖并发推送的账号数，
+  同一主机的多批次、多账号不再逐次建立 TCP/TLS 连接
+- 429 和建立连接阶段的错误按退避重试：优先遵循 Retry-After（秒数或 HTTP 日期），
+  否则指数退避并加随机抖动，单次等待有上限。POST 在 5xx 或请求已发出后的连接错误/读取超时
+  时消息可能已经送达，不重试，交由调用方按原有逻辑处理，避免重复推送；GET 为幂等请求，
+  额外重试 502 / 503 / 504 和读取阶段的错误
+- SMTP 连接按 (服务器, 端口, 加密方式, 账号) 缓存，登录一次后供本轮所有邮件复用；
+  复用前用 NOOP 探活，连接已断开时重新建立
+
+- 推送截止时间（deadline）：NotificationDispatcher 通过 contextvars 传入，截止后不再发起新请求，
+  每次请求的超时和重试等待都不超过剩余时间，保证截止后发送线程很快结束
+
+连接在 AppContext.cleanup() / end_cycle() 中释放。
+"""
+
+import contextvars
+import random
+import smtplib
+import threading
+import time
+from datetime import datetime, timezone
+from email.message import Message
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_MAX_RETRIES = 2
+RETRY_STATUS_CODES = (429,)
+IDEMPOTENT_RETRY_STATUS_CODES = (429, 502, 503, 504)
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS")
+BACKOFF_BASE = 1.0
+MAX_RETRY_WAIT = 60.0
+
+# 推送截止时间（time.monotonic() 时间点，None=不限制），随 contextvars 传入工作线程
+_deadline: contextvars.ContextVar = contextvars.ContextVar("push_deadline", default=None)
+
+_sessions: Dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+_smtp_connections: Dict[Tuple, smtplib.SMTP] = {}
+_smtp_lock = threading.Lock()
+
+
+# ========================================
+# 截止时间
+# ========================================
+
+
+class DeadlineExceeded(requests.exceptions.Timeout):
+    """已超过推送截止时间，不再发起请求"""
+
+
+def set_deadline(deadline_at: Optional[float]) -> contextvars.Token:
+    """
+    设置当前上下文的推送截止时间
+
+    Args:
+        deadline_at: time.monotonic() 时间点，None 表示不限制
+
+    Returns:
+        用于 reset_deadline 的令牌
+    """
+    return _deadline.set(deadline_at)
+
+
+def reset_deadline(token: contextvars.Token) -> None:
+    """恢复设置截止时间之前的状态"""
+    _deadline.reset(token)
+
+
+def remaining_time() -> Optional[float]:
+    """距离推送截止时间的剩余秒数（None 表示不限制）"""
+    deadline_at = _deadline.get()
+    if deadline_at is None:
+        return None
+    return max(0.0, deadline_at - time.monotonic())
+
+
+def _can_wait(seconds: float) -> bool:
+    """等待指定秒数后是否仍在截止时间之内"""
+    remaining = remaining_time()
+    return remaining is None or seconds < remaining
+
+
+def _bounded_timeout(timeout: float) -> float:
+    """按剩余时间收紧超时，已超过截止时间时抛出 DeadlineExceeded"""
+    remaining = remaining_time()
+    if remaining is None:
+        return timeout
+    if remaining <= 0:
+        raise DeadlineExceeded("已超过推送截止时间")
+    return min(timeout, remaining)
+
+
+# ========================================
+# HTTP
+# ========================================
+
+
+def _host_key(url: str) -> str:
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}".lower()
+
+
+def get_session(url: str) -> requests.Session:
+    """获取目标主机的 keep-alive Session（线程安全，同一主机共用一个连接池）"""
+    key = _host_key(url)
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=DEFAULT_POOL_SIZE, pool_maxsize=DEFAULT_POOL_SIZE)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _sessions[key] = session
+        return session
+
+
+def _retry_after_seconds(response: requests.Response) -> Optional[float]:
+    """解析 Retry-After 响应头（秒数或 HTTP 日期）"""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _backoff_seconds(attempt: int) -> float:
+    """指数退避（带抖动）"""
+    delay = BACKOFF_BASE * (2 ** attempt)
+    return min(MAX_RETRY_WAIT, delay + random.uniform(0, delay / 2))
+
+
+def _is_connect_error(error: requests.exceptions.ConnectionError) -> bool:
+    """
+    是否为建立连接阶段的错误（请求尚未发出，重试不会重复投递）
+
+    ConnectTimeout、代理连接失败以及 DNS 解析/连接被拒绝（NewConnectionError）属于此类；
+    连接被重置、远端断开等发生在请求发出之后的错误不属于。
+    """
+    if isinstance(error, (requests.exceptions.ConnectTimeout, requests.exceptions.ProxyError)):
+        return True
+    reason = error.args[0] if error.args else None
+    reason = getattr(reason, "reason", reason)
+    return isinstance(reason, urllib3.exceptions.NewConnectionError)
+
+
+def request(
+    method: str,
+    url: str,
+    *,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    **kwargs,
+) -> requests.Response:
+    """
+    通过复用的 Session 发送请求，遇到限流或连接建立失败时退避重试
+
+    非幂等请求（POST 等）只重试 429 和请求发出前的连接错误；
+    GET 等幂等请求还会重试 502 / 503 / 504、连接中断和读取超时。
+
+    Args:
+        method: HTTP 方法
+        url: 请求地址
+        max_retries: 最大重试次数
+        **kwargs: 透传给 requests 的参数（headers、json、data、proxies、timeout 等）
+
+    Returns:
+        最后一次请求的响应（重试用尽或不可重试时可能是 429/5xx，由调用方按状态码处理）
+
+    Raises:
+        requests.exceptions.RequestException: 重试用尽后仍失败的网络异常
+        DeadlineExceeded: 已超过推送截止时间（请求未发出）
+    """
+    timeout = kwargs.pop("timeout", 30)
+    session = get_session(url)
+    host = urlparse(url).netloc
+    idempotent = method.upper() in IDEMPOTENT_METHODS
+    retry_status_codes = IDEMPOTENT_RETRY_STATUS_CODES if idempotent else RETRY_STATUS_CODES
+
+    attempt = 0
+    while True:
+        try:
+            response = session.request(method, url, timeout=_bounded_timeout(timeout), **kwargs)
+        except (requests.exceptions.ConnectionError, requests.exceptions.ReadTimeout) as e:
+            retryable = idempotent or (
+                isinstance(e, requests.exceptions.ConnectionError) and _is_connect_error(e)
+            )
+            if not retryable or attempt >= max_retries:
+                raise
+            wait_seconds = _backoff_seconds(attempt)
+            if not _can_wait(wait_seconds):
+                raise
+            print(f"[推送] {host} 连接失败，{wait_seconds:.1f} 秒后重试（{attempt + 1}/{max_retries}）")
+        else:
+            if response.status_code not in retry_status_codes or attempt >= max_retries:
+                return response
+            retry_after = _retry_after_seconds(response)
+            if retry_after is not None:
+                wait_seconds = min(MAX_RETRY_WAIT, retry_after)
+            else:
+                wait_seconds = _backoff_seconds(attempt)
+            if not _can_wait(wait_seconds):
+                return response
+            print(
+                f"[推送] {host} 返回 {response.status_code}，"
+                f"{wait_seconds:.1f} 秒后重试（{attempt + 1}/{max_retries}）"
+            )
+            response.close()
+
+        time.sleep(wait_seconds)
+        attempt += 1
+
+
+def post(url: str, **kwargs) -> requests.Response:
+    """POST 请求（参数同 request）"""
+    return request("POST", url, **kwargs)
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    """GET 请求（参数同 request）"""
+    return request("GET", url, **kwargs)
+
+
+def close_sessions() -> None:
+    """关闭所有 HTTP 连接池"""
+    with _sessions_lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+    for session in sessions:
+        try:
+            session.close()
+        except Exception:
+            pass
+
+
+# ========================================
+# SMTP
+# ========================================
+
+
+def _smtp_connect(
+    server: str, port: int, use_tls: bool, username: str, password: str, timeout: float
+) -> smtplib.SMTP:
+    if use_tls:
+        # TLS 模式（STARTTLS）
+        conn = smtplib.SMTP(server, port, timeout=timeout)
+        conn.set_debuglevel(0)  # 设为1可以查看详细调试信息
+        conn.ehlo()
+        conn.starttls()
+        conn.ehlo()
+    else:
+        # SSL 模式
+        conn = smtplib.SMTP_SSL(server, port, timeout=timeout)
+        conn.set_debuglevel(0)
+        conn.ehlo()
+    try:
+        conn.login(username, password)
+    except Exception:
+        _smtp_close(conn)
+        raise
+    return conn
+
+
+def _smtp_alive(conn: smtplib.SMTP) -> bool:
+    try:
+        return conn.noop()[0] == 250
+    except (smtplib.SMTPException, OSError):
+        return False
+
+
+def _smtp_close(conn: smtplib.SMTP) -> None:
+    try:
+        conn.quit()
+    except (smtplib.SMTPException, OSError):
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+def send_mail(
+    server: str,
+    port: int,
+    use_tls: bool,
+    username: str,
+    password: str,
+    msg: Message,
+    timeout: float = 30,
+) -> None:
+    """
+    通过复用的 SMTP 连接发送邮件
+
+    一封邮件包含所有收件人，一次 send_message 完成投递；连接在发送成功后保留，
+    同一账号的后续邮件（如热榜与 RSS 报告）直接复用。复用的连接在发送时被服务端断开，
+    会重新建立连接再发送一次。
+
+    Raises:
+        smtplib.SMTPException: 认证、收件人、数据等错误（连接随即丢弃）
+    """
+    key = (server, port, use_tls, username)
+    timeout = _bounded_timeout(timeout)
+    with _smtp_lock:
+        conn = _smtp_connections.pop(key, None)
+        reused = conn is not None and _smtp_alive(conn)
+        if conn is not None and not reused:
+            _smtp_close(conn)
+        if not reused:
+            conn = _smtp_connect(server, port, use_tls, username, password, timeout)
+
+        try:
+            conn.send_message(msg)
+        except smtplib.SMTPServerDisconnected:
+            _smtp_close(conn)
+            if not reused:
+                raise
+            print("[推送] SMTP 复用连接已断开，重新连接")
+            conn = _smtp_connect(server, port, use_tls, username, password, timeout)
+            try:
+                conn.send_message(msg)
+            except Exception:
+                _smtp_close(conn)
+                raise
+        except Exception:
+            _smtp_close(conn)
+            raise
+
+        _smtp_connections[key] = conn
+
+
+def close_smtp_connections() -> None:
+    """关闭所有缓存的 SMTP 连接"""
+    with _smtp_lock:
+        connections = list(_smtp_connections.values())
+        _smtp_connections.clear()
+    for conn in connections:
+        _smtp_close(conn)
+
+
+def close_all() -> None:
+    """释放所有推送连接"""
+    close_sessions()
+    close_smtp_connections()
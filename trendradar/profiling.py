@@ -0,0 +1,203 @@
+# coding=utf-8
+"""
+启动耗时分析
+
+通过 --profile-startup 开启，统计每个模块的导入耗时（累计/自身）和各初始化阶段的耗时，
+用于排查冷启动慢的问题（cron 单次运行、MCP stdio 服务每个会话都要冷启动一次）。
+
+导入计时通过在 sys.meta_path 最前面插入一个 finder 实现：它把其他 finder 找到的
+loader 包一层，只在 exec_module 前后计时，执行模块代码前即恢复原始 loader，
+不影响模块自身看到的 __loader__ / __spec__。
+"""
+
+import sys
+import time
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+from typing import Dict, Iterator, List, Optional, TextIO, Tuple
+
+
+PROFILE_FLAG = "--profile-startup"
+
+
+class _TimedLoader:
+    """loader 代理：记录 exec_module 耗时"""
+
+    def __init__(self, loader, profiler: "StartupProfiler"):
+        self._loader = loader
+        self._profiler = profiler
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module) -> None:
+        # 先恢复原始 loader，模块代码和后续的 importlib.resources 等都只看到原始 loader
+        spec = getattr(module, "__spec__", None)
+        if spec is not None and spec.loader is self:
+            spec.loader = self._loader
+        if getattr(module, "__loader__", None) is self:
+            module.__loader__ = self._loader
+
+        self._profiler._enter_import(module.__name__)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._exit_import()
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+
+class _ImportTimer:
+    """meta_path finder：委托给其余 finder 查找，再包装找到的 loader"""
+
+    def __init__(self, profiler: "StartupProfiler"):
+        self._profiler = profiler
+
+    def find_spec(self, fullname, path=None, target=None):
+        for finder in sys.meta_path:
+            if finder is self:
+                continue
+            find_spec = getattr(finder, "find_spec", None)
+            if find_spec is None:
+                continue
+            spec = find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                spec.loader = _TimedLoader(spec.loader, self._profiler)
+            return spec
+        return None
+
+
+class StartupProfiler:
+    """启动耗时分析器（默认关闭，关闭时所有方法都是空操作）"""
+
+    def __init__(self):
+        self.enabled = False
+        self._finder: Optional[_ImportTimer] = None
+        self._started = 0.0
+        # 导入栈：[模块名, 开始时间, 子模块耗时]
+        self._stack: List[List] = []
+        # 模块名 -> (累计耗时, 自身耗时)
+        self._imports: Dict[str, Tuple[float, float]] = {}
+        self._phases: List[Tuple[str, float]] = []
+
+    def enable(self) -> None:
+        """开启分析（安装导入计时 finder）"""
+        if self.enabled:
+            return
+        self.enabled = True
+        self._started = time.perf_counter()
+        self._finder = _ImportTimer(self)
+        sys.meta_path.insert(0, self._finder)
+
+    def disable(self) -> None:
+        """停止导入计时（已收集的数据保留）"""
+        if self._finder is not None and self._finder in sys.meta_path:
+            sys.meta_path.remove(self._finder)
+        self._finder = None
+
+    def _enter_import(self, name: str) -> None:
+        self._stack.append([name, time.perf_counter(), 0.0])
+
+    def _exit_import(self) -> None:
+        name, start, children = self._stack.pop()
+        elapsed = time.perf_counter() - start
+        self._imports[name] = (elapsed, elapsed - children)
+        if self._stack:
+            self._stack[-1][2] += elapsed
+
+    @contextmanager
+    def _timed_phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._phases.append((name, time.perf_counter() - start))
+
+    def phase(self, name: str):
+        """
+        初始化阶段计时
+
+        Args:
+            name: 阶段名称
+
+        Returns:
+            上下文管理器（未开启时为空操作）
+        """
+        if not self.enabled:
+            return nullcontext()
+        return self._timed_phase(name)
+
+    def report(self, top_n: int = 20, file: Optional[TextIO] = None) -> None:
+        """
+        输出启动耗时报告（默认输出到 stderr，不干扰 MCP stdio 协议）
+
+        Args:
+            top_n: 列出耗时最多的模块数
+            file: 输出目标
+        """
+        if not self.enabled:
+            return
+        self.disable()
+        out = file or sys.stderr
+
+        total = time.perf_counter() - self._started
+        # 各模块自身耗时之和即导入总耗时（避免嵌套重复计算）
+        import_total = sum(self_time for _, self_time in self._imports.values())
+
+        packages: Dict[str, List[float]] = defaultdict(lambda: [0.0, 0])
+        for name, (_, self_time) in self._imports.items():
+            package = packages[name.split(".", 1)[0]]
+            package[0] += self_time
+            package[1] += 1
+
+        print("=" * 60, file=out)
+        print("启动耗时分析", file=out)
+        print("=" * 60, file=out)
+        print(
+            f"总耗时: {total * 1000:.1f} ms（模块导入 {import_total * 1000:.1f} ms，"
+            f"共 {len(self._imports)} 个模块）",
+            file=out,
+        )
+
+        print("-" * 60, file=out)
+        print("按顶层包汇总（自身耗时之和）:", file=out)
+        for package, (self_time, count) in sorted(
+            packages.items(), key=lambda item: item[1][0], reverse=True
+        )[:top_n]:
+            print(f"  {package:<32} {self_time * 1000:>9.1f} ms  {count:>4} 个模块", file=out)
+
+        print("-" * 60, file=out)
+        print("耗时最多的模块（累计 / 自身）:", file=out)
+        for name, (cumulative, self_time) in sorted(
+            self._imports.items(), key=lambda item: item[1][0], reverse=True
+        )[:top_n]:
+            print(f"  {name:<40} {cumulative * 1000:>9.1f} / {self_time * 1000:>7.1f} ms", file=out)
+
+        if self._phases:
+            print("-" * 60, file=out)
+            print("初始化阶段（含阶段内触发的延迟导入）:", file=out)
+            for name, elapsed in self._phases:
+                print(f"  {name:<32} {elapsed * 1000:>9.1f} ms", file=out)
+        print("=" * 60, file=out)
+
+
+# 全局分析器实例
+startup_profiler = StartupProfiler()
+
+
+def enable_if_requested(argv: Optional[List[str]] = None) -> bool:
+    """
+    命令行包含 --profile-startup 时开启分析
+
+    需要在入口模块导入其他依赖之前调用，才能统计到全部导入耗时。
+
+    Returns:
+        是否已开启
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if PROFILE_FLAG in argv:
+        startup_profiler.enable()
+    return startup_profiler.enabled
@@ -10,6 +10,8 @@
 from pathlib import Path
 from typing import Dict, List, Optional, Callable
 
+from trendradar.report.html_assets import inline_assets, write_report_assets
+
 
 def prepare_report_data(
     stats: List[Dict],
@@ -163,6 +165,9 @@ def generate_html_report(
     2. 复制到 output/html/latest/{mode}.html（最新报告）
     3. 复制到 output/index.html 和根目录 index.html（入口）
 
+    快照和 latest 引用 output/html/assets/ 下带版本号的 CSS/JS 文件，
+    入口 index.html 需单独访问，仍内联 CSS/JS。
+
     Args:
         stats: 统计结果列表
         total_titles: 总标题数
@@ -202,35 +207,40 @@ def generate_html_report(
         load_frequency_words_func,
     )
 
-    # 渲染 HTML 内容
+    # 渲染 HTML 内容（快照和 latest 与 assets 目录同级，引用 ../assets/）
     if render_html_func:
+        write_report_assets(Path(output_dir) / "html" / "assets")
         html_content = render_html_func(
-            report_data, total_titles, mode, update_info
+            report_data, total_titles, mode, update_info, asset_prefix="../assets/"
         )
     else:
         # 默认简单 HTML
         html_content = f"<html><body><h1>Report</h1><pre>{report_data}</pre></body></html>"
 
+    linked_bytes = html_content.encode("utf-8")
+
     # 1. 保存时间戳快照（历史记录）
-    with open(snapshot_file, "w", encoding="utf-8") as f:
-        f.write(html_content)
+    with open(snapshot_file, "wb") as f:
+        f.write(linked_bytes)
 
     # 2. 复制到 html/latest/{mode}.html（最新报告）
     latest_dir = Path(output_dir) / "html" / "latest"
     latest_dir.mkdir(parents=True, exist_ok=True)
     latest_file = latest_dir / f"{mode}.html"
-    with open(latest_file, "w", encoding="utf-8") as f:
-        f.write(html_content)
+    with open(latest_file, "wb") as f:
+        f.write(linked_bytes)
+
+    # 3. 复制到 index.html（入口，内联 CSS/JS）
+    inline_bytes = inline_assets(html_content).encode("utf-8")
 
-    # 3. 复制到 index.html（入口）
     # output/index.html（供 Docker Volume 挂载访问）
     output_index = Path(output_dir) / "index.html"
-    with open(output_index, "w", encoding="utf-8") as f:
-        f.write(html_content)
+    with open(output_index, "wb") as f:
+        f.write(inline_bytes)
 
     # 根目录 index.html（供 GitHub Pages 访问）
     root_index = Path("index.html")
-    with open(root_index, "w", encoding="utf-8") as f:
-        f.write(html_content)
+    with open(root_index, "wb") as f:
+        f.write(inline_bytes)
 
     return snapshot_file
@@ -6,6 +6,7 @@
 """
 
 import re
+from functools import lru_cache
 from typing import List
 
 
@@ -25,8 +26,17 @@ def clean_title(title: str) -> str:
     """
     if not isinstance(title, str):
         title = str(title)
+    return _clean_title_cached(title)
+
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=8192)
+def _clean_title_cached(title: str) -> str:
+    """clean_title 的缓存实现（与渠道格式无关，各渠道推送共用）"""
     cleaned_title = title.replace("\n", " ").replace("\r", " ")
-    cleaned_title = re.sub(r"\s+", " ", cleaned_title)
+    cleaned_title = _WHITESPACE_RE.sub(" ", cleaned_title)
     cleaned_title = cleaned_title.strip()
     return cleaned_title
 
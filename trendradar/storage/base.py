@@ -5,31 +5,146 @@
 定义统一的存储接口，所有存储后端都需要实现这些方法
 """
 
+import sys
 from abc import ABC, abstractmethod
+from array import array
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Iterator, Sequence, Set, Tuple
+
+
+_RANK_MAX = 65535  # array('H') 可表示的最大排名
+
+
+def _intern(value):
+    """驻留重复度高的短字符串（来源ID、名称、时间等），多个条目共享同一对象"""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _rank_array(ranks) -> array:
+    """排名序列转为紧凑数组（超出 0~65535 时退化为有符号长整型）"""
+    values = [int(rank) for rank in ranks] if ranks else []
+    if values and (min(values) < 0 or max(values) > _RANK_MAX):
+        return array("l", values)
+    return array("H", values)
 
 
-@dataclass
 class NewsItem:
-    """新闻条目数据模型（热榜数据）"""
-
-    title: str                          # 新闻标题
-    source_id: str                      # 来源平台ID（如 toutiao, baidu）
-    source_name: str = ""               # 来源平台名称（运行时使用，数据库不存储）
-    rank: int = 0                       # 排名
-    url: str = ""                       # 链接 URL
-    mobile_url: str = ""                # 移动端 URL
-    crawl_time: str = ""                # 抓取时间（HH:MM 格式）
-
-    # 统计信息（用于分析）
-    ranks: List[int] = field(default_factory=list)  # 历史排名列表
-    first_time: str = ""                # 首次出现时间
-    last_time: str = ""                 # 最后出现时间
-    count: int = 1                      # 出现次数
-    rank_timeline: List[Dict[str, Any]] = field(default_factory=list)  # 完整排名时间线
-                                        # 格式: [{"time": "09:30", "rank": 1}, {"time": "10:00", "rank": 2}, ...]
-                                        # None 表示脱榜: [{"time": "11:00", "rank": None}]
+    """
+    新闻条目数据模型（热榜数据）
+
+    使用 __slots__ 存储以降低多日聚合时大量条目的内存占用：
+    - 来源ID/名称/时间等字段驻留（intern），相同取值共享同一字符串对象
+    - ranks 以 array('H') 存储
+    - rank_timeline 以并列的时间元组 + 排名数组存储（排名 0 表示脱榜）
+
+    ranks / rank_timeline 访问时返回 list / dict 列表（与旧版 dataclass 接口一致），
+    返回的是副本，修改后需重新赋值。
+    """
+
+    __slots__ = (
+        "title", "source_id", "source_name", "rank", "url", "mobile_url", "crawl_time",
+        "first_time", "last_time", "count",
+        "_ranks", "_timeline_times", "_timeline_ranks",
+    )
+
+    def __init__(
+        self,
+        title: str,
+        source_id: str,
+        source_name: str = "",
+        rank: int = 0,
+        url: str = "",
+        mobile_url: str = "",
+        crawl_time: str = "",
+        ranks: Optional[Sequence[int]] = None,
+        first_time: str = "",
+        last_time: str = "",
+        count: int = 1,
+        rank_timeline: Optional[Sequence[Any]] = None,
+    ):
+        """
+        Args:
+            title: 新闻标题
+            source_id: 来源平台ID（如 toutiao, baidu）
+            source_name: 来源平台名称（运行时使用，数据库不存储）
+            rank: 排名
+            url: 链接 URL
+            mobile_url: 移动端 URL
+            crawl_time: 抓取时间（HH:MM 格式）
+            ranks: 历史排名列表
+            first_time: 首次出现时间
+            last_time: 最后出现时间
+            count: 出现次数
+            rank_timeline: 完整排名时间线
+                格式: [{"time": "09:30", "rank": 1}, {"time": "10:00", "rank": 2}, ...]
+                None 表示脱榜: [{"time": "11:00", "rank": None}]
+                也接受 (时间, 排名) 元组
+        """
+        self.title = title
+        self.source_id = _intern(source_id)
+        self.source_name = _intern(source_name)
+        self.rank = rank
+        self.url = url
+        self.mobile_url = mobile_url
+        self.crawl_time = _intern(crawl_time)
+        self.first_time = _intern(first_time)
+        self.last_time = _intern(last_time)
+        self.count = count
+        self.ranks = ranks
+        self.rank_timeline = rank_timeline
+
+    @property
+    def ranks(self) -> List[int]:
+        """历史排名列表"""
+        return self._ranks.tolist()
+
+    @ranks.setter
+    def ranks(self, value: Optional[Sequence[int]]) -> None:
+        self._ranks = _rank_array(value)
+
+    @property
+    def rank_timeline(self) -> List[Dict[str, Any]]:
+        """完整排名时间线（{"time", "rank"} 字典列表）"""
+        return [{"time": time_str, "rank": rank} for time_str, rank in self.timeline_pairs]
+
+    @rank_timeline.setter
+    def rank_timeline(self, value: Optional[Sequence[Any]]) -> None:
+        if not value:
+            self._timeline_times = ()
+            self._timeline_ranks = None
+            return
+        times = []
+        ranks = []
+        for point in value:
+            if isinstance(point, dict):
+                time_str, rank = point.get("time", ""), point.get("rank")
+            else:
+                time_str, rank = point
+            times.append(_intern(time_str))
+            ranks.append(rank or 0)
+        self._timeline_times = tuple(times)
+        self._timeline_ranks = _rank_array(ranks)
+
+    @property
+    def timeline_pairs(self) -> List[Tuple[str, Optional[int]]]:
+        """完整排名时间线（(时间, 排名) 元组列表，脱榜排名为 None）"""
+        if self._timeline_ranks is None:
+            return []
+        return [
+            (time_str, rank or None)
+            for time_str, rank in zip(self._timeline_times, self._timeline_ranks)
+        ]
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{key}={value!r}" for key, value in self.to_dict().items())
+        return f"NewsItem({fields})"
 
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典"""
@@ -67,23 +182,68 @@ class NewsItem:
         )
 
 
-@dataclass
 class RSSItem:
-    """RSS 条目数据模型"""
-
-    title: str                          # 标题
-    feed_id: str                        # RSS 源 ID（如 "hacker-news"）
-    feed_name: str = ""                 # RSS 源名称（运行时使用）
-    url: str = ""                       # 文章链接
-    published_at: str = ""              # RSS 发布时间（ISO 格式）
-    summary: str = ""                   # 摘要/描述
-    author: str = ""                    # 作者
-    crawl_time: str = ""                # 抓取时间（HH:MM 格式）
-
-    # 统计信息
-    first_time: str = ""                # 首次抓取时间
-    last_time: str = ""                 # 最后抓取时间
-    count: int = 1                      # 抓取次数
+    """
+    RSS 条目数据模型
+
+    使用 __slots__ 存储，源ID/名称/作者/时间等重复度高的字段驻留（intern）。
+    """
+
+    __slots__ = (
+        "title", "feed_id", "feed_name", "url", "published_at", "summary", "author",
+        "crawl_time", "first_time", "last_time", "count",
+    )
+
+    def __init__(
+        self,
+        title: str,
+        feed_id: str,
+        feed_name: str = "",
+        url: str = "",
+        published_at: str = "",
+        summary: str = "",
+        author: str = "",
+        crawl_time: str = "",
+        first_time: str = "",
+        last_time: str = "",
+        count: int = 1,
+    ):
+        """
+        Args:
+            title: 标题
+            feed_id: RSS 源 ID（如 "hacker-news"）
+            feed_name: RSS 源名称（运行时使用）
+            url: 文章链接
+            published_at: RSS 发布时间（ISO 格式）
+            summary: 摘要/描述
+            author: 作者
+            crawl_time: 抓取时间（HH:MM 格式）
+            first_time: 首次抓取时间
+            last_time: 最后抓取时间
+            count: 抓取次数
+        """
+        self.title = title
+        self.feed_id = _intern(feed_id)
+        self.feed_name = _intern(feed_name)
+        self.url = url
+        self.published_at = published_at
+        self.summary = summary
+        self.author = _intern(author)
+        self.crawl_time = _intern(crawl_time)
+        self.first_time = _intern(first_time)
+        self.last_time = _intern(last_time)
+        self.count = count
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{key}={value!r}" for key, value in self.to_dict().items())
+        return f"RSSItem({fields})"
 
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典"""
@@ -332,6 +492,31 @@ class StorageBackend(ABC):
         """
         pass
 
+    def iter_today_news(self, date: Optional[str] = None) -> Iterator[Tuple]:
+        """
+        流式读取指定日期的所有新闻（按平台、最后抓取时间排序）
+
+        默认基于 get_today_all_data 实现；SQLite 后端直接从单次 JOIN 游标产出。
+
+        Args:
+            date: 日期字符串（YYYY-MM-DD），默认为今天
+
+        Yields:
+            (platform_id, platform_name, title, rank, url, mobile_url,
+             first_time, last_time, count, ranks, rank_timeline)
+            rank_timeline 为 (HH:MM, 排名) 元组列表，脱榜排名为 None
+        """
+        data = self.get_today_all_data(date)
+        if not data:
+            return
+        for source_id, news_list in data.items.items():
+            source_name = data.id_to_name.get(source_id, source_id)
+            for item in news_list:
+                yield (
+                    source_id, source_name, item.title, item.rank, item.url, item.mobile_url,
+                    item.first_time, item.last_time, item.count, item.ranks, item.timeline_pairs,
+                )
+
     @abstractmethod
     def get_latest_crawl_data(self, date: Optional[str] = None) -> Optional[NewsData]:
         """
@@ -358,6 +543,24 @@ class StorageBackend(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_historical_titles(
+        self,
+        current_data: NewsData,
+        platform_ids: Optional[List[str]] = None,
+    ) -> Optional[Tuple[bool, Set[Tuple[str, str]]]]:
+        """
+        查询当前批次中已在更早批次出现过的标题
+
+        Args:
+            current_data: 当前批次数据
+            platform_ids: 只考虑这些平台（None 表示全部平台）
+
+        Returns:
+            (是否存在任何历史条目, {(source_id, title)} 历史标题集合)，失败返回 None
+        """
+        pass
+
     @abstractmethod
     def save_txt_snapshot(self, data: NewsData) -> Optional[str]:
         """
@@ -0,0 +1,395 @@
+# coding=utf-8
+"""
+远程存储增量同步
+
+每次抓取不再上传当天完整的 SQLite 文件，而是只上传一个增量段（segment）：
+本次连接中新增/修改/删除的行（按 rowid 记录的完整行内容）。
+
+- 变更跟踪：在连接上创建 TEMP 触发器，把每张表的 INSERT/UPDATE/DELETE 记录到
+  temp._sync_changes（只存表名和 rowid），不修改数据库文件本身
+- 增量段：gzip 压缩的 JSON，包含每张表的列名、变更行（含 rowid）、删除的 rowid，
+  以及变更行引用的父表行的自然键（refs）
+- 回放：不同写入方各自分配 rowid，同一个 rowid 在两边可能是不同的行，因此已知的表按自然键合并：
+  news_items / rss_items 按 (url, 平台/源)，抓取记录按 crawl_time，推送记录按 date 定位目标行
+  （存在则更新，否则插入新行）；rank_history / title_changes / 抓取状态表中的外键
+  经自然键换算为目标库中的 id 后再写入；platforms 等以主键为标识的表按主键覆盖。
+  只有未登记的表仍按 rowid INSERT OR REPLACE / DELETE 回放
+
+远程对象布局：
+    news/2025-12-28.db                     完整数据库（base，元数据 last-segment 记录已合并到的段）
+    news/2025-12-28.segments/<序号>.seg     base 之后的增量段（按对象键排序回放）
+"""
+
+import base64
+import gzip
+import json
+import sqlite3
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+SEGMENT_FORMAT = "trendradar-segment"
+SEGMENT_VERSION = 1
+
+_CHANGES_TABLE = "temp._sync_changes"
+_TRIGGER_PREFIX = "_sync_track_"
+
+# 表的自然键（与 schema.sql / rss_schema.sql 中的唯一约束一致）；
+# 自然键取值为空（如 URL 为空的新闻）时无法定位，按新行插入
+_NATURAL_KEYS: Dict[str, Tuple[str, ...]] = {
+    "news_items": ("url", "platform_id"),
+    "rss_items": ("url", "feed_id"),
+    "crawl_records": ("crawl_time",),
+    "rss_crawl_records": ("crawl_time",),
+    "push_records": ("date",),
+    "rss_push_records": ("date",),
+}
+
+# 引用其他表 rowid 的外键列：{表: {列: 父表}}
+_REFERENCES: Dict[str, Dict[str, str]] = {
+    "title_changes": {"news_item_id": "news_items"},
+    "rank_history": {"news_item_id": "news_items"},
+    "crawl_source_status": {"crawl_record_id": "crawl_records"},
+    "rss_crawl_status": {"crawl_record_id": "rss_crawl_records"},
+}
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _user_tables(conn: sqlite3.Connection) -> List[str]:
+    rows = conn.execute(
+        "SELECT name FROM main.sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'"
+    ).fetchall()
+    return [row[0] for row in rows]
+
+
+def _table_columns(conn: sqlite3.Connection, table: str) -> Tuple[List[str], Optional[str], List[str]]:
+    """
+    获取表的列名、INTEGER PRIMARY KEY 列（即 rowid 别名列，没有时为 None）和主键列
+    """
+    info = conn.execute(f"PRAGMA main.table_info({_quote(table)})").fetchall()
+    columns = [row[1] for row in info]
+    pk_columns = [row[1] for row in sorted(info, key=lambda r: r[5]) if row[5]]
+    rowid_alias = None
+    if len(pk_columns) == 1:
+        pk_type = next(row[2] for row in info if row[1] == pk_columns[0])
+        if (pk_type or "").upper() == "INTEGER":
+            rowid_alias = pk_columns[0]
+    return columns, rowid_alias, pk_columns
+
+
+def install_change_tracking(conn: sqlite3.Connection) -> None:
+    """
+    在连接上安装变更跟踪触发器（TEMP，只对当前连接生效）
+
+    需在表结构初始化之后调用；重复调用会为新出现的表补装触发器。
+
+    Args:
+        conn: 数据库连接
+    """
+    conn.execute(f"""
+        CREATE TABLE IF NOT EXISTS {_CHANGES_TABLE} (
+            tbl TEXT NOT NULL,
+            row_id INTEGER NOT NULL,
+            deleted INTEGER NOT NULL,
+            PRIMARY KEY (tbl, row_id)
+        ) WITHOUT ROWID
+    """)
+
+    # 触发器内使用 UPSERT：INSERT OR REPLACE 会被外层语句的冲突策略覆盖
+    record = (
+        "INSERT INTO _sync_changes (tbl, row_id, deleted) VALUES ({table}, {row_id}, {deleted}) "
+        "ON CONFLICT (tbl, row_id) DO UPDATE SET deleted = excluded.deleted"
+    )
+    for table in _user_tables(conn):
+        literal = "'" + table.replace("'", "''") + "'"
+        for event, row_id, deleted in (
+            ("INSERT", "NEW.rowid", 0),
+            ("UPDATE", "NEW.rowid", 0),
+            ("DELETE", "OLD.rowid", 1),
+        ):
+            trigger = _quote(f"{_TRIGGER_PREFIX}{table}_{event.lower()}")
+            statement = record.format(table=literal, row_id=row_id, deleted=deleted)
+            conn.execute(
+                f"CREATE TEMP TRIGGER IF NOT EXISTS {trigger} AFTER {event} ON main.{_quote(table)} "
+                f"BEGIN {statement}; END"
+            )
+
+
+def clear_changes(conn: sqlite3.Connection) -> None:
+    """清空已记录的变更（增量段上传成功后调用）"""
+    try:
+        conn.execute(f"DELETE FROM {_CHANGES_TABLE}")
+        conn.commit()
+    except sqlite3.OperationalError:
+        pass
+
+
+def _encode_value(value):
+    if isinstance(value, bytes):
+        return {"b64": base64.b64encode(value).decode("ascii")}
+    return value
+
+
+def _decode_value(value):
+    if isinstance(value, dict):
+        return base64.b64decode(value["b64"])
+    return value
+
+
+def _select_by_rowid(conn: sqlite3.Connection, table: str, columns: Sequence[str], row_ids: Sequence[int]):
+    """按 rowid 分批查询（SQLite 绑定参数数量有上限），逐行产出 (rowid, 列值...)"""
+    select_columns = ", ".join(_quote(c) for c in columns)
+    for start in range(0, len(row_ids), 500):
+        batch = row_ids[start:start + 500]
+        placeholders = ",".join("?" * len(batch))
+        yield from conn.execute(
+            f"SELECT rowid, {select_columns} FROM main.{_quote(table)} WHERE rowid IN ({placeholders})",
+            batch,
+        )
+
+
+def build_segment(conn: sqlite3.Connection, meta: Optional[Dict] = None) -> Optional[bytes]:
+    """
+    把已记录的变更打包成增量段
+
+    Args:
+        conn: 已安装变更跟踪的数据库连接
+        meta: 附加到段头部的信息（如日期、数据库类型）
+
+    Returns:
+        gzip 压缩后的增量段，没有变更时返回 None
+    """
+    changes: Dict[str, Tuple[List[int], List[int]]] = {}
+    for table, row_id, deleted in conn.execute(
+        f"SELECT tbl, row_id, deleted FROM {_CHANGES_TABLE} ORDER BY tbl, row_id"
+    ):
+        upserts, deletes = changes.setdefault(table, ([], []))
+        (deletes if deleted else upserts).append(row_id)
+
+    if not changes:
+        return None
+
+    existing_tables = set(_user_tables(conn))
+    tables = {}
+    referenced: Dict[str, set] = {}
+    row_count = 0
+    for table, (upserts, deletes) in changes.items():
+        if table not in existing_tables:
+            continue
+        columns, rowid_alias, _ = _table_columns(conn, table)
+
+        rows = []
+        found = set()
+        for row in _select_by_rowid(conn, table, columns, upserts):
+            found.add(row[0])
+            rows.append([_encode_value(v) for v in row])
+
+        # 记录外键引用的父表行，回放时经自然键换算为目标库中的 id
+        for column, parent in _REFERENCES.get(table, {}).items():
+            if column in columns:
+                index = columns.index(column) + 1
+                referenced.setdefault(parent, set()).update(
+                    row[index] for row in rows if row[index] is not None
+                )
+
+        # INSERT OR REPLACE 冲突时删除旧行不会触发 DELETE 触发器，
+        # 记录为变更但已不存在的行按删除处理
+        deletes = sorted(set(deletes) | (set(upserts) - found))
+
+        tables[table] = {
+            "columns": columns,
+            "rowid_alias": rowid_alias is not None,
+            "rows": rows,
+            "deleted": deletes,
+        }
+        row_count += len(rows) + len(deletes)
+
+    refs: Dict[str, Dict[str, list]] = {}
+    for parent, row_ids in referenced.items():
+        key_columns = _NATURAL_KEYS.get(parent)
+        if parent not in existing_tables or not key_columns:
+            continue
+        refs[parent] = {
+            str(row[0]): [_encode_value(v) for v in row[1:]]
+            for row in _select_by_rowid(conn, parent, key_columns, sorted(row_ids))
+        }
+
+    payload = {
+        "format": SEGMENT_FORMAT,
+        "version": SEGMENT_VERSION,
+        "rows": row_count,
+        "meta": meta or {},
+        "tables": tables,
+        "refs": refs,
+    }
+    raw = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return gzip.compress(raw, compresslevel=6)
+
+
+def _find_by_natural_key(conn: sqlite3.Connection, table: str, values: Sequence) -> Optional[int]:
+    """按自然键查找目标库中的行，返回 rowid（找不到或自然键为空时返回 None）"""
+    key_columns = _NATURAL_KEYS[table]
+    if any(value is None or value == "" for value in values):
+        return None
+    # 显式带上 != '' 条件，才能命中 idx_news_url_platform 这类部分唯一索引
+    condition = " AND ".join(f"{_quote(c)} = ? AND {_quote(c)} != ''" for c in key_columns)
+    row = conn.execute(
+        f"SELECT rowid FROM main.{_quote(table)} WHERE {condition} LIMIT 1", list(values)
+    ).fetchone()
+    return row[0] if row else None
+
+
+class _IdMapper:
+    """把写入方的 rowid 换算为目标库中的 rowid（同一增量段内共享）"""
+
+    def __init__(self, conn: sqlite3.Connection, refs: Dict[str, Dict[str, list]]):
+        self._conn = conn
+        self._refs = refs
+        self._mapped: Dict[str, Dict[int, int]] = {}
+
+    def record(self, table: str, source_id: int, target_id: int) -> None:
+        self._mapped.setdefault(table, {})[source_id] = target_id
+
+    def resolve(self, table: str, source_id: int) -> Optional[int]:
+        mapped = self._mapped.get(table, {}).get(source_id)
+        if mapped is not None:
+            return mapped
+        key = self._refs.get(table, {}).get(str(source_id))
+        if key is None or table not in _NATURAL_KEYS:
+            return None
+        target_id = _find_by_natural_key(self._conn, table, [_decode_value(v) for v in key])
+        if target_id is not None:
+            self.record(table, source_id, target_id)
+        return target_id
+
+
+def _apply_rowid(conn: sqlite3.Connection, table: str, section: Dict, target_set: set) -> int:
+    """按 rowid 回放（未登记自然键、也没有主键的表）"""
+    source_columns: Sequence[str] = section["columns"]
+
+    # 行数据第 0 列为 rowid；有 rowid 别名列时由别名列携带 rowid
+    keep = [i for i, c in enumerate(source_columns) if c in target_set]
+    insert_columns = [_quote(source_columns[i]) for i in keep]
+    offset = 1
+    if not section.get("rowid_alias"):
+        insert_columns.insert(0, "rowid")
+        keep = [-1] + keep
+
+    quoted = _quote(table)
+    deleted = section.get("deleted") or []
+    if deleted:
+        conn.executemany(
+            f"DELETE FROM main.{quoted} WHERE rowid = ?", [(row_id,) for row_id in deleted]
+        )
+
+    rows = section.get("rows") or []
+    if rows and insert_columns:
+        placeholders = ",".join("?" * len(insert_columns))
+        conn.executemany(
+            f"INSERT OR REPLACE INTO main.{quoted} ({', '.join(insert_columns)}) VALUES ({placeholders})",
+            [
+                [_decode_value(row[i + offset]) for i in keep]
+                for row in rows
+            ],
+        )
+    return len(rows) + len(deleted)
+
+
+def _apply_merged(
+    conn: sqlite3.Connection,
+    table: str,
+    section: Dict,
+    target_columns: List[str],
+    rowid_alias: Optional[str],
+    mapper: _IdMapper,
+) -> int:
+    """
+    按自然键 / 主键合并回放
+
+    写入方的 rowid 不写入目标库：有自然键的表定位到已有行后更新，否则插入新行；
+    外键列换算为目标库中的 id，父行无法定位的行跳过。
+    删除记录不回放——这些表中的删除只来自同键行的替换，新行回放时会覆盖同键的旧行。
+    """
+    source_columns: Sequence[str] = section["columns"]
+    target_set = set(target_columns)
+    columns = [c for c in source_columns if c in target_set and c != rowid_alias]
+    if not columns:
+        return 0
+
+    quoted = _quote(table)
+    key_columns = _NATURAL_KEYS.get(table)
+    references = {
+        column: parent for column, parent in _REFERENCES.get(table, {}).items() if column in columns
+    }
+    assignments = ", ".join(f"{_quote(c)} = ?" for c in columns)
+    insert_sql = (
+        f"INSERT OR REPLACE INTO main.{quoted} ({', '.join(_quote(c) for c in columns)}) "
+        f"VALUES ({','.join('?' * len(columns))})"
+    )
+
+    applied = 0
+    for row in section.get("rows") or []:
+        values = dict(zip(source_columns, (_decode_value(v) for v in row[1:])))
+
+        resolved = True
+        for column, parent in references.items():
+            if values[column] is None:
+                continue
+            target_id = mapper.resolve(parent, values[column])
+            if target_id is None:
+                resolved = False
+                break
+            values[column] = target_id
+        if not resolved:
+            continue
+
+        params = [values[c] for c in columns]
+        target_id = None
+        if key_columns and all(c in values for c in key_columns):
+            target_id = _find_by_natural_key(conn, table, [values[c] for c in key_columns])
+        if target_id is not None:
+            conn.execute(f"UPDATE main.{quoted} SET {assignments} WHERE rowid = ?", params + [target_id])
+        else:
+            target_id = conn.execute(insert_sql, params).lastrowid
+        mapper.record(table, row[0], target_id)
+        applied += 1
+    return applied
+
+
+def apply_segment(conn: sqlite3.Connection, segment: bytes) -> int:
+    """
+    回放增量段
+
+    父表（news_items、抓取记录等）先于引用它们的表回放，以便换算外键。
+    目标库缺少的表或列会被忽略（写入方版本较新时仍能回放已知的部分）。
+    不负责提交事务，由调用方统一 commit。
+
+    Args:
+        conn: 目标数据库连接（表结构应已初始化）
+        segment: build_segment 生成的增量段
+
+    Returns:
+        回放的行数（含删除）
+
+    Raises:
+        ValueError: 增量段格式无法识别
+    """
+    payload = json.loads(gzip.decompress(segment).decode("utf-8"))
+    if payload.get("format") != SEGMENT_FORMAT or payload.get("version") != SEGMENT_VERSION:
+        raise ValueError("无法识别的增量段格式")
+
+    existing_tables = set(_user_tables(conn))
+    mapper = _IdMapper(conn, payload.get("refs") or {})
+    applied = 0
+    for table in sorted(payload["tables"], key=lambda name: name in _REFERENCES):
+        if table not in existing_tables:
+            continue
+        section = payload["tables"][table]
+        target_columns, rowid_alias, pk_columns = _table_columns(conn, table)
+        if table in _NATURAL_KEYS or table in _REFERENCES or (pk_columns and rowid_alias is None):
+            applied += _apply_merged(conn, table, section, target_columns, rowid_alias, mapper)
+        else:
+            applied += _apply_rowid(conn, table, section, set(target_columns))
+    return applied
@@ -11,7 +11,7 @@ import pytz
 import re
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
 from trendradar.storage.base import StorageBackend, NewsItem, NewsData, RSSItem, RSSData
 from trendradar.storage.sqlite_mixin import SQLiteStorageMixin
@@ -38,6 +38,7 @@ class LocalStorageBackend(SQLiteStorageMixin, StorageBackend):
         enable_txt: bool = True,
         enable_html: bool = True,
         timezone: str = "Asia/Shanghai",
+        sqlite_profile: Optional[Dict] = None,
     ):
         """
         初始化本地存储后端
@@ -47,11 +48,13 @@ class LocalStorageBackend(SQLiteStorageMixin, StorageBackend):
             enable_txt: 是否启用 TXT 快照
             enable_html: 是否启用 HTML 报告
             timezone: 时区配置（默认 Asia/Shanghai）
+            sqlite_profile: SQLite 连接参数（缺省项使用 DEFAULT_SQLITE_PROFILE）
         """
         self.data_dir = Path(data_dir)
         self.enable_txt = enable_txt
         self.enable_html = enable_html
         self.timezone = timezone
+        self.sqlite_profile = sqlite_profile or {}
         self._db_connections: Dict[str, sqlite3.Connection] = {}
 
     @property
@@ -114,6 +117,7 @@ class LocalStorageBackend(SQLiteStorageMixin, StorageBackend):
         if db_path not in self._db_connections:
             conn = sqlite3.connect(db_path)
             conn.row_factory = sqlite3.Row
+            self._apply_connection_profile(conn, self.sqlite_profile)
             self._init_tables(conn, db_type)
             self._db_connections[db_path] = conn
 
@@ -153,6 +157,12 @@ class LocalStorageBackend(SQLiteStorageMixin, StorageBackend):
             return None
         return self._get_today_all_data_impl(date)
 
+    def iter_today_news(self, date: Optional[str] = None) -> Iterator[Tuple]:
+        """流式读取指定日期的所有新闻"""
+        if not self._get_db_path(date).exists():
+            return iter(())
+        return self._iter_today_news_impl(date)
+
     def get_latest_crawl_data(self, date: Optional[str] = None) -> Optional[NewsData]:
         """获取最新一次抓取的数据"""
         db_path = self._get_db_path(date)
@@ -164,6 +174,14 @@ class LocalStorageBackend(SQLiteStorageMixin, StorageBackend):
         """检测新增的标题"""
         return self._detect_new_titles_impl(current_data)
 
+    def get_historical_titles(
+        self,
+        current_data: NewsData,
+        platform_ids: Optional[List[str]] = None,
+    ) -> Optional[Tuple[bool, Set[Tuple[str, str]]]]:
+        """查询当前批次中已在更早批次出现过的标题"""
+        return self._get_historical_titles_impl(current_data, platform_ids)
+
     def is_first_crawl_today(self, date: Optional[str] = None) -> bool:
         """检查是否是当天第一次抓取"""
         db_path = self._get_db_path(date)
@@ -406,9 +424,12 @@ class LocalStorageBackend(SQLiteStorageMixin, StorageBackend):
                             except Exception:
                                 pass
 
-                        # 删除文件
+                        # 删除文件（包括 WAL 模式的 -wal / -shm 文件和列式汇总文件）
                         try:
                             db_file.unlink()
+                            for suffix in ("-wal", "-shm"):
+                                Path(db_path + suffix).unlink(missing_ok=True)
+                            db_file.with_suffix(".rollup").unlink(missing_ok=True)
                             deleted_count += 1
                             print(f"[本地存储] 清理过期数据: {db_type}/{db_file.name}")
                         except Exception as e:
@@ -6,7 +6,7 @@
 """
 
 import os
-from typing import Optional
+from typing import Iterator, List, Optional, Set, Tuple
 
 from trendradar.storage.base import StorageBackend, NewsData, RSSData
 
@@ -37,7 +37,9 @@ class StorageManager:
         remote_retention_days: int = 0,
         pull_enabled: bool = False,
         pull_days: int = 0,
+        pull_workers: int = 8,
         timezone: str = "Asia/Shanghai",
+        sqlite_profile: Optional[dict] = None,
     ):
         """
         初始化存储管理器
@@ -52,7 +54,9 @@ class StorageManager:
             remote_retention_days: 远程数据保留天数（0 = 无限制）
             pull_enabled: 是否启用启动时自动拉取
             pull_days: 拉取最近 N 天的数据
+            pull_workers: 拉取时的并行下载数
             timezone: 时区配置（默认 Asia/Shanghai）
+            sqlite_profile: 本地 SQLite 连接参数（journal_mode、synchronous 等）
         """
         self.backend_type = backend_type
         self.data_dir = data_dir
@@ -61,12 +65,17 @@ class StorageManager:
         self.remote_config = remote_config or {}
         self.local_retention_days = local_retention_days
         self.remote_retention_days = remote_retention_days
+        self._segments_compacted_date: Optional[str] = None
         self.pull_enabled = pull_enabled
         self.pull_days = pull_days
+        self.pull_workers = pull_workers
         self.timezone = timezone
+        self.sqlite_profile = sqlite_profile
 
         self._backend: Optional[StorageBackend] = None
         self._remote_backend: Optional[StorageBackend] = None
+        # 新闻数据写入次数（运行期数据快照据此判断是否失效）
+        self.news_data_version = 0
 
     @staticmethod
     def is_github_actions() -> bool:
@@ -137,6 +146,8 @@ class StorageManager:
                 enable_txt=self.enable_txt,
                 enable_html=self.enable_html,
                 timezone=self.timezone,
+                delta_sync=self.remote_config.get("delta_sync", True),
+                compact_segments=self.remote_config.get("compact_segments", 12),
             )
         except ImportError as e:
             print(f"[存储管理器] 远程后端导入失败: {e}")
@@ -167,6 +178,7 @@ class StorageManager:
                     enable_txt=self.enable_txt,
                     enable_html=self.enable_html,
                     timezone=self.timezone,
+                    sqlite_profile=self.sqlite_profile,
                 )
                 print(f"[存储管理器] 使用本地存储后端 (数据目录: {self.data_dir})")
 
@@ -195,11 +207,14 @@ class StorageManager:
             return 0
 
         # 调用拉取方法
-        return self._remote_backend.pull_recent_days(self.pull_days, self.data_dir)
+        return self._remote_backend.pull_recent_days(self.pull_days, self.data_dir, self.pull_workers)
 
     def save_news_data(self, data: NewsData) -> bool:
         """保存新闻数据"""
-        return self.get_backend().save_news_data(data)
+        try:
+            return self.get_backend().save_news_data(data)
+        finally:
+            self.news_data_version += 1
 
     def save_rss_data(self, data: RSSData) -> bool:
         """保存 RSS 数据"""
@@ -221,6 +236,10 @@ class StorageManager:
         """获取当天所有数据"""
         return self.get_backend().get_today_all_data(date)
 
+    def iter_today_news(self, date: Optional[str] = None) -> Iterator[Tuple]:
+        """流式读取当天所有新闻"""
+        return self.get_backend().iter_today_news(date)
+
     def get_latest_crawl_data(self, date: Optional[str] = None) -> Optional[NewsData]:
         """获取最新抓取数据"""
         return self.get_backend().get_latest_crawl_data(date)
@@ -229,6 +248,14 @@ class StorageManager:
         """检测新增标题"""
         return self.get_backend().detect_new_titles(current_data)
 
+    def get_historical_titles(
+        self,
+        current_data: NewsData,
+        platform_ids: Optional[List[str]] = None,
+    ) -> Optional[Tuple[bool, Set[Tuple[str, str]]]]:
+        """查询当前批次中已在更早批次出现过的标题"""
+        return self.get_backend().get_historical_titles(current_data, platform_ids)
+
     def save_txt_snapshot(self, data: NewsData) -> Optional[str]:
         """保存 TXT 快照"""
         return self.get_backend().save_txt_snapshot(data)
@@ -261,6 +288,14 @@ class StorageManager:
         if self.local_retention_days > 0:
             total_deleted += self.get_backend().cleanup_old_data(self.local_retention_days)
 
+        # 合并之前日期遗留的增量段（每天只检查一次）
+        backend = self.get_backend()
+        if getattr(backend, "delta_sync", False) and hasattr(backend, "compact_stale_segments"):
+            today = backend._format_date_folder()
+            if self._segments_compacted_date != today:
+                backend.compact_stale_segments()
+                self._segments_compacted_date = today
+
         # 清理远程数据（如果配置了）
         if self.remote_retention_days > 0 and self._has_remote_config():
             if self._remote_backend is None:
@@ -343,7 +378,9 @@ def get_storage_manager(
     remote_retention_days: int = 0,
     pull_enabled: bool = False,
     pull_days: int = 0,
+    pull_workers: int = 8,
     timezone: str = "Asia/Shanghai",
+    sqlite_profile: Optional[dict] = None,
     force_new: bool = False,
 ) -> StorageManager:
     """
@@ -359,7 +396,9 @@ def get_storage_manager(
         remote_retention_days: 远程数据保留天数（0 = 无限制）
         pull_enabled: 是否启用启动时自动拉取
         pull_days: 拉取最近 N 天的数据
+        pull_workers: 拉取时的并行下载数
         timezone: 时区配置（默认 Asia/Shanghai）
+        sqlite_profile: 本地 SQLite 连接参数
         force_new: 是否强制创建新实例
 
     Returns:
@@ -378,7 +417,9 @@ def get_storage_manager(
             remote_retention_days=remote_retention_days,
             pull_enabled=pull_enabled,
             pull_days=pull_days,
+            pull_workers=pull_workers,
             timezone=timezone,
+            sqlite_profile=sqlite_profile,
         )
 
     return _storage_manager
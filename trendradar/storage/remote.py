@@ -7,29 +7,33 @@
 数据流程：下载当天 SQLite → 合并新数据 → 上传回远程
 """
 
+import importlib.util
 import pytz
 import re
 import shutil
 import sys
 import tempfile
+import time
+import uuid
 import sqlite3
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
-
-try:
-    import boto3
-    from botocore.config import Config as BotoConfig
-    from botocore.exceptions import ClientError
-    HAS_BOTO3 = True
-except ImportError:
-    HAS_BOTO3 = False
-    boto3 = None
-    BotoConfig = None
-    ClientError = Exception
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+# boto3 导入较慢，只在创建远程后端时导入（见 _import_boto3）
+HAS_BOTO3 = importlib.util.find_spec("boto3") is not None
+boto3 = None
+BotoConfig = None
+ClientError = Exception
 
 from trendradar.storage.base import StorageBackend, NewsItem, NewsData, RSSItem, RSSData
 from trendradar.storage.sqlite_mixin import SQLiteStorageMixin
+from trendradar.storage.delta_sync import (
+    apply_segment,
+    build_segment,
+    clear_changes,
+    install_change_tracking,
+)
 from trendradar.utils.time import (
     get_configured_time,
     format_date_folder,
@@ -37,6 +41,18 @@ from trendradar.utils.time import (
 )
 
 
+def _import_boto3() -> None:
+    """导入 boto3 并替换模块级占位符"""
+    global boto3, BotoConfig, ClientError
+    if boto3 is not None:
+        return
+    import boto3 as _boto3
+    from botocore.config import Config as _BotoConfig
+    from botocore.exceptions import ClientError as _ClientError
+
+    boto3, BotoConfig, ClientError = _boto3, _BotoConfig, _ClientError
+
+
 class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
     """
     远程云存储后端（S3 兼容协议）
@@ -45,7 +61,7 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
     - 使用 S3 兼容 API 访问远程存储
     - 支持 Cloudflare R2、阿里云 OSS、腾讯云 COS、AWS S3、MinIO 等
     - 下载 SQLite 到临时目录进行操作
-    - 支持数据合并和上传
+    - 支持数据合并和上传（增量同步模式下每次只上传变更段，定期合并为完整数据库）
     - 支持从远程拉取历史数据到本地
     - 运行结束后自动清理临时文件
     """
@@ -61,6 +77,8 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
         enable_html: bool = True,
         temp_dir: Optional[str] = None,
         timezone: str = "Asia/Shanghai",
+        delta_sync: bool = True,
+        compact_segments: int = 12,
     ):
         """
         初始化远程存储后端
@@ -75,9 +93,12 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
             enable_html: 是否启用 HTML 报告
             temp_dir: 临时目录路径（默认使用系统临时目录）
             timezone: 时区配置（默认 Asia/Shanghai）
+            delta_sync: 是否启用增量同步（每次只上传变更段，而非整个数据库）
+            compact_segments: 累计多少个变更段后合并回完整数据库
         """
         if not HAS_BOTO3:
             raise ImportError("远程存储后端需要安装 boto3: pip install boto3")
+        _import_boto3()
 
         self.bucket_name = bucket_name
         self.endpoint_url = endpoint_url
@@ -85,6 +106,8 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
         self.enable_txt = enable_txt
         self.enable_html = enable_html
         self.timezone = timezone
+        self.delta_sync = delta_sync
+        self.compact_segments = max(1, int(compact_segments or 1))
 
         # 创建临时目录
         self.temp_dir = Path(temp_dir) if temp_dir else Path(tempfile.mkdtemp(prefix="trendradar_"))
@@ -118,6 +141,10 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
         self._downloaded_files: List[Path] = []
         self._db_connections: Dict[str, sqlite3.Connection] = {}
 
+        # 增量同步状态（按本地数据库路径）：远程是否已有完整数据库、已合并到本地的变更段
+        self._base_exists: Dict[str, bool] = {}
+        self._known_segments: Dict[str, List[str]] = {}
+
         print(f"[远程存储] 初始化完成，存储桶: {bucket_name}，签名版本: {signature_version}")
 
     @property
@@ -158,6 +185,16 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
         date_folder = self._format_date_folder(date)
         return f"{db_type}/{date_folder}.db"
 
+    def _get_remote_segment_prefix(self, date: Optional[str] = None, db_type: str = "news") -> str:
+        """
+        获取增量段的对象键前缀
+
+        Returns:
+            如 "news/2025-12-28.segments/"
+        """
+        date_folder = self._format_date_folder(date)
+        return f"{db_type}/{date_folder}.segments/"
+
     def _get_local_db_path(self, date: Optional[str] = None, db_type: str = "news") -> Path:
         """
         获取本地临时 SQLite 文件路径
@@ -199,66 +236,164 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
             print(f"[远程存储] 检查对象存在性异常 ({r2_key}): {e}")
             return False
 
-    def _download_sqlite(self, date: Optional[str] = None, db_type: str = "news") -> Optional[Path]:
+    def _list_segments(self, date: Optional[str] = None, db_type: str = "news") -> List[str]:
         """
-        从远程存储下载当天的 SQLite 文件到本地临时目录
+        列出指定日期的增量段（按回放顺序）
+
+        Returns:
+            对象键列表
+        """
+        prefix = self._get_remote_segment_prefix(date, db_type)
+        keys = []
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix):
+            for obj in page.get('Contents', []):
+                if obj['Key'].endswith(".seg"):
+                    keys.append(obj['Key'])
+        return sorted(keys)
+
+    def _get_object_bytes(self, key: str) -> bytes:
+        """下载对象内容（iter_chunks 以兼容 chunked transfer encoding）"""
+        response = self.s3_client.get_object(Bucket=self.bucket_name, Key=key)
+        return b"".join(response['Body'].iter_chunks(chunk_size=1024*1024))
+
+    def _apply_segments_to_file(self, local_path: Path, keys: List[str], db_type: str) -> int:
+        """
+        把增量段依次回放到本地数据库文件
+
+        Returns:
+            回放的行数
+        """
+        conn = sqlite3.connect(str(local_path))
+        try:
+            self._init_tables(conn, db_type)
+            applied = 0
+            for key in keys:
+                applied += apply_segment(conn, self._get_object_bytes(key))
+            conn.commit()
+            return applied
+        finally:
+            conn.close()
+
+    def _fetch_day(self, date: Optional[str], local_path: Path, db_type: str = "news") -> Tuple[bool, List[str]]:
+        """
+        重建指定日期的数据库：下载完整数据库，再回放其后的增量段
 
-        使用 get_object + iter_chunks 替代 download_file，
-        以正确处理腾讯云 COS 的 chunked transfer encoding。
+        先写入临时文件，完成后原子替换目标文件。
 
         Args:
             date: 日期字符串
+            local_path: 本地目标路径
             db_type: 数据库类型 ("news" 或 "rss")
 
         Returns:
-            本地文件路径，如果不存在返回 None
+            (远程是否存在完整数据库, 已回放的增量段键列表)；
+            远程既没有完整数据库也没有增量段时目标文件不会被创建
         """
         r2_key = self._get_remote_db_key(date, db_type)
-        local_path = self._get_local_db_path(date, db_type)
-
-        # 确保目录存在
         local_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = local_path.with_name(local_path.name + ".tmp")
 
-        # 先检查文件是否存在
-        if not self._check_object_exists(r2_key):
-            print(f"[远程存储] 文件不存在，将创建新数据库: {r2_key}")
-            return None
-
+        base_exists = False
+        last_segment = ""
         try:
             # 使用 get_object + iter_chunks 替代 download_file
             # iter_chunks 会自动处理 chunked transfer encoding
             response = self.s3_client.get_object(Bucket=self.bucket_name, Key=r2_key)
-            with open(local_path, 'wb') as f:
+            with open(tmp_path, 'wb') as f:
                 for chunk in response['Body'].iter_chunks(chunk_size=1024*1024):
                     f.write(chunk)
-            self._downloaded_files.append(local_path)
-            print(f"[远程存储] 已下载: {r2_key} -> {local_path}")
-            return local_path
+            base_exists = True
+            last_segment = response.get('Metadata', {}).get('last-segment', "")
         except ClientError as e:
             error_code = e.response.get("Error", {}).get("Code", "")
-            # S3 兼容存储可能返回不同的错误码
-            if error_code in ("404", "NoSuchKey", "Not Found"):
-                print(f"[远程存储] 文件不存在，将创建新数据库: {r2_key}")
-                return None
-            else:
-                print(f"[远程存储] 下载失败 (错误码: {error_code}): {e}")
+            # S3 兼容存储可能返回 404, NoSuchKey, 或其他变体
+            if error_code not in ("404", "NoSuchKey", "Not Found"):
                 raise
+
+        # 只回放完整数据库之后的增量段（之前的已合并到完整数据库中，不能重复回放）
+        segments = [key for key in self._list_segments(date, db_type) if key > last_segment]
+        if not base_exists and not segments:
+            return False, []
+
+        try:
+            if segments:
+                applied = self._apply_segments_to_file(tmp_path, segments, db_type)
+                print(f"[远程存储] 已回放 {len(segments)} 个增量段（{applied} 行）: {r2_key}")
+            tmp_path.replace(local_path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+        return base_exists, segments
+
+    def download_day(self, date: str, local_path: Path, db_type: str = "news") -> bool:
+        """
+        把远程指定日期的数据库（完整数据库 + 增量段）下载到本地
+
+        Args:
+            date: 日期字符串（YYYY-MM-DD）
+            local_path: 本地目标路径
+            db_type: 数据库类型 ("news" 或 "rss")
+
+        Returns:
+            远程是否有该日期的数据
+        """
+        base_exists, segments = self._fetch_day(date, Path(local_path), db_type)
+        return base_exists or bool(segments)
+
+    def _download_sqlite(self, date: Optional[str] = None, db_type: str = "news") -> Optional[Path]:
+        """
+        从远程存储下载当天的 SQLite 文件到本地临时目录
+
+        完整数据库之后若有增量段，会在本地回放重建。
+
+        Args:
+            date: 日期字符串
+            db_type: 数据库类型 ("news" 或 "rss")
+
+        Returns:
+            本地文件路径，如果不存在返回 None
+        """
+        r2_key = self._get_remote_db_key(date, db_type)
+        local_path = self._get_local_db_path(date, db_type)
+
+        try:
+            base_exists, segments = self._fetch_day(date, local_path, db_type)
         except Exception as e:
             print(f"[远程存储] 下载异常: {e}")
             raise
 
-    def _upload_sqlite(self, date: Optional[str] = None, db_type: str = "news") -> bool:
+        self._base_exists[str(local_path)] = base_exists
+        self._known_segments[str(local_path)] = list(segments)
+
+        if not base_exists and not segments:
+            print(f"[远程存储] 文件不存在，将创建新数据库: {r2_key}")
+            return None
+
+        self._downloaded_files.append(local_path)
+        print(f"[远程存储] 已下载: {r2_key} -> {local_path}")
+        return local_path
+
+    def _upload_sqlite(
+        self,
+        date: Optional[str] = None,
+        db_type: str = "news",
+        last_segment: str = "",
+        local_path: Optional[Path] = None,
+    ) -> bool:
         """
         上传本地 SQLite 文件到远程存储
 
         Args:
             date: 日期字符串
             db_type: 数据库类型 ("news" 或 "rss")
+            last_segment: 该文件已合并到的最后一个增量段（写入对象元数据）
+            local_path: 本地文件路径（默认为临时目录中对应日期的数据库）
 
         Returns:
             是否上传成功
         """
-        local_path = self._get_local_db_path(date, db_type)
+        local_path = local_path or self._get_local_db_path(date, db_type)
         r2_key = self._get_remote_db_key(date, db_type)
 
         if not local_path.exists():
@@ -277,12 +412,16 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
                 file_content = f.read()
 
             # 使用 put_object 并明确设置 ContentLength，确保不使用 chunked encoding
+            put_kwargs = {}
+            if last_segment:
+                put_kwargs["Metadata"] = {"last-segment": last_segment}
             self.s3_client.put_object(
                 Bucket=self.bucket_name,
                 Key=r2_key,
                 Body=file_content,
                 ContentLength=local_size,
                 ContentType='application/x-sqlite3',
+                **put_kwargs,
             )
             print(f"[远程存储] 已上传: {local_path} -> {r2_key}")
 
@@ -323,10 +462,178 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
             conn = sqlite3.connect(db_path)
             conn.row_factory = sqlite3.Row
             self._init_tables(conn, db_type)
+            if self.delta_sync:
+                install_change_tracking(conn)
             self._db_connections[db_path] = conn
 
         return self._db_connections[db_path]
 
+    def _sync_to_remote(self, date: Optional[str] = None, db_type: str = "news") -> bool:
+        """
+        把本地变更同步到远程存储
+
+        增量同步模式下只上传本次的变更段；远程还没有完整数据库（当天首次写入）
+        或未启用增量同步时上传整个数据库。变更段累计到 compact_segments 个后合并。
+
+        Returns:
+            是否同步成功
+        """
+        local_path = self._get_local_db_path(date, db_type)
+        db_path = str(local_path)
+        conn = self._db_connections.get(db_path)
+
+        if not self.delta_sync or conn is None or not self._base_exists.get(db_path):
+            last_segment = max(self._known_segments.get(db_path, []), default="")
+            if not self._upload_sqlite(date, db_type, last_segment=last_segment):
+                return False
+            self._base_exists[db_path] = True
+            if conn is not None:
+                clear_changes(conn)
+            return True
+
+        segment = build_segment(conn, {"date": self._format_date_folder(date), "db_type": db_type})
+        if segment is None:
+            return True
+
+        key = f"{self._get_remote_segment_prefix(date, db_type)}{time.time_ns():020d}-{uuid.uuid4().hex[:8]}.seg"
+        try:
+            self.s3_client.put_object(
+                Bucket=self.bucket_name,
+                Key=key,
+                Body=segment,
+                ContentLength=len(segment),
+                ContentType='application/gzip',
+            )
+        except Exception as e:
+            # 变更保留在 temp._sync_changes 中，下次同步时一并上传
+            print(f"[远程存储] 增量段上传失败: {e}")
+            return False
+
+        clear_changes(conn)
+        known = self._known_segments.setdefault(db_path, [])
+        known.append(key)
+        print(f"[远程存储] 已上传增量段: {key} ({len(segment)} bytes)")
+
+        if len(known) >= self.compact_segments:
+            self._compact_open_database(date, db_type)
+        return True
+
+    def _compact_open_database(self, date: Optional[str] = None, db_type: str = "news") -> bool:
+        """
+        把当前打开的数据库合并为新的完整数据库并删除已合并的增量段
+
+        远程出现了本地未回放的增量段，或本写入方上传的增量段已被删除（其他写入方做过合并），
+        说明本地数据库不是远程的完整状态，不能直接作为完整数据库上传：
+        改为从远程重建（完整数据库 + 全部增量段，按自然键合并），上传重建结果，
+        并用它替换本地数据库。本地变更此时均已作为增量段上传，替换不会丢失数据。
+        """
+        local_path = self._get_local_db_path(date, db_type)
+        db_path = str(local_path)
+        conn = self._db_connections.get(db_path)
+        if conn is None:
+            return False
+
+        try:
+            segments = self._list_segments(date, db_type)
+            known = set(self._known_segments.get(db_path, []))
+            if known != set(segments):
+                return self._rebase_open_database(date, db_type)
+            if not segments:
+                return True
+
+            if not self._upload_sqlite(date, db_type, last_segment=segments[-1]):
+                return False
+            self._delete_keys(segments)
+            self._known_segments[db_path] = []
+            print(f"[远程存储] 已合并 {len(segments)} 个增量段为完整数据库: {self._get_remote_db_key(date, db_type)}")
+            return True
+        except Exception as e:
+            print(f"[远程存储] 合并增量段失败: {e}")
+            return False
+
+    def _rebase_open_database(self, date: Optional[str] = None, db_type: str = "news") -> bool:
+        """
+        从远程重建当天数据库并替换本地打开的数据库，再把重建结果作为完整数据库上传
+
+        调用前本地变更须已全部上传（temp._sync_changes 为空）。
+        """
+        local_path = self._get_local_db_path(date, db_type)
+        db_path = str(local_path)
+        r2_key = self._get_remote_db_key(date, db_type)
+        print(f"[远程存储] 检测到其他写入方的变更，从远程重建后再合并: {r2_key}")
+
+        # 替换文件前关闭连接；下次访问时重新打开并安装变更跟踪
+        conn = self._db_connections.pop(db_path, None)
+        if conn is not None:
+            conn.close()
+
+        base_exists, segments = self._fetch_day(date, local_path, db_type)
+        self._base_exists[db_path] = base_exists
+        self._known_segments[db_path] = list(segments)
+        if not segments:
+            return True
+
+        if not self._upload_sqlite(date, db_type, last_segment=segments[-1]):
+            return False
+        self._base_exists[db_path] = True
+        self._delete_keys(segments)
+        self._known_segments[db_path] = []
+        print(f"[远程存储] 已合并 {len(segments)} 个增量段为完整数据库: {r2_key}")
+        return True
+
+    def _delete_keys(self, keys: List[str]) -> None:
+        """批量删除对象（每次最多 1000 个）"""
+        for i in range(0, len(keys), 1000):
+            batch = keys[i:i + 1000]
+            self.s3_client.delete_objects(
+                Bucket=self.bucket_name,
+                Delete={'Objects': [{'Key': key} for key in batch]},
+            )
+
+    def compact_stale_segments(self) -> int:
+        """
+        把之前日期遗留的增量段合并回完整数据库（日终合并）
+
+        当天的增量段由写入方按 compact_segments 合并；跨日后不再有写入，
+        在下一次运行时统一合并，使历史日期只剩一个完整数据库文件。
+
+        Returns:
+            合并的日期数
+        """
+        today = self._format_date_folder()
+        pending: Dict[Tuple[str, str], List[str]] = {}
+
+        try:
+            paginator = self.s3_client.get_paginator('list_objects_v2')
+            for db_type in ("news", "rss"):
+                for page in paginator.paginate(Bucket=self.bucket_name, Prefix=f"{db_type}/"):
+                    for obj in page.get('Contents', []):
+                        match = re.match(r'(news|rss)/(\d{4}-\d{2}-\d{2})\.segments/.+\.seg$', obj['Key'])
+                        if match and match.group(2) < today:
+                            pending.setdefault((match.group(1), match.group(2)), []).append(obj['Key'])
+        except Exception as e:
+            print(f"[远程存储] 列出增量段失败: {e}")
+            return 0
+
+        compacted = 0
+        for (db_type, date_str), keys in sorted(pending.items()):
+            local_path = self.temp_dir / "compact" / db_type / f"{date_str}.db"
+            try:
+                _, segments = self._fetch_day(date_str, local_path, db_type)
+                if not segments:
+                    continue
+                if self._upload_sqlite(date_str, db_type, last_segment=segments[-1], local_path=local_path):
+                    self._delete_keys(sorted(keys))
+                    compacted += 1
+                    print(f"[远程存储] 日终合并: {db_type}/{date_str}.db（{len(keys)} 个增量段）")
+            except Exception as e:
+                print(f"[远程存储] 日终合并失败 ({db_type}/{date_str}): {e}")
+            finally:
+                if local_path.exists():
+                    local_path.unlink()
+
+        return compacted
+
     # ========================================
     # StorageBackend 接口实现（委托给 mixin + 上传）
     # ========================================
@@ -370,7 +677,7 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
         print("，".join(log_parts))
 
         # 上传到远程存储
-        if self._upload_sqlite(data.date):
+        if self._sync_to_remote(data.date):
             print(f"[远程存储] 数据已同步到远程存储")
             return True
         else:
@@ -381,6 +688,10 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
         """获取指定日期的所有新闻数据（合并后）"""
         return self._get_today_all_data_impl(date)
 
+    def iter_today_news(self, date: Optional[str] = None) -> Iterator[Tuple]:
+        """流式读取指定日期的所有新闻"""
+        return self._iter_today_news_impl(date)
+
     def get_latest_crawl_data(self, date: Optional[str] = None) -> Optional[NewsData]:
         """获取最新一次抓取的数据"""
         return self._get_latest_crawl_data_impl(date)
@@ -389,6 +700,14 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
         """检测新增的标题"""
         return self._detect_new_titles_impl(current_data)
 
+    def get_historical_titles(
+        self,
+        current_data: NewsData,
+        platform_ids: Optional[List[str]] = None,
+    ) -> Optional[Tuple[bool, Set[Tuple[str, str]]]]:
+        """查询当前批次中已在更早批次出现过的标题"""
+        return self._get_historical_titles_impl(current_data, platform_ids)
+
     def is_first_crawl_today(self, date: Optional[str] = None) -> bool:
         """检查是否是当天第一次抓取"""
         return self._is_first_crawl_today_impl(date)
@@ -406,7 +725,7 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
             print(f"[远程存储] 推送记录已保存: {report_type} at {now_str}")
 
             # 上传到远程存储 确保记录持久化
-            if self._upload_sqlite(date):
+            if self._sync_to_remote(date):
                 print(f"[远程存储] 推送记录已同步到远程存储")
                 return True
             else:
@@ -428,7 +747,7 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
             print(f"[远程存储] AI 分析记录已保存: {analysis_mode} at {now_str}")
 
             # 上传到远程存储 确保记录持久化
-            if self._upload_sqlite(date):
+            if self._sync_to_remote(date):
                 print(f"[远程存储] AI 分析记录已同步到远程存储")
                 return True
             else:
@@ -459,7 +778,7 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
         print("，".join(log_parts))
 
         # 上传到远程存储
-        if self._upload_sqlite(data.date, db_type="rss"):
+        if self._sync_to_remote(data.date, db_type="rss"):
             print(f"[远程存储] RSS 数据已同步到远程存储")
             return True
         else:
@@ -588,6 +907,10 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
         if downloaded_files:
             downloaded_files.clear()
 
+        for state in (getattr(self, "_base_exists", None), getattr(self, "_known_segments", None)):
+            if state:
+                state.clear()
+
     def cleanup_old_data(self, retention_days: int) -> int:
         """
         清理远程存储上的过期数据
@@ -624,7 +947,7 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
                     folder_date = None
                     date_str = None
                     try:
-                        date_match = re.match(r'news/(\d{4})-(\d{2})-(\d{2})\.db$', key)
+                        date_match = re.match(r'news/(\d{4})-(\d{2})-(\d{2})\.(?:db$|segments/)', key)
                         if date_match:
                             folder_date = datetime(
                                 int(date_match.group(1)),
@@ -681,13 +1004,17 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
     # 远程特有功能：数据拉取和列表
     # ========================================
 
-    def pull_recent_days(self, days: int, local_data_dir: str = "output") -> int:
+    def pull_recent_days(self, days: int, local_data_dir: str = "output", max_workers: int = 8) -> int:
         """
         从远程拉取最近 N 天的数据到本地
 
+        拉取到 {local_data_dir}/news/{date}.db（与本地存储后端的目录结构一致），
+        并行下载、支持断点续传，远程未变化的日期直接跳过。
+
         Args:
             days: 拉取天数
             local_data_dir: 本地数据目录
+            max_workers: 并行下载数
 
         Returns:
             成功拉取的数据库文件数量
@@ -695,49 +1022,19 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
         if days <= 0:
             return 0
 
-        local_dir = Path(local_data_dir)
-        local_dir.mkdir(parents=True, exist_ok=True)
-
-        pulled_count = 0
-        now = self._get_configured_time()
+        from trendradar.storage.remote_pull import RemotePuller
 
         print(f"[远程存储] 开始拉取最近 {days} 天的数据...")
+        puller = RemotePuller(self, local_data_dir, db_type="news", max_workers=max_workers)
+        try:
+            result = puller.pull_recent_days(days, self._get_configured_time())
+        except Exception as e:
+            print(f"[远程存储] 拉取失败: {e}")
+            return 0
 
-        for i in range(days):
-            date = now - timedelta(days=i)
-            date_str = date.strftime("%Y-%m-%d")
-
-            # 本地目标路径
-            local_date_dir = local_dir / date_str
-            local_db_path = local_date_dir / "news.db"
-
-            # 如果本地已存在，跳过
-            if local_db_path.exists():
-                print(f"[远程存储] 跳过（本地已存在）: {date_str}")
-                continue
-
-            # 远程对象键
-            remote_key = f"news/{date_str}.db"
-
-            # 检查远程是否存在
-            if not self._check_object_exists(remote_key):
-                print(f"[远程存储] 跳过（远程不存在）: {date_str}")
-                continue
-
-            # 下载（使用 get_object + iter_chunks 处理 chunked encoding）
-            try:
-                local_date_dir.mkdir(parents=True, exist_ok=True)
-                response = self.s3_client.get_object(Bucket=self.bucket_name, Key=remote_key)
-                with open(local_db_path, 'wb') as f:
-                    for chunk in response['Body'].iter_chunks(chunk_size=1024*1024):
-                        f.write(chunk)
-                print(f"[远程存储] 已拉取: {remote_key} -> {local_db_path}")
-                pulled_count += 1
-            except Exception as e:
-                print(f"[远程存储] 拉取失败 ({date_str}): {e}")
-
-        print(f"[远程存储] 拉取完成，共下载 {pulled_count} 个数据库文件")
-        return pulled_count
+        for failure in result.failed:
+            print(f"[远程存储] 拉取失败 ({failure['date']}): {failure['error']}")
+        return len(result.pulled)
 
     def list_remote_dates(self) -> List[str]:
         """
@@ -746,7 +1043,7 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
         Returns:
             日期字符串列表（YYYY-MM-DD 格式）
         """
-        dates = []
+        dates = set()
 
         try:
             paginator = self.s3_client.get_paginator('list_objects_v2')
@@ -758,10 +1055,10 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
 
                 for obj in page['Contents']:
                     key = obj['Key']
-                    # 解析日期
-                    date_match = re.match(r'news/(\d{4}-\d{2}-\d{2})\.db$', key)
+                    # 解析日期（只有增量段、尚未生成完整数据库的日期也算）
+                    date_match = re.match(r'news/(\d{4}-\d{2}-\d{2})\.(?:db$|segments/)', key)
                     if date_match:
-                        dates.append(date_match.group(1))
+                        dates.add(date_match.group(1))
 
             return sorted(dates, reverse=True)
 
@@ -0,0 +1,374 @@
+# coding=utf-8
+"""
+远程数据批量拉取
+
+把远程存储中最近 N 天的数据库拉取到本地（output/{db_type}/{date}.db，与本地存储后端一致）：
+
+- 一次 list_objects_v2 获取所有日期的 ETag/大小和增量段，不再逐天 HEAD
+- 与上次拉取记录（output/{db_type}/.pull_state.json）比较，远程未变化的日期直接跳过；
+  上次拉取之后被本地写入过的文件不会被覆盖
+- 有界线程池并行下载，下载到 .part 临时文件，中断后按 Range 续传（If-Match 校验 ETag），
+  回放增量段后原子替换目标文件，任何时刻目标文件都是完整的数据库
+- 输出进度和吞吐量
+"""
+
+import json
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+DEFAULT_MAX_WORKERS = 8
+STATE_FILENAME = ".pull_state.json"
+
+_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass
+class RemoteDay:
+    """远程某一天的对象信息"""
+
+    date: str
+    base_key: Optional[str] = None
+    etag: str = ""
+    size: int = 0
+    segments: List[str] = field(default_factory=list)
+
+    @property
+    def version(self) -> Tuple[str, str]:
+        """远程版本标识：(完整数据库 ETag, 最后一个增量段)"""
+        return self.etag, self.segments[-1] if self.segments else ""
+
+
+@dataclass
+class PullResult:
+    """批量拉取结果"""
+
+    pulled: List[str] = field(default_factory=list)      # 新拉取或刷新的日期
+    unchanged: List[str] = field(default_factory=list)   # 远程未变化，跳过
+    skipped: List[str] = field(default_factory=list)     # 本地已有（本地写入的数据），跳过
+    missing: List[str] = field(default_factory=list)     # 远程不存在
+    failed: List[Dict[str, str]] = field(default_factory=list)
+    bytes_downloaded: int = 0
+    seconds: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """平均吞吐量（MB/s）"""
+        if self.seconds <= 0:
+            return 0.0
+        return self.bytes_downloaded / 1024 / 1024 / self.seconds
+
+
+class RemotePuller:
+    """
+    远程数据批量拉取器
+
+    依赖 RemoteStorageBackend 提供的 s3_client、bucket_name 和增量段回放能力。
+    """
+
+    def __init__(
+        self,
+        backend,
+        local_data_dir: str = "output",
+        db_type: str = "news",
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ):
+        """
+        初始化拉取器
+
+        Args:
+            backend: RemoteStorageBackend 实例
+            local_data_dir: 本地数据目录
+            db_type: 数据库类型 ("news" 或 "rss")
+            max_workers: 并行下载数
+        """
+        self.backend = backend
+        self.db_type = db_type
+        self.local_dir = Path(local_data_dir) / db_type
+        self.max_workers = max(1, int(max_workers or 1))
+        self.state_path = self.local_dir / STATE_FILENAME
+
+        self._state: Dict[str, Dict] = {}
+        self._state_lock = threading.Lock()
+        self._progress_lock = threading.Lock()
+        self._bytes = 0
+
+    # ========================================
+    # 远程清单与本地状态
+    # ========================================
+
+    def list_remote_days(self) -> Dict[str, RemoteDay]:
+        """
+        一次列举获取所有日期的完整数据库信息和增量段
+
+        Returns:
+            {日期: RemoteDay}
+        """
+        pattern = re.compile(
+            rf'{re.escape(self.db_type)}/(\d{{4}}-\d{{2}}-\d{{2}})(\.db$|\.segments/.+\.seg$)'
+        )
+        days: Dict[str, RemoteDay] = {}
+        paginator = self.backend.s3_client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.backend.bucket_name, Prefix=f"{self.db_type}/"):
+            for obj in page.get('Contents', []):
+                match = pattern.match(obj['Key'])
+                if not match:
+                    continue
+                day = days.setdefault(match.group(1), RemoteDay(date=match.group(1)))
+                if match.group(2) == ".db":
+                    day.base_key = obj['Key']
+                    day.etag = (obj.get('ETag') or "").strip('"')
+                    day.size = int(obj.get('Size', 0))
+                else:
+                    day.segments.append(obj['Key'])
+        for day in days.values():
+            day.segments.sort()
+        return days
+
+    def _load_state(self) -> None:
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                self._state = json.load(f)
+        except (OSError, ValueError):
+            self._state = {}
+
+    def _save_state(self) -> None:
+        tmp_path = self.state_path.with_name(self.state_path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._state, f, ensure_ascii=False, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.state_path)
+
+    def _record_pulled(self, day: RemoteDay, target: Path) -> None:
+        stat = target.stat()
+        with self._state_lock:
+            self._state[day.date] = {
+                "etag": day.etag,
+                "last_segment": day.version[1],
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+            }
+            self._save_state()
+
+    def _classify(self, day: RemoteDay, target: Path) -> str:
+        """
+        判断某一天是否需要拉取
+
+        Returns:
+            "pull" / "unchanged" / "skipped"
+        """
+        if not target.exists():
+            return "pull"
+
+        record = self._state.get(day.date)
+        if not record:
+            # 不是由拉取生成的文件（本地抓取写入），保持原样
+            return "skipped"
+
+        stat = target.stat()
+        if stat.st_size != record.get("size") or stat.st_mtime_ns != record.get("mtime_ns"):
+            # 拉取之后本地又写入过，不覆盖
+            return "skipped"
+
+        if (record.get("etag", ""), record.get("last_segment", "")) == day.version:
+            return "unchanged"
+        return "pull"
+
+    # ========================================
+    # 下载
+    # ========================================
+
+    def _add_bytes(self, count: int) -> None:
+        with self._progress_lock:
+            self._bytes += count
+
+    def _download_base(self, day: RemoteDay, part_path: Path) -> str:
+        """
+        续传下载完整数据库到 .part 文件
+
+        Returns:
+            完整数据库已合并到的最后一个增量段（对象元数据 last-segment）
+        """
+        meta_path = part_path.with_name(part_path.name + ".json")
+        meta: Dict = {}
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            pass
+
+        offset = 0
+        if part_path.exists() and meta.get("etag") == day.etag and day.etag:
+            offset = part_path.stat().st_size
+            if offset > day.size:
+                offset = 0
+        if offset == day.size and offset > 0:
+            return meta.get("last_segment", "")
+
+        request = {"Bucket": self.backend.bucket_name, "Key": day.base_key}
+        if offset > 0:
+            request["Range"] = f"bytes={offset}-"
+            request["IfMatch"] = day.etag
+
+        try:
+            response = self.backend.s3_client.get_object(**request)
+        except Exception as e:
+            error_code = getattr(e, "response", {}).get("Error", {}).get("Code", "")
+            if offset > 0 and error_code in ("PreconditionFailed", "412", "InvalidRange", "416"):
+                # 远程对象已变化或范围无效，从头下载
+                offset = 0
+                request.pop("Range")
+                request.pop("IfMatch")
+                response = self.backend.s3_client.get_object(**request)
+            else:
+                raise
+
+        last_segment = (response.get('Metadata') or {}).get('last-segment', "")
+        if offset == 0:
+            last_segment_known = last_segment
+        else:
+            last_segment_known = meta.get("last_segment", last_segment)
+
+        with open(meta_path, "w", encoding="utf-8") as f:
+            json.dump({"etag": day.etag, "last_segment": last_segment_known}, f)
+
+        with open(part_path, "ab" if offset > 0 else "wb") as f:
+            for chunk in response['Body'].iter_chunks(chunk_size=_CHUNK_SIZE):
+                f.write(chunk)
+                self._add_bytes(len(chunk))
+
+        if part_path.stat().st_size != day.size:
+            raise IOError(f"下载不完整: {part_path.stat().st_size}/{day.size} bytes")
+        return last_segment_known
+
+    def _pull_day(self, day: RemoteDay) -> str:
+        """
+        拉取单个日期：完整数据库（续传）+ 增量段回放，完成后原子替换
+
+        Returns:
+            目标文件路径
+        """
+        target = self.local_dir / f"{day.date}.db"
+        part_path = target.with_name(target.name + ".part")
+        meta_path = part_path.with_name(part_path.name + ".json")
+
+        # 上次回放中断留下的 SQLite 日志属于已被修改的 .part，不能作用到重新下载的文件上
+        for suffix in ("-journal", "-wal", "-shm"):
+            sidecar = part_path.with_name(part_path.name + suffix)
+            if sidecar.exists():
+                sidecar.unlink()
+
+        last_segment = ""
+        if day.base_key:
+            last_segment = self._download_base(day, part_path)
+        elif part_path.exists():
+            # 只有增量段的日期从空库开始回放
+            part_path.unlink()
+
+        segments = [key for key in day.segments if key > last_segment]
+        if segments:
+            # 回放会原地修改 .part，先删除续传记录：回放中断后下次从头下载，
+            # 而不是按 Range 续传到已被修改的文件上
+            if meta_path.exists():
+                meta_path.unlink()
+            self.backend._apply_segments_to_file(part_path, segments, self.db_type)
+
+        os.replace(part_path, target)
+        if meta_path.exists():
+            meta_path.unlink()
+        self._record_pulled(day, target)
+        return str(target)
+
+    # ========================================
+    # 批量拉取
+    # ========================================
+
+    def pull(self, dates: List[str], log_prefix: str = "[远程拉取]") -> PullResult:
+        """
+        并行拉取指定日期
+
+        Args:
+            dates: 日期列表（YYYY-MM-DD）
+            log_prefix: 日志前缀
+
+        Returns:
+            PullResult
+        """
+        result = PullResult()
+        started = time.perf_counter()
+        self._bytes = 0
+        self.local_dir.mkdir(parents=True, exist_ok=True)
+        self._load_state()
+
+        remote_days = self.list_remote_days()
+        tasks: List[RemoteDay] = []
+        for date_str in dates:
+            day = remote_days.get(date_str)
+            if day is None:
+                result.missing.append(date_str)
+                continue
+            status = self._classify(day, self.local_dir / f"{date_str}.db")
+            if status == "pull":
+                tasks.append(day)
+            else:
+                getattr(result, status).append(date_str)
+
+        if result.unchanged:
+            print(f"{log_prefix} 远程未变化，跳过 {len(result.unchanged)} 天")
+        if result.skipped:
+            print(f"{log_prefix} 本地已有数据，跳过 {len(result.skipped)} 天: {', '.join(result.skipped)}")
+
+        if tasks:
+            total_size = sum(day.size for day in tasks)
+            workers = min(self.max_workers, len(tasks))
+            print(
+                f"{log_prefix} 开始拉取 {len(tasks)} 天"
+                f"（约 {total_size / 1024 / 1024:.1f} MB，并发 {workers}）"
+            )
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pull") as executor:
+                futures = {executor.submit(self._pull_day, day): day for day in tasks}
+                for done, future in enumerate(as_completed(futures), 1):
+                    day = futures[future]
+                    try:
+                        future.result()
+                        result.pulled.append(day.date)
+                        status = "完成"
+                    except Exception as e:
+                        result.failed.append({"date": day.date, "error": str(e)})
+                        status = f"失败: {e}"
+                    elapsed = time.perf_counter() - started
+                    rate = self._bytes / 1024 / 1024 / elapsed if elapsed > 0 else 0.0
+                    print(
+                        f"{log_prefix} [{done}/{len(tasks)}] {day.date} {status}"
+                        f"（已下载 {self._bytes / 1024 / 1024:.1f} MB，{rate:.1f} MB/s）"
+                    )
+
+        result.pulled.sort(reverse=True)
+        result.bytes_downloaded = self._bytes
+        result.seconds = time.perf_counter() - started
+        print(
+            f"{log_prefix} 拉取完成：新增/更新 {len(result.pulled)} 天，未变化 {len(result.unchanged)} 天，"
+            f"失败 {len(result.failed)} 天，共 {result.bytes_downloaded / 1024 / 1024:.1f} MB，"
+            f"耗时 {result.seconds:.1f}s（{result.throughput:.1f} MB/s）"
+        )
+        return result
+
+    def pull_recent_days(self, days: int, now) -> PullResult:
+        """
+        拉取最近 N 天（含今天）
+
+        Args:
+            days: 天数
+            now: 当前时间（配置时区）
+
+        Returns:
+            PullResult
+        """
+        dates = [(now - timedelta(days=i)).strftime("%Y-%m-%d") for i in range(days)]
+        return self.pull(dates)
@@ -0,0 +1,574 @@
+# coding=utf-8
+"""
+按日列式汇总文件（rollup）
+
+为 output/news/{date}.db 生成紧凑的列式汇总文件 output/news/{date}.rollup，
+供 MCP 多日分析工具直接扫描数组，而不必为每一天重建嵌套字典：
+- 标题去重后按 UTF-8 拼接存放（原文与小写各一份），子串搜索在小写块上
+  直接 find，不逐条构造 str
+- 每条新闻（platform_id, title）一行：标题编号、平台编号、首次排名、
+  排名统计（用于权重计算）、抓取次数、首次/最后出现时间（当天分钟数）
+- 标题 -> 新闻行的 CSR 索引，用于按命中标题回查新闻
+
+文件格式：8 字节魔数 + 头部长度 + JSON 头部 + 8 字节对齐的数组段，
+读取时整体 mmap，数组段以 memoryview（安装了 NumPy 时为 ndarray）零拷贝访问。
+
+新闻行的顺序与 ParserService 读取结果的字典遍历顺序一致（平台按首次出现，
+平台内标题按首次出现），因此基于 rollup 的统计与逐条遍历字典的结果相同。
+
+汇总文件在每次抓取保存后更新，跨天后封存（sealed）；已封存的日期记录在
+output/news/.rollup_sealed.json 中，更新时无需逐个打开旧汇总文件。读取时校验
+新闻库签名，不一致时重新生成。
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+import threading
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+
+_MAGIC = b"TRROLL01"
+_VERSION = 1
+
+# 高排名阈值（与 MCP 权重计算的默认 rank_threshold 一致）
+HIGH_RANK_THRESHOLD = 5
+
+# 数组段：名称 -> array 类型码
+_SECTIONS = (
+    ("title_offsets", "I"),
+    ("title_blob", "B"),
+    ("lower_offsets", "I"),
+    ("lower_blob", "B"),
+    ("item_title", "I"),
+    ("item_platform", "H"),
+    ("item_rank", "i"),
+    ("item_rank_count", "I"),
+    ("item_rank_score", "I"),
+    ("item_rank_high", "I"),
+    ("item_crawl_count", "I"),
+    ("item_first_minute", "h"),
+    ("item_last_minute", "h"),
+    ("title_item_ptr", "I"),
+    ("title_items", "I"),
+)
+
+_NUMPY_DTYPES = {"I": "<u4", "B": "u1", "i": "<i4", "H": "<u2", "h": "<i2"}
+
+
+def _db_signature(db_path: Path) -> str:
+    """新闻库文件签名（库文件与 -wal 文件的 mtime/size）"""
+    parts = []
+    for path in (str(db_path), f"{db_path}-wal"):
+        try:
+            stat = os.stat(path)
+            parts.append(f"{stat.st_mtime_ns}:{stat.st_size}")
+        except OSError:
+            parts.append("-")
+    return "|".join(parts)
+
+
+def _to_minute(time_str: Optional[str]) -> int:
+    """"HH:MM" / "HH-MM" 转为当天分钟数，无法解析时返回 -1"""
+    if not time_str or len(time_str) < 5:
+        return -1
+    try:
+        return int(time_str[0:2]) * 60 + int(time_str[3:5])
+    except ValueError:
+        return -1
+
+
+_SEALED_INDEX = ".rollup_sealed.json"
+
+
+def _load_sealed_dates(news_dir: Path) -> set:
+    """已封存的日期集合（索引缺失或损坏时为空）"""
+    try:
+        with open(Path(news_dir) / _SEALED_INDEX, "r", encoding="utf-8") as f:
+            return set(json.load(f))
+    except (OSError, ValueError, TypeError):
+        return set()
+
+
+def _save_sealed_dates(news_dir: Path, dates: Iterable[str]) -> None:
+    path = Path(news_dir) / _SEALED_INDEX
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(sorted(dates), f)
+    os.replace(tmp_path, path)
+
+
+def rollup_path(news_dir: Path, date_str: str) -> Path:
+    """汇总文件路径（与新闻库同目录）"""
+    return Path(news_dir) / f"{date_str}.rollup"
+
+
+# === 生成 ===
+
+def _read_news_rows(db_path: Path) -> Tuple[List[Tuple], Dict[int, List[int]], List[str]]:
+    """只读方式读取新闻库（查询与 ParserService 一致）"""
+    import sqlite3
+
+    conn = sqlite3.connect(f"{db_path.resolve().as_uri()}?mode=ro", uri=True)
+    try:
+        if not conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name='news_items'"
+        ).fetchone():
+            return [], {}, []
+
+        rows = conn.execute("""
+            SELECT n.id, n.platform_id, p.name as platform_name, n.title,
+                   n.rank, n.url, n.mobile_url,
+                   n.first_crawl_time, n.last_crawl_time, n.crawl_count
+            FROM news_items n
+            LEFT JOIN platforms p ON n.platform_id = p.id
+        """).fetchall()
+
+        rank_history: Dict[int, List[int]] = {}
+        for news_id, rank in conn.execute("""
+            SELECT news_item_id, rank FROM rank_history
+            ORDER BY news_item_id, crawl_time
+        """):
+            rank_history.setdefault(news_id, []).append(rank)
+
+        crawl_times = [
+            row[0] for row in conn.execute(
+                "SELECT crawl_time FROM crawl_records ORDER BY crawl_time"
+            )
+        ]
+    finally:
+        conn.close()
+    return rows, rank_history, crawl_times
+
+
+def _build_sections(
+    rows: Sequence[Tuple],
+    rank_history: Dict[int, List[int]],
+) -> Tuple[Dict[str, array], List[List[str]], List[int]]:
+    """把新闻行整理为列式数组"""
+    # 与 ParserService 相同的字典语义：同一 (平台, 标题) 后出现的行覆盖前面的，
+    # 但保留首次出现的位置
+    platforms: "OrderedDict[str, Dict[str, Tuple]]" = OrderedDict()
+    platform_names: Dict[str, str] = {}
+    for row in rows:
+        news_id, platform_id, platform_name, title = row[0], row[1], row[2], row[3]
+        if platform_id not in platform_names:
+            platform_names[platform_id] = platform_name or platform_id
+        ranks = rank_history.get(news_id, [row[4]])
+        platforms.setdefault(platform_id, {})[title] = (ranks, row[7], row[8], row[9])
+
+    sections = {name: array(code) for name, code in _SECTIONS}
+    title_ids: Dict[str, int] = {}
+    title_blob = bytearray()
+    lower_blob = bytearray()
+    title_offsets = sections["title_offsets"]
+    lower_offsets = sections["lower_offsets"]
+    title_items: List[List[int]] = []
+    platform_counts = []
+
+    item_index = 0
+    for platform_index, (platform_id, titles) in enumerate(platforms.items()):
+        platform_counts.append(len(titles))
+        for title, (ranks, first_time, last_time, crawl_count) in titles.items():
+            title_id = title_ids.get(title)
+            if title_id is None:
+                title_id = len(title_ids)
+                title_ids[title] = title_id
+                title_offsets.append(len(title_blob))
+                title_blob += title.encode("utf-8")
+                lower_offsets.append(len(lower_blob))
+                # \x00 分隔，保证子串不会跨标题命中
+                lower_blob += title.lower().encode("utf-8") + b"\x00"
+                title_items.append([])
+            title_items[title_id].append(item_index)
+
+            ranks = [r for r in ranks if r is not None]
+            sections["item_title"].append(title_id)
+            sections["item_platform"].append(platform_index)
+            sections["item_rank"].append(ranks[0] if ranks else 999)
+            sections["item_rank_count"].append(len(ranks))
+            sections["item_rank_score"].append(sum(11 - min(r, 10) for r in ranks))
+            sections["item_rank_high"].append(
+                sum(1 for r in ranks if r <= HIGH_RANK_THRESHOLD)
+            )
+            sections["item_crawl_count"].append(crawl_count or 1)
+            sections["item_first_minute"].append(_to_minute(first_time))
+            sections["item_last_minute"].append(_to_minute(last_time))
+            item_index += 1
+
+    title_offsets.append(len(title_blob))
+    lower_offsets.append(len(lower_blob))
+    sections["title_blob"] = array("B", bytes(title_blob))
+    sections["lower_blob"] = array("B", bytes(lower_blob))
+
+    ptr = sections["title_item_ptr"]
+    ptr.append(0)
+    for items in title_items:
+        sections["title_items"].extend(items)
+        ptr.append(len(sections["title_items"]))
+
+    platform_list = [[pid, platform_names[pid]] for pid in platforms]
+    return sections, platform_list, platform_counts
+
+
+def _serialize(header: Dict, sections: Dict[str, array]) -> bytes:
+    """序列化为汇总文件内容（数组段 8 字节对齐，小端序）"""
+    layout = {}
+    offset = 0
+    chunks = []
+    for name, code in _SECTIONS:
+        data = sections[name]
+        if sys.byteorder != "little" and data.itemsize > 1:
+            data = array(code, data)
+            data.byteswap()
+        raw = data.tobytes()
+        layout[name] = [offset, len(data)]
+        chunks.append(raw)
+        padding = (-len(raw)) % 8
+        if padding:
+            chunks.append(b"\x00" * padding)
+        offset += len(raw) + padding
+
+    header = dict(header, sections=layout)
+    header_bytes = json.dumps(header, ensure_ascii=False).encode("utf-8")
+    header_bytes += b" " * ((-(len(_MAGIC) + 8 + len(header_bytes))) % 8)
+    prefix = _MAGIC + struct.pack("<II", len(header_bytes), 0) + header_bytes
+    return prefix + b"".join(chunks)
+
+
+def build_daily_rollup(news_dir: Path, date_str: str, sealed: bool = False) -> Optional[bytes]:
+    """
+    从新闻库生成汇总文件内容
+
+    Args:
+        news_dir: 新闻库目录（output/news）
+        date_str: 日期（YYYY-MM-DD）
+        sealed: 是否标记为已封存（当天不会再写入）
+
+    Returns:
+        汇总文件内容，新闻库不存在时返回 None
+    """
+    db_path = Path(news_dir) / f"{date_str}.db"
+    if not db_path.exists():
+        return None
+
+    signature = _db_signature(db_path)
+    rows, rank_history, crawl_times = _read_news_rows(db_path)
+    sections, platforms, platform_counts = _build_sections(rows, rank_history)
+    header = {
+        "version": _VERSION,
+        "date": date_str,
+        "signature": signature,
+        "sealed": sealed,
+        "items": len(sections["item_title"]),
+        "titles": len(sections["title_offsets"]) - 1,
+        "platforms": platforms,
+        "platform_counts": platform_counts,
+        "crawl_times": crawl_times,
+    }
+    return _serialize(header, sections)
+
+
+def write_daily_rollup(news_dir: Path, date_str: str, sealed: bool = False) -> Optional[Path]:
+    """
+    生成并原子写入汇总文件
+
+    Returns:
+        汇总文件路径，新闻库不存在时返回 None
+    """
+    content = build_daily_rollup(news_dir, date_str, sealed=sealed)
+    if content is None:
+        return None
+    path = rollup_path(news_dir, date_str)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(content)
+    _close_open_rollup(path)
+    os.replace(tmp_path, path)
+    return path
+
+
+# === 读取 ===
+
+class DailyRollup:
+    """单日汇总数据（只读，数组段零拷贝映射）"""
+
+    def __init__(self, buffer, path: Optional[Path] = None):
+        """
+        Args:
+            buffer: 汇总文件内容（mmap 或 bytes）
+            path: 来源文件路径（内存中生成时为 None）
+        """
+        if bytes(buffer[:len(_MAGIC)]) != _MAGIC:
+            raise ValueError("不是有效的 rollup 文件")
+        header_len, _ = struct.unpack_from("<II", buffer, len(_MAGIC))
+        data_start = len(_MAGIC) + 8
+        header = json.loads(bytes(buffer[data_start:data_start + header_len]).decode("utf-8"))
+        if header.get("version") != _VERSION:
+            raise ValueError(f"不支持的 rollup 版本: {header.get('version')}")
+
+        self.path = path
+        self.header = header
+        self.date: str = header["date"]
+        self.signature: str = header["signature"]
+        self.sealed: bool = header["sealed"]
+        self.item_count: int = header["items"]
+        self.title_count: int = header["titles"]
+        self.platform_ids: List[str] = [p[0] for p in header["platforms"]]
+        self.platform_names: List[str] = [p[1] for p in header["platforms"]]
+        self.platform_counts: List[int] = header["platform_counts"]
+        self.crawl_times: List[str] = header["crawl_times"]
+
+        self._buffer = buffer
+        self._view = memoryview(buffer)
+        self._starts: Dict[str, int] = {}
+        base = data_start + header_len
+        for name, code in _SECTIONS:
+            offset, count = header["sections"][name]
+            start = base + offset
+            self._starts[name] = start
+            size = count * array(code).itemsize
+            raw = self._view[start:start + size]
+            if sys.byteorder != "little" and array(code).itemsize > 1:
+                data = array(code, raw.tobytes())
+                data.byteswap()
+                setattr(self, name, memoryview(data))
+            else:
+                setattr(self, name, raw.cast(code))
+
+    @property
+    def nbytes(self) -> int:
+        """文件大小"""
+        return len(self._view)
+
+    def close(self) -> None:
+        """
+        释放文件映射（之后不能再访问数组段）
+
+        Windows 上文件仍被映射时无法替换或删除，重写汇总文件前须先关闭。
+        调用方仍持有 as_numpy() 返回的数组时映射无法立即关闭，随数组释放。
+        """
+        for name, _ in _SECTIONS:
+            view = getattr(self, name, None)
+            if isinstance(view, memoryview):
+                view.release()
+        self._view.release()
+        if isinstance(self._buffer, mmap.mmap):
+            try:
+                self._buffer.close()
+            except BufferError:
+                pass
+
+    def title(self, title_id: int) -> str:
+        """标题原文"""
+        return bytes(
+            self.title_blob[self.title_offsets[title_id]:self.title_offsets[title_id + 1]]
+        ).decode("utf-8")
+
+    def as_numpy(self, name: str):
+        """以 ndarray 访问数组段（需要 NumPy）"""
+        code = dict(_SECTIONS)[name]
+        return np.frombuffer(getattr(self, name), dtype=_NUMPY_DTYPES[code])
+
+    def match_titles(self, keyword: str) -> List[int]:
+        """
+        标题（小写）包含关键词（小写）的标题编号
+
+        Args:
+            keyword: 关键词
+
+        Returns:
+            标题编号列表（升序）
+        """
+        needle = keyword.lower().encode("utf-8")
+        if not needle:
+            return list(range(self.title_count))
+
+        blob = self._buffer
+        start = self._starts["lower_blob"]
+        end = start + len(self.lower_blob)
+        offsets = self.lower_offsets
+        matched = []
+        pos = blob.find(needle, start, end)
+        while pos != -1:
+            title_id = bisect_right(offsets, pos - start) - 1
+            matched.append(title_id)
+            # 跳到下一个标题，同一标题只记一次
+            pos = blob.find(needle, start + offsets[title_id + 1], end)
+        return matched
+
+    def items_for_titles(self, title_ids: Iterable[int]) -> List[int]:
+        """标题对应的全部新闻行（升序）"""
+        ptr = self.title_item_ptr
+        items = self.title_items
+        result = []
+        for title_id in title_ids:
+            result.extend(items[ptr[title_id]:ptr[title_id + 1]])
+        result.sort()
+        return result
+
+    def item_count_for_titles(self, title_ids: Iterable[int]) -> int:
+        """标题对应的新闻行数"""
+        ptr = self.title_item_ptr
+        return sum(ptr[t + 1] - ptr[t] for t in title_ids)
+
+
+# 已打开的汇总文件缓存（mmap 常驻，按路径 LRU）
+_MAX_OPEN_ROLLUPS = 128
+_open_rollups: "OrderedDict[str, DailyRollup]" = OrderedDict()
+_open_rollups_lock = threading.Lock()
+
+
+def _close_open_rollup(path: Path) -> None:
+    """从缓存中移除并关闭指定汇总文件的映射（替换或删除该文件前调用）"""
+    with _open_rollups_lock:
+        rollup = _open_rollups.pop(str(path.resolve()), None)
+    if rollup is not None:
+        rollup.close()
+
+
+def _open_rollup(path: Path) -> Optional[DailyRollup]:
+    try:
+        with open(path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return DailyRollup(buffer, path)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"[汇总] 读取 {path.name} 失败，将重新生成: {e}")
+        return None
+
+
+def load_daily_rollup(news_dir: Path, date_str: str, build: bool = True) -> Optional[DailyRollup]:
+    """
+    加载某一天的汇总数据
+
+    汇总文件缺失、损坏或与新闻库签名不一致时，按需重新生成（写入失败时
+    只在内存中使用）。
+
+    Args:
+        news_dir: 新闻库目录（output/news）
+        date_str: 日期（YYYY-MM-DD）
+        build: 汇总文件不可用时是否重新生成
+
+    Returns:
+        DailyRollup，新闻库不存在时返回 None
+    """
+    news_dir = Path(news_dir)
+    db_path = news_dir / f"{date_str}.db"
+    if not db_path.exists():
+        return None
+
+    path = rollup_path(news_dir, date_str)
+    key = str(path.resolve())
+    signature = _db_signature(db_path)
+
+    with _open_rollups_lock:
+        rollup = _open_rollups.get(key)
+        if rollup is not None and rollup.signature == signature:
+            _open_rollups.move_to_end(key)
+            return rollup
+
+    rollup = None
+    if path.exists():
+        rollup = _open_rollup(path)
+        if rollup is not None and rollup.signature != signature:
+            rollup.close()
+            rollup = None
+
+    if rollup is None:
+        if not build:
+            return None
+        content = build_daily_rollup(news_dir, date_str)
+        if content is None:
+            return None
+        try:
+            tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(content)
+            _close_open_rollup(path)
+            os.replace(tmp_path, path)
+            rollup = _open_rollup(path)
+        except OSError:
+            rollup = None
+        if rollup is None:
+            rollup = DailyRollup(content)
+
+    evicted = []
+    with _open_rollups_lock:
+        previous = _open_rollups.get(key)
+        if previous is not None and previous is not rollup:
+            evicted.append(previous)
+        _open_rollups[key] = rollup
+        _open_rollups.move_to_end(key)
+        while len(_open_rollups) > _MAX_OPEN_ROLLUPS:
+            evicted.append(_open_rollups.popitem(last=False)[1])
+    for stale in evicted:
+        stale.close()
+    return rollup
+
+
+def update_daily_rollups(data_dir: str, date_str: str) -> int:
+    """
+    抓取保存后更新当天的汇总文件，并封存之前未封存的汇总文件
+
+    Args:
+        data_dir: 数据目录
+        date_str: 当天日期（YYYY-MM-DD）
+
+    Returns:
+        写入的汇总文件数（失败时返回 0）
+    """
+    news_dir = Path(data_dir) / "news"
+    written = 0
+    try:
+        if write_daily_rollup(news_dir, date_str) is not None:
+            written += 1
+
+        sealed_dates = _load_sealed_dates(news_dir)
+        new_sealed = set()
+        for path in sorted(news_dir.glob("*.rollup")):
+            other_date = path.stem
+            if other_date >= date_str:
+                continue
+            if not (news_dir / f"{other_date}.db").exists():
+                # 新闻库已被清理
+                _close_open_rollup(path)
+                path.unlink(missing_ok=True)
+                continue
+            if other_date in sealed_dates:
+                new_sealed.add(other_date)
+                continue
+            # 索引中没有记录的日期（如索引生成前封存的文件）才打开检查
+            rollup = _open_rollup(path)
+            sealed = rollup is not None and rollup.sealed
+            if rollup is not None:
+                # 重写前关闭映射（Windows 上被映射的文件无法替换）
+                rollup.close()
+            if sealed:
+                new_sealed.add(other_date)
+                continue
+            try:
+                if write_daily_rollup(news_dir, other_date, sealed=True) is not None:
+                    new_sealed.add(other_date)
+                    written += 1
+            except OSError as e:
+                # 单个日期失败不影响其余日期，下次运行时重试
+                print(f"[汇总] 封存 {other_date} 失败: {e}")
+
+        if new_sealed != sealed_dates:
+            _save_sealed_dates(news_dir, new_sealed)
+    except Exception as e:
+        print(f"[汇总] 更新失败: {e}")
+    return written
@@ -101,14 +101,14 @@ CREATE TABLE IF NOT EXISTS push_records (
 -- 索引定义
 -- ============================================
 
--- 平台索引
-CREATE INDEX IF NOT EXISTS idx_news_platform ON news_items(platform_id);
-
 -- 时间索引（用于查询最新数据）
 CREATE INDEX IF NOT EXISTS idx_news_crawl_time ON news_items(last_crawl_time);
 
--- 标题索引（用于标题搜索）
-CREATE INDEX IF NOT EXISTS idx_news_title ON news_items(title);
+-- 平台 + 时间复合索引（用于脱榜检测：按平台查询上次在榜条目；也覆盖按平台过滤）
+CREATE INDEX IF NOT EXISTS idx_news_platform_last_crawl ON news_items(platform_id, last_crawl_time);
+
+-- 标题覆盖索引（用于标题搜索和新增标题检测）
+CREATE INDEX IF NOT EXISTS idx_news_title_platform ON news_items(title, platform_id, first_crawl_time);
 
 -- URL + platform_id 唯一索引（仅对非空 URL，实现去重）
 CREATE UNIQUE INDEX IF NOT EXISTS idx_news_url_platform
@@ -117,5 +117,5 @@ CREATE UNIQUE INDEX IF NOT EXISTS idx_news_url_platform
 -- 抓取状态索引
 CREATE INDEX IF NOT EXISTS idx_crawl_status_record ON crawl_source_status(crawl_record_id);
 
--- 排名历史索引
-CREATE INDEX IF NOT EXISTS idx_rank_history_news ON rank_history(news_item_id);
+-- 排名历史覆盖索引（按条目读取排名时间线时无需回表）
+CREATE INDEX IF NOT EXISTS idx_rank_history_news_time ON rank_history(news_item_id, crawl_time, rank);
@@ -0,0 +1,533 @@
+# coding=utf-8
+"""
+跨日期新闻搜索索引
+
+为 output/news/{date}.db 中的标题建立持久化倒排索引（存放在 output/index/），
+供 MCP 搜索类工具在精确打分前把候选集缩小到很小的范围：
+- 单字 / 双字 n-gram 倒排：子串搜索取所有双字 posting 的交集；
+  相似度搜索用共享字符数给出 SequenceMatcher.ratio() 的上界
+- 关键词倒排：按 extract_keywords 的分词结果，查找共享关键词的标题
+
+索引按日期增量更新：每次抓取保存后（或查询前）比较新闻库的文件签名，
+只为新出现的标题追加 posting。候选集只保证"不漏"，调用方仍需精确校验。
+"""
+
+import os
+import re
+import sqlite3
+import threading
+from array import array
+from collections import Counter
+from itertools import chain
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS index_days (
+    date TEXT PRIMARY KEY,
+    signature TEXT NOT NULL,
+    doc_count INTEGER NOT NULL DEFAULT 0,
+    lengths BLOB NOT NULL,
+    updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS docs (
+    date TEXT NOT NULL,
+    doc_id INTEGER NOT NULL,
+    platform_id TEXT NOT NULL,
+    title TEXT NOT NULL,
+    PRIMARY KEY (date, doc_id)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS postings (
+    gram TEXT NOT NULL,
+    date TEXT NOT NULL,
+    docs BLOB NOT NULL,
+    PRIMARY KEY (gram, date)
+) WITHOUT ROWID;
+"""
+
+# 关键词 posting 的 key 前缀（与单字/双字 n-gram 区分）
+_TOKEN_PREFIX = "\x01"
+
+
+def extract_keywords(text: str, min_length: int = 2) -> List[str]:
+    """
+    从文本中提取关键词（中文连续片段 / 英文单词）
+
+    Args:
+        text: 输入文本
+        min_length: 最小词长
+
+    Returns:
+        关键词列表
+    """
+    # 移除URL和特殊字符
+    text = re.sub(r'http[s]?://\S+', '', text)
+    text = re.sub(r'\[.*?\]', '', text)  # 移除方括号内容
+
+    # 使用正则表达式分词（中文和英文）
+    words = re.findall(r'[\w]+', text)
+
+    # 过滤短词
+    return [word for word in words if word and len(word) >= min_length]
+
+
+def _title_grams(title: str) -> Set[str]:
+    """标题（小写）的单字、双字 n-gram 以及关键词 posting key"""
+    lower = title.lower()
+    grams = set(lower)
+    grams.update(lower[i:i + 2] for i in range(len(lower) - 1))
+    grams.update(_TOKEN_PREFIX + word for word in extract_keywords(title))
+    return grams
+
+
+def _db_signature(db_path: Path) -> str:
+    """新闻库文件签名（库文件与 -wal 文件的 mtime/size）"""
+    parts = []
+    for path in (str(db_path), f"{db_path}-wal"):
+        try:
+            stat = os.stat(path)
+            parts.append(f"{stat.st_mtime_ns}:{stat.st_size}")
+        except OSError:
+            parts.append("-")
+    return "|".join(parts)
+
+
+def _decode(blob: bytes) -> array:
+    ids = array("I")
+    ids.frombytes(blob)
+    return ids
+
+
+class NewsSearchIndex:
+    """
+    跨日期新闻搜索索引
+
+    索引文件：{data_dir}/index/news_search.db。同一实例可在多线程间共享，
+    爬虫进程与 MCP Server 可同时读写（WAL + 写事务内重新校验签名）。
+    """
+
+    def __init__(self, data_dir: str = "output"):
+        """
+        Args:
+            data_dir: 数据目录（包含 news/ 子目录）
+        """
+        self.data_dir = Path(data_dir)
+        self.news_dir = self.data_dir / "news"
+        self.index_path = self.data_dir / "index" / "news_search.db"
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                str(self.index_path), timeout=30, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        """关闭索引连接"""
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    self._conn.close()
+                except sqlite3.Error:
+                    pass
+                self._conn = None
+
+    # === 索引维护 ===
+
+    def update_date(self, date_str: str) -> int:
+        """
+        增量更新某一天的索引
+
+        新闻库签名未变化时直接返回；否则只为新出现的 (platform_id, title) 追加 posting。
+        新闻库不存在时删除该日期的索引。
+
+        Args:
+            date_str: 日期（YYYY-MM-DD）
+
+        Returns:
+            新增索引的标题数
+        """
+        db_path = self.news_dir / f"{date_str}.db"
+
+        with self._lock:
+            conn = self._get_connection()
+
+            if not db_path.exists():
+                self._drop_date(conn, date_str)
+                return 0
+
+            signature = _db_signature(db_path)
+            row = conn.execute(
+                "SELECT signature FROM index_days WHERE date = ?", (date_str,)
+            ).fetchone()
+            if row and row[0] == signature:
+                return 0
+
+            # 读取新闻库中的全部标题（只读）
+            try:
+                src = sqlite3.connect(f"{db_path.resolve().as_uri()}?mode=ro", uri=True)
+                try:
+                    titles = src.execute(
+                        "SELECT DISTINCT platform_id, title FROM news_items"
+                    ).fetchall()
+                finally:
+                    src.close()
+            except sqlite3.Error as e:
+                print(f"[搜索索引] 读取 {date_str} 新闻库失败: {e}")
+                return 0
+
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                added = self._append_titles(conn, date_str, signature, titles)
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            return added
+
+    def _append_titles(
+        self,
+        conn: sqlite3.Connection,
+        date_str: str,
+        signature: str,
+        titles: List[Tuple[str, str]],
+    ) -> int:
+        """在写事务内追加新标题（调用方负责提交）"""
+        row = conn.execute(
+            "SELECT signature, doc_count, lengths FROM index_days WHERE date = ?",
+            (date_str,),
+        ).fetchone()
+        if row and row[0] == signature:
+            # 其他进程已完成更新
+            return 0
+
+        doc_count = row[1] if row else 0
+        lengths = array("H")
+        if row:
+            lengths.frombytes(row[2])
+
+        existing = set(
+            conn.execute(
+                "SELECT platform_id, title FROM docs WHERE date = ?", (date_str,)
+            ).fetchall()
+        )
+
+        new_docs = []
+        new_postings: Dict[str, List[int]] = {}
+        for platform_id, title in titles:
+            if not title or (platform_id, title) in existing:
+                continue
+            existing.add((platform_id, title))
+            doc_id = doc_count + len(new_docs)
+            new_docs.append((date_str, doc_id, platform_id, title))
+            lengths.append(min(len(title.lower()), 0xFFFF))
+            for gram in _title_grams(title):
+                new_postings.setdefault(gram, []).append(doc_id)
+
+        if new_docs:
+            conn.executemany(
+                "INSERT INTO docs (date, doc_id, platform_id, title) VALUES (?, ?, ?, ?)",
+                new_docs,
+            )
+
+            # 合并 posting（新 doc_id 总是更大，直接追加即可保持有序）
+            grams = list(new_postings)
+            old_blobs: Dict[str, bytes] = {}
+            for start in range(0, len(grams), 500):
+                chunk = grams[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                old_blobs.update(
+                    conn.execute(
+                        f"SELECT gram, docs FROM postings WHERE date = ? AND gram IN ({placeholders})",
+                        [date_str] + chunk,
+                    ).fetchall()
+                )
+            conn.executemany(
+                "INSERT OR REPLACE INTO postings (gram, date, docs) VALUES (?, ?, ?)",
+                (
+                    (gram, date_str, old_blobs.get(gram, b"") + array("I", ids).tobytes())
+                    for gram, ids in new_postings.items()
+                ),
+            )
+
+        conn.execute(
+            """
+            INSERT INTO index_days (date, signature, doc_count, lengths, updated_at)
+            VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+            ON CONFLICT(date) DO UPDATE SET
+                signature = excluded.signature,
+                doc_count = excluded.doc_count,
+                lengths = excluded.lengths,
+                updated_at = CURRENT_TIMESTAMP
+            """,
+            (date_str, signature, doc_count + len(new_docs), lengths.tobytes()),
+        )
+        return len(new_docs)
+
+    def _drop_date(self, conn: sqlite3.Connection, date_str: str) -> None:
+        if conn.execute(
+            "SELECT 1 FROM index_days WHERE date = ?", (date_str,)
+        ).fetchone() is None:
+            return
+        with conn:
+            conn.execute("DELETE FROM postings WHERE date = ?", (date_str,))
+            conn.execute("DELETE FROM docs WHERE date = ?", (date_str,))
+            conn.execute("DELETE FROM index_days WHERE date = ?", (date_str,))
+
+    def ensure_dates(self, dates: Iterable[str]) -> List[str]:
+        """
+        确保给定日期的索引是最新的
+
+        Args:
+            dates: 日期列表（YYYY-MM-DD）
+
+        Returns:
+            有新闻数据（已建立索引）的日期列表
+        """
+        available = []
+        for date_str in dates:
+            if (self.news_dir / f"{date_str}.db").exists():
+                self.update_date(date_str)
+                available.append(date_str)
+            else:
+                with self._lock:
+                    self._drop_date(self._get_connection(), date_str)
+        return available
+
+    def prune(self) -> int:
+        """删除新闻库已不存在（如被保留策略清理）的日期索引"""
+        with self._lock:
+            conn = self._get_connection()
+            dates = [row[0] for row in conn.execute("SELECT date FROM index_days")]
+            removed = 0
+            for date_str in dates:
+                if not (self.news_dir / f"{date_str}.db").exists():
+                    self._drop_date(conn, date_str)
+                    removed += 1
+            return removed
+
+    # === 查询 ===
+
+    def _postings(self, date_str: str, grams: Iterable[str]) -> Dict[str, array]:
+        grams = list(grams)
+        if not grams:
+            return {}
+        placeholders = ",".join("?" * len(grams))
+        with self._lock:
+            rows = self._get_connection().execute(
+                f"SELECT gram, docs FROM postings WHERE date = ? AND gram IN ({placeholders})",
+                [date_str] + grams,
+            ).fetchall()
+        return {gram: _decode(blob) for gram, blob in rows}
+
+    def _all_doc_ids(self, date_str: str) -> Set[int]:
+        with self._lock:
+            row = self._get_connection().execute(
+                "SELECT doc_count FROM index_days WHERE date = ?", (date_str,)
+            ).fetchone()
+        return set(range(row[0])) if row else set()
+
+    def _lengths(self, date_str: str) -> array:
+        lengths = array("H")
+        with self._lock:
+            row = self._get_connection().execute(
+                "SELECT lengths FROM index_days WHERE date = ?", (date_str,)
+            ).fetchone()
+        if row:
+            lengths.frombytes(row[0])
+        return lengths
+
+    def _resolve(self, date_str: str, doc_ids: Set[int]) -> Set[Tuple[str, str]]:
+        """doc_id -> (platform_id, title)"""
+        if not doc_ids:
+            return set()
+        result = set()
+        ids = sorted(doc_ids)
+        with self._lock:
+            conn = self._get_connection()
+            for start in range(0, len(ids), 500):
+                chunk = ids[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                result.update(
+                    conn.execute(
+                        f"SELECT platform_id, title FROM docs WHERE date = ? AND doc_id IN ({placeholders})",
+                        [date_str] + chunk,
+                    ).fetchall()
+                )
+        return result
+
+    def _substring_ids(self, date_str: str, query_lower: str) -> Set[int]:
+        """包含 query_lower 的候选标题（所有双字 / 单字 posting 的交集）"""
+        if len(query_lower) >= 2:
+            grams = {query_lower[i:i + 2] for i in range(len(query_lower) - 1)}
+        else:
+            grams = {query_lower}
+        postings = self._postings(date_str, grams)
+        if len(postings) < len(grams):
+            return set()
+        ordered = sorted(postings.values(), key=len)
+        result = set(ordered[0])
+        for ids in ordered[1:]:
+            result.intersection_update(ids)
+            if not result:
+                break
+        return result
+
+    def _ratio_ids(self, date_str: str, query_lower: str, min_ratio: float) -> Set[int]:
+        """
+        SequenceMatcher(query, title).ratio() 可能 >= min_ratio 的候选标题
+
+        匹配字符数 M 不超过查询中出现于标题的字符（按查询中的次数计）总数 UB，
+        因此 ratio = 2M / (|q| + |t|) <= 2UB / (|q| + |t|)。
+        """
+        if min_ratio <= 0:
+            return self._all_doc_ids(date_str)
+
+        query_len = len(query_lower)
+        char_counts = Counter(query_lower)
+        postings = self._postings(date_str, char_counts)
+        if not postings:
+            return set()
+
+        # 按查询中的字符次数加权计数（Counter 的计数在 C 层完成）
+        upper_bounds = Counter(
+            chain.from_iterable(
+                chain.from_iterable([ids] * char_counts[ch])
+                for ch, ids in postings.items()
+            )
+        )
+        lengths = self._lengths(date_str)
+        # 留出浮点误差余量，保证候选集不漏
+        min_ratio -= 1e-9
+        return {
+            doc_id
+            for doc_id, bound in upper_bounds.items()
+            if doc_id < len(lengths)
+            and 2 * bound >= min_ratio * (query_len + lengths[doc_id])
+        }
+
+    def _token_ids(self, date_str: str, tokens: Set[str], min_shared: int) -> Set[int]:
+        """至少共享 min_shared 个关键词的候选标题"""
+        if not tokens or min_shared <= 0:
+            return set()
+        postings = self._postings(date_str, (_TOKEN_PREFIX + t for t in tokens))
+        if len(postings) < min_shared:
+            return set()
+        if min_shared == 1:
+            return set(chain.from_iterable(postings.values()))
+        counts = Counter(chain.from_iterable(postings.values()))
+        return {doc_id for doc_id, count in counts.items() if count >= min_shared}
+
+    def find_substring(self, query: str, dates: Iterable[str]) -> Dict[str, Set[Tuple[str, str]]]:
+        """
+        查找（不区分大小写）包含 query 的候选标题
+
+        Args:
+            query: 查询文本
+            dates: 日期列表
+
+        Returns:
+            {date: {(platform_id, title), ...}}
+        """
+        query_lower = query.lower()
+        result = {}
+        for date_str in self.ensure_dates(dates):
+            if not query_lower:
+                ids = self._all_doc_ids(date_str)
+            else:
+                ids = self._substring_ids(date_str, query_lower)
+            result[date_str] = self._resolve(date_str, ids)
+        return result
+
+    def find_similar(
+        self,
+        query: str,
+        dates: Iterable[str],
+        min_ratio: Optional[float] = None,
+        tokens: Optional[Iterable[str]] = None,
+        min_shared_tokens: int = 1,
+        include_substring: bool = False,
+    ) -> Dict[str, Set[Tuple[str, str]]]:
+        """
+        查找相似候选标题（以下条件的并集）
+
+        Args:
+            query: 查询文本
+            dates: 日期列表
+            min_ratio: 与 query 的 SequenceMatcher 相似度可能达到该值的标题（None 表示不使用）
+            tokens: 关键词集合
+            min_shared_tokens: 至少共享的关键词数
+            include_substring: 是否包含 query 为子串的标题
+
+        Returns:
+            {date: {(platform_id, title), ...}}
+        """
+        query_lower = query.lower()
+        token_set = set(tokens or [])
+        result = {}
+        for date_str in self.ensure_dates(dates):
+            ids: Set[int] = set()
+            if min_ratio is not None:
+                ids |= self._ratio_ids(date_str, query_lower, min_ratio)
+            if token_set:
+                ids |= self._token_ids(date_str, token_set, min_shared_tokens)
+            if include_substring and query_lower:
+                ids |= self._substring_ids(date_str, query_lower)
+            result[date_str] = self._resolve(date_str, ids)
+        return result
+
+
+# 按数据目录共享的索引实例
+_indexes: Dict[str, NewsSearchIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_search_index(data_dir: str = "output") -> NewsSearchIndex:
+    """
+    获取数据目录对应的搜索索引实例
+
+    Args:
+        data_dir: 数据目录
+
+    Returns:
+        NewsSearchIndex 实例
+    """
+    key = str(Path(data_dir).resolve())
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = NewsSearchIndex(data_dir)
+            _indexes[key] = index
+        return index
+
+
+def update_search_index(data_dir: str, date_str: str) -> int:
+    """
+    抓取保存后增量更新当天的搜索索引
+
+    Args:
+        data_dir: 数据目录
+        date_str: 日期（YYYY-MM-DD）
+
+    Returns:
+        新增索引的标题数（失败时返回 0）
+    """
+    try:
+        index = get_search_index(data_dir)
+        added = index.update_date(date_str)
+        index.prune()
+        return added
+    except Exception as e:
+        print(f"[搜索索引] 更新失败: {e}")
+        return 0
@@ -9,12 +9,28 @@ import sqlite3
 from abc import abstractmethod
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
 from trendradar.storage.base import NewsItem, NewsData, RSSItem, RSSData
 from trendradar.utils.url import normalize_url
 
 
+# 默认 SQLite 连接参数（可通过 config.yaml 的 storage.sqlite 覆盖）
+DEFAULT_SQLITE_PROFILE: Dict[str, Any] = {
+    "journal_mode": "WAL",          # 读写并发（MCP Server 读取时不阻塞爬虫写入）
+    "synchronous": "NORMAL",        # WAL 模式下安全且显著减少 fsync
+    "mmap_size": 268435456,         # 256MB 内存映射读取
+    "cache_size": -65536,           # 页缓存 64MB（负数表示 KB）
+    "temp_store": "MEMORY",         # 临时表/排序使用内存
+}
+
+_PRAGMA_CHOICES = {
+    "journal_mode": {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"},
+    "synchronous": {"OFF", "NORMAL", "FULL", "EXTRA"},
+    "temp_store": {"DEFAULT", "FILE", "MEMORY"},
+}
+
+
 class SQLiteStorageMixin:
     """
     SQLite 存储操作 Mixin
@@ -26,6 +42,36 @@ class SQLiteStorageMixin:
     - _format_time_filename() -> str
     """
 
+    # Schema 版本迁移（记录在 PRAGMA user_version 中）
+    # 每项为 (版本号, SQL 语句列表)，按版本号递增排列。
+    # 新建数据库由 schema.sql 直接生成最新结构，迁移语句需幂等（IF [NOT] EXISTS）；
+    # 已有的每日数据库在首次打开时依次执行尚未应用的迁移，实现原地升级。
+    _SCHEMA_MIGRATIONS: Dict[str, List[tuple]] = {
+        "news": [
+            # v1: 脱榜检测复合索引 + 排名历史覆盖索引（替代原有单列索引）
+            (1, [
+                "CREATE INDEX IF NOT EXISTS idx_news_platform_last_crawl "
+                "ON news_items(platform_id, last_crawl_time)",
+                "DROP INDEX IF EXISTS idx_news_platform",
+                "CREATE INDEX IF NOT EXISTS idx_rank_history_news_time "
+                "ON rank_history(news_item_id, crawl_time, rank)",
+                "DROP INDEX IF EXISTS idx_rank_history_news",
+                "ANALYZE",
+            ]),
+            # v2: 标题覆盖索引（新增标题检测按 (title, platform_id) 查询首次出现时间）
+            (2, [
+                "CREATE INDEX IF NOT EXISTS idx_news_title_platform "
+                "ON news_items(title, platform_id, first_crawl_time)",
+                "DROP INDEX IF EXISTS idx_news_title",
+                "ANALYZE",
+            ]),
+        ],
+        "rss": [
+            # v1: 引入版本号（无结构变更）
+            (1, []),
+        ],
+    }
+
     # ========================================
     # 抽象方法 - 子类必须实现
     # ========================================
@@ -70,12 +116,21 @@ class SQLiteStorageMixin:
 
     def _init_tables(self, conn: sqlite3.Connection, db_type: str = "news") -> None:
         """
-        从 schema.sql 初始化数据库表结构
+        从 schema.sql 初始化数据库表结构，并执行未应用的版本迁移
+
+        已是最新版本的数据库直接跳过（不再重复解析 schema.sql）。
 
         Args:
             conn: 数据库连接
             db_type: 数据库类型 ("news" 或 "rss")
         """
+        migrations = self._SCHEMA_MIGRATIONS.get(db_type, [])
+        latest_version = migrations[-1][0] if migrations else 0
+        current_version = conn.execute("PRAGMA user_version").fetchone()[0]
+
+        if migrations and current_version >= latest_version:
+            return
+
         schema_path = self._get_schema_path(db_type)
 
         if schema_path.exists():
@@ -85,8 +140,52 @@ class SQLiteStorageMixin:
         else:
             raise FileNotFoundError(f"Schema file not found: {schema_path}")
 
+        for version, statements in migrations:
+            if version <= current_version:
+                continue
+            for sql in statements:
+                conn.execute(sql)
+
+        conn.execute(f"PRAGMA user_version = {int(latest_version)}")
         conn.commit()
 
+    def _apply_connection_profile(
+        self,
+        conn: sqlite3.Connection,
+        profile: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        应用 SQLite 连接参数（PRAGMA）
+
+        Args:
+            conn: 数据库连接
+            profile: 连接参数，缺省项使用 DEFAULT_SQLITE_PROFILE；值为 None 的项跳过
+        """
+        merged = dict(DEFAULT_SQLITE_PROFILE)
+        if profile:
+            merged.update(profile)
+
+        for name, value in merged.items():
+            if value is None or value == "":
+                continue
+            if name in _PRAGMA_CHOICES:
+                value = str(value).upper()
+                if value not in _PRAGMA_CHOICES[name]:
+                    print(f"[存储] 忽略无效的 SQLite 参数 {name}={value}")
+                    continue
+            elif name in ("mmap_size", "cache_size"):
+                try:
+                    value = int(value)
+                except (TypeError, ValueError):
+                    print(f"[存储] 忽略无效的 SQLite 参数 {name}={value}")
+                    continue
+            else:
+                continue
+            try:
+                conn.execute(f"PRAGMA {name} = {value}")
+            except sqlite3.Error as e:
+                print(f"[存储] 设置 SQLite 参数 {name} 失败: {e}")
+
     # ========================================
     # 新闻数据存储
     # ========================================
@@ -95,6 +194,10 @@ class SQLiteStorageMixin:
         """
         保存新闻数据到 SQLite（核心实现）
 
+        整批数据先写入临时表 _staged_news，随后以少量集合操作完成：
+        标题变更检测、upsert（依赖 idx_news_url_platform 唯一索引）、
+        排名历史追加和脱榜检测，全部在同一事务中完成。
+
         Args:
             data: 新闻数据
             log_prefix: 日志前缀
@@ -102,6 +205,7 @@ class SQLiteStorageMixin:
         Returns:
             (success, new_count, updated_count, title_changed_count, off_list_count)
         """
+        conn = None
         try:
             conn = self._get_connection(data.date)
             cursor = conn.cursor()
@@ -109,113 +213,135 @@ class SQLiteStorageMixin:
             # 获取配置时区的当前时间
             now_str = self._get_configured_time().strftime("%Y-%m-%d %H:%M:%S")
 
+            self._prepare_news_staging(cursor)
+
             # 首先同步平台信息到 platforms 表
-            for source_id, source_name in data.id_to_name.items():
-                cursor.execute("""
-                    INSERT INTO platforms (id, name, updated_at)
-                    VALUES (?, ?, ?)
-                    ON CONFLICT(id) DO UPDATE SET
-                        name = excluded.name,
-                        updated_at = excluded.updated_at
-                """, (source_id, source_name, now_str))
+            cursor.executemany("""
+                INSERT INTO platforms (id, name, updated_at)
+                VALUES (?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    name = excluded.name,
+                    updated_at = excluded.updated_at
+            """, [(source_id, source_name, now_str) for source_id, source_name in data.id_to_name.items()])
+
+            # 暂存本批数据（标准化 URL 只计算一次，如去除微博的 band_rank）
+            success_sources = list(data.items.keys())
+            cursor.executemany(
+                "INSERT INTO _staged_sources (platform_id) VALUES (?)",
+                [(source_id,) for source_id in success_sources],
+            )
+            cursor.executemany("""
+                INSERT INTO _staged_news (title, platform_id, rank, url, mobile_url)
+                VALUES (?, ?, ?, ?, ?)
+            """, [
+                (item.title, source_id, item.rank,
+                 normalize_url(item.url, source_id) if item.url else "",
+                 item.mobile_url)
+                for source_id, news_list in data.items.items()
+                for item in news_list
+            ])
+
+            # 注意：idx_news_url_platform 是部分索引（WHERE url != ''），
+            # 以下查询需显式带上 n.url != '' 条件才能命中该索引
+
+            # 记录库中已有条目的当前标题（NULL 表示库中不存在）
+            cursor.execute("""
+                UPDATE _staged_news SET existing_title = (
+                    SELECT n.title FROM news_items n
+                    WHERE n.url = _staged_news.url AND n.platform_id = _staged_news.platform_id
+                      AND n.url != ''
+                )
+                WHERE url != ''
+            """)
 
             # 统计计数器
-            new_count = 0
-            updated_count = 0
-            title_changed_count = 0
-            success_sources = []
-
-            for source_id, news_list in data.items.items():
-                success_sources.append(source_id)
-
-                for item in news_list:
-                    try:
-                        # 标准化 URL（去除动态参数，如微博的 band_rank）
-                        normalized_url = normalize_url(item.url, source_id) if item.url else ""
-
-                        # 检查是否已存在（通过标准化 URL + platform_id）
-                        if normalized_url:
-                            cursor.execute("""
-                                SELECT id, title FROM news_items
-                                WHERE url = ? AND platform_id = ?
-                            """, (normalized_url, source_id))
-                            existing = cursor.fetchone()
-
-                            if existing:
-                                # 已存在，更新记录
-                                existing_id, existing_title = existing
-
-                                # 检查标题是否变化
-                                if existing_title != item.title:
-                                    # 记录标题变更
-                                    cursor.execute("""
-                                        INSERT INTO title_changes
-                                        (news_item_id, old_title, new_title, changed_at)
-                                        VALUES (?, ?, ?, ?)
-                                    """, (existing_id, existing_title, item.title, now_str))
-                                    title_changed_count += 1
-
-                                # 记录排名历史
-                                cursor.execute("""
-                                    INSERT INTO rank_history
-                                    (news_item_id, rank, crawl_time, created_at)
-                                    VALUES (?, ?, ?, ?)
-                                """, (existing_id, item.rank, data.crawl_time, now_str))
+            # 有 URL 的条目：库中不存在的 (url, platform_id) 组合计为新增，其余计为更新
+            # （与逐条处理时同一批次内重复 URL 的计数方式一致）
+            cursor.execute("""
+                SELECT
+                    COUNT(CASE WHEN url != '' THEN 1 END),
+                    COUNT(DISTINCT CASE WHEN url != '' AND existing_title IS NULL
+                                        THEN url || char(0) || platform_id END),
+                    COUNT(CASE WHEN url = '' THEN 1 END)
+                FROM _staged_news
+            """)
+            url_total, url_new, empty_url_count = cursor.fetchone()
 
-                                # 更新现有记录
-                                cursor.execute("""
-                                    UPDATE news_items SET
-                                        title = ?,
-                                        rank = ?,
-                                        mobile_url = ?,
-                                        last_crawl_time = ?,
-                                        crawl_count = crawl_count + 1,
-                                        updated_at = ?
-                                    WHERE id = ?
-                                """, (item.title, item.rank, item.mobile_url,
-                                      data.crawl_time, now_str, existing_id))
-                                updated_count += 1
-                            else:
-                                # 不存在，插入新记录（存储标准化后的 URL）
-                                cursor.execute("""
-                                    INSERT INTO news_items
-                                    (title, platform_id, rank, url, mobile_url,
-                                     first_crawl_time, last_crawl_time, crawl_count,
-                                     created_at, updated_at)
-                                    VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
-                                """, (item.title, source_id, item.rank, normalized_url,
-                                      item.mobile_url, data.crawl_time, data.crawl_time,
-                                      now_str, now_str))
-                                new_id = cursor.lastrowid
-                                # 记录初始排名
-                                cursor.execute("""
-                                    INSERT INTO rank_history
-                                    (news_item_id, rank, crawl_time, created_at)
-                                    VALUES (?, ?, ?, ?)
-                                """, (new_id, item.rank, data.crawl_time, now_str))
-                                new_count += 1
-                        else:
-                            # URL 为空的情况，直接插入（不做去重）
-                            cursor.execute("""
-                                INSERT INTO news_items
-                                (title, platform_id, rank, url, mobile_url,
-                                 first_crawl_time, last_crawl_time, crawl_count,
-                                 created_at, updated_at)
-                                VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
-                            """, (item.title, source_id, item.rank, "",
-                                  item.mobile_url, data.crawl_time, data.crawl_time,
-                                  now_str, now_str))
-                            new_id = cursor.lastrowid
-                            # 记录初始排名
-                            cursor.execute("""
-                                INSERT INTO rank_history
-                                (news_item_id, rank, crawl_time, created_at)
-                                VALUES (?, ?, ?, ?)
-                            """, (new_id, item.rank, data.crawl_time, now_str))
-                            new_count += 1
+            new_count = url_new + empty_url_count
+            updated_count = url_total - url_new
 
-                    except sqlite3.Error as e:
-                        print(f"{log_prefix} 保存新闻条目失败 [{item.title[:30]}...]: {e}")
+            # upsert：已存在则更新，不存在则插入（存储标准化后的 URL）
+            # URL 为空的条目不受部分唯一索引约束，直接插入（不做去重）
+            cursor.execute("""
+                INSERT INTO news_items
+                (title, platform_id, rank, url, mobile_url,
+                 first_crawl_time, last_crawl_time, crawl_count,
+                 created_at, updated_at)
+                SELECT title, platform_id, rank, url, mobile_url, ?, ?, 1, ?, ?
+                FROM _staged_news
+                WHERE url != ''
+                ORDER BY seq
+                ON CONFLICT(url, platform_id) WHERE url != '' DO UPDATE SET
+                    title = excluded.title,
+                    rank = excluded.rank,
+                    mobile_url = excluded.mobile_url,
+                    last_crawl_time = excluded.last_crawl_time,
+                    crawl_count = crawl_count + 1,
+                    updated_at = excluded.updated_at
+            """, (data.crawl_time, data.crawl_time, now_str, now_str))
+
+            # 标题变更检测：与同一条目的上一个标题比较
+            # （批次内重复出现时为批次内前一条的标题，否则为写入前库中的标题）
+            cursor.execute("""
+                INSERT INTO title_changes (news_item_id, old_title, new_title, changed_at)
+                SELECT n.id, c.old_title, c.title, ?
+                FROM (
+                    SELECT seq, url, platform_id, title,
+                           COALESCE(
+                               LAG(title) OVER (PARTITION BY url, platform_id ORDER BY seq),
+                               existing_title
+                           ) AS old_title
+                    FROM _staged_news
+                    WHERE url != ''
+                ) c
+                JOIN news_items n
+                    ON n.url = c.url AND n.platform_id = c.platform_id AND n.url != ''
+                WHERE c.old_title IS NOT NULL AND c.old_title != c.title
+                ORDER BY c.seq
+            """, (now_str,))
+            title_changed_count = max(cursor.rowcount, 0)
+
+            # 记录排名历史
+            cursor.execute("""
+                INSERT INTO rank_history (news_item_id, rank, crawl_time, created_at)
+                SELECT n.id, s.rank, ?, ?
+                FROM _staged_news s
+                JOIN news_items n
+                    ON n.url = s.url AND n.platform_id = s.platform_id AND n.url != ''
+                WHERE s.url != ''
+                ORDER BY s.seq
+            """, (data.crawl_time, now_str))
+
+            # URL 为空的条目需要新行 ID 来记录初始排名，逐条插入（极少出现）
+            cursor.execute("""
+                SELECT title, platform_id, rank, mobile_url FROM _staged_news
+                WHERE url = ''
+                ORDER BY seq
+            """)
+            for title, source_id, rank, mobile_url in cursor.fetchall():
+                cursor.execute("""
+                    INSERT INTO news_items
+                    (title, platform_id, rank, url, mobile_url,
+                     first_crawl_time, last_crawl_time, crawl_count,
+                     created_at, updated_at)
+                    VALUES (?, ?, ?, '', ?, ?, ?, 1, ?, ?)
+                """, (title, source_id, rank, mobile_url,
+                      data.crawl_time, data.crawl_time, now_str, now_str))
+                cursor.execute("""
+                    INSERT INTO rank_history
+                    (news_item_id, rank, crawl_time, created_at)
+                    VALUES (?, ?, ?, ?)
+                """, (cursor.lastrowid, rank, data.crawl_time, now_str))
 
             total_items = new_count + updated_count
 
@@ -236,34 +362,22 @@ class SQLiteStorageMixin:
             if prev_record:
                 prev_crawl_time = prev_record[0]
 
-                # 对于每个成功抓取的平台，检测脱榜
-                for source_id in success_sources:
-                    # 获取当前抓取中该平台的所有标准化 URL
-                    current_urls = set()
-                    for item in data.items.get(source_id, []):
-                        normalized_url = normalize_url(item.url, source_id) if item.url else ""
-                        if normalized_url:
-                            current_urls.add(normalized_url)
-
-                    # 查询上次在榜（last_crawl_time = prev_crawl_time）但这次不在榜的新闻
-                    # 这些新闻是"第一次脱榜"，需要记录
-                    cursor.execute("""
-                        SELECT id, url FROM news_items
-                        WHERE platform_id = ?
-                          AND last_crawl_time = ?
-                          AND url != ''
-                    """, (source_id, prev_crawl_time))
-
-                    for row in cursor.fetchall():
-                        news_id, url = row[0], row[1]
-                        if url not in current_urls:
-                            # 插入脱榜记录（rank=0 表示脱榜）
-                            cursor.execute("""
-                                INSERT INTO rank_history
-                                (news_item_id, rank, crawl_time, created_at)
-                                VALUES (?, 0, ?, ?)
-                            """, (news_id, data.crawl_time, now_str))
-                            off_list_count += 1
+                # 上次在榜（last_crawl_time = prev_crawl_time）但这次不在榜的新闻
+                # 本批在榜的条目已被 upsert 更新为当前时间，因此这些就是"第一次脱榜"的条目
+                # 插入脱榜记录（rank=0 表示脱榜）
+                cursor.execute("""
+                    INSERT INTO rank_history (news_item_id, rank, crawl_time, created_at)
+                    SELECT n.id, 0, ?, ?
+                    FROM news_items n
+                    JOIN _staged_sources src ON src.platform_id = n.platform_id
+                    WHERE n.last_crawl_time = ?
+                      AND n.url != ''
+                      AND NOT EXISTS (
+                          SELECT 1 FROM _staged_news s
+                          WHERE s.url = n.url AND s.platform_id = n.platform_id
+                      )
+                """, (data.crawl_time, now_str, prev_crawl_time))
+                off_list_count = max(cursor.rowcount, 0)
 
             # 记录抓取信息
             cursor.execute("""
@@ -281,35 +395,123 @@ class SQLiteStorageMixin:
                 crawl_record_id = record_row[0]
 
                 # 记录成功的来源
-                for source_id in success_sources:
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO crawl_source_status
-                        (crawl_record_id, platform_id, status)
-                        VALUES (?, ?, 'success')
-                    """, (crawl_record_id, source_id))
-
-                # 记录失败的来源
-                for failed_id in data.failed_ids:
-                    # 确保失败的平台也在 platforms 表中
-                    cursor.execute("""
-                        INSERT OR IGNORE INTO platforms (id, name, updated_at)
-                        VALUES (?, ?, ?)
-                    """, (failed_id, failed_id, now_str))
-
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO crawl_source_status
-                        (crawl_record_id, platform_id, status)
-                        VALUES (?, ?, 'failed')
-                    """, (crawl_record_id, failed_id))
-
+                cursor.executemany("""
+                    INSERT OR REPLACE INTO crawl_source_status
+                    (crawl_record_id, platform_id, status)
+                    VALUES (?, ?, 'success')
+                """, [(crawl_record_id, source_id) for source_id in success_sources])
+
+                # 记录失败的来源（确保失败的平台也在 platforms 表中）
+                cursor.executemany("""
+                    INSERT OR IGNORE INTO platforms (id, name, updated_at)
+                    VALUES (?, ?, ?)
+                """, [(failed_id, failed_id, now_str) for failed_id in data.failed_ids])
+                cursor.executemany("""
+                    INSERT OR REPLACE INTO crawl_source_status
+                    (crawl_record_id, platform_id, status)
+                    VALUES (?, ?, 'failed')
+                """, [(crawl_record_id, failed_id) for failed_id in data.failed_ids])
+
+            self._prepare_news_staging(cursor)
             conn.commit()
 
             return True, new_count, updated_count, title_changed_count, off_list_count
 
         except Exception as e:
             print(f"{log_prefix} 保存失败: {e}")
+            if conn is not None:
+                try:
+                    conn.rollback()
+                except sqlite3.Error:
+                    pass
             return False, 0, 0, 0, 0
 
+    def _prepare_news_staging(self, cursor: sqlite3.Cursor) -> None:
+        """创建（或清空）批量写入使用的临时表（TEMP 表仅对当前连接可见）"""
+        cursor.execute("""
+            CREATE TEMP TABLE IF NOT EXISTS _staged_news (
+                seq INTEGER PRIMARY KEY,
+                title TEXT NOT NULL,
+                platform_id TEXT NOT NULL,
+                rank INTEGER NOT NULL,
+                url TEXT NOT NULL,
+                mobile_url TEXT,
+                existing_title TEXT
+            )
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS temp._idx_staged_news_url
+                ON _staged_news(url, platform_id)
+        """)
+        cursor.execute("""
+            CREATE TEMP TABLE IF NOT EXISTS _staged_sources (
+                platform_id TEXT PRIMARY KEY
+            )
+        """)
+        cursor.execute("DELETE FROM _staged_news")
+        cursor.execute("DELETE FROM _staged_sources")
+
+    def _iter_today_news_impl(self, date: Optional[str] = None) -> Iterator[Tuple]:
+        """
+        流式读取指定日期的所有新闻
+
+        news_items 与 rank_history 通过一次有序 JOIN 读取（无 IN 参数列表），
+        游标按新闻分组逐条产出，不整体加载结果集。
+
+        Args:
+            date: 日期字符串，默认为今天
+
+        Yields:
+            (platform_id, platform_name, title, rank, url, mobile_url,
+             first_time, last_time, count, ranks, rank_timeline)
+            rank_timeline 为 (HH:MM, 排名) 元组列表，脱榜排名为 None
+        """
+        conn = self._get_connection(date)
+
+        # 过滤逻辑：只保留 last_crawl_time 之前的脱榜记录（rank=0）
+        # 这样可以避免显示新闻永久脱榜后的无意义记录
+        cursor = conn.execute("""
+            SELECT n.id, n.platform_id, COALESCE(NULLIF(p.name, ''), n.platform_id),
+                   n.title, n.rank, n.url, n.mobile_url,
+                   n.first_crawl_time, n.last_crawl_time, n.crawl_count,
+                   rh.rank, rh.crawl_time
+            FROM news_items n
+            LEFT JOIN platforms p ON n.platform_id = p.id
+            LEFT JOIN rank_history rh
+                   ON rh.news_item_id = n.id
+                  AND NOT (rh.rank = 0 AND rh.crawl_time > n.last_crawl_time)
+            ORDER BY n.platform_id, n.last_crawl_time, n.id, rh.crawl_time
+        """)
+
+        current_id = None
+        item = None
+        ranks: List[int] = []
+        seen_ranks: Set[int] = set()
+        timeline: List[Tuple[str, Optional[int]]] = []
+
+        for row in cursor:
+            if row[0] != current_id:
+                if item is not None:
+                    # 没有排名历史时使用当前排名
+                    yield item + (ranks if timeline else [item[3]], timeline)
+                current_id = row[0]
+                item = tuple(row[1:10])
+                ranks, seen_ranks, timeline = [], set(), []
+
+            rank, crawl_time = row[10], row[11]
+            if crawl_time is None:
+                continue
+            # 构建 ranks 列表（去重，排除脱榜记录 rank=0）
+            if rank != 0 and rank not in seen_ranks:
+                seen_ranks.add(rank)
+                ranks.append(rank)
+            # 构建 rank_timeline（完整时间线，包含脱榜；只取时间部分 HH:MM）
+            time_part = crawl_time.split()[1][:5] if ' ' in crawl_time else crawl_time[:5]
+            timeline.append((time_part, rank if rank != 0 else None))
+
+        if item is not None:
+            yield item + (ranks if timeline else [item[3]], timeline)
+
     def _get_today_all_data_impl(self, date: Optional[str] = None) -> Optional[NewsData]:
         """
         获取指定日期的所有新闻数据（合并后）
@@ -321,96 +523,34 @@ class SQLiteStorageMixin:
             合并后的新闻数据
         """
         try:
-            conn = self._get_connection(date)
-            cursor = conn.cursor()
-
-            # 获取所有新闻数据（包含 id 用于查询排名历史）
-            cursor.execute("""
-                SELECT n.id, n.title, n.platform_id, p.name as platform_name,
-                       n.rank, n.url, n.mobile_url,
-                       n.first_crawl_time, n.last_crawl_time, n.crawl_count
-                FROM news_items n
-                LEFT JOIN platforms p ON n.platform_id = p.id
-                ORDER BY n.platform_id, n.last_crawl_time
-            """)
-
-            rows = cursor.fetchall()
-            if not rows:
-                return None
-
-            # 收集所有 news_item_id
-            news_ids = [row[0] for row in rows]
-
-            # 批量查询排名历史（同时获取时间和排名）
-            # 过滤逻辑：只保留 last_crawl_time 之前的脱榜记录（rank=0）
-            # 这样可以避免显示新闻永久脱榜后的无意义记录
-            rank_history_map: Dict[int, List[int]] = {}
-            rank_timeline_map: Dict[int, List[Dict[str, Any]]] = {}
-            if news_ids:
-                placeholders = ",".join("?" * len(news_ids))
-                cursor.execute(f"""
-                    SELECT rh.news_item_id, rh.rank, rh.crawl_time
-                    FROM rank_history rh
-                    JOIN news_items ni ON rh.news_item_id = ni.id
-                    WHERE rh.news_item_id IN ({placeholders})
-                      AND NOT (rh.rank = 0 AND rh.crawl_time > ni.last_crawl_time)
-                    ORDER BY rh.news_item_id, rh.crawl_time
-                """, news_ids)
-                for rh_row in cursor.fetchall():
-                    news_id, rank, crawl_time = rh_row[0], rh_row[1], rh_row[2]
-
-                    # 构建 ranks 列表（去重，排除脱榜记录 rank=0）
-                    if news_id not in rank_history_map:
-                        rank_history_map[news_id] = []
-                    if rank != 0 and rank not in rank_history_map[news_id]:
-                        rank_history_map[news_id].append(rank)
-
-                    # 构建 rank_timeline 列表（完整时间线，包含脱榜）
-                    if news_id not in rank_timeline_map:
-                        rank_timeline_map[news_id] = []
-                    # 提取时间部分（HH:MM）
-                    time_part = crawl_time.split()[1][:5] if ' ' in crawl_time else crawl_time[:5]
-                    rank_timeline_map[news_id].append({
-                        "time": time_part,
-                        "rank": rank if rank != 0 else None  # 0 转为 None 表示脱榜
-                    })
-
             # 按 platform_id 分组
             items: Dict[str, List[NewsItem]] = {}
             id_to_name: Dict[str, str] = {}
             crawl_date = self._format_date_folder(date)
 
-            for row in rows:
-                news_id = row[0]
-                platform_id = row[2]
-                title = row[1]
-                platform_name = row[3] or platform_id
-
+            for (platform_id, platform_name, title, rank, url, mobile_url,
+                 first_time, last_time, count, ranks, timeline) in self._iter_today_news_impl(date):
                 id_to_name[platform_id] = platform_name
-
-                if platform_id not in items:
-                    items[platform_id] = []
-
-                # 获取排名历史，如果没有则使用当前排名
-                ranks = rank_history_map.get(news_id, [row[4]])
-                rank_timeline = rank_timeline_map.get(news_id, [])
-
-                items[platform_id].append(NewsItem(
+                items.setdefault(platform_id, []).append(NewsItem(
                     title=title,
                     source_id=platform_id,
                     source_name=platform_name,
-                    rank=row[4],
-                    url=row[5] or "",
-                    mobile_url=row[6] or "",
-                    crawl_time=row[8],  # last_crawl_time
+                    rank=rank,
+                    url=url or "",
+                    mobile_url=mobile_url or "",
+                    crawl_time=last_time,
                     ranks=ranks,
-                    first_time=row[7],  # first_crawl_time
-                    last_time=row[8],   # last_crawl_time
-                    count=row[9],       # crawl_count
-                    rank_timeline=rank_timeline,
+                    first_time=first_time,
+                    last_time=last_time,
+                    count=count,
+                    rank_timeline=timeline,
                 ))
 
-            final_items = items
+            if not items:
+                return None
+
+            conn = self._get_connection(date)
+            cursor = conn.cursor()
 
             # 获取失败的来源
             cursor.execute("""
@@ -434,7 +574,7 @@ class SQLiteStorageMixin:
             return NewsData(
                 date=crawl_date,
                 crawl_time=crawl_time,
-                items=final_items,
+                items=items,
                 id_to_name=id_to_name,
                 failed_ids=failed_ids,
             )
@@ -582,6 +722,10 @@ class SQLiteStorageMixin:
         该方法比较当前抓取数据与历史数据，找出新增的标题。
         关键逻辑：只有在历史批次中从未出现过的标题才算新增。
 
+        只查询当前批次中的 (platform_id, title) 是否在更早的批次出现过
+        （见 _get_historical_titles_impl），开销与批次大小成正比，
+        而不随当天累计数据量增长。
+
         Args:
             current_data: 当前抓取的数据
 
@@ -589,31 +733,21 @@ class SQLiteStorageMixin:
             新增的标题数据 {source_id: {title: NewsItem}}
         """
         try:
-            # 获取历史数据
-            historical_data = self._get_today_all_data_impl(current_data.date)
+            conn = self._get_connection(current_data.date)
+            cursor = conn.cursor()
 
-            if not historical_data:
+            cursor.execute("SELECT EXISTS(SELECT 1 FROM news_items)")
+            if not cursor.fetchone()[0]:
                 # 没有历史数据，所有都是新的
                 new_titles = {}
                 for source_id, news_list in current_data.items.items():
                     new_titles[source_id] = {item.title: item for item in news_list}
                 return new_titles
 
-            # 获取当前批次时间
-            current_time = current_data.crawl_time
-
-            # 收集历史标题（first_time < current_time 的标题）
-            # 这样可以正确处理同一标题因 URL 变化而产生多条记录的情况
-            historical_titles: Dict[str, set] = {}
-            for source_id, news_list in historical_data.items.items():
-                historical_titles[source_id] = set()
-                for item in news_list:
-                    first_time = getattr(item, 'first_time', item.crawl_time)
-                    if first_time < current_time:
-                        historical_titles[source_id].add(item.title)
-
-            # 检查是否有历史数据
-            has_historical_data = any(len(titles) > 0 for titles in historical_titles.values())
+            history = self._get_historical_titles_impl(current_data)
+            if history is None:
+                return {}
+            has_historical_data, historical_titles = history
             if not has_historical_data:
                 # 第一次抓取，没有"新增"概念
                 return {}
@@ -621,9 +755,8 @@ class SQLiteStorageMixin:
             # 检测新增
             new_titles = {}
             for source_id, news_list in current_data.items.items():
-                hist_set = historical_titles.get(source_id, set())
                 for item in news_list:
-                    if item.title not in hist_set:
+                    if (source_id, item.title) not in historical_titles:
                         if source_id not in new_titles:
                             new_titles[source_id] = {}
                         new_titles[source_id][item.title] = item
@@ -634,6 +767,86 @@ class SQLiteStorageMixin:
             print(f"[存储] 检测新标题失败: {e}")
             return {}
 
+    def _get_historical_titles_impl(
+        self,
+        current_data: NewsData,
+        platform_ids: Optional[List[str]] = None,
+    ) -> Optional[Tuple[bool, Set[Tuple[str, str]]]]:
+        """
+        查询当前批次中哪些标题在更早的批次出现过
+
+        一个标题只要有任何一条记录的 first_crawl_time < 当前批次时间，就算历史标题
+        （可以正确处理同一标题因 URL 变化而产生多条记录的情况）。
+        只探测当前批次的标题，不读取当天全部数据。
+
+        Args:
+            current_data: 当前批次数据（使用其 date、crawl_time 和 items）
+            platform_ids: 只考虑这些平台（None 表示全部平台）
+
+        Returns:
+            (是否存在任何历史条目, {(platform_id, title)} 历史标题集合)，失败返回 None
+        """
+        try:
+            conn = self._get_connection(current_data.date)
+            cursor = conn.cursor()
+            current_time = current_data.crawl_time
+
+            # 是否存在任何早于当前批次的条目（限定平台时只看这些平台）
+            if platform_ids is None:
+                cursor.execute("""
+                    SELECT EXISTS(SELECT 1 FROM news_items WHERE first_crawl_time < ?)
+                """, (current_time,))
+            else:
+                if not platform_ids:
+                    return False, set()
+                placeholders = ",".join("?" * len(platform_ids))
+                cursor.execute(f"""
+                    SELECT EXISTS(
+                        SELECT 1 FROM news_items
+                        WHERE first_crawl_time < ? AND platform_id IN ({placeholders})
+                    )
+                """, (current_time, *platform_ids))
+            has_historical_data = bool(cursor.fetchone()[0])
+            if not has_historical_data:
+                return False, set()
+
+            # 用临时表探测当前批次的 (platform_id, title)，命中 idx_news_title_platform
+            cursor.execute("""
+                CREATE TEMP TABLE IF NOT EXISTS _probe_titles (
+                    platform_id TEXT NOT NULL,
+                    title TEXT NOT NULL
+                )
+            """)
+            cursor.execute("DELETE FROM _probe_titles")
+            cursor.executemany(
+                "INSERT INTO _probe_titles (platform_id, title) VALUES (?, ?)",
+                [
+                    (source_id, item.title)
+                    for source_id, news_list in current_data.items.items()
+                    if platform_ids is None or source_id in platform_ids
+                    for item in news_list
+                ],
+            )
+            cursor.execute("""
+                SELECT DISTINCT p.platform_id, p.title
+                FROM _probe_titles p
+                WHERE EXISTS (
+                    SELECT 1 FROM news_items n
+                    WHERE n.title = p.title
+                      AND n.platform_id = p.platform_id
+                      AND n.first_crawl_time < ?
+                )
+            """, (current_time,))
+            historical_titles = {(row[0], row[1]) for row in cursor.fetchall()}
+            cursor.execute("DELETE FROM _probe_titles")
+            conn.commit()
+
+            return True, historical_titles
+
+        except Exception as e:
+            print(f"[存储] 查询历史标题失败: {e}")
+            return None
+
     def _is_first_crawl_today_impl(self, date: Optional[str] = None) -> bool:
         """
         检查是否是当天第一次抓取